@@ -14,7 +14,11 @@ from cstar.entrypoint.config import JOBFILE_DATE_FORMAT
 from cstar.execution.file_system import local_copy
 from cstar.execution.handler import ExecutionStatus
 from cstar.orchestration.models import BlueprintCore
-from cstar.orchestration.serialization import SerializableModel, deserialize
+from cstar.orchestration.serialization import (
+    SerializableModel,
+    deserialize,
+    deserialize_cached,
+)
 
 if t.TYPE_CHECKING:
     from cstar.entrypoint.config import JobConfig, ServiceConfiguration
@@ -352,7 +356,7 @@ def get_application_name(path: Path) -> str:
         msg = f"Blueprint file not found at {str(path)!r}"
         raise FileNotFoundError(msg)
 
-    base_bp = deserialize(path, BlueprintCore)
+    base_bp = deserialize_cached(path, BlueprintCore)
     return base_bp.application
 
 
@@ -0,0 +1,50 @@
+"""Options shared by the compilation of ROMS and its external codebases."""
+
+import shutil
+
+from cstar.base.env import (
+    ENV_CSTAR_BUILD_CCACHE,
+    ENV_CSTAR_BUILD_JOBS,
+    FLAG_ON,
+    get_env_item,
+)
+
+
+def build_jobs() -> int:
+    """Return the number of parallel jobs to compile with.
+
+    Returns
+    -------
+    int
+        The value of `CSTAR_BUILD_JOBS`, which defaults to the number of
+        processors available to C-Star.
+
+    Raises
+    ------
+    ValueError
+        If `CSTAR_BUILD_JOBS` is not a positive integer.
+    """
+    value = get_env_item(ENV_CSTAR_BUILD_JOBS).value
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+
+    if jobs < 1:
+        msg = f"{ENV_CSTAR_BUILD_JOBS} must be a positive integer, got `{value}`"
+        raise ValueError(msg)
+    return jobs
+
+
+def compiler_launcher() -> str | None:
+    """Return the compiler cache to launch compilers through, if any.
+
+    Returns
+    -------
+    str | None
+        The path to `ccache` if it is on the `PATH` and `CSTAR_BUILD_CCACHE` is
+        enabled, otherwise `None`.
+    """
+    if get_env_item(ENV_CSTAR_BUILD_CCACHE).value != FLAG_ON:
+        return None
+    return shutil.which("ccache")
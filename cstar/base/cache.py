@@ -0,0 +1,286 @@
+"""Building blocks for caches shared by all C-Star processes on a host.
+
+The build, dataset and partition caches store each entry in a directory named
+with its key. Work on a key is serialized by a per-key file lock, entries are
+published atomically from a private staging directory, and the least-recently
+used entries are evicted when the cache exceeds its size limit.
+
+The run catalog, fingerprint index and classification cache are SQLite
+databases shared in the same way; `connect_database` opens them consistently.
+"""
+
+import fcntl
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import typing as t
+from collections.abc import Iterator
+from contextlib import closing, contextmanager, nullcontext
+from pathlib import Path
+
+from cstar.base.log import LoggingMixin
+
+
+@contextmanager
+def exclusive_lock(lock_path: Path, *, blocking: bool = True) -> Iterator[bool]:
+    """Hold an exclusive lock on a file, shared by all processes on the host.
+
+    Parameters
+    ----------
+    lock_path : Path
+        The lock file, created if it does not exist.
+    blocking : bool
+        If `False`, do not wait for a lock held by another process.
+
+    Returns
+    -------
+    Iterator[bool]
+        `True` if the lock is held; `False` if it is held by another process
+        and `blocking` is `False`.
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with lock_path.open("a") as fp:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fp.fileno(), flags)
+        except BlockingIOError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+_initialized: set[Path] = set()
+"""The database files in which this process has created the schema."""
+
+_initialized_lock = threading.Lock()
+"""Serializes the creation of database schemas."""
+
+
+@contextmanager
+def connect_database(path: Path, schema: str) -> Iterator[sqlite3.Connection]:
+    """Open a connection to a SQLite database shared by all processes on the host.
+
+    The schema is created once per process and database file. The default
+    rollback journal is used because WAL mode relies on shared memory that is
+    not supported on network file systems (e.g. NFS, Lustre).
+
+    The connection commits on success and rolls back on failure.
+
+    Parameters
+    ----------
+    path : Path
+        The database file, created if it does not exist.
+    schema : str
+        Idempotent statements creating the tables and indices of the database.
+
+    Returns
+    -------
+    Iterator[sqlite3.Connection]
+
+    Raises
+    ------
+    sqlite3.Error
+        If the database cannot be opened or a statement fails.
+    OSError
+        If the directory containing the database cannot be created.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    exists = path.exists()
+
+    with closing(sqlite3.connect(path, timeout=30)) as conn:
+        with _initialized_lock:
+            if not exists or path not in _initialized:
+                conn.executescript(schema)
+                _initialized.add(path)
+        with conn:
+            yield conn
+
+
+class DirectoryCache(LoggingMixin):
+    """A size- and age-bounded, least-recently-used cache of directory entries.
+
+    Each entry is a directory named with its key. Subclasses populate a staging
+    directory returned by `_stage` and publish it with `_publish`, and record
+    each use of an entry with `_touch`.
+    """
+
+    description: t.ClassVar[str] = "entries"
+    """A plural noun describing the cached entries, used in log messages."""
+
+    root: Path
+    """The directory containing cache entries."""
+
+    max_bytes: int
+    """The maximum combined size of all cache entries."""
+
+    max_age: float
+    """The maximum time (in seconds) an unused entry is retained. Entries do not
+    expire if the value is not positive."""
+
+    def __init__(self, root: Path, max_bytes: int, max_age: float = 0.0) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        root : Path
+            The directory containing cache entries.
+        max_bytes : int
+            The maximum combined size of all cache entries. Caching is disabled
+            if the value is not positive.
+        max_age : float
+            The maximum time (in seconds) an unused entry is retained.
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    @property
+    def enabled(self) -> bool:
+        """Return `True` if entries may be cached.
+
+        Returns
+        -------
+        bool
+        """
+        return self.max_bytes > 0
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _lock_path(self, key: str) -> Path:
+        return self.root / f"{key}.lock"
+
+    @contextmanager
+    def _locked(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on a cache key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key to lock.
+
+        Returns
+        -------
+        Iterator[None]
+        """
+        with exclusive_lock(self._lock_path(key)):
+            yield
+
+    def lock(self, key: str) -> t.ContextManager[None]:
+        """Serialize work on entries that share a cache key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key to lock.
+
+        Returns
+        -------
+        t.ContextManager[None]
+            A context manager holding the lock; a no-op if the cache is disabled.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._locked(key)
+
+    def _touch(self, key: str) -> None:
+        """Record the use of an entry for least-recently-used eviction.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the entry.
+        """
+        os.utime(self._entry_dir(key))
+
+    def _stage(self, key: str) -> Path:
+        """Create an empty directory, private to this process, to populate an entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the entry.
+
+        Returns
+        -------
+        Path
+        """
+        staging = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        return staging
+
+    def _publish(self, key: str, staging: Path) -> None:
+        """Replace an entry with a populated staging directory and evict old entries.
+
+        Concurrent readers never observe a partially written entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the entry.
+        staging : Path
+            The directory returned by `_stage`.
+        """
+        entry = self._entry_dir(key)
+        shutil.rmtree(entry, ignore_errors=True)
+        staging.rename(entry)
+
+        self.evict(keep=key)
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """Remove expired entries, then least-recently-used entries until the
+        cache fits its size limit.
+
+        Entries locked by a concurrent process are never removed. Files that are
+        hardlinks of an evicted entry are unaffected.
+
+        Parameters
+        ----------
+        keep : str | None
+            A cache key that must not be evicted.
+
+        Returns
+        -------
+        list[str]
+            The keys of the evicted entries.
+        """
+        if not self.root.exists():
+            return []
+
+        entries = [
+            p for p in self.root.iterdir() if p.is_dir() and not p.name.startswith(".")
+        ]
+        sizes = {
+            p: sum(f.stat().st_size for f in p.iterdir() if f.is_file())
+            for p in entries
+        }
+        total = sum(sizes.values())
+        expire_before = time.time() - self.max_age if self.max_age > 0 else 0.0
+
+        evicted: list[str] = []
+        for entry in sorted(entries, key=lambda p: p.stat().st_mtime):
+            expired = entry.stat().st_mtime < expire_before
+            if not expired and total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+
+            with exclusive_lock(self._lock_path(entry.name), blocking=False) as held:
+                if not held:
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+
+            total -= sizes[entry]
+            evicted.append(entry.name)
+
+        if evicted:
+            self.log.debug(f"Evicted {len(evicted)} {self.description} from the cache")
+        return evicted
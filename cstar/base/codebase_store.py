@@ -0,0 +1,245 @@
+"""A host-wide store of retrieved and compiled external codebases.
+
+Every step of a workplan and every member of an ensemble uses the same ROMS,
+MARBL and ParallelIO builds. The store installs each codebase once per
+combination of repository, commit, compiler environment and build options, and
+simulations point `ROMS_ROOT`, `MARBL_ROOT` and `PIO_ROOT` at the shared install
+instead of cloning and compiling the codebase in their own directories.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+import typing as t
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+from cstar.base.cache import exclusive_lock
+from cstar.base.log import LoggingMixin
+from cstar.execution.file_system import DirectoryManager
+
+_MANIFEST_NAME: t.Final[str] = "manifest.json"
+"""The file name of the manifest describing a completed install."""
+
+_ROOT_DIR_NAME: t.Final[str] = "root"
+"""The name of the directory containing the codebase within an install."""
+
+
+def compute_install_key(components: Mapping[str, t.Any]) -> str:
+    """Compute a store key from the inputs to an install.
+
+    Parameters
+    ----------
+    components : Mapping[str, t.Any]
+        JSON-serializable values that affect the result of the install.
+
+    Returns
+    -------
+    str
+        A hex digest uniquely identifying the install inputs.
+    """
+    content = json.dumps(components, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class CodebaseStore(LoggingMixin):
+    """A store of external codebase installs shared by all simulations on a host.
+
+    Each install is a directory named with its key, containing the codebase in
+    `root/` and a manifest. The manifest is written once the codebase has been
+    built, so an install without a manifest is incomplete and is rebuilt.
+    Installs of the same key are serialized by a per-key file lock, so only the
+    first of many concurrent simulations builds the codebase.
+    """
+
+    root: Path
+    """The directory containing installs."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the codebase store.
+
+        Parameters
+        ----------
+        root : Path
+            The directory containing installs.
+        """
+        self.root = root
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _lock_path(self, key: str) -> Path:
+        return self.root / f"{key}.lock"
+
+    def root_dir(self, key: str) -> Path:
+        """Return the directory an install places its codebase in.
+
+        Parameters
+        ----------
+        key : str
+            The install key.
+
+        Returns
+        -------
+        Path
+        """
+        return self._entry_dir(key) / _ROOT_DIR_NAME
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on an install.
+
+        Parameters
+        ----------
+        key : str
+            The install key to lock.
+
+        Returns
+        -------
+        Iterator[None]
+        """
+        with exclusive_lock(self._lock_path(key)):
+            yield
+
+    def manifest(self, key: str) -> dict[str, t.Any] | None:
+        """Return the manifest of a completed install.
+
+        Parameters
+        ----------
+        key : str
+            The install key.
+
+        Returns
+        -------
+        dict[str, t.Any] | None
+            The manifest, or `None` if the install does not exist or is incomplete.
+        """
+        try:
+            return json.loads((self._entry_dir(key) / _MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def manifest_for(self, path: str | Path) -> dict[str, t.Any] | None:
+        """Return the manifest of the install containing a codebase directory.
+
+        Parameters
+        ----------
+        path : str | Path
+            The root directory of a codebase, e.g. the value of `ROMS_ROOT`.
+
+        Returns
+        -------
+        dict[str, t.Any] | None
+            The manifest, or `None` if the directory is not a completed install
+            in this store.
+        """
+        path = Path(path)
+        if path.name != _ROOT_DIR_NAME or path.parent.parent != self.root:
+            return None
+        return self.manifest(path.parent.name)
+
+    def prepare(self, key: str) -> Path:
+        """Remove any incomplete install of a key and return its source directory.
+
+        The caller must hold the lock on the key.
+
+        Parameters
+        ----------
+        key : str
+            The install key.
+
+        Returns
+        -------
+        Path
+            The (non-existent) directory to place the codebase in.
+        """
+        entry = self._entry_dir(key)
+        if entry.exists():
+            self.log.debug(f"Removing incomplete codebase install {key[:12]}")
+            shutil.rmtree(entry)
+        entry.mkdir(parents=True)
+        return self.root_dir(key)
+
+    def publish(self, key: str, manifest: Mapping[str, t.Any]) -> None:
+        """Mark an install as complete and protect its files from modification.
+
+        The caller must hold the lock on the key.
+
+        Parameters
+        ----------
+        key : str
+            The install key.
+        manifest : Mapping[str, t.Any]
+            JSON-serializable metadata describing the install.
+        """
+        _make_read_only(self.root_dir(key))
+        self._write_manifest(key, {**manifest, "created_at": time.time()})
+        self.log.debug(f"Published codebase install {key[:12]}")
+
+    def add_alias(self, key: str, checkout_target: str) -> None:
+        """Record a checkout target that resolves to the commit of an install.
+
+        The caller must hold the lock on the key.
+
+        Parameters
+        ----------
+        key : str
+            The install key.
+        checkout_target : str
+            A branch, tag or commit resolving to the installed commit.
+        """
+        manifest = self.manifest(key)
+        if manifest is None or checkout_target in manifest["checkout_targets"]:
+            return
+        manifest["checkout_targets"].append(checkout_target)
+        self._write_manifest(key, manifest)
+
+    def _write_manifest(self, key: str, manifest: Mapping[str, t.Any]) -> None:
+        path = self._entry_dir(key) / _MANIFEST_NAME
+        tmp_path = path.with_name(f".{_MANIFEST_NAME}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, default=str))
+        tmp_path.replace(path)
+
+
+def _make_read_only(path: Path) -> None:
+    """Remove the write permissions of all files under a directory.
+
+    Directories remain writable so that the install can be removed.
+    """
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            file_path = Path(dirpath) / name
+            if not file_path.is_symlink():
+                mode = file_path.stat().st_mode
+                file_path.chmod(mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+
+@lru_cache
+def _get_codebase_store(path: Path) -> CodebaseStore:
+    """Return the codebase store rooted at a path.
+
+    Parameters
+    ----------
+    path : Path
+        The directory containing installs.
+
+    Returns
+    -------
+    CodebaseStore
+    """
+    return CodebaseStore(path)
+
+
+def get_codebase_store() -> CodebaseStore:
+    """Return the codebase store in the C-Star cache home.
+
+    Returns
+    -------
+    CodebaseStore
+    """
+    return _get_codebase_store(DirectoryManager.cache_home() / "codebases")
@@ -26,6 +26,12 @@ FLAG_ON: t.Final[str] = "1"
 FLAG_OFF: t.Final[str] = "0"
 """Value indicating a toggle is disabled."""
 
+JOIN_ENGINE_NCJOIN: t.Final[str] = "ncjoin"
+"""Join partitioned output files with the `ncjoin` program from Tools-Roms."""
+
+JOIN_ENGINE_NATIVE: t.Final[str] = "native"
+"""Join partitioned output files in-process with `cstar.roms.join`."""
+
 ENVVAR_PREFIX: t.Final[str] = "CSTAR_"
 """The common env var prefix that identifies a C-Star configuration setting."""
 CONSTANT_PREFIX: t.Final[str] = "ENV_"
@@ -147,6 +153,13 @@ def nprocs_factory() -> str:
     return str((os.cpu_count() or 3) // 3)
 
 
+def build_jobs_factory() -> str:
+    """Return the number of processors available to the current process."""
+    if hasattr(os, "sched_getaffinity"):
+        return str(len(os.sched_getaffinity(0)))
+    return str(os.cpu_count() or 1)
+
+
 def generate_run_id() -> str:
     """Generate a unique run identifier based on the current time."""
     return datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
@@ -204,6 +217,46 @@ ENV_CSTAR_DISABLE_BUILD_VERIFICATION: t.Annotated[
 ] = "CSTAR_DISABLE_BUILD_VERIFICATION"
 """Set to `1` to skip the pre- and post-build toolchain consistency checks performed when compiling ROMS."""
 
+ENV_CSTAR_BUILD_CACHE_MAX_MB: t.Annotated[
+    t.Literal["CSTAR_BUILD_CACHE_MAX_MB"],
+    EnvVar(
+        "Maximum size (in MB) of the cache of compiled ROMS executables. Set to `0` to disable the cache.",
+        GROUP_SIM,
+        default="2048",
+    ),
+] = "CSTAR_BUILD_CACHE_MAX_MB"
+"""Maximum size (in MB) of the cache of compiled ROMS executables. Set to `0` to disable the cache."""
+
+ENV_CSTAR_PARTITION_CACHE_MAX_MB: t.Annotated[
+    t.Literal["CSTAR_PARTITION_CACHE_MAX_MB"],
+    EnvVar(
+        "Maximum size (in MB) of the cache of partitioned ROMS input files. Set to `0` to disable the cache.",
+        GROUP_SIM,
+        default="10240",
+    ),
+] = "CSTAR_PARTITION_CACHE_MAX_MB"
+"""Maximum size (in MB) of the cache of partitioned ROMS input files. Set to `0` to disable the cache."""
+
+ENV_CSTAR_BUILD_JOBS: t.Annotated[
+    t.Literal["CSTAR_BUILD_JOBS"],
+    EnvVar(
+        "Specify the number of parallel jobs used when compiling ROMS, Tools-Roms, MARBL and ParallelIO. Dynamic default: the number of processors available to C-Star.",
+        GROUP_SIM,
+        default_factory=lambda _: build_jobs_factory(),
+    ),
+] = "CSTAR_BUILD_JOBS"
+"""Specify the number of parallel jobs used when compiling ROMS, Tools-Roms, MARBL and ParallelIO."""
+
+ENV_CSTAR_BUILD_CCACHE: t.Annotated[
+    t.Literal["CSTAR_BUILD_CCACHE"],
+    EnvVar(
+        "Set to `0` to stop launching compilers through `ccache` when it is found on the `PATH`.",
+        GROUP_SIM,
+        default=FLAG_ON,
+    ),
+] = "CSTAR_BUILD_CCACHE"
+"""Set to `0` to stop launching compilers through `ccache` when it is found on the `PATH`."""
+
 ENV_CSTAR_FRESH_CODEBASES: t.Annotated[
     t.Literal["CSTAR_FRESH_CODEBASES"],
     EnvVar(
@@ -214,6 +267,16 @@ ENV_CSTAR_FRESH_CODEBASES: t.Annotated[
 ] = "CSTAR_FRESH_CODEBASES"
 """Set to `1` to automatically clear codebase directories and create fresh clones during each run. Otherwise, use code found in locations specified in `ROMS_ROOT` and `ROMS_MARBL`."""
 
+ENV_CSTAR_SHARED_CODEBASES: t.Annotated[
+    t.Literal["CSTAR_SHARED_CODEBASES"],
+    EnvVar(
+        "Set to `0` to clone and build external codebases in each simulation directory instead of sharing a single install of each codebase version, compiler environment and build options across the host. Ignored if `CSTAR_FRESH_CODEBASES` is set.",
+        GROUP_SIM,
+        default=FLAG_ON,
+    ),
+] = "CSTAR_SHARED_CODEBASES"
+"""Set to `0` to clone and build external codebases in each simulation directory instead of sharing a single install of each codebase version, compiler environment and build options across the host. Ignored if `CSTAR_FRESH_CODEBASES` is set."""
+
 ENV_CSTAR_IN_ACTIVE_ALLOCATION: t.Annotated[
     t.Literal["CSTAR_IN_ACTIVE_ALLOCATION"],
     EnvVar(
@@ -234,6 +297,146 @@ ENV_CSTAR_NPROCS_POST: t.Annotated[
 ] = "CSTAR_NPROCS_POST"
 """Specify the number of processes to be used for post-processing simulation output files."""
 
+ENV_CSTAR_NPROCS_PRE: t.Annotated[
+    t.Literal["CSTAR_NPROCS_PRE"],
+    EnvVar(
+        "Specify the number of processes to be used for partitioning input dataset files before running a simulation. Values greater than 1 start processes with ``spawn``, so Python scripts must guard their entry point with ``if __name__ == '__main__':``.",
+        GROUP_SIM,
+        default="1",
+    ),
+] = "CSTAR_NPROCS_PRE"
+"""Specify the number of processes to be used for partitioning input dataset files before running a simulation. By default, files are partitioned in the current process."""
+
+ENV_CSTAR_JOIN_ENGINE: t.Annotated[
+    t.Literal["CSTAR_JOIN_ENGINE"],
+    EnvVar(
+        "Specify the engine used to join partitioned ROMS output files. Options: ncjoin, native.",
+        GROUP_SIM,
+        default=JOIN_ENGINE_NCJOIN,
+    ),
+] = "CSTAR_JOIN_ENGINE"
+"""Specify the engine used to join partitioned ROMS output files. Options: ncjoin, native."""
+
+ENV_CSTAR_INCREMENTAL_JOIN: t.Annotated[
+    t.Literal["CSTAR_INCREMENTAL_JOIN"],
+    EnvVar(
+        "Set to `1` to join partitioned ROMS output files in the background as soon as ROMS closes them, instead of joining every file after the run completes.",
+        GROUP_SIM,
+        default=FLAG_OFF,
+    ),
+] = "CSTAR_INCREMENTAL_JOIN"
+"""Set to `1` to join partitioned ROMS output files in the background as soon as ROMS closes them."""
+
+ENV_CSTAR_INCREMENTAL_JOIN_INTERVAL: t.Annotated[
+    t.Literal["CSTAR_INCREMENTAL_JOIN_INTERVAL"],
+    EnvVar(
+        "Specify the time (in seconds) between scans of the output directory for closed ROMS output files when `CSTAR_INCREMENTAL_JOIN` is enabled.",
+        GROUP_SIM,
+        default="30",
+    ),
+] = "CSTAR_INCREMENTAL_JOIN_INTERVAL"
+"""Time (in seconds) between scans of the output directory for closed ROMS output files."""
+
+ENV_CSTAR_STAGING_WORKERS: t.Annotated[
+    t.Literal["CSTAR_STAGING_WORKERS"],
+    EnvVar(
+        "Specify the maximum number of data sources staged concurrently. Set to `1` to stage sources one at a time.",
+        GROUP_FS,
+        default="8",
+    ),
+] = "CSTAR_STAGING_WORKERS"
+"""Specify the maximum number of data sources staged concurrently."""
+
+ENV_CSTAR_STAGING_HOST_WORKERS: t.Annotated[
+    t.Literal["CSTAR_STAGING_HOST_WORKERS"],
+    EnvVar(
+        "Specify the maximum number of concurrent downloads from a single remote host.",
+        GROUP_FS,
+        default="4",
+    ),
+] = "CSTAR_STAGING_HOST_WORKERS"
+"""Specify the maximum number of concurrent downloads from a single remote host."""
+
+ENV_CSTAR_DATASET_CACHE_MAX_MB: t.Annotated[
+    t.Literal["CSTAR_DATASET_CACHE_MAX_MB"],
+    EnvVar(
+        "Specify the maximum size (in MB) of the host-wide cache of downloaded datasets. Set to `0` to disable the cache.",
+        GROUP_FS,
+        default="10240",
+    ),
+] = "CSTAR_DATASET_CACHE_MAX_MB"
+"""Maximum size (in MB) of the host-wide cache of downloaded datasets. Set to `0` to disable the cache."""
+
+ENV_CSTAR_DATASET_CACHE_MAX_AGE_DAYS: t.Annotated[
+    t.Literal["CSTAR_DATASET_CACHE_MAX_AGE_DAYS"],
+    EnvVar(
+        "Specify the number of days an unused dataset is kept in the dataset cache.",
+        GROUP_FS,
+        default="30",
+    ),
+] = "CSTAR_DATASET_CACHE_MAX_AGE_DAYS"
+"""Number of days an unused dataset is kept in the dataset cache."""
+
+ENV_CSTAR_DOWNLOAD_SEGMENTS: t.Annotated[
+    t.Literal["CSTAR_DOWNLOAD_SEGMENTS"],
+    EnvVar(
+        "Specify the maximum number of concurrent connections used to download a single file from a server supporting range requests.",
+        GROUP_FS,
+        default="4",
+    ),
+] = "CSTAR_DOWNLOAD_SEGMENTS"
+"""Maximum number of concurrent connections used to download a single file."""
+
+ENV_CSTAR_DOWNLOAD_SEGMENT_MIN_MB: t.Annotated[
+    t.Literal["CSTAR_DOWNLOAD_SEGMENT_MIN_MB"],
+    EnvVar(
+        "Specify the minimum size (in MB) of each segment of a multi-connection download.",
+        GROUP_FS,
+        default="32",
+    ),
+] = "CSTAR_DOWNLOAD_SEGMENT_MIN_MB"
+"""Minimum size (in MB) of each segment of a multi-connection download."""
+
+ENV_CSTAR_DOWNLOAD_RETRIES: t.Annotated[
+    t.Literal["CSTAR_DOWNLOAD_RETRIES"],
+    EnvVar(
+        "Specify the number of times an interrupted download is resumed before failing.",
+        GROUP_FS,
+        default="3",
+    ),
+] = "CSTAR_DOWNLOAD_RETRIES"
+"""Number of times an interrupted download is resumed before failing."""
+
+ENV_CSTAR_CLASSIFICATION_TTL_HOURS: t.Annotated[
+    t.Literal["CSTAR_CLASSIFICATION_TTL_HOURS"],
+    EnvVar(
+        "Specify the number of hours the classification of a remote data source is cached. Set to 0 to disable the cache.",
+        GROUP_FS,
+        default="24",
+    ),
+] = "CSTAR_CLASSIFICATION_TTL_HOURS"
+"""Number of hours the classification of a remote data source is cached."""
+
+ENV_CSTAR_GIT_REF_TTL_SECONDS: t.Annotated[
+    t.Literal["CSTAR_GIT_REF_TTL_SECONDS"],
+    EnvVar(
+        "Specify the number of seconds the branches and tags of a remote repository are cached before `git ls-remote` is run again. Commit hashes are cached indefinitely.",
+        GROUP_FS,
+        default="300",
+    ),
+] = "CSTAR_GIT_REF_TTL_SECONDS"
+"""Number of seconds the branches and tags of a remote repository are cached."""
+
+ENV_CSTAR_GIT_REF_CACHE_PERSIST: t.Annotated[
+    t.Literal["CSTAR_GIT_REF_CACHE_PERSIST"],
+    EnvVar(
+        "Set to `1` to share the cached branches, tags and commit hashes of remote repositories between processes via the C-Star cache home.",
+        GROUP_FS,
+        default=FLAG_ON,
+    ),
+] = "CSTAR_GIT_REF_CACHE_PERSIST"
+"""Set to `1` to share cached remote repository refs between processes."""
+
 ENV_CSTAR_SCRATCH_DIRS: t.Annotated[
     t.Literal["CSTAR_SCRATCH_DIRS"],
     EnvVar(
@@ -302,15 +505,75 @@ ENV_CSTAR_RUNID: t.Annotated[
 ] = "CSTAR_RUNID"
 """Environment variable containing a unique run identifier used by the orchestrator."""
 
-ENV_CSTAR_SLURM_POST_SUBMIT_DELAY: t.Annotated[
-    t.Literal["CSTAR_SLURM_POST_SUBMIT_DELAY"],
+ENV_CSTAR_SLURM_SUBMIT_CONCURRENCY: t.Annotated[
+    t.Literal["CSTAR_SLURM_SUBMIT_CONCURRENCY"],
+    EnvVar(
+        "Maximum number of `sbatch` submissions the orchestrator runs concurrently.",
+        GROUP_SIM,
+        default="8",
+    ),
+] = "CSTAR_SLURM_SUBMIT_CONCURRENCY"
+"""Maximum number of `sbatch` submissions the orchestrator runs concurrently."""
+
+ENV_CSTAR_SLURM_VISIBILITY_TIMEOUT: t.Annotated[
+    t.Literal["CSTAR_SLURM_VISIBILITY_TIMEOUT"],
+    EnvVar(
+        "Time (in seconds) a submitted SLURM job is reported as pending while it is not yet visible to `sacct`.",
+        GROUP_SIM,
+        default="120.0",
+    ),
+] = "CSTAR_SLURM_VISIBILITY_TIMEOUT"
+"""Time (in seconds) a submitted SLURM job is reported as pending while it is not yet visible to `sacct`."""
+
+ENV_CSTAR_SLURM_STATUS_TTL: t.Annotated[
+    t.Literal["CSTAR_SLURM_STATUS_TTL"],
+    EnvVar(
+        "Maximum age (in seconds) of a cached SLURM job status before `sacct` is queried again.",
+        GROUP_SIM,
+        default="5.0",
+    ),
+] = "CSTAR_SLURM_STATUS_TTL"
+"""Maximum age (in seconds) of a cached SLURM job status before `sacct` is queried again."""
+
+ENV_CSTAR_LOCAL_MAX_CPUS: t.Annotated[
+    t.Literal["CSTAR_LOCAL_MAX_CPUS"],
     EnvVar(
-        "Delay (in seconds) after a submission to ensure status for a SLURM job can be queried.",
+        "Maximum number of CPUs occupied by steps run by the local launcher. Dynamic default: the number of processors available to C-Star.",
+        GROUP_SIM,
+        default_factory=lambda _: build_jobs_factory(),  # type: ignore[reportOptionalOperand]
+    ),
+] = "CSTAR_LOCAL_MAX_CPUS"
+"""Maximum number of CPUs occupied by steps run by the local launcher."""
+
+ENV_CSTAR_LOCAL_MAX_MEMORY_MB: t.Annotated[
+    t.Literal["CSTAR_LOCAL_MAX_MEMORY_MB"],
+    EnvVar(
+        "Maximum memory (in MB) reserved by steps run by the local launcher. Set to 0 to use the physical memory of the machine.",
+        GROUP_SIM,
+        default="0",
+    ),
+] = "CSTAR_LOCAL_MAX_MEMORY_MB"
+"""Maximum memory (in MB) reserved by steps run by the local launcher."""
+
+ENV_CSTAR_STATUS_POLL_MIN_SECONDS: t.Annotated[
+    t.Literal["CSTAR_STATUS_POLL_MIN_SECONDS"],
+    EnvVar(
+        "Minimum interval (in seconds) between job status queries while streaming job output.",
         GROUP_SIM,
         default="1.0",
     ),
-] = "CSTAR_SLURM_POST_SUBMIT_DELAY"
-"""Delay (in seconds) after a submission to ensure status for a SLURM job can be queried."""
+] = "CSTAR_STATUS_POLL_MIN_SECONDS"
+"""Minimum interval (in seconds) between job status queries while streaming job output."""
+
+ENV_CSTAR_STATUS_POLL_MAX_SECONDS: t.Annotated[
+    t.Literal["CSTAR_STATUS_POLL_MAX_SECONDS"],
+    EnvVar(
+        "Maximum interval (in seconds) between job status queries while a job's status is unchanged.",
+        GROUP_SIM,
+        default="30.0",
+    ),
+] = "CSTAR_STATUS_POLL_MAX_SECONDS"
+"""Maximum interval (in seconds) between job status queries while a job's status is unchanged."""
 
 ENV_CSTAR_ORCH_LOCAL_DELAY: t.Annotated[
     t.Literal["CSTAR_ORCH_LOCAL_DELAY"],
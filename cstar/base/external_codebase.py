@@ -1,6 +1,15 @@
+import json
+import os
+import typing as t
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from cstar.base.codebase_store import (
+    CodebaseStore,
+    compute_install_key,
+    get_codebase_store,
+)
+from cstar.base.gitutils import _get_hash_from_checkout_target
 from cstar.base.log import LoggingMixin
 from cstar.io.source_data import SourceData
 from cstar.io.staged_data import StagedRepository
@@ -29,6 +38,8 @@ class ExternalCodeBase(ABC, LoggingMixin):
         Perform any actions necessary to configure this codebase locally for use
     setup(target_dir: Path):
         Calls both `get()` and `configure()` in sequence
+    install():
+        Retrieve and configure the codebase in the host-wide codebase store
     """
 
     _working_copy: StagedRepository | None = None  # updated by self.get()
@@ -133,6 +144,13 @@ class ExternalCodeBase(ABC, LoggingMixin):
         """
         return self.root_env_var.split("_")[0].casefold()
 
+    @property
+    def build_options(self) -> dict[str, t.Any]:
+        """Options, other than the compiler environment, that affect the result of
+        `configure()`. Defined in subclasses that are built with such options.
+        """
+        return {}
+
     @property
     def working_copy(self) -> StagedRepository | None:
         """StagedRepository instance describing the local clone of this codebase (if it exists)"""
@@ -190,6 +208,135 @@ class ExternalCodeBase(ABC, LoggingMixin):
     def _configure(self) -> None:
         """Must be implemented by subclasses"""
 
+    def _set_environment(self, root: Path) -> None:
+        """Set the environment variables pointing to a configured copy of the codebase.
+
+        Parameters
+        ----------
+        root: Path
+            The root directory of the configured codebase
+        """
+        get_sysmgr().environment.set_env_var(self.root_env_var, str(root))
+
+    def _get_dependency_root(self, env_var: str) -> str | None:
+        """Look up a dependency location from the C-Star environment or the process
+        environment.
+        """
+        return get_sysmgr().environment.environment_variables.get(
+            env_var
+        ) or os.environ.get(env_var)
+
+    def _install_components(self, commit: str) -> dict[str, t.Any]:
+        """Collect the inputs that determine the result of installing this codebase.
+
+        Parameters
+        ----------
+        commit: str
+            The commit hash of the codebase to install
+
+        Returns
+        -------
+        dict[str, Any]
+            JSON-serializable values used to compute the codebase store key.
+        """
+        return {
+            "codebase": self.key,
+            "source_repo": self.source.location,
+            "commit": commit,
+            **self._build_environment(),
+        }
+
+    def _build_environment(self) -> dict[str, t.Any]:
+        """Collect the compiler environment and options this codebase is built with.
+
+        Returns
+        -------
+        dict[str, Any]
+            JSON-compatible values, as recorded in the manifest of an install.
+        """
+        cstar_sysmgr = get_sysmgr()
+        environment = {
+            "system": cstar_sysmgr.name,
+            "compiler": cstar_sysmgr.environment.compiler,
+            "toolchain": {
+                var: self._get_dependency_root(var)
+                for var in ("MPIHOME", "NETCDFHOME", "NETCDFFHOME", "PNETCDFHOME")
+            },
+            "build_options": self.build_options,
+        }
+        # match the values read back from a manifest
+        return json.loads(json.dumps(environment, default=str))
+
+    def _check_install_manifest(self, root: str | Path) -> bool | None:
+        """Determine whether a shared install of this codebase is configured from the
+        manifest in the codebase store, without querying git.
+
+        Parameters
+        ----------
+        root: str or Path
+            The root directory of the codebase, e.g. the value of `root_env_var`
+
+        Returns
+        -------
+        bool or None
+            Whether the install matches this codebase, or None if `root` is not a
+            completed install in the codebase store.
+        """
+        manifest = get_codebase_store().manifest_for(root)
+        if manifest is None:
+            return None
+
+        return (
+            manifest["source_repo"] == self.source.location
+            and self.source.checkout_target
+            in (manifest["commit"], *manifest["checkout_targets"])
+            and all(
+                manifest.get(name) == value
+                for name, value in self._build_environment().items()
+            )
+        )
+
+    def install(self, store: CodebaseStore | None = None) -> None:
+        """Retrieve and configure this codebase in the host-wide codebase store.
+
+        The codebase is built once for each combination of repository, commit,
+        compiler environment and build options, and is shared read-only by every
+        simulation on the host. Concurrent installs of the same combination wait
+        for the first to finish building, then reuse its build.
+
+        Parameters
+        ----------
+        store: CodebaseStore or None
+            The store to install the codebase to. Defaults to the store in the
+            C-Star cache home.
+        """
+        store = store or get_codebase_store()
+        checkout_target = self.source.checkout_target
+        assert checkout_target is not None  # Cannot be for ExternalCodeBase
+
+        commit = _get_hash_from_checkout_target(self.source.location, checkout_target)
+        components = self._install_components(commit)
+        key = compute_install_key(components)
+        root = store.root_dir(key)
+        name = self.__class__.__name__
+
+        with store.lock(key):
+            if store.manifest(key) is None:
+                self.log.info(f"🔧 Installing {name} at {commit[:12]} in {root}")
+                pinned_source = SourceData(
+                    location=self.source.location, identifier=commit
+                )
+                pinned_source.stage(target_dir=store.prepare(key))
+                self._working_copy = StagedRepository(source=self.source, path=root)
+                self._configure()
+                manifest = {**components, "checkout_targets": [checkout_target]}
+                store.publish(key, manifest)
+            else:
+                self.log.info(f"✅ Using installed {name} at {commit[:12]} in {root}")
+                store.add_alias(key, checkout_target)
+                self._working_copy = StagedRepository(source=self.source, path=root)
+                self._set_environment(root)
+
     def setup(self, target_dir: Path | None = None) -> None:
         """Retrieve and configure this codebase in a single call"""
         self.get(target_dir)
@@ -131,6 +131,28 @@ ENV_FF_ENABLE_LOCAL_PROXY: t.Annotated[
 """Enable experimental support for asynchronous status updates in the local launcher."""
 
 
+ENV_FF_ORCH_STATE_JOURNAL: t.Annotated[
+    t.Literal["CSTAR_FF_ORCH_STATE_JOURNAL"],
+    EnvVar(
+        "Enable persisting run state transitions to an append-only journal.",
+        GROUP_FF,
+        default=FLAG_OFF,
+    ),
+] = "CSTAR_FF_ORCH_STATE_JOURNAL"
+"""Enable persisting run state transitions to an append-only journal."""
+
+
+ENV_FF_ORCH_RUN_CATALOG: t.Annotated[
+    t.Literal["CSTAR_FF_ORCH_RUN_CATALOG"],
+    EnvVar(
+        "Enable indexing run history and run state in a SQLite catalog.",
+        GROUP_FF,
+        default=FLAG_OFF,
+    ),
+] = "CSTAR_FF_ORCH_RUN_CATALOG"
+"""Enable indexing run history and run state in a SQLite catalog."""
+
+
 def is_flag_enabled(flag: str) -> bool:
     """Determine if a boolean environment varible is enabled.
 
@@ -1,12 +1,29 @@
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+import typing as t
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
-from cstar.base.log import get_logger
+from cstar.base.env import (
+    ENV_CSTAR_GIT_REF_CACHE_PERSIST,
+    ENV_CSTAR_GIT_REF_TTL_SECONDS,
+    FLAG_ON,
+    get_env_item,
+)
+from cstar.base.log import LoggingMixin, get_logger
 from cstar.base.utils import _run_cmd
+from cstar.execution.file_system import DirectoryManager
 
 log = get_logger(__name__)
 
+_FULL_HASH: t.Final[re.Pattern[str]] = re.compile(r"[0-9a-f]{40}")
+"""Matches a full (40 character) git commit hash."""
+
 
 def _clone(source_repo: str, local_path: str | Path) -> None:
     """Clone `source_repo` to `local_path`.
@@ -83,6 +100,93 @@ def _clone_and_checkout(
     _checkout(source_repo, local_path, checkout_target)
 
 
+def _clone_mirror(source_repo: str, local_path: str | Path) -> None:
+    """Create a bare mirror of `source_repo` at `local_path`.
+
+    Parameters
+    ----------
+    source_repo : str
+        The URI identifying the source git repository.
+    local_path : str
+        The path to a local directory where the mirror should be created.
+    """
+    _run_cmd(
+        f"git clone --mirror {source_repo} {local_path}",
+        msg_pre=f"Mirroring `{source_repo}`",
+        msg_post=f"Mirrored {source_repo} to {local_path}",
+        msg_err=f"Error when mirroring repository {source_repo} to {local_path}",
+        raise_on_error=True,
+    )
+
+
+def _fetch_mirror(local_path: str | Path) -> None:
+    """Update all refs of the bare mirror found at `local_path`.
+
+    Parameters
+    ----------
+    local_path : str
+        The path to a local directory containing a mirrored repository.
+    """
+    _run_cmd(
+        f"git -C {local_path} fetch --prune origin",
+        msg_pre=f"Fetching latest to mirror `{local_path}`",
+        msg_post=f"Fetched latest to mirror {local_path}",
+        msg_err=f"Error when fetching latest changes to mirror {local_path}",
+        raise_on_error=True,
+    )
+
+
+def _has_commit(local_path: str | Path, commit: str) -> bool:
+    """Return `True` if the repository at `local_path` contains `commit`.
+
+    Parameters
+    ----------
+    local_path : str
+        The path to a local directory containing a repository or mirror.
+    commit : str
+        A git commit identifier.
+    """
+    try:
+        _run_cmd(
+            f"git -C {local_path} cat-file -e {commit}^{{commit}}",
+            raise_on_error=True,
+        )
+    except RuntimeError:
+        return False
+    return True
+
+
+def _clone_local(
+    mirror_path: str | Path, source_repo: str, local_path: str | Path
+) -> None:
+    """Clone the mirror at `mirror_path` to `local_path` without copying objects.
+
+    The objects of the mirror are hardlinked (or copied, if the clone is on
+    another file system), so the clone remains usable if the mirror is removed.
+    Its `origin` remote is pointed at `source_repo`.
+
+    Parameters
+    ----------
+    mirror_path : str
+        The path to a local directory containing a mirrored repository.
+    source_repo : str
+        The URI identifying the source git repository.
+    local_path : str
+        The path to a local directory where the repository should be cloned.
+    """
+    _run_cmd(
+        f"git clone --local {mirror_path} {local_path}",
+        msg_pre=f"Cloning `{source_repo}` from mirror `{mirror_path}`",
+        msg_post=f"Cloned {source_repo} to {local_path}",
+        msg_err=f"Error when cloning mirror {mirror_path} to {local_path}",
+        raise_on_error=True,
+    )
+    _run_cmd(
+        f"git -C {local_path} remote set-url origin {source_repo}",
+        raise_on_error=True,
+    )
+
+
 def _check_local_repo_changed_from_remote(
     remote_repo: str, local_repo: str | Path, checkout_target: str
 ) -> bool:
@@ -172,6 +276,43 @@ def _get_repo_head_hash(local_path: str | Path) -> str:
     )
 
 
+def _get_clean_head_hash(local_path: str | Path) -> str | None:
+    """Return the commit hash of HEAD if the work tree matches it.
+
+    Parameters
+    ----------
+    local_path : str or Path
+        The path to a local directory where a git repository is cloned.
+
+    Returns
+    -------
+    str or None
+        The commit hash of HEAD, or `None` if the directory is not a git
+        repository, the commit cannot be retrieved, or tracked files have
+        uncommitted changes.
+    """
+    local_path = Path(local_path)
+    if not (local_path / ".git").exists():
+        return None
+
+    try:
+        head_hash = _run_cmd(
+            cmd="git rev-parse HEAD", cwd=local_path, raise_on_error=True
+        )
+        # unlike `git diff-index`, `git status` refreshes the index so that
+        # changes to file metadata alone (e.g. permissions) are not reported
+        changes = _run_cmd(
+            cmd="git status --porcelain --untracked-files=no",
+            cwd=local_path,
+            raise_on_error=True,
+        )
+    except RuntimeError:
+        log.debug("Unable to retrieve the commit hash of %s", local_path)
+        return None
+
+    return None if changes.strip() else head_hash
+
+
 def _describe_nearest_tag(local_path: str | Path, ref: str) -> tuple[str, int] | None:
     """Resolve `ref` to its nearest ancestor release tag in a local repository.
 
@@ -209,6 +350,203 @@ def _describe_nearest_tag(local_path: str | Path, ref: str) -> tuple[str, int] |
     return match.group("tag"), int(match.group("ahead") or 0)
 
 
+class RefCache(LoggingMixin):
+    """A cache of the refs advertised by remote repositories.
+
+    All refs of a repository are retrieved with a single `git ls-remote` and
+    re-used until `CSTAR_GIT_REF_TTL_SECONDS` have elapsed, so resolving several
+    branches or tags of the same repository costs one network round-trip.
+    Commit hashes that have been verified against a repository never change
+    meaning and are remembered indefinitely.
+
+    If `CSTAR_GIT_REF_CACHE_PERSIST` is set, the cache is also written to the
+    C-Star cache home and shared with other processes.
+    """
+
+    root: Path
+    """The directory containing the persisted cache of each repository."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        root : Path
+            The directory containing the persisted cache of each repository.
+        """
+        self.root = root
+        self._refs: dict[str, tuple[dict[str, str], float]] = {}
+        self._commits: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        """The time (in seconds) branches and tags are cached."""
+        return float(get_env_item(ENV_CSTAR_GIT_REF_TTL_SECONDS).value or 0)
+
+    @property
+    def persist(self) -> bool:
+        """Whether the cache is shared with other processes."""
+        return get_env_item(ENV_CSTAR_GIT_REF_CACHE_PERSIST).value == FLAG_ON
+
+    def _path(self, repo_url: str) -> Path:
+        """Return the path of the persisted cache of a repository."""
+        return self.root / f"{hashlib.sha256(repo_url.encode()).hexdigest()}.json"
+
+    def _load(self, repo_url: str) -> None:
+        """Merge the persisted cache of a repository into the in-process cache."""
+        if not self.persist:
+            return
+
+        try:
+            data = json.loads(self._path(repo_url).read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("url") != repo_url:
+            return
+
+        with self._lock:
+            self._commits.setdefault(repo_url, set()).update(data.get("commits", []))
+            refs, fetched_at = data.get("refs", {}), data.get("fetched_at", 0.0)
+            if fetched_at > self._refs.get(repo_url, ({}, 0.0))[1]:
+                self._refs[repo_url] = (refs, fetched_at)
+
+    def _save(self, repo_url: str) -> None:
+        """Atomically persist the cache of a repository."""
+        if not self.persist:
+            return
+
+        with self._lock:
+            refs, fetched_at = self._refs.get(repo_url, ({}, 0.0))
+            data = {
+                "url": repo_url,
+                "fetched_at": fetched_at,
+                "refs": refs,
+                "commits": sorted(self._commits.get(repo_url, ())),
+            }
+
+        path = self._path(repo_url)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data))
+            tmp_path.replace(path)
+        except OSError:
+            self.log.debug(f"Unable to persist git refs of {repo_url}")
+
+    def _fresh_refs(self, repo_url: str) -> dict[str, str] | None:
+        """Return the cached refs of a repository if they have not expired."""
+        with self._lock:
+            cached = self._refs.get(repo_url)
+        if cached and time.time() - cached[1] < self.ttl:
+            return cached[0]
+        return None
+
+    def refs(self, repo_url: str) -> dict[str, str]:
+        """Return the refs advertised by a remote repository.
+
+        Parameters
+        ----------
+        repo_url : str
+            URL pointing to a git-controlled repository.
+
+        Returns
+        -------
+        dict[str, str]
+            A `reference: hash` dictionary.
+        """
+        if (refs := self._fresh_refs(repo_url)) is not None:
+            return refs
+
+        self._load(repo_url)
+        if (refs := self._fresh_refs(repo_url)) is not None:
+            return refs
+
+        ls_remote = _run_cmd(
+            f"git ls-remote {repo_url}",
+            msg_pre=f"Retrieving remote refs for repository `{repo_url}`.",
+            msg_post=f"Retrieved remote refs for repository `{repo_url}`.",
+            msg_err=f"Error retrieving remote refs for repository {repo_url}.",
+        )
+
+        # Process the output into a `reference: hash` dictionary
+        refs = {
+            ref: has for has, ref in (line.split() for line in ls_remote.splitlines())
+        }
+
+        # an unreachable repository is not cached
+        if refs:
+            with self._lock:
+                self._refs[repo_url] = (refs, time.time())
+            self._save(repo_url)
+        return refs
+
+    def is_known_commit(self, repo_url: str, commit_hash: str) -> bool:
+        """Return `True` if a commit hash was previously verified for a repository.
+
+        Parameters
+        ----------
+        repo_url : str
+            URL pointing to a git-controlled repository.
+        commit_hash : str
+            A full commit hash.
+
+        Returns
+        -------
+        bool
+        """
+        with self._lock:
+            if commit_hash in self._commits.get(repo_url, ()):
+                return True
+
+        self._load(repo_url)
+        with self._lock:
+            return commit_hash in self._commits.get(repo_url, ())
+
+    def add_known_commit(self, repo_url: str, commit_hash: str) -> None:
+        """Record that a full commit hash is valid for a repository.
+
+        Parameters
+        ----------
+        repo_url : str
+            URL pointing to a git-controlled repository.
+        commit_hash : str
+            A full commit hash.
+        """
+        if not _FULL_HASH.fullmatch(commit_hash):
+            return
+
+        with self._lock:
+            self._commits.setdefault(repo_url, set()).add(commit_hash)
+        self._save(repo_url)
+
+
+@lru_cache
+def _get_ref_cache(root: Path) -> RefCache:
+    """Return the ref cache persisted to a directory.
+
+    Parameters
+    ----------
+    root : Path
+        The directory containing the persisted cache of each repository.
+
+    Returns
+    -------
+    RefCache
+    """
+    return RefCache(root)
+
+
+def get_ref_cache() -> RefCache:
+    """Return the ref cache of the C-Star cache home.
+
+    Returns
+    -------
+    RefCache
+    """
+    return _get_ref_cache(DirectoryManager.cache_home() / "git-refs")
+
+
 def _get_hash_from_checkout_target(repo_url: str, checkout_target: str) -> str:
     """Take a git checkout target (any `arg` accepted by `git checkout arg`) and return
     a commit hash.
@@ -216,6 +554,7 @@ def _get_hash_from_checkout_target(repo_url: str, checkout_target: str) -> str:
     This method parses the output of `git ls-remote {repo_url}` to create a dictionary
     of refs and hashes, returning the hash corresponding to `checkout_target` or
     raising an error listing available branches and tags if the target is not found.
+    The refs of each repository are cached by the `RefCache`.
 
     Parameters:
     -----------
@@ -229,27 +568,25 @@ def _get_hash_from_checkout_target(repo_url: str, checkout_target: str) -> str:
     git_hash: str
         A git commit hash associated with the checkout target
     """
-    # Get list of targets from git ls-remote
-    ls_remote = _run_cmd(
-        f"git ls-remote {repo_url}",
-        msg_pre=f"Retrieving remote refs for repository `{repo_url}`.",
-        msg_post=f"Retrieved remote refs for repository `{repo_url}`.",
-        msg_err=f"Error retrieving remote refs for repository {repo_url}.",
-    )
+    ref_cache = get_ref_cache()
+
+    # A verified commit hash always refers to the same commit
+    if ref_cache.is_known_commit(repo_url, checkout_target):
+        return checkout_target
 
-    # Process the output into a `reference: hash` dictionary
-    ref_dict = {
-        ref: has for has, ref in (line.split() for line in ls_remote.splitlines())
-    }
+    # Get a `reference: hash` dictionary of targets from git ls-remote
+    ref_dict = ref_cache.refs(repo_url)
 
     # If the checkout target is a valid hash, return it
     if checkout_target in ref_dict.values():
+        ref_cache.add_known_commit(repo_url, checkout_target)
         return checkout_target
 
     # Otherwise, see if it is listed as a branch or tag
     alt_refs = {f"refs/heads/{checkout_target}", f"refs/tags/{checkout_target}"}
     for ref, has in ref_dict.items():
         if ref in alt_refs:
+            ref_cache.add_known_commit(repo_url, has)
             return has
 
     # Lastly, if NOTA worked, see if the checkout target is a 7 or 40 digit hexadecimal string
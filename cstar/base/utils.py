@@ -67,12 +67,8 @@ def _get_sha256_hash(file_path: str | Path) -> str:
             f"Error when calculating file hash: {file_path} is not a valid file"
         )
 
-    sha256_hash = hashlib.sha256()
     with file_path.open("rb") as file:
-        for chunk in iter(lambda: file.read(4096), b""):
-            sha256_hash.update(chunk)
-
-    file_hash = sha256_hash.hexdigest()
+        file_hash = hashlib.file_digest(file, "sha256").hexdigest()
     return file_hash
 
 
@@ -24,6 +24,7 @@ from cstar.cli.common import (
 from cstar.cli.workplan.shared import colored, list_runs
 from cstar.entrypoint.utils import ARG_DRY_RUN
 from cstar.execution.file_system import DirectoryManager, StateDirectoryManager
+from cstar.orchestration.ledger import SubmissionLedger
 from cstar.orchestration.orchestration import LiveWorkplan
 from cstar.orchestration.serialization import deserialize
 from cstar.orchestration.tracking import TrackingRepository
@@ -417,13 +418,17 @@ def get_run_actions(run_id: str) -> list[CleanupAction]:
         for step in workplan.steps:
             cache_key = f"{run_id}_{step.name}_{fn_name}"
             cache_paths.append(storage_root / cache_key)
-    else:
+    elif storage_root.exists():
         cache_paths.extend(
             p
             for p in storage_root.iterdir()
             if p.is_dir() and p.name.startswith(run_id)
         )
 
+    # submissions recorded by the native orchestration engine
+    if (ledger_dir := SubmissionLedger(run_id).root_dir).exists():
+        cache_paths.append(ledger_dir)
+
     if run_paths := run_repo.list_runtracking_paths(run_id, all_history=True):
         runstate_paths.extend(run_paths)
 
@@ -67,10 +67,10 @@ def create_host_workplan(
     return wp_path
 
 
-def _run(wp_path: Path, working_dir: Path, run_id: str) -> None:
+def _run(wp_path: Path, run_id: str) -> None:
     """Execute the DAG synchronously."""
     try:
-        asyncio.run(build_and_run_dag(wp_path, run_id, working_dir))
+        asyncio.run(build_and_run_dag(wp_path, run_id))
         print(f"Completed execution of composed workplan: {wp_path}.")
     except Exception as ex:
         print(
@@ -138,7 +138,7 @@ def compose(
         raise ValueError("Workplan path is malformed.")
 
     if execute:
-        _run(wp_path, working_path, run_id)
+        _run(wp_path, run_id)
 
     return wp_path
 
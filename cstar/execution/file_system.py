@@ -381,6 +381,9 @@ class StateDirectoryManager:
     _RUN_TRACKING_NAME: t.ClassVar[t.Literal["run_tracking"]] = "run_tracking"
     """The name of the directory where run-tracking files are written."""
 
+    _CATALOG_NAME: t.ClassVar[t.Literal["catalog.sqlite3"]] = "catalog.sqlite3"
+    """The name of the database file indexing run-tracking and run-state files."""
+
     @classmethod
     def root_dir(cls) -> Path:
         """The root directory containing all job outputs.
@@ -418,6 +421,18 @@ class StateDirectoryManager:
         root = cls.root_dir()
         return root / cls._RUN_TRACKING_NAME
 
+    @classmethod
+    def catalog_path(cls) -> Path:
+        """The path to the database indexing run-tracking and run-state files.
+
+        The result is a _non-run-specific_ file.
+
+        Returns
+        -------
+        Path
+        """
+        return cls.root_dir() / cls._CATALOG_NAME
+
     @classmethod
     def data_dir(cls, run_id: str | None = None) -> Path:
         """The directory for data files used by a run.
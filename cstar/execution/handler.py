@@ -1,14 +1,155 @@
 import asyncio
+import ctypes
+import os
+import sys
 import time
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from pathlib import Path
-from typing import TextIO
-
+from types import TracebackType
+from typing import Self, TextIO
+
+from cstar.base.env import (
+    ENV_CSTAR_STATUS_POLL_MAX_SECONDS,
+    ENV_CSTAR_STATUS_POLL_MIN_SECONDS,
+    get_env_item,
+)
 from cstar.base.log import LoggingMixin
 
 STATUS_RECHECK_SECONDS = 30
 
+TAIL_MIN_DELAY_SECONDS = 0.05
+"""The initial wait (in seconds) for new output after reaching the end of a log."""
+TAIL_MAX_DELAY_SECONDS = 1.0
+"""The longest wait (in seconds) for new output before re-reading a log.
+
+Bounds the wait even when inotify is used, because writes made by other hosts
+to a shared file system do not generate inotify events.
+"""
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+
+
+def _inotify_watch(path: Path) -> int | None:
+    """Open an inotify descriptor reporting writes to a file.
+
+    Parameters
+    ----------
+    path : Path
+        The file to watch.
+
+    Returns
+    -------
+    int | None
+        A non-blocking inotify file descriptor, or `None` if inotify is unavailable.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    except (AttributeError, OSError):
+        return None
+    if fd < 0:
+        return None
+
+    if libc.inotify_add_watch(fd, os.fsencode(path), _IN_MODIFY | _IN_CLOSE_WRITE) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class _LogWatcher:
+    """Wait for a log file to be written to.
+
+    Uses inotify where it is available and falls back to sleeping otherwise. In
+    both cases the wait grows from `TAIL_MIN_DELAY_SECONDS` to
+    `TAIL_MAX_DELAY_SECONDS` while no output arrives.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the watcher.
+
+        Parameters
+        ----------
+        path : Path
+            The log file to watch.
+        """
+        self._fd = _inotify_watch(path)
+        self._delay = TAIL_MIN_DELAY_SECONDS
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def reset(self) -> None:
+        """Restart the backoff after new output has been read."""
+        self._delay = TAIL_MIN_DELAY_SECONDS
+
+    def _drain(self) -> None:
+        """Discard pending inotify events."""
+        try:
+            while self._fd is not None and os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    async def wait(self, timeout: float) -> None:
+        """Wait until the file is written to, the backoff delay elapses, or
+        `timeout` seconds have passed, whichever comes first.
+
+        Parameters
+        ----------
+        timeout : float
+            The longest time (in seconds) to wait.
+        """
+        delay = max(0.0, min(self._delay, timeout))
+        self._delay = min(self._delay * 2, TAIL_MAX_DELAY_SECONDS)
+
+        if self._fd is None:
+            await asyncio.sleep(delay)
+            return
+
+        loop = asyncio.get_running_loop()
+        written: asyncio.Future[None] = loop.create_future()
+
+        def on_readable() -> None:
+            if not written.done():
+                written.set_result(None)
+
+        try:
+            loop.add_reader(self._fd, on_readable)
+        except NotImplementedError:
+            # event loops without `add_reader` support cannot watch descriptors
+            self.close()
+            await asyncio.sleep(delay)
+            return
+
+        try:
+            await asyncio.wait_for(written, delay)
+        except TimeoutError:
+            pass
+        finally:
+            loop.remove_reader(self._fd)
+            self._drain()
+
 
 class ExecutionStatus(Enum):
     """Enum representing possible states of a process to be executed.
@@ -88,6 +229,12 @@ class ExecutionHandler(ABC, LoggingMixin):
     """
     _enabled: bool = True
     """Flag used to disable processing update requests after the task has terminated."""
+    _last_status: ExecutionStatus | None = None
+    """The status returned by the most recent status query."""
+    _next_status_query: float = 0.0
+    """The monotonic time after which the status is queried again."""
+    _status_interval: float = 0.0
+    """The current interval (in seconds) between status queries."""
 
     @property
     @abstractmethod
@@ -127,25 +274,73 @@ class ExecutionHandler(ABC, LoggingMixin):
         msg = "This job is still pending. Updates will be available after it starts running."
         self.log.info(msg)
 
+    def _status_poll_bounds(self) -> tuple[float, float]:
+        """Return the minimum and maximum interval (in seconds) between status
+        queries made while streaming updates.
+
+        Returns
+        -------
+        tuple[float, float]
+        """
+        return (
+            float(get_env_item(ENV_CSTAR_STATUS_POLL_MIN_SECONDS).value),
+            float(get_env_item(ENV_CSTAR_STATUS_POLL_MAX_SECONDS).value),
+        )
+
+    def _polled_status(self) -> ExecutionStatus:
+        """Return the task status, querying it only when the polling interval has
+        elapsed.
+
+        The interval doubles each time a query returns an unchanged status and is
+        reset to its minimum when the status changes. A terminal status is never
+        queried again.
+
+        Returns
+        -------
+        ExecutionStatus
+        """
+        last = self._last_status
+        now = time.monotonic()
+        if last is not None and (
+            ExecutionStatus.is_terminal(last) or now < self._next_status_query
+        ):
+            return last
+
+        status = self.status
+        min_interval, max_interval = self._status_poll_bounds()
+        if status == last:
+            self._status_interval = min(self._status_interval * 2, max_interval)
+        else:
+            self._status_interval = min_interval
+
+        self._last_status = status
+        self._next_status_query = now + self._status_interval
+        return status
+
     async def on_running(self, seconds: float) -> None:
-        """Forward logs from the process until time budget elapses."""
+        """Forward logs from the process until time budget elapses.
+
+        New output is awaited with a `_LogWatcher`, independently of the status
+        queries, which follow the backoff schedule of `_polled_status`.
+        """
         try:
-            with open(self.output_file) as f:
+            with open(self.output_file) as f, _LogWatcher(self.output_file) as watcher:
                 f.seek(self._log_position)
-                start_time = time.time()
-                while seconds == 0 or (time.time() - start_time < seconds):
-                    line = f.readline()
-                    self._log_position = f.tell()
-
-                    if line:
-                        self.log.info(line.rstrip())
-                        continue
-
-                    if ExecutionStatus.is_terminal(self.status):
+                deadline = None if seconds == 0 else time.monotonic() + seconds
+                while deadline is None or time.monotonic() < deadline:
+                    if self._forward_available(f):
+                        watcher.reset()
+
+                    if ExecutionStatus.is_terminal(self._polled_status()):
+                        # forward anything written before the task ended
+                        self._forward_available(f)
                         break
 
-                    # reached EOF; wait before checking for updates
-                    await asyncio.sleep(0.1)
+                    # reached EOF; wait for output or the next status query
+                    timeout = self._next_status_query - time.monotonic()
+                    if deadline is not None:
+                        timeout = min(timeout, deadline - time.monotonic())
+                    await watcher.wait(timeout)
         except KeyboardInterrupt:
             self.log.info("Live status updates stopped by user.")
 
@@ -184,11 +379,15 @@ class ExecutionHandler(ABC, LoggingMixin):
           new lines appended during the specified duration.
         - When streaming indefinitely (`seconds=0`), user confirmation is
           required before proceeding.
+        - The status of the task is queried at most once per polling interval
+          (see `CSTAR_STATUS_POLL_MIN_SECONDS` and `CSTAR_STATUS_POLL_MAX_SECONDS`),
+          so an ended task may be reported on a later call.
         """
         if not self._enabled:
             return
 
-        match (ExecutionStatus.is_terminal(self.status), self.output_file.exists()):
+        is_terminal = ExecutionStatus.is_terminal(self._polled_status())
+        match (is_terminal, self.output_file.exists()):
             case [False, False]:
                 # ready state - process is running but hasn't produced output, yet.
                 await self.on_ready()
@@ -205,7 +404,7 @@ class ExecutionHandler(ABC, LoggingMixin):
                 await self.on_exceptional_shutdown()
                 self._enabled = False
 
-    def _forward_available(self, file_handle: TextIO) -> None:
+    def _forward_available(self, file_handle: TextIO) -> bool:
         """Forward all currently-available lines from ``file_handle`` to the log.
 
         Reads from the handle's current position to end-of-file, logging each line,
@@ -217,10 +416,18 @@ class ExecutionHandler(ABC, LoggingMixin):
         file_handle : TextIO
             An open text handle for the task's output file, positioned at the point
             from which to begin reading.
+
+        Returns
+        -------
+        bool
+            `True` if any lines were forwarded.
         """
+        forwarded = False
         while True:
             line = file_handle.readline()
             if not line:
                 break
             self.log.info(line.rstrip())
+            forwarded = True
         self._log_position = file_handle.tell()
+        return forwarded
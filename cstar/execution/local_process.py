@@ -4,6 +4,9 @@ from pathlib import Path
 
 from cstar.execution.handler import ExecutionHandler, ExecutionStatus
 
+LOCAL_STATUS_POLL_SECONDS = 0.1
+"""The interval (in seconds) between status queries of a local process."""
+
 
 class LocalProcess(ExecutionHandler):
     """Execution handler for managing and monitoring local subprocesses.
@@ -145,6 +148,18 @@ class LocalProcess(ExecutionHandler):
             case _:
                 return ExecutionStatus.FAILED
 
+    def _status_poll_bounds(self) -> tuple[float, float]:
+        """Poll the status of a local process at a fixed, short interval.
+
+        Querying a local process is a non-blocking `waitpid` call, so there is no
+        need to back off.
+
+        Returns
+        -------
+        tuple[float, float]
+        """
+        return (LOCAL_STATUS_POLL_SECONDS, LOCAL_STATUS_POLL_SECONDS)
+
     def _drop_process(self) -> None:
         """Un-sets private attributes associated with a completed subprocess.
 
@@ -1,8 +1,11 @@
 import asyncio
 import enum
+import functools
 import json
 import os
 import re
+import threading
+import time
 import typing as t
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -13,6 +16,11 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field, PrivateAttr
 
+from cstar.base.env import (
+    ENV_CSTAR_SLURM_STATUS_TTL,
+    ENV_CSTAR_SLURM_VISIBILITY_TIMEOUT,
+    get_env_item,
+)
 from cstar.base.feature import (
     ENV_FF_SLURM_DISABLE_MT,
     is_feature_enabled,
@@ -41,6 +49,23 @@ sacct_status_map = defaultdict(
         "FAILED": ExecutionStatus.FAILED,
         "TIMEOUT": ExecutionStatus.TIMEOUT,
         "OUT_OF_MEMORY": ExecutionStatus.FAILED,
+        "BOOT_FAIL": ExecutionStatus.FAILED,
+        "NODE_FAIL": ExecutionStatus.FAILED,
+        "PREEMPTED": ExecutionStatus.FAILED,
+        "DEADLINE": ExecutionStatus.TIMEOUT,
+        "REVOKED": ExecutionStatus.CANCELLED,
+        "REQUEUED": ExecutionStatus.PENDING,
+        "REQUEUE_FED": ExecutionStatus.PENDING,
+        "REQUEUE_HOLD": ExecutionStatus.HELD,
+        "RESV_DEL_HOLD": ExecutionStatus.HELD,
+        "SUSPENDED": ExecutionStatus.HELD,
+        "STOPPED": ExecutionStatus.HELD,
+        "CONFIGURING": ExecutionStatus.RUNNING,
+        "RESIZING": ExecutionStatus.RUNNING,
+        "SIGNALING": ExecutionStatus.RUNNING,
+        "STAGE_OUT": ExecutionStatus.RUNNING,
+        "COMPLETING": ExecutionStatus.ENDING,
+        "SPECIAL_EXIT": ExecutionStatus.FAILED,
     },
 )
 """Map sacct states to ExecutionStatus enum."""
@@ -182,19 +207,29 @@ class SlurmBatch:
     _job: SlurmStep | None = None
     """The parent step for the batch."""
 
-    def __init__(self, steps: Iterable[SlurmStep]) -> None:
+    _default_status: ExecutionStatus = ExecutionStatus.UNSUBMITTED
+    """The status reported when the batch has no parent step."""
+
+    def __init__(
+        self,
+        steps: Iterable[SlurmStep],
+        default_status: ExecutionStatus = ExecutionStatus.UNSUBMITTED,
+    ) -> None:
         """Initialize the instance.
 
         Parameters
         ----------
         steps: Iterable[SlurmStep]
             The steps belonging to the batch.
+        default_status: ExecutionStatus
+            The status reported if no steps are found for the batch.
         """
         job_ids = {x.job_id for x in steps}
         if len(job_ids) > 1:
             raise ValueError("Attempted to create batch from multiple batches")
 
         self._job = None
+        self._default_status = default_status
         self.steps = []
 
         if all_steps := list(steps):
@@ -210,7 +245,7 @@ class SlurmBatch:
         """Return the status of the parent job."""
         if self._job is not None:
             return self._job.status
-        return ExecutionStatus.UNSUBMITTED
+        return self._default_status
 
     @property
     def job_id(self) -> str | None:
@@ -344,6 +379,271 @@ async def get_slurm_batches(
     return SlurmBatch.from_multi_query(all_steps)
 
 
+class SlurmStatusService:
+    """Process-wide, rate-limited source of SLURM batch status.
+
+    Every job ID requested through the service is tracked until it reaches a
+    terminal state. When a requested status is missing or older than the TTL,
+    all outstanding job IDs are refreshed together with a single `sacct` query,
+    so polling many in-flight jobs costs one subprocess per interval instead of
+    one per job.
+
+    A newly submitted job may not be visible to `sacct` until the accounting
+    database catches up. Jobs registered with `register_submission` are reported
+    as pending, and re-queried quickly, until they become visible or the
+    visibility timeout elapses.
+    """
+
+    MAX_IDS_PER_QUERY: t.ClassVar[int] = 500
+    """The maximum number of job IDs passed to a single `sacct` invocation."""
+
+    VISIBILITY_RETRY: t.ClassVar[float] = 1.0
+    """The maximum age (in seconds) of the status of a submitted job that is not yet
+    visible to `sacct`."""
+
+    ttl: float
+    """The maximum age (in seconds) of a non-terminal status before it is refreshed."""
+
+    visibility_timeout: float
+    """The time (in seconds) a submitted job that is not visible to `sacct` is
+    reported as pending."""
+
+    num_queries: int
+    """The number of `sacct` invocations performed by the service."""
+
+    def __init__(
+        self, ttl: float | None = None, visibility_timeout: float | None = None
+    ) -> None:
+        """Initialize the service.
+
+        Parameters
+        ----------
+        ttl : float | None
+            The maximum age of a cached, non-terminal status. Defaults to the
+            value of `CSTAR_SLURM_STATUS_TTL`.
+        visibility_timeout : float | None
+            The time a submitted job that is not visible to `sacct` is reported
+            as pending. Defaults to the value of `CSTAR_SLURM_VISIBILITY_TIMEOUT`.
+        """
+        if ttl is None:
+            ttl = float(get_env_item(ENV_CSTAR_SLURM_STATUS_TTL).value)
+        if visibility_timeout is None:
+            visibility_timeout = float(
+                get_env_item(ENV_CSTAR_SLURM_VISIBILITY_TIMEOUT).value
+            )
+
+        self.ttl = ttl
+        self.visibility_timeout = visibility_timeout
+        self.num_queries = 0
+
+        self._batches: dict[str, SlurmBatch] = {}
+        self._refreshed_at: dict[str, float] = {}
+        self._tracked: set[str] = set()
+        self._submitted_at: dict[str, float] = {}
+        self._track_lock = threading.Lock()
+        self._query_lock = threading.Lock()
+
+    @staticmethod
+    def _batch_id(job_id: str | int) -> str:
+        """Return the batch job ID for a job or step ID."""
+        return str(job_id).split(".")[0]
+
+    def track(self, job_ids: Iterable[str | int]) -> None:
+        """Add job IDs to the set refreshed by the next `sacct` query.
+
+        Parameters
+        ----------
+        job_ids : Iterable[str | int]
+            The job IDs to track.
+        """
+        with self._track_lock:
+            self._tracked.update(self._batch_id(x) for x in job_ids)
+
+    def invalidate(self, job_ids: Iterable[str | int] | None = None) -> None:
+        """Discard cached status so the next request triggers a refresh.
+
+        Parameters
+        ----------
+        job_ids : Iterable[str | int] | None
+            The job IDs to invalidate. Invalidates all cached status if `None`.
+        """
+        with self._query_lock:
+            if job_ids is None:
+                self._batches.clear()
+                self._refreshed_at.clear()
+                return
+
+            invalidated = [self._batch_id(x) for x in job_ids]
+            for job_id in invalidated:
+                self._batches.pop(job_id, None)
+                self._refreshed_at.pop(job_id, None)
+
+        self.track(invalidated)
+
+    def register_submission(self, job_ids: Iterable[str | int]) -> None:
+        """Record newly submitted jobs so they are reported as pending until they
+        are visible to `sacct`.
+
+        Parameters
+        ----------
+        job_ids : Iterable[str | int]
+            The IDs of the submitted jobs.
+        """
+        submitted = [self._batch_id(x) for x in job_ids]
+        now = time.monotonic()
+        with self._query_lock:
+            for job_id in submitted:
+                self._submitted_at[job_id] = now
+                self._batches[job_id] = SlurmBatch([], ExecutionStatus.PENDING)
+                self._refreshed_at[job_id] = now
+
+        self.track(submitted)
+
+    def _is_terminal(self, job_id: str) -> bool:
+        """Return `True` if the cached status for a job is terminal."""
+        batch = self._batches.get(job_id)
+        return batch is not None and ExecutionStatus.is_terminal(batch.status)
+
+    def _is_fresh(self, job_id: str, now: float) -> bool:
+        """Return `True` if the cached status for a job can be served."""
+        if job_id not in self._batches:
+            return False
+
+        if self._is_terminal(job_id):
+            return True
+
+        max_age = self.ttl
+        if job_id in self._submitted_at:
+            max_age = min(max_age, self.VISIBILITY_RETRY)
+
+        return now - self._refreshed_at[job_id] < max_age
+
+    def _unseen_batch(self, job_id: str, now: float) -> SlurmBatch:
+        """Return the batch reported for a job that `sacct` did not return."""
+        submitted_at = self._submitted_at.get(job_id)
+        if submitted_at is not None and now - submitted_at < self.visibility_timeout:
+            return SlurmBatch([], ExecutionStatus.PENDING)
+
+        # a job that was never submitted, or never became visible, is unsubmitted
+        self._submitted_at.pop(job_id, None)
+        return SlurmBatch([])
+
+    @staticmethod
+    def _checked_batch(batch: SlurmBatch) -> SlurmBatch:
+        """Return the batch, or an unknown batch if its state cannot be mapped.
+
+        Replacing a batch reporting an unmapped `sacct` state keeps the error
+        from surfacing in every status request served from the cache.
+        """
+        try:
+            _ = batch.status
+        except ValueError:
+            return SlurmBatch([], ExecutionStatus.UNKNOWN)
+        return batch
+
+    def _refresh(self, now: float) -> None:
+        """Query `sacct` for every outstanding job ID and update the cache."""
+        with self._track_lock:
+            outstanding = sorted(x for x in self._tracked if not self._is_terminal(x))
+
+        for i in range(0, len(outstanding), self.MAX_IDS_PER_QUERY):
+            chunk = outstanding[i : i + self.MAX_IDS_PER_QUERY]
+            steps = get_slurm_steps_sync(",".join(chunk))
+            self.num_queries += 1
+
+            found = SlurmBatch.from_multi_query(steps)
+            for job_id in chunk:
+                if job_id in found:
+                    self._batches[job_id] = self._checked_batch(found[job_id])
+                    self._submitted_at.pop(job_id, None)
+                else:
+                    self._batches[job_id] = self._unseen_batch(job_id, now)
+                self._refreshed_at[job_id] = now
+
+        with self._track_lock:
+            self._tracked.difference_update(
+                x for x in outstanding if self._is_terminal(x)
+            )
+
+    def get_batches_sync(self, job_ids: Iterable[str | int]) -> dict[str, SlurmBatch]:
+        """Retrieve batch metadata, refreshing outstanding jobs if needed.
+
+        Parameters
+        ----------
+        job_ids : Iterable[str | int]
+            The job IDs to retrieve.
+
+        Returns
+        -------
+        dict[str, SlurmBatch]
+            A mapping of job-id to SlurmBatch for the supplied job ID's
+        """
+        requested = {self._batch_id(x) for x in job_ids}
+        if not requested:
+            return {}
+
+        # track before waiting on the query lock so concurrent requests are
+        # coalesced into the query performed by the current lock holder.
+        self.track(requested)
+
+        with self._query_lock:
+            now = time.monotonic()
+            if not all(self._is_fresh(x, now) for x in requested):
+                self._refresh(now)
+
+            return {x: self._batches[x] for x in requested}
+
+    def get_batch_sync(self, job_id: str | int) -> SlurmBatch:
+        """Retrieve batch metadata for a single job.
+
+        Parameters
+        ----------
+        job_id : str | int
+
+        Returns
+        -------
+        SlurmBatch
+        """
+        job_id = self._batch_id(job_id)
+        return self.get_batches_sync([job_id])[job_id]
+
+    async def get_batches(
+        self, job_ids: Iterable[str | int]
+    ) -> Mapping[str, SlurmBatch]:
+        """Retrieve batch metadata, refreshing outstanding jobs if needed.
+
+        Parameters
+        ----------
+        job_ids : Iterable[str | int]
+            The job IDs to retrieve.
+
+        Returns
+        -------
+        Mapping[str, SlurmBatch]
+            A mapping of job-id to SlurmBatch for the supplied job ID's
+        """
+        return await asyncio.to_thread(self.get_batches_sync, list(job_ids))
+
+    async def get_batch(self, job_id: str | int) -> SlurmBatch:
+        """Retrieve batch metadata for a single job.
+
+        Parameters
+        ----------
+        job_id : str | int
+
+        Returns
+        -------
+        SlurmBatch
+        """
+        return await asyncio.to_thread(self.get_batch_sync, job_id)
+
+
+@functools.lru_cache
+def get_slurm_status_service() -> SlurmStatusService:
+    """Return the process-wide SLURM status service."""
+    return SlurmStatusService()
+
+
 def create_scheduler_job(
     commands: str,
     account_key: str,
@@ -935,7 +1235,7 @@ class SlurmJob(SchedulerJob):
         if self._batch is None or not ExecutionStatus.is_terminal(
             self._batch.status,
         ):
-            self._batch = get_slurm_batch_sync(self.id)
+            self._batch = get_slurm_status_service().get_batch_sync(self.id)
         return self._batch
 
     @property
@@ -1033,6 +1333,7 @@ class SlurmJob(SchedulerJob):
         matches = re.search(r"Submitted batch job (\d+)", stdout)
         if matches:
             self._id = int(matches.group(1))
+            get_slurm_status_service().register_submission([self._id])
             return self._id
         else:
             raise RuntimeError(f"Failed to parse job ID from sbatch output: {stdout}")
@@ -1061,6 +1362,7 @@ class SlurmJob(SchedulerJob):
             msg_post=f"Job {self.id} cancelled",
             msg_err="Non-zero exit code when cancelling job.",
         )
+        get_slurm_status_service().invalidate([self.id])
 
 
 class PBSJob(SchedulerJob):
@@ -0,0 +1,172 @@
+"""A persistent cache of remote data source classifications.
+
+Classifying a remote location may require a `git ls-remote`, an HTTP `HEAD`
+request and a partial download of the file. The `ClassificationCache` records
+the classification of each remote location for a limited time so blueprints
+loaded repeatedly, by any process on the host, do not repeat those requests.
+"""
+
+import sqlite3
+import threading
+import time
+import typing as t
+from functools import lru_cache
+from pathlib import Path
+
+from cstar.base.cache import connect_database
+from cstar.base.env import ENV_CSTAR_CLASSIFICATION_TTL_HOURS, get_env_item
+from cstar.base.log import LoggingMixin
+from cstar.execution.file_system import DirectoryManager
+from cstar.io.constants import SourceClassification
+
+_CACHE_NAME: t.Final[str] = "classifications.sqlite3"
+"""The file name of the classification cache in the C-Star cache home."""
+
+_SCHEMA: t.Final[str] = """
+CREATE TABLE IF NOT EXISTS classifications (
+    location TEXT PRIMARY KEY,
+    classification TEXT NOT NULL,
+    classified_at REAL NOT NULL
+);
+"""
+"""Statements creating the classification table."""
+
+
+def classification_ttl() -> float:
+    """Return the time (in seconds) a cached classification remains valid.
+
+    Returns
+    -------
+    float
+        The value of `CSTAR_CLASSIFICATION_TTL_HOURS`, in seconds.
+    """
+    hours = get_env_item(ENV_CSTAR_CLASSIFICATION_TTL_HOURS).value
+    return float(hours or 0) * 60 * 60
+
+
+class ClassificationCache(LoggingMixin):
+    """A cache of source classifications backed by SQLite.
+
+    Classifications are also memoized in-process. The cache is shared by all
+    processes using the same C-Star cache home; if the database cannot be used,
+    only the in-process memo is consulted.
+    """
+
+    path: Path
+    """The path to the database file."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the database file.
+        """
+        self.path = path
+        self._memo: dict[str, tuple[SourceClassification, float]] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> t.ContextManager[sqlite3.Connection]:
+        """Open a connection to the cache, creating the schema if necessary.
+
+        Returns
+        -------
+        t.ContextManager[sqlite3.Connection]
+        """
+        return connect_database(self.path, _SCHEMA)
+
+    def get(self, location: str) -> SourceClassification | None:
+        """Retrieve the cached classification of a location.
+
+        Parameters
+        ----------
+        location : str
+            The location of the data source.
+
+        Returns
+        -------
+        SourceClassification | None
+            The cached classification, or `None` if the location is unknown, the
+            entry has expired, or the cache is disabled.
+        """
+        ttl = classification_ttl()
+        if ttl <= 0:
+            return None
+        not_before = time.time() - ttl
+
+        with self._lock:
+            memo = self._memo.get(location)
+        if memo and memo[1] >= not_before:
+            return memo[0]
+
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT classification, classified_at FROM classifications "
+                    "WHERE location = ? AND classified_at >= ?",
+                    (location, not_before),
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            self.log.debug(f"Unable to read classification cache: {self.path}")
+            return None
+
+        if row is None or row[0] not in SourceClassification.__members__:
+            return None
+
+        classification = SourceClassification[row[0]]
+        with self._lock:
+            self._memo[location] = (classification, row[1])
+        return classification
+
+    def put(self, location: str, classification: SourceClassification) -> None:
+        """Record the classification of a location.
+
+        Parameters
+        ----------
+        location : str
+            The location of the data source.
+        classification : SourceClassification
+            The classification of the data source.
+        """
+        if classification_ttl() <= 0:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._memo[location] = (classification, now)
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO classifications VALUES (?, ?, ?)",
+                    (location, classification.name, now),
+                )
+        except (sqlite3.Error, OSError):
+            self.log.debug(f"Unable to update classification cache: {self.path}")
+
+
+@lru_cache
+def _get_classification_cache(path: Path) -> ClassificationCache:
+    """Return the classification cache stored at a path.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the database file.
+
+    Returns
+    -------
+    ClassificationCache
+    """
+    return ClassificationCache(path)
+
+
+def get_classification_cache() -> ClassificationCache:
+    """Return the classification cache of the C-Star cache home.
+
+    Returns
+    -------
+    ClassificationCache
+    """
+    return _get_classification_cache(DirectoryManager.cache_home() / _CACHE_NAME)
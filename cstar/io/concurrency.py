@@ -0,0 +1,139 @@
+"""Bounded-concurrency execution of independent staging operations.
+
+Staging a simulation copies, downloads and hashes many independent files. The
+helpers in this module run those operations on a thread pool whose size is
+configured with `CSTAR_STAGING_WORKERS`, while `CSTAR_STAGING_HOST_WORKERS`
+limits the number of simultaneous requests made to any single remote host.
+"""
+
+import threading
+import typing as t
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from cstar.base.env import (
+    ENV_CSTAR_STAGING_HOST_WORKERS,
+    ENV_CSTAR_STAGING_WORKERS,
+    get_env_item,
+)
+from cstar.base.exceptions import CstarError
+from cstar.base.log import get_logger
+
+log = get_logger(__name__)
+
+_T = t.TypeVar("_T")
+
+
+class StagingTask(t.NamedTuple, t.Generic[_T]):
+    """An independent unit of staging work."""
+
+    name: str
+    """A description of the work used when reporting failures."""
+    fn: Callable[[], _T]
+    """The function performing the work."""
+
+
+class StagingError(CstarError):
+    """Exception raised when more than one concurrent staging task fails."""
+
+    failures: list[tuple[str, BaseException]]
+    """The name and exception of each failed task, in submission order."""
+
+    def __init__(self, failures: list[tuple[str, BaseException]]) -> None:
+        """Initialize StagingError with the failures of each task."""
+        self.failures = failures
+        details = "\n".join(f"  - {name}: {ex!r}" for name, ex in failures)
+        super().__init__(f"{len(failures)} staging operations failed:\n{details}")
+
+
+def staging_workers() -> int:
+    """Return the maximum number of staging tasks to run concurrently.
+
+    Returns
+    -------
+    int
+    """
+    return max(1, int(get_env_item(ENV_CSTAR_STAGING_WORKERS).value or 1))
+
+
+@lru_cache
+def _host_semaphore(host: str, limit: int) -> threading.BoundedSemaphore:
+    """Return the process-wide semaphore limiting requests to a host."""
+    return threading.BoundedSemaphore(limit)
+
+
+@contextmanager
+def host_slot(location: str) -> Iterator[None]:
+    """Hold one of the limited request slots for the host of a location.
+
+    Local paths are not limited.
+
+    Parameters
+    ----------
+    location : str
+        The location of the data to be retrieved.
+
+    Returns
+    -------
+    Iterator[None]
+    """
+    host = urlparse(location).netloc
+    if not host:
+        yield
+        return
+
+    limit = max(1, int(get_env_item(ENV_CSTAR_STAGING_HOST_WORKERS).value or 1))
+    with _host_semaphore(host, limit):
+        yield
+
+
+def run_concurrently(
+    tasks: Sequence[StagingTask[_T]],
+    max_workers: int | None = None,
+) -> list[_T]:
+    """Run independent staging tasks on a bounded thread pool.
+
+    Every task is run to completion, even if another task fails, so the set of
+    reported failures does not depend on scheduling.
+
+    Parameters
+    ----------
+    tasks : Sequence[StagingTask[_T]]
+        The tasks to run.
+    max_workers : int | None
+        The maximum number of concurrent tasks. Defaults to the value of
+        `CSTAR_STAGING_WORKERS`.
+
+    Returns
+    -------
+    list[_T]
+        The result of each task, in submission order.
+
+    Raises
+    ------
+    StagingError
+        If more than one task fails. A single failure is re-raised unchanged.
+    """
+    workers = min(max_workers or staging_workers(), len(tasks))
+
+    if workers <= 1:
+        return [task.fn() for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(task.fn) for task in tasks]
+
+    failures = [
+        (task.name, ex)
+        for task, future in zip(tasks, futures)
+        if (ex := future.exception()) is not None
+    ]
+    if len(failures) == 1:
+        raise failures[0][1]
+    if failures:
+        log.error(f"{len(failures)} of {len(tasks)} staging operations failed")
+        raise StagingError(failures) from failures[0][1]
+
+    return [future.result() for future in futures]
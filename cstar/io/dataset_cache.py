@@ -0,0 +1,226 @@
+"""A host-wide, content-addressed cache of downloaded datasets.
+
+Every step of a workplan and every member of an ensemble stages its own copy of
+the same grid and forcing files. The `DatasetCache` stores each downloaded file
+once, keyed by its expected checksum (or by its URL and HTTP validators when no
+checksum is known), and materializes it into staging directories by hardlink
+or reflink so repeated staging costs neither bandwidth nor disk space.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import time
+import typing as t
+from pathlib import Path
+
+import requests
+
+from cstar.base.cache import DirectoryCache
+from cstar.base.env import (
+    ENV_CSTAR_DATASET_CACHE_MAX_AGE_DAYS,
+    ENV_CSTAR_DATASET_CACHE_MAX_MB,
+    get_env_item,
+)
+from cstar.execution.file_system import DirectoryManager
+from cstar.io.download import get_session
+
+if t.TYPE_CHECKING:
+    from cstar.io.source_data import SourceData
+
+_DATA_NAME: t.Final[str] = "data"
+"""The file name of the cached dataset within a cache entry."""
+
+_META_NAME: t.Final[str] = "meta.json"
+"""The file name of the metadata stored with each cached dataset."""
+
+_FICLONE: t.Final[int] = 0x40049409
+"""The Linux `ioctl` request that clones (reflinks) a file."""
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Create a copy-on-write clone of a file.
+
+    Parameters
+    ----------
+    src : Path
+        The file to clone.
+    dst : Path
+        The path of the clone.
+
+    Raises
+    ------
+    OSError
+        If the file system does not support reflinks.
+    """
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            dst.unlink(missing_ok=True)
+            raise
+
+
+def materialize(src: Path, dst: Path) -> None:
+    """Make a file available at a new path without duplicating it if possible.
+
+    A hardlink is preferred, then a reflink, then a full copy.
+
+    Parameters
+    ----------
+    src : Path
+        The existing file.
+    dst : Path
+        The path at which the file is made available.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    try:
+        _reflink(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class DatasetCache(DirectoryCache):
+    """A size- and age-bounded, least-recently-used cache of datasets.
+
+    Each entry is a directory named with the cache key. Concurrent downloads of
+    the same key, from any process on the host, are serialized by a per-key
+    file lock, so only the first download reaches the remote server.
+    """
+
+    description: t.ClassVar[str] = "datasets"
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int | None = None,
+        max_age: float | None = None,
+    ) -> None:
+        """Initialize the dataset cache.
+
+        Parameters
+        ----------
+        root : Path | None
+            The directory containing cache entries. Defaults to a directory in
+            the C-Star cache home.
+        max_bytes : int | None
+            The maximum combined size of all cache entries. Defaults to the value
+            of `CSTAR_DATASET_CACHE_MAX_MB`.
+        max_age : float | None
+            The maximum time (in seconds) an unused entry is retained. Defaults to
+            the value of `CSTAR_DATASET_CACHE_MAX_AGE_DAYS`.
+        """
+        if max_bytes is None:
+            max_mb = float(get_env_item(ENV_CSTAR_DATASET_CACHE_MAX_MB).value or 0)
+            max_bytes = int(max_mb * 1024 * 1024)
+
+        if max_age is None:
+            max_days = get_env_item(ENV_CSTAR_DATASET_CACHE_MAX_AGE_DAYS).value
+            max_age = float(max_days or 0) * 24 * 60 * 60
+
+        super().__init__(
+            root or DirectoryManager.cache_home() / "datasets", max_bytes, max_age
+        )
+
+    def key_for(self, source: "SourceData") -> str | None:
+        """Compute the cache key of a remote dataset.
+
+        The expected checksum of the dataset is used when it is known. Otherwise,
+        the key is derived from the URL and the `ETag` and `Last-Modified`
+        headers returned by the server.
+
+        Parameters
+        ----------
+        source : SourceData
+            The source of the dataset.
+
+        Returns
+        -------
+        str | None
+            The cache key, or `None` if the dataset cannot be identified.
+        """
+        if source.file_hash:
+            return f"sha256-{source.file_hash.lower()}"
+
+        try:
+            response = get_session().head(
+                source.location, allow_redirects=True, timeout=10
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            self.log.debug(f"Unable to identify {source.location} for caching")
+            return None
+
+        validators = [response.headers.get(h, "") for h in ("ETag", "Last-Modified")]
+        if not any(validators):
+            return None
+
+        content = "\n".join([source.location, *validators])
+        return f"url-{hashlib.sha256(content.encode()).hexdigest()}"
+
+    def fetch(self, key: str, target: Path) -> Path | None:
+        """Materialize a cached dataset at a target path.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the dataset.
+        target : Path
+            The path to materialize the dataset to.
+
+        Returns
+        -------
+        Path | None
+            The materialized path, or `None` if the key is not cached.
+        """
+        entry = self._entry_dir(key)
+        cached = entry / _DATA_NAME
+
+        if not self.enabled or not cached.exists():
+            return None
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        materialize(cached, target)
+
+        self._touch(key)
+        self.log.info(f"Using cached dataset for {target.name}")
+        return target
+
+    def store(self, key: str, path: Path, location: str) -> None:
+        """Add a dataset to the cache and evict old entries if necessary.
+
+        The entry is published atomically; concurrent readers never observe a
+        partially written dataset.
+
+        Parameters
+        ----------
+        key : str
+            The cache key of the dataset.
+        path : Path
+            The path to the downloaded dataset.
+        location : str
+            The location the dataset was downloaded from.
+        """
+        if not self.enabled or not path.is_file():
+            return
+
+        staging = self._stage(key)
+
+        cached = staging / _DATA_NAME
+        materialize(path, cached)
+        # hardlinks share permissions; prevent in-place edits of the cached file
+        cached.chmod(0o444)
+
+        meta = {"location": location, "created_at": time.time()}
+        (staging / _META_NAME).write_text(json.dumps(meta))
+
+        self.log.debug(f"Cached dataset {path.name} as {key[:19]}")
+        self._publish(key, staging)
@@ -0,0 +1,397 @@
+"""Resumable, multi-connection HTTP downloads.
+
+Large remote datasets are downloaded to a `.part` file next to the target. When
+the server supports range requests, the file is split into segments that are
+fetched concurrently over a pooled `requests.Session`; the progress of each
+segment is checkpointed so that an interrupted download resumes where it
+stopped rather than from the first byte. Servers without range support are
+downloaded with a single stream.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import typing as t
+from collections.abc import Callable
+from functools import lru_cache, partial
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cstar.base.env import (
+    ENV_CSTAR_DOWNLOAD_RETRIES,
+    ENV_CSTAR_DOWNLOAD_SEGMENT_MIN_MB,
+    ENV_CSTAR_DOWNLOAD_SEGMENTS,
+    get_env_item,
+)
+from cstar.base.log import LoggingMixin
+from cstar.base.utils import _get_sha256_hash
+from cstar.io.concurrency import StagingError, StagingTask, run_concurrently
+
+_CHUNK_SIZE: t.Final[int] = 1024 * 1024
+"""The number of bytes read from a response at a time.
+
+A chunk interrupted by a dropped connection is discarded and downloaded again.
+"""
+
+_CHECKPOINT_CHUNKS: t.Final[int] = 16
+"""The number of chunks written by a segment between progress checkpoints."""
+
+_TIMEOUT: t.Final[float] = 60.0
+"""The timeout (in seconds) for connecting to, and reading from, a server."""
+
+_RETRY_DELAY: t.Final[float] = 1.0
+"""The delay (in seconds) before the first retry of an interrupted download."""
+
+
+@lru_cache
+def get_session() -> requests.Session:
+    """Return the HTTP session shared by all downloads.
+
+    The session pools connections so segments and consecutive downloads from
+    the same host re-use established connections.
+
+    Returns
+    -------
+    requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class RemoteFileInfo(t.NamedTuple):
+    """Metadata about a remote file used to plan its download."""
+
+    size: int | None
+    """The size of the file in bytes, if reported by the server."""
+    accepts_ranges: bool
+    """Whether the server supports byte-range requests."""
+    validator: str
+    """The `ETag` or `Last-Modified` header identifying the version of the file."""
+
+
+class RangeNotSatisfied(requests.RequestException):
+    """Raised when a server ignores a byte-range request."""
+
+
+class Download(LoggingMixin):
+    """Download a remote file, resuming after interruptions.
+
+    Attributes
+    ----------
+    url : str
+        The location of the remote file.
+    target : Path
+        The path the file is saved to.
+    """
+
+    url: str
+    target: Path
+
+    def __init__(
+        self,
+        url: str,
+        target: Path,
+        *,
+        segments: int | None = None,
+        min_segment_bytes: int | None = None,
+        retries: int | None = None,
+    ) -> None:
+        """Initialize the download.
+
+        Parameters
+        ----------
+        url : str
+            The location of the remote file.
+        target : Path
+            The path the file is saved to.
+        segments : int | None
+            The maximum number of concurrent connections. Defaults to the value
+            of `CSTAR_DOWNLOAD_SEGMENTS`.
+        min_segment_bytes : int | None
+            The minimum size of each segment. Defaults to the value of
+            `CSTAR_DOWNLOAD_SEGMENT_MIN_MB`.
+        retries : int | None
+            The number of times an interrupted transfer is resumed. Defaults to
+            the value of `CSTAR_DOWNLOAD_RETRIES`.
+        """
+        self.url = url
+        self.target = target
+
+        if segments is None:
+            segments = int(get_env_item(ENV_CSTAR_DOWNLOAD_SEGMENTS).value or 1)
+        self._segments = max(1, segments)
+
+        if min_segment_bytes is None:
+            min_mb = float(get_env_item(ENV_CSTAR_DOWNLOAD_SEGMENT_MIN_MB).value or 1)
+            min_segment_bytes = int(min_mb * 1024 * 1024)
+        self._min_segment_bytes = max(1, min_segment_bytes)
+
+        if retries is None:
+            retries = int(get_env_item(ENV_CSTAR_DOWNLOAD_RETRIES).value or 0)
+        self._retries = max(0, retries)
+
+        self._lock = threading.Lock()
+        self._progress: list[list[int]] = []
+
+    @property
+    def part_path(self) -> Path:
+        """The path of the incomplete download."""
+        return self.target.with_name(f"{self.target.name}.part")
+
+    @property
+    def state_path(self) -> Path:
+        """The path of the progress checkpoint of the incomplete download."""
+        return self.target.with_name(f"{self.target.name}.part.json")
+
+    def probe(self) -> RemoteFileInfo:
+        """Request the metadata of the remote file.
+
+        Returns
+        -------
+        RemoteFileInfo
+            The file metadata. Range support is reported as unavailable if the
+            server does not answer the request.
+        """
+        try:
+            response = get_session().head(
+                self.url, allow_redirects=True, timeout=_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.RequestException:
+            return RemoteFileInfo(None, False, "")
+
+        headers = response.headers
+        length = headers.get("Content-Length", "")
+        return RemoteFileInfo(
+            size=int(length) if length.isdigit() else None,
+            accepts_ranges=headers.get("Accept-Ranges", "").lower() == "bytes",
+            validator=headers.get("ETag", "") or headers.get("Last-Modified", ""),
+        )
+
+    def run(self) -> str:
+        """Download the file.
+
+        Returns
+        -------
+        str
+            The SHA-256 checksum of the downloaded file.
+        """
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        info = self.probe()
+
+        digest = None
+        if info.accepts_ranges and info.size:
+            try:
+                digest = self._download_ranges(info)
+            except RangeNotSatisfied:
+                self.log.debug(f"Server ignored range request for {self.url}")
+
+        if digest is None:
+            digest = self._download_stream()
+
+        self.state_path.unlink(missing_ok=True)
+        self.part_path.replace(self.target)
+        return digest
+
+    def _retry(self, fn: Callable[[], None]) -> None:
+        """Call a function, retrying with exponential backoff on request errors.
+
+        Parameters
+        ----------
+        fn : Callable[[], None]
+            The function to call.
+        """
+        for attempt in range(self._retries + 1):
+            try:
+                fn()
+                return
+            except RangeNotSatisfied:
+                raise
+            except requests.RequestException:
+                if attempt == self._retries:
+                    raise
+                delay = _RETRY_DELAY * 2**attempt
+                msg = f"Download of {self.url} interrupted. Resuming in {delay}s."
+                self.log.warning(msg)
+                time.sleep(delay)
+
+    def _download_stream(self) -> str:
+        """Download the file with a single request.
+
+        Returns
+        -------
+        str
+            The SHA-256 checksum of the downloaded file.
+        """
+        digest = ""
+
+        def _transfer() -> None:
+            nonlocal digest
+            hash_obj = hashlib.sha256()
+
+            with (
+                get_session().get(
+                    self.url, stream=True, allow_redirects=True, timeout=_TIMEOUT
+                ) as r,
+                self.part_path.open("wb") as fp,
+            ):
+                r.raise_for_status()
+                for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
+                    if chunk:
+                        fp.write(chunk)
+                        hash_obj.update(chunk)
+
+            digest = hash_obj.hexdigest()
+
+        self._retry(_transfer)
+        return digest
+
+    def _plan_segments(self, info: RemoteFileInfo) -> list[list[int]]:
+        """Split the file into segments, resuming a previous attempt if possible.
+
+        Parameters
+        ----------
+        info : RemoteFileInfo
+            The metadata of the remote file.
+
+        Returns
+        -------
+        list[list[int]]
+            The `[start, end, completed]` byte counts of each segment, where
+            `end` is exclusive.
+        """
+        size = t.cast("int", info.size)
+
+        if self.part_path.exists() and self.state_path.exists():
+            try:
+                state = json.loads(self.state_path.read_text())
+            except ValueError:
+                state = {}
+
+            if (
+                state.get("url") == self.url
+                and state.get("size") == size
+                and state.get("validator") == info.validator
+                and self.part_path.stat().st_size == size
+            ):
+                done = sum(s[2] for s in state["segments"])
+                self.log.info(f"Resuming download of {self.url} ({done}/{size} bytes)")
+                return state["segments"]
+
+        count = min(self._segments, max(1, size // self._min_segment_bytes))
+        bounds = [size * i // count for i in range(count + 1)]
+
+        with self.part_path.open("wb") as fp:
+            fp.truncate(size)
+
+        return [[bounds[i], bounds[i + 1], 0] for i in range(count)]
+
+    def _checkpoint(self, info: RemoteFileInfo) -> None:
+        """Atomically persist the progress of each segment.
+
+        Parameters
+        ----------
+        info : RemoteFileInfo
+            The metadata of the remote file.
+        """
+        with self._lock:
+            state = {
+                "url": self.url,
+                "size": info.size,
+                "validator": info.validator,
+                "segments": self._progress,
+            }
+            tmp_path = self.state_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(state))
+            tmp_path.replace(self.state_path)
+
+    def _transfer_segment(
+        self, fd: int, segment: list[int], info: RemoteFileInfo
+    ) -> None:
+        """Download the remaining bytes of a segment.
+
+        Parameters
+        ----------
+        fd : int
+            The descriptor of the `.part` file, opened for writing.
+        segment : list[int]
+            The `[start, end, completed]` byte counts of the segment.
+        info : RemoteFileInfo
+            The metadata of the remote file.
+        """
+        start, end, _ = segment
+        if start + segment[2] >= end:
+            return
+
+        # byte offsets refer to the unencoded content
+        headers = {
+            "Range": f"bytes={start + segment[2]}-{end - 1}",
+            "Accept-Encoding": "identity",
+        }
+        with get_session().get(
+            self.url, headers=headers, stream=True, timeout=_TIMEOUT
+        ) as r:
+            r.raise_for_status()
+            if r.status_code != requests.codes.partial_content:
+                raise RangeNotSatisfied(self.url)
+
+            for i, chunk in enumerate(r.iter_content(chunk_size=_CHUNK_SIZE)):
+                chunk = chunk[: end - start - segment[2]]
+                os.pwrite(fd, chunk, start + segment[2])
+                with self._lock:
+                    segment[2] += len(chunk)
+                if i % _CHECKPOINT_CHUNKS == _CHECKPOINT_CHUNKS - 1:
+                    self._checkpoint(info)
+
+        if start + segment[2] < end:
+            msg = f"Connection closed before the end of the range for {self.url}"
+            raise requests.ConnectionError(msg)
+
+    def _download_ranges(self, info: RemoteFileInfo) -> str:
+        """Download the file as concurrent byte-range segments.
+
+        Parameters
+        ----------
+        info : RemoteFileInfo
+            The metadata of the remote file.
+
+        Returns
+        -------
+        str
+            The SHA-256 checksum of the downloaded file.
+
+        Raises
+        ------
+        RangeNotSatisfied
+            If the server does not honor range requests.
+        """
+        self._progress = self._plan_segments(info)
+        self._checkpoint(info)
+
+        fd = os.open(self.part_path, os.O_WRONLY)
+        tasks = [
+            StagingTask(
+                f"{self.url} [{s[0]}-{s[1]}]",
+                partial(self._retry, partial(self._transfer_segment, fd, s, info)),
+            )
+            for s in self._progress
+        ]
+        try:
+            run_concurrently(tasks, max_workers=len(tasks))
+        except StagingError as ex:
+            if all(isinstance(e, RangeNotSatisfied) for _, e in ex.failures):
+                raise RangeNotSatisfied(self.url) from ex
+            raise
+        finally:
+            os.close(fd)
+            self._checkpoint(info)
+
+        # segments are written out of order; hash the assembled file
+        return _get_sha256_hash(self.part_path)
@@ -0,0 +1,208 @@
+"""A persistent index of file checksums keyed by file-system metadata.
+
+Verifying a staged file requires the SHA-256 checksum of its content, which is
+expensive for multi-GB datasets. The `FingerprintIndex` records the checksum
+of a file along with its device, inode, size and modification time so the
+checksum is only recomputed after the file changes.
+"""
+
+import os
+import sqlite3
+import threading
+import typing as t
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+
+from cstar.base.cache import connect_database
+from cstar.base.log import LoggingMixin
+from cstar.base.utils import _get_sha256_hash
+from cstar.execution.file_system import DirectoryManager
+
+_INDEX_NAME: t.Final[str] = "fingerprints.sqlite3"
+"""The file name of the fingerprint index in the C-Star cache home."""
+
+_SCHEMA: t.Final[str] = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (device, inode)
+);
+"""
+"""Statements creating the fingerprint table."""
+
+
+class Fingerprint(t.NamedTuple):
+    """File-system metadata identifying a specific version of a file."""
+
+    device: int
+    """The device containing the file."""
+    inode: int
+    """The inode of the file."""
+    size: int
+    """The size of the file in bytes."""
+    mtime_ns: int
+    """The modification time of the file in nanoseconds."""
+
+    @classmethod
+    def of(cls, path: Path) -> "Fingerprint":
+        """Create the fingerprint of a file.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the file. Symbolic links are followed.
+
+        Returns
+        -------
+        Fingerprint
+        """
+        st = os.stat(path)
+        return cls(st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class FingerprintIndex(LoggingMixin):
+    """A cache of file checksums backed by SQLite.
+
+    Checksums are also memoized in-process. The index is shared by all
+    processes using the same C-Star cache home; if the database cannot be
+    used, checksums are computed without being persisted.
+    """
+
+    path: Path
+    """The path to the database file."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the index.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the database file.
+        """
+        self.path = path
+        self._memo: dict[Fingerprint, str] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> t.ContextManager[sqlite3.Connection]:
+        """Open a connection to the index, creating the schema if necessary.
+
+        Returns
+        -------
+        t.ContextManager[sqlite3.Connection]
+        """
+        return connect_database(self.path, _SCHEMA)
+
+    def get(self, fingerprint: Fingerprint) -> str | None:
+        """Retrieve the checksum recorded for a fingerprint.
+
+        Parameters
+        ----------
+        fingerprint : Fingerprint
+            The fingerprint of the file.
+
+        Returns
+        -------
+        str | None
+            The recorded checksum, or `None` if the file is unknown or changed.
+        """
+        with self._lock:
+            if digest := self._memo.get(fingerprint):
+                return digest
+
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT sha256 FROM fingerprints "
+                    "WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?",
+                    fingerprint,
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            self.log.debug(f"Unable to read fingerprint index: {self.path}")
+            return None
+
+        if row is None:
+            return None
+
+        with self._lock:
+            self._memo[fingerprint] = row[0]
+        return row[0]
+
+    def put(self, fingerprint: Fingerprint, digest: str) -> None:
+        """Record the checksum of a file.
+
+        Parameters
+        ----------
+        fingerprint : Fingerprint
+            The fingerprint of the file.
+        digest : str
+            The SHA-256 checksum of the file content.
+        """
+        with self._lock:
+            self._memo[fingerprint] = digest
+
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)",
+                    (*fingerprint, digest),
+                )
+        except (sqlite3.Error, OSError):
+            self.log.debug(f"Unable to update fingerprint index: {self.path}")
+
+    def sha256(
+        self,
+        path: Path,
+        hash_fn: Callable[[Path], str] = _get_sha256_hash,
+    ) -> str:
+        """Return the checksum of a file, computing it only if the file changed.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the file.
+        hash_fn : Callable[[Path], str]
+            The function used to compute a checksum that is not in the index.
+
+        Returns
+        -------
+        str
+        """
+        fingerprint = Fingerprint.of(path)
+        if digest := self.get(fingerprint):
+            return digest
+
+        digest = hash_fn(path)
+        # only record the checksum if the file did not change while hashing
+        if Fingerprint.of(path) == fingerprint:
+            self.put(fingerprint, digest)
+        return digest
+
+
+@lru_cache
+def _get_fingerprint_index(path: Path) -> FingerprintIndex:
+    """Return the fingerprint index stored at a path.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the database file.
+
+    Returns
+    -------
+    FingerprintIndex
+    """
+    return FingerprintIndex(path)
+
+
+def get_fingerprint_index() -> FingerprintIndex:
+    """Return the fingerprint index of the C-Star cache home.
+
+    Returns
+    -------
+    FingerprintIndex
+    """
+    return _get_fingerprint_index(DirectoryManager.cache_home() / _INDEX_NAME)
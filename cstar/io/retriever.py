@@ -1,4 +1,3 @@
-import hashlib
 import shutil
 import time
 from abc import ABC, abstractmethod
@@ -11,6 +10,8 @@ from cstar.base.exceptions import CstarError
 from cstar.base.gitutils import _checkout, _clone, _pull
 from cstar.base.log import LoggingMixin
 from cstar.io.constants import SourceClassification
+from cstar.io.download import Download
+from cstar.io.fingerprint import Fingerprint, get_fingerprint_index
 
 if TYPE_CHECKING:
     from cstar.io.source_data import SourceData
@@ -134,6 +135,9 @@ class RemoteBinaryFileRetriever(RemoteFileRetriever):
     def _save(self, target_dir: Path) -> Path:
         """Saves this remote file's contents to `target_dir`.
 
+        Files are downloaded with `cstar.io.download.Download`, which resumes
+        interrupted transfers and uses concurrent range requests when supported.
+
         If the file's SourceData specifies a checksum as its `identifier`,
         the downloaded file is validated using this checksum, and deleted
         if there is no match.
@@ -154,21 +158,14 @@ class RemoteBinaryFileRetriever(RemoteFileRetriever):
             if the checksum of the downloaded file does not match what is
             specified in its SourceData.
         """
-        hash_obj = hashlib.sha256()
         target_dir.mkdir(parents=True, exist_ok=True)
         target_path = target_dir / self.source.basename
 
-        with requests.get(self.source.location, stream=True, allow_redirects=True) as r:
-            r.raise_for_status()
-            with open(target_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):  # Download in 8kB chunks
-                    if chunk:
-                        f.write(chunk)
-                        hash_obj.update(chunk)
+        # large files are downloaded in concurrent, resumable segments
+        actual_hash = Download(self.source.location, target_path).run()
 
         # Hash verification if specified in "SourceData":
         if self.source.identifier:
-            actual_hash = hash_obj.hexdigest()
             expected_hash = self.source.identifier.lower()
 
             if actual_hash != expected_hash:
@@ -178,6 +175,9 @@ class RemoteBinaryFileRetriever(RemoteFileRetriever):
                     f"Expected: {expected_hash}\nActual:   {actual_hash}.\n"
                     f"File deleted for safety."
                 )
+
+        # record the checksum so verifying the staged file does not rehash it
+        get_fingerprint_index().put(Fingerprint.of(target_path), actual_hash)
         return target_path
 
 
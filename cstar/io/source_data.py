@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
@@ -8,6 +8,8 @@ import requests
 
 from cstar.base.gitutils import _get_hash_from_checkout_target, git_location_to_raw
 from cstar.base.utils import _run_cmd
+from cstar.io.classification_cache import get_classification_cache
+from cstar.io.concurrency import StagingTask, host_slot, run_concurrently
 from cstar.io.constants import (
     FileEncoding,
     LocationType,
@@ -194,6 +196,42 @@ class _SourceInspector:
         return SourceClassification(self.characteristics)
 
 
+def _is_remote(location: str) -> bool:
+    """Return True if 'location' is a URL rather than a local path"""
+    urlparsed_location = urlparse(location)
+    return all([urlparsed_location.scheme, urlparsed_location.netloc])
+
+
+def classify_location(location: str | Path) -> SourceClassification:
+    """Determine the classification of the data at a location.
+
+    Classifications of remote locations are shared through the classification
+    cache, so each remote location is only inspected once per
+    `CSTAR_CLASSIFICATION_TTL_HOURS`. Local paths are always inspected.
+
+    Parameters
+    ----------
+    location (str or Path):
+        The location of the data (a local path or remote address)
+
+    Returns
+    -------
+    SourceClassification
+        The classification of the data at 'location'
+    """
+    location = str(location)
+    if not _is_remote(location):
+        return _SourceInspector(location).classify()
+
+    cache = get_classification_cache()
+    if classification := cache.get(location):
+        return classification
+
+    classification = _SourceInspector(location).classify()
+    cache.put(location, classification)
+    return classification
+
+
 class SourceData:
     """Class for obtaining information about and acting on a source of data
 
@@ -232,9 +270,7 @@ class SourceData:
         """
         self._location = str(location)
         self._identifier: str | None = identifier
-        self._classification: SourceClassification = _SourceInspector(
-            location
-        ).classify()
+        self._classification: SourceClassification | None = None
         self._stager: Stager | None = None
         self._retriever: Retriever | None = None
 
@@ -245,7 +281,13 @@ class SourceData:
 
     @property
     def classification(self) -> SourceClassification:
-        """The classification of the data source."""
+        """The classification of the data source.
+
+        The location is inspected on first access rather than on initialization,
+        so sources that are never staged or read cost no network requests.
+        """
+        if self._classification is None:
+            self._classification = classify_location(self.location)
         return self._classification
 
     @property
@@ -296,8 +338,13 @@ class SourceData:
         return self._retriever
 
     def stage(self, target_dir: str | Path) -> "StagedData":
-        """Stages the data, making it available to C-Star"""
-        return self.stager.stage(target_dir=Path(target_dir))
+        """Stages the data, making it available to C-Star
+
+        Concurrent requests to the same remote host are limited by
+        `CSTAR_STAGING_HOST_WORKERS`.
+        """
+        with host_slot(self.location):
+            return self.stager.stage(target_dir=Path(target_dir))
 
 
 class SourceDataCollection:
@@ -308,16 +355,26 @@ class SourceDataCollection:
         self._sources: list[SourceData] = list(sources)
         self._validate()
 
+    @staticmethod
+    def _check_source(source: SourceData) -> None:
+        """Confirm that a SourceData instance can belong to a collection"""
+        if source.classification.value.source_type in [
+            SourceType.DIRECTORY,
+            SourceType.REPOSITORY,
+        ]:
+            raise TypeError(
+                f"Cannot create SourceDataCollection with data of source type '{source.classification.value.source_type.value}'"
+            )
+
     def _validate(self):
-        """Confirm that the SourceData instances in this collection are valid"""
+        """Confirm that the SourceData instances in this collection are valid
+
+        Sources that are not yet classified are checked when they are staged,
+        so creating a collection does not require inspecting every location.
+        """
         for s in self._sources:
-            if s.classification.value.source_type in [
-                SourceType.DIRECTORY,
-                SourceType.REPOSITORY,
-            ]:
-                raise TypeError(
-                    f"Cannot create SourceDataCollection with data of source type '{s.classification.value.source_type.value}'"
-                )
+            if s._classification is not None:
+                self._check_source(s)
 
     def __len__(self) -> int:
         return len(self._sources)
@@ -420,9 +477,22 @@ class SourceDataCollection:
         return self._sources
 
     def stage(self, target_dir: str | Path) -> StagedDataCollection:
-        """Stages each SourceData instance in this collection"""
-        staged_data_instances = []
-        for s in self.sources:
-            staged_data = s.stage(target_dir=target_dir)
-            staged_data_instances.append(staged_data)
-        return StagedDataCollection(items=staged_data_instances)
+        """Stages each SourceData instance in this collection
+
+        Sources are staged concurrently, up to `CSTAR_STAGING_WORKERS` at a time.
+
+        Raises
+        ------
+        StagingError
+            If more than one source fails to stage.
+        """
+        tasks = [
+            StagingTask(s.location, partial(self._stage_source, s, target_dir))
+            for s in self.sources
+        ]
+        return StagedDataCollection(items=run_concurrently(tasks))
+
+    def _stage_source(self, source: SourceData, target_dir: str | Path) -> "StagedData":
+        """Validate and stage a single SourceData instance of this collection"""
+        self._check_source(source)
+        return source.stage(target_dir=target_dir)
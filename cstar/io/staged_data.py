@@ -1,11 +1,14 @@
 import os
 import shutil
 from abc import ABC, abstractmethod
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from cstar.base.gitutils import _check_local_repo_changed_from_remote
 from cstar.base.utils import _get_sha256_hash, _run_cmd
+from cstar.io.concurrency import StagingTask, run_concurrently
+from cstar.io.fingerprint import get_fingerprint_index
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
@@ -125,7 +128,8 @@ class StagedFile(StagedData):
         """True if the file has changed since staging.
 
         Checks cached checksum, filesize, and modification time against current
-        values.
+        values. Checksums are looked up in the fingerprint index and only
+        recomputed if the file has changed since it was last hashed.
         """
         resolved_path = self._path.resolve()
         if not resolved_path.exists():
@@ -140,8 +144,10 @@ class StagedFile(StagedData):
             if stat.st_size != r_stat.st_size:
                 return True
 
-        if self._sha256 and self._sha256 != _get_sha256_hash(resolved_path.resolve()):
-            return True
+        if self._sha256:
+            index = get_fingerprint_index()
+            if self._sha256 != index.sha256(resolved_path, hash_fn=_get_sha256_hash):
+                return True
 
         return False
 
@@ -200,6 +206,11 @@ class StagedRepository(StagedData):
             cmd="git rev-parse HEAD", cwd=self.path, raise_on_error=True
         )
 
+    @property
+    def checkout_hash(self) -> str:
+        """The commit hash checked out when the repository was staged."""
+        return self._checkout_hash
+
     @property
     def changed_from_source(self) -> bool:
         """Check if the current repo is dirty or differs from a given commit hash."""
@@ -226,6 +237,11 @@ class StagedRepository(StagedData):
             )
 
 
+def _changed_from_source(staged: StagedData) -> bool:
+    """Return `True` if a staged item differs from its source."""
+    return staged.changed_from_source
+
+
 class StagedDataCollection:
     """A class to hold a collection of related SourceData instances.
 
@@ -279,8 +295,16 @@ class StagedDataCollection:
 
     @property
     def changed_from_source(self) -> bool:
-        """True if any item's  StagedData.changed_from_source is True."""
-        return any(s.changed_from_source for s in self._items)
+        """True if any item's  StagedData.changed_from_source is True.
+
+        Items are checked concurrently, up to `CSTAR_STAGING_WORKERS` at a time.
+        """
+        tasks = [
+            StagingTask(s.path.as_posix(), partial(_changed_from_source, s))
+            for s in self._items
+        ]
+        changed: list[bool] = run_concurrently(tasks)
+        return any(changed)
 
     def reset(self) -> None:
         """Resets each StagedData item in the collection"""
@@ -1,13 +1,21 @@
+import os
 import shutil
 from abc import ABC
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, ClassVar, cast
 
-from cstar.base.utils import _run_cmd, slugify
+from cstar.base.cache import exclusive_lock
+from cstar.base.exceptions import CstarError
+from cstar.base.gitutils import _clone_local, _clone_mirror, _fetch_mirror, _has_commit
+from cstar.base.log import LoggingMixin
+from cstar.base.utils import slugify
 from cstar.execution.file_system import DirectoryManager
 from cstar.io.constants import SourceClassification
+from cstar.io.dataset_cache import DatasetCache
 from cstar.io.staged_data import StagedFile, StagedRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from cstar.io.retriever import RemoteRepositoryRetriever
@@ -49,7 +57,7 @@ def get_stager(source: "SourceData") -> "Stager":
     raise ValueError(f"No stager for {classification}")
 
 
-class Stager(ABC):
+class Stager(ABC, LoggingMixin):
     """Class to handle the staging of data on the local filesystem for access by C-Star.
 
     Attributes
@@ -83,6 +91,40 @@ class Stager(ABC):
 class RemoteBinaryFileStager(Stager):
     _classification = SourceClassification.REMOTE_BINARY_FILE
 
+    # Used for e.g. a remote netCDF InputDataset
+    def stage(self, target_dir: "Path") -> StagedFile:
+        """Stage a remote binary file via the host-wide dataset cache.
+
+        The file is only downloaded if it is not already cached. Cached files are
+        materialized by hardlink where possible and are read-only.
+
+        Parameters
+        ----------
+        target_dir : Path
+            The local directory in which to stage the file
+
+        Returns
+        -------
+        StagedFile
+        """
+        cache = DatasetCache()
+        if not cache.enabled or not (key := cache.key_for(self.source)):
+            # the base strategy always stages a single file
+            return cast("StagedFile", super().stage(target_dir))
+
+        target_path = target_dir / self.source.basename
+        with cache.lock(key):
+            if not cache.fetch(key, target_path):
+                target_path = self.source.retriever.save(target_dir=target_dir)
+                cache.store(key, target_path, self.source.location)
+
+        return StagedFile(
+            source=self.source,
+            path=target_path,
+            sha256=self.source.file_hash,
+            stat=None,
+        )
+
 
 @register_stager
 class RemoteTextFileStager(Stager):
@@ -141,7 +183,10 @@ class CachedRemoteRepositoryStager(Stager):
     def stage(self, target_dir: "Path") -> "StagedRepository":
         """Clone and checkout a git repository at a given target.
 
-        Store the result in a local repository cache for re-use.
+        A bare mirror of the repository is kept in the C-Star cache home and is
+        only fetched when it does not contain the requested commit. Targets are
+        cloned from the mirror with `git clone --local`, which hardlinks its
+        objects, so targets do not depend on the mirror once they are staged.
 
         Parameters
         ----------
@@ -152,30 +197,86 @@ class CachedRemoteRepositoryStager(Stager):
         -------
         StagedRepository
         """
-        cache_path = self._get_cache_path()
-        if not cache_path.exists():
-            cache_path = self.source.retriever.save(target_dir=cache_path)
-        elif not self.source.retriever.refresh(target_dir=cache_path):
-            # if cache cannot be refreshed, it may be incomplete or altered
-            shutil.rmtree(cache_path)
-            cache_path = self.source.retriever.save(target_dir=cache_path)
-
+        mirror_path = self._get_cache_path()
         if target_dir.exists():
             target_dir.rmdir()
 
-        _run_cmd(f"cp -av {cache_path}/ {target_dir}")
+        # hold the lock while cloning so the mirror is not fetched by another
+        # process at the same time
+        with self._locked(mirror_path):
+            self._update_mirror(mirror_path)
+            _clone_local(mirror_path, self.source.location, target_dir)
+
         remote = cast("RemoteRepositoryRetriever", self.source.retriever)
         remote.checkout(target_dir=target_dir)
 
         return StagedRepository(source=self.source, path=target_dir)
 
+    def _update_mirror(self, mirror_path: "Path") -> None:
+        """Create or fetch the mirror unless it contains the requested commit.
+
+        Parameters
+        ----------
+        mirror_path : Path
+            The path to the bare mirror of the repository
+
+        Raises
+        ------
+        CstarError
+            If the mirror cannot be created or fetched.
+        """
+        if mirror_path.exists():
+            checkout_hash = self.source.checkout_hash
+            if checkout_hash and _has_commit(mirror_path, checkout_hash):
+                self.log.debug(f"Mirror of {self.source.location} is up to date")
+                return
+
+            # the mirror is kept when the fetch fails so it can still serve the
+            # commits it contains
+            try:
+                _fetch_mirror(mirror_path)
+            except RuntimeError as ex:
+                msg = f"Unable to fetch mirror {mirror_path} of {self.source.location}"
+                raise CstarError(msg) from ex
+            return
+
+        # publish the mirror atomically so a failed clone leaves no partial mirror
+        tmp_path = mirror_path.with_name(f".{mirror_path.name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        try:
+            _clone_mirror(self.source.location, tmp_path)
+        except RuntimeError as ex:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            msg = f"Unable to mirror repository: {self.source.location}"
+            raise CstarError(msg) from ex
+        tmp_path.rename(mirror_path)
+
+    @contextmanager
+    def _locked(self, mirror_path: "Path") -> "Iterator[None]":
+        """Hold an exclusive lock on a mirror.
+
+        Concurrent stages of the same repository, from any process on the host,
+        are serialized while the mirror is created, fetched or cloned.
+
+        Parameters
+        ----------
+        mirror_path : Path
+            The path to the bare mirror of the repository
+
+        Returns
+        -------
+        Iterator[None]
+        """
+        with exclusive_lock(mirror_path.with_name(f"{mirror_path.name}.lock")):
+            yield
+
     def _get_cache_path(self) -> "Path":
-        """Calculate the path where the stager will cache the repository.
+        """Calculate the path where the stager will mirror the repository.
 
         Returns
         -------
         Path
         """
-        cache_dir = DirectoryManager.cache_home()
+        cache_dir = DirectoryManager.cache_home() / "git-mirrors"
         source_key = slugify(self.source.location)
-        return cache_dir / source_key
+        return cache_dir / f"{source_key}.git"
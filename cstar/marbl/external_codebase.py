@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from cstar.base.build_tools import build_jobs
 from cstar.base.external_codebase import ExternalCodeBase
 from cstar.base.gitutils import _check_local_repo_changed_from_remote
 from cstar.base.utils import _run_cmd
@@ -41,11 +42,11 @@ class MARBLExternalCodeBase(ExternalCodeBase):
         assert self.working_copy is not None  # Has been verified by `configure()``
         marbl_root = self.working_copy.path
         # Set env var:
-        cstar_sysmgr.environment.set_env_var(self.root_env_var, str(marbl_root))
+        self._set_environment(marbl_root)
 
         # Compile
         _run_cmd(
-            f"make {cstar_sysmgr.environment.compiler} USEMPI=TRUE",
+            f"make -j{build_jobs()} {cstar_sysmgr.environment.compiler} USEMPI=TRUE",
             cwd=marbl_root / "src",
             msg_pre="Compiling MARBL...",
             msg_post=f"MARBL successfully installed at {marbl_root}",
@@ -70,6 +71,10 @@ class MARBLExternalCodeBase(ExternalCodeBase):
         )
         if not marbl_root:
             return False
+        # Shared installs are described by their manifest:
+        installed = self._check_install_manifest(marbl_root)
+        if installed is not None:
+            return installed
         # Check MARBL repo hasn't changed:
         assert self.source.checkout_target is not None  # cannot be for ExternalCodeBase
         # NOTE can't use self.working_copy.changed_from_source here as ExternalCodeBase uses this property to set `working_copy`
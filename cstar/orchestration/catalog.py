@@ -0,0 +1,396 @@
+import sqlite3
+import typing as t
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from cstar.base.cache import connect_database
+from cstar.base.feature import ENV_FF_ORCH_RUN_CATALOG, is_feature_enabled
+from cstar.base.log import LoggingMixin
+from cstar.execution.file_system import StateDirectoryManager
+
+_SCHEMA: t.Final[str] = """
+CREATE TABLE IF NOT EXISTS runs (
+    history_path TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    start_at TEXT NOT NULL,
+    workplan_path TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_runs_run_id ON runs (run_id, start_at);
+
+CREATE TABLE IF NOT EXISTS latest_runs (
+    run_id TEXT PRIMARY KEY,
+    history_path TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS steps (
+    sentinel_path TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    job_id TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_steps_run_id ON steps (run_id);
+
+CREATE TABLE IF NOT EXISTS properties (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+"""Statements creating the catalog tables and indices."""
+
+_GENERATION: t.Final[str] = "generation"
+"""The property recording the generation of latest-run records that is indexed."""
+
+
+class CatalogRecord(t.NamedTuple):
+    """A serialized record retrieved from the catalog."""
+
+    path: Path
+    """The path to the file the record was indexed from."""
+    record: str
+    """The JSON-serialized record."""
+
+
+class RunCatalog(LoggingMixin):
+    """An index of run-tracking and run-state files backed by SQLite.
+
+    The catalog is a cache; the YAML files written by the `TrackingRepository`
+    and `StateRepository` remain the source of truth and the catalog can be
+    rebuilt from them at any time.
+    """
+
+    path: Path
+    """The path to the database file."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the catalog.
+
+        Parameters
+        ----------
+        path : Path | None
+            The path to the database file. Defaults to the catalog path
+            of the `StateDirectoryManager`.
+        """
+        self.path = path or StateDirectoryManager.catalog_path()
+
+    @property
+    def exists(self) -> bool:
+        """Return `True` if the database file has been created.
+
+        Returns
+        -------
+        bool
+        """
+        return self.path.exists()
+
+    def _connect(self) -> t.ContextManager[sqlite3.Connection]:
+        """Open a connection to the catalog, creating the schema if necessary.
+
+        The connection commits on success and rolls back on failure.
+
+        Returns
+        -------
+        t.ContextManager[sqlite3.Connection]
+        """
+        return connect_database(self.path, _SCHEMA)
+
+    def put_run(
+        self,
+        run_id: str,
+        start_at: datetime,
+        workplan_path: Path,
+        history_path: Path,
+        record: str,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Index a run record and mark it as the latest run for the run-id.
+
+        Parameters
+        ----------
+        run_id : str
+            The run-id of the run.
+        start_at : datetime
+            The date and time the run was triggered.
+        workplan_path : Path
+            The path to the original workplan.
+        history_path : Path
+            The path to the persisted history record.
+        record : str
+            The JSON-serialized run record.
+        generation : tuple[int, int] | None
+            The generation of the latest-run records before and after the run
+            was persisted. The catalog is only marked as up to date with the new
+            generation if it was up to date with the prior one.
+        """
+        with self._connect() as conn:
+            _insert_runs(
+                conn,
+                [(run_id, start_at, workplan_path, history_path, record)],
+                latest=True,
+            )
+            if generation is not None:
+                conn.execute(
+                    "UPDATE properties SET value = ? WHERE name = ? AND value = ?",
+                    (generation[1], _GENERATION, generation[0]),
+                )
+
+    def put_runs(
+        self,
+        runs: Iterable[tuple[str, datetime, Path, Path, str]],
+        latest: bool = True,
+    ) -> None:
+        """Index multiple run records in a single transaction.
+
+        Parameters
+        ----------
+        runs : Iterable[tuple[str, datetime, Path, Path, str]]
+            The run-id, start time, workplan path, history path, and
+            JSON-serialized record of each run.
+        latest : bool
+            If `True`, mark each run as the latest run for its run-id.
+        """
+        with self._connect() as conn:
+            _insert_runs(conn, runs, latest=latest)
+
+    def replace(
+        self,
+        runs: Iterable[tuple[str, datetime, Path, Path, str]],
+        latest: Iterable[tuple[str, Path]],
+        generation: int,
+    ) -> None:
+        """Replace all records of the catalog in a single transaction.
+
+        Concurrent readers observe either the prior or the new records.
+
+        Parameters
+        ----------
+        runs : Iterable[tuple[str, datetime, Path, Path, str]]
+            The run-id, start time, workplan path, history path, and
+            JSON-serialized record of each run.
+        latest : Iterable[tuple[str, Path]]
+            The run-id and history path of each latest run.
+        generation : int
+            The generation of the latest-run records that were indexed.
+        """
+        with self._connect() as conn:
+            _delete_all(conn)
+            _insert_runs(conn, runs, latest=False)
+            conn.executemany(
+                "INSERT OR REPLACE INTO latest_runs VALUES (?, ?)",
+                [(run_id, str(path)) for run_id, path in latest],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO properties VALUES (?, ?)",
+                (_GENERATION, generation),
+            )
+
+    def generation(self) -> int | None:
+        """Retrieve the generation of the latest-run records that is indexed.
+
+        Returns
+        -------
+        int | None
+            The generation, or `None` if the catalog has never been rebuilt.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM properties WHERE name = ?", (_GENERATION,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def latest_runs(self, run_id_filter: str) -> list[CatalogRecord]:
+        """Retrieve the latest run for all run-ids starting with a filter value.
+
+        Parameters
+        ----------
+        run_id_filter : str
+            A prefix used to filter run-ids.
+
+        Returns
+        -------
+        list[CatalogRecord]
+        """
+        query = (
+            "SELECT r.history_path, r.record FROM latest_runs l "
+            "JOIN runs r ON r.history_path = l.history_path "
+            "WHERE l.run_id GLOB ? ORDER BY l.run_id"
+        )
+        return self._select_runs(query, run_id_filter)
+
+    def history_runs(self, run_id_filter: str) -> list[CatalogRecord]:
+        """Retrieve every run for all run-ids starting with a filter value.
+
+        Parameters
+        ----------
+        run_id_filter : str
+            A prefix used to filter run-ids.
+
+        Returns
+        -------
+        list[CatalogRecord]
+        """
+        query = (
+            "SELECT history_path, record FROM runs "
+            "WHERE run_id GLOB ? ORDER BY run_id, start_at"
+        )
+        return self._select_runs(query, run_id_filter)
+
+    def _select_runs(self, query: str, run_id_filter: str) -> list[CatalogRecord]:
+        """Execute a run query and discard records whose file no longer exists.
+
+        Parameters
+        ----------
+        query : str
+            A query selecting the history path and record of runs.
+        run_id_filter : str
+            A prefix used to filter run-ids.
+
+        Returns
+        -------
+        list[CatalogRecord]
+        """
+        pattern = f"{_escape_glob(run_id_filter)}*"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, (pattern,)).fetchall()
+
+            results: list[CatalogRecord] = []
+            stale: list[tuple[str]] = []
+            for path, record in rows:
+                if Path(path).exists():
+                    results.append(CatalogRecord(Path(path), record))
+                else:
+                    stale.append((path,))
+
+            if stale:
+                # records removed outside the repository (e.g. `cstar admin clean`)
+                msg = f"Removing {len(stale)} runs without a record from the catalog"
+                self.log.debug(msg)
+                conn.executemany("DELETE FROM runs WHERE history_path = ?", stale)
+                conn.executemany(
+                    "DELETE FROM latest_runs WHERE history_path = ?", stale
+                )
+
+        return results
+
+    def put_steps(
+        self,
+        steps: Iterable[tuple[Path, str, str, int, str, int, str]],
+    ) -> None:
+        """Index the state of multiple steps in a single transaction.
+
+        Parameters
+        ----------
+        steps : Iterable[tuple[Path, str, str, int, str, int, str]]
+            The sentinel path, run-id, step name, status, job id, sentinel
+            modification time (ns), and JSON-serialized record of each step.
+        """
+        rows = [(str(path), *rest) for path, *rest in steps]
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO steps VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def steps(self, run_id: str) -> dict[Path, tuple[int, str]]:
+        """Retrieve the indexed state of all steps in a run.
+
+        Parameters
+        ----------
+        run_id : str
+            The run-id of the run.
+
+        Returns
+        -------
+        dict[Path, tuple[int, str]]
+            Mapping of sentinel paths to the modification time (ns) of the
+            indexed sentinel and the JSON-serialized record.
+        """
+        query = "SELECT sentinel_path, mtime_ns, record FROM steps WHERE run_id = ?"
+
+        with self._connect() as conn:
+            rows = conn.execute(query, (run_id,)).fetchall()
+
+        return {Path(p): (mtime, record) for p, mtime, record in rows}
+
+    def clear(self) -> None:
+        """Remove all records from the catalog."""
+        with self._connect() as conn:
+            _delete_all(conn)
+
+
+def _insert_runs(
+    conn: sqlite3.Connection,
+    runs: Iterable[tuple[str, datetime, Path, Path, str]],
+    latest: bool,
+) -> None:
+    """Index run records using an open connection.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection to the catalog.
+    runs : Iterable[tuple[str, datetime, Path, Path, str]]
+        The run-id, start time, workplan path, history path, and
+        JSON-serialized record of each run.
+    latest : bool
+        If `True`, mark each run as the latest run for its run-id.
+    """
+    rows = [
+        (str(history), run_id, start_at.isoformat(), str(wp_path), record)
+        for run_id, start_at, wp_path, history, record in runs
+    ]
+    conn.executemany("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?)", rows)
+    if latest:
+        conn.executemany(
+            "INSERT OR REPLACE INTO latest_runs VALUES (?, ?)",
+            [(row[1], row[0]) for row in rows],
+        )
+
+
+def _delete_all(conn: sqlite3.Connection) -> None:
+    """Remove all records from the catalog using an open connection.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        The connection to the catalog.
+    """
+    conn.execute("DELETE FROM runs")
+    conn.execute("DELETE FROM latest_runs")
+    conn.execute("DELETE FROM steps")
+    conn.execute("DELETE FROM properties")
+
+
+def get_run_catalog() -> RunCatalog | None:
+    """Return the run catalog if indexing is enabled.
+
+    Returns
+    -------
+    RunCatalog | None
+        The catalog when the `CSTAR_FF_ORCH_RUN_CATALOG` feature is enabled,
+        otherwise `None`.
+    """
+    if not is_feature_enabled(ENV_FF_ORCH_RUN_CATALOG):
+        return None
+    return RunCatalog()
+
+
+def _escape_glob(value: str) -> str:
+    """Escape the special characters of a SQLite `GLOB` pattern.
+
+    Parameters
+    ----------
+    value : str
+        The literal value to match.
+
+    Returns
+    -------
+    str
+    """
+    return "".join(f"[{c}]" if c in "*?[" else c for c in value)
@@ -7,7 +7,6 @@ from dataclasses import dataclass, field
 from itertools import cycle
 from pathlib import Path
 
-from prefect import flow
 from pydantic import BaseModel, Field, computed_field
 
 from cstar.base.env import (
@@ -20,6 +19,7 @@ from cstar.base.feature import is_flag_enabled
 from cstar.base.log import get_logger
 from cstar.base.utils import slugify
 from cstar.execution.file_system import StateDirectoryManager
+from cstar.orchestration.engine import engine_flow
 from cstar.orchestration.launch.local import LocalLauncher
 from cstar.orchestration.launch.slurm import SlurmLauncher
 from cstar.orchestration.models import KEY_CLOBBER, Step, UserDefinedVariables, Workplan
@@ -36,7 +36,11 @@ from cstar.orchestration.orchestration import (
     configure_environment,
 )
 from cstar.orchestration.serialization import deserialize, serialize, try_deserialize
-from cstar.orchestration.state import StateRepository, load_sentinels
+from cstar.orchestration.state import (
+    StateRepository,
+    get_state_journal,
+    load_sentinels,
+)
 from cstar.orchestration.tracking import TrackingRepository, WorkplanRun
 from cstar.orchestration.transforms import (
     TemplateFillTransform,
@@ -235,6 +239,7 @@ async def load_run_state(
     updates = await asyncio.gather(*map(launcher.update_status, sentinels))
     changes = [h for (is_updated, h) in updates if is_updated]
     await asyncio.gather(*map(on_status_changed, changes))
+    await close_run_state()
 
     closed_set = {s.name: s.status for s in sentinels if Status.is_terminal(s.status)}
     open_set = {s.name: s.status for s in sentinels if s.name not in closed_set}
@@ -282,33 +287,34 @@ async def process_plan(orchestrator: Orchestrator, mode: RunMode) -> DagStatus:
         - RunMode.Schedule submits all processes in the plan in a non-blocking manner.
         - RunMode.Monitor waits for all processes in the plan to complete.
     """
-    closed_set = orchestrator.get_closed_nodes(mode=mode)
+    state_repo = StateRepository()
     open_set = orchestrator.get_open_nodes(mode=mode)
+    revision = orchestrator.revision
     delay_iter = iter(incremental_delays())
 
-    while open_set is not None:
-        await orchestrator.run(mode=mode)
-
-        curr_closed = orchestrator.get_closed_nodes(mode=mode)
-        curr_open = orchestrator.get_open_nodes(mode=mode)
-
-        if curr_closed != closed_set or open_set != curr_open:
-            # reset to initial delay when a task is found or completed
-            delay_iter = iter(incremental_delays())
+    try:
+        while open_set is not None:
+            await orchestrator.run(mode=mode)
+            await state_repo.flush()
 
-        open_set = curr_open
-        closed_set = curr_closed
+            open_set = orchestrator.get_open_nodes(mode=mode)
 
-        sleep_duration = next(delay_iter)
-        await asyncio.sleep(sleep_duration)
+            if orchestrator.revision != revision:
+                # process newly opened nodes immediately when a task is found or
+                # completed, and reset to the initial delay
+                delay_iter = iter(incremental_delays())
+                revision = orchestrator.revision
+            elif open_set is not None:
+                # sleep until the launcher reports a task has ended
+                await orchestrator.wait_for_update(next(delay_iter))
+    finally:
+        await close_run_state()
 
     msg = f"Workplan {str(mode)!r} is complete."
     log.info(msg)
 
-    if open_set is None:
-        open_set = {}
-
-    return DagStatus({**open_set, **closed_set})
+    closed_set = orchestrator.get_closed_nodes(mode=mode)
+    return DagStatus(dict(closed_set))
 
 
 async def prepare_workplan(
@@ -655,12 +661,35 @@ async def on_status_changed(handle: ProcessHandle) -> None:
     state_repo = StateRepository()
     run_repo = TrackingRepository()
 
+    if state_repo.journaled:
+        # run records are updated once when the journal is closed
+        await state_repo.put_sentinel(handle)
+        return
+
     if path := await state_repo.put_sentinel(handle):
         if run := await run_repo.get_workplan_run(handle.run_id):
             run.sentinels.add(path)
             await run_repo.put_workplan_run(run)
 
 
+async def close_run_state() -> None:
+    """Flush journaled state transitions and update the run record with
+    any sentinels that are not yet tracked.
+    """
+    state_repo = StateRepository()
+    if not state_repo.journaled:
+        return
+
+    run_repo = TrackingRepository()
+    paths = await state_repo.close()
+
+    run_id = get_state_journal().run_id
+    run = await run_repo.get_workplan_run(run_id) if paths else None
+    if run and not paths.issubset(run.sentinels):
+        run.sentinels.update(paths)
+        await run_repo.put_workplan_run(run)
+
+
 async def build_dag(
     wp_path: Path,
     run_id: str = "",
@@ -704,7 +733,7 @@ async def build_dag(
     return planner, prepared_wp_path
 
 
-@flow(log_prints=True)
+@engine_flow
 async def run_dag(
     wp_path: Path,
     run_id: str,
@@ -766,7 +795,7 @@ async def run_dag(
     return await ExecutiveRunSummary.from_run(wp_run)
 
 
-@flow(log_prints=True)
+@engine_flow
 async def build_and_run_dag(
     wp_path: Path,
     run_id: str = "",
@@ -0,0 +1,81 @@
+"""Select the engine used to execute workplans.
+
+With the `prefect` engine (the default), the entry points of the dag runner run
+as Prefect flows and SLURM submissions are cached as Prefect task results. The
+`native` engine runs the same entry points as plain coroutines and records
+submissions in a `SubmissionLedger`, avoiding the import of Prefect, the startup
+of its ephemeral server and the storage of task results.
+
+Prefect is only imported when the `prefect` engine is used.
+"""
+
+import functools
+import typing as t
+from collections.abc import Callable, Coroutine
+
+from cstar.base.env import get_env_item
+from cstar.orchestration.utils import (
+    ENV_CSTAR_ORCH_ENGINE,
+    ORCH_ENGINE_NATIVE,
+    ORCH_ENGINE_PREFECT,
+)
+
+_P = t.ParamSpec("_P")
+_R = t.TypeVar("_R")
+
+
+def get_engine() -> str:
+    """Return the engine used to execute workplans.
+
+    Returns
+    -------
+    str
+        The value of `CSTAR_ORCH_ENGINE`.
+
+    Raises
+    ------
+    ValueError
+        If `CSTAR_ORCH_ENGINE` is not a known engine.
+    """
+    engine = get_env_item(ENV_CSTAR_ORCH_ENGINE).value
+    if engine not in (ORCH_ENGINE_PREFECT, ORCH_ENGINE_NATIVE):
+        msg = (
+            f"Unknown orchestration engine {engine!r}. Set {ENV_CSTAR_ORCH_ENGINE} "
+            f"to {ORCH_ENGINE_PREFECT!r} or {ORCH_ENGINE_NATIVE!r}."
+        )
+        raise ValueError(msg)
+    return engine
+
+
+def engine_flow(
+    fn: Callable[_P, Coroutine[t.Any, t.Any, _R]],
+) -> Callable[_P, Coroutine[t.Any, t.Any, _R]]:
+    """Run a coroutine function as a Prefect flow when the `prefect` engine is
+    selected, and as a plain coroutine otherwise.
+
+    The engine is read on every call, so it may be changed after import.
+
+    Parameters
+    ----------
+    fn : Callable
+        The coroutine function to decorate.
+
+    Returns
+    -------
+    Callable
+        The decorated coroutine function.
+    """
+
+    @functools.cache
+    def as_flow() -> Callable[_P, Coroutine[t.Any, t.Any, _R]]:
+        from prefect import flow  # noqa: PLC0415
+
+        return flow(log_prints=True)(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        if get_engine() == ORCH_ENGINE_PREFECT:
+            return await as_flow()(*args, **kwargs)
+        return await fn(*args, **kwargs)
+
+    return wrapper
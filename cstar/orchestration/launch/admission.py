@@ -0,0 +1,295 @@
+"""Admission control for steps executed by the local launcher.
+
+Without admission control every ready step is started as soon as its dependencies
+clear, so a workplan of many multi-rank steps oversubscribes the machine. The
+`LocalResourceScheduler` admits steps only while their CPU and memory
+requirements fit in the remaining budget. Requests are considered in arrival
+order, and a request that does not fit may be overtaken by smaller requests that
+fit in the leftover capacity (backfilling). To avoid starving large requests, a
+request that has been overtaken `max_bypass` times blocks further backfilling
+until it is admitted.
+"""
+
+import asyncio
+import functools
+import typing as t
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import psutil
+
+from cstar.base.env import (
+    ENV_CSTAR_LOCAL_MAX_CPUS,
+    ENV_CSTAR_LOCAL_MAX_MEMORY_MB,
+    get_env_item,
+)
+from cstar.base.log import LoggingMixin
+
+
+class ResourceRequest(t.NamedTuple):
+    """The resources required to run a step."""
+
+    name: str
+    """The name of the step."""
+    cpus: int
+    """The number of CPUs occupied by the step."""
+    memory_mb: int = 0
+    """The memory (in MB) expected to be used by the step, if known."""
+
+
+class Occupancy(t.NamedTuple):
+    """A snapshot of the state of a `LocalResourceScheduler`."""
+
+    max_cpus: int
+    """The number of CPUs available to steps."""
+    cpus_in_use: int
+    """The number of CPUs reserved by running steps."""
+    max_memory_mb: int
+    """The memory (in MB) available to steps."""
+    memory_in_use_mb: int
+    """The memory (in MB) reserved by running steps."""
+    running: tuple[str, ...]
+    """The names of the admitted steps, in order of admission."""
+    queued: tuple[str, ...]
+    """The names of the steps waiting for admission, in order of arrival."""
+
+
+@dataclass
+class _Waiter:
+    """A request waiting for admission."""
+
+    request: ResourceRequest
+    admitted: asyncio.Future[None]
+    bypassed: int = 0
+    """The number of later requests admitted ahead of this request."""
+
+
+@dataclass
+class _Reservation:
+    """The resources held by an admitted step."""
+
+    request: ResourceRequest
+    is_finished: Callable[[], bool] | None = field(default=None)
+    """Returns `True` once the step has ended and its resources can be reclaimed."""
+
+
+class LocalResourceScheduler(LoggingMixin):
+    """Admit steps to run locally while their resource requirements fit the budget."""
+
+    max_cpus: int
+    """The number of CPUs available to steps."""
+
+    max_memory_mb: int
+    """The memory (in MB) available to steps."""
+
+    max_bypass: int
+    """The number of times a request may be overtaken before backfilling stops."""
+
+    poll_interval: float
+    """The time (in seconds) between checks for ended steps while requests wait."""
+
+    def __init__(
+        self,
+        max_cpus: int | None = None,
+        max_memory_mb: int | None = None,
+        max_bypass: int = 8,
+        poll_interval: float = 0.25,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Parameters
+        ----------
+        max_cpus : int | None
+            The number of CPUs available to steps. Defaults to the value of
+            `CSTAR_LOCAL_MAX_CPUS`.
+        max_memory_mb : int | None
+            The memory (in MB) available to steps. Defaults to the value of
+            `CSTAR_LOCAL_MAX_MEMORY_MB` or, if it is 0, the physical memory.
+        max_bypass : int
+            The number of times a request may be overtaken before backfilling stops.
+        poll_interval : float
+            The time (in seconds) between checks for ended steps while requests wait.
+        """
+        if max_cpus is None:
+            max_cpus = int(get_env_item(ENV_CSTAR_LOCAL_MAX_CPUS).value)
+        if max_memory_mb is None:
+            max_memory_mb = int(get_env_item(ENV_CSTAR_LOCAL_MAX_MEMORY_MB).value)
+        if max_memory_mb <= 0:
+            max_memory_mb = psutil.virtual_memory().total // 2**20
+
+        self.max_cpus = max(1, max_cpus)
+        self.max_memory_mb = max_memory_mb
+        self.max_bypass = max_bypass
+        self.poll_interval = poll_interval
+
+        self._queue: list[_Waiter] = []
+        self._running: dict[str, _Reservation] = {}
+        self._reaper: asyncio.Task[None] | None = None
+
+    @property
+    def cpus_in_use(self) -> int:
+        """The number of CPUs reserved by running steps."""
+        return sum(r.request.cpus for r in self._running.values())
+
+    @property
+    def memory_in_use_mb(self) -> int:
+        """The memory (in MB) reserved by running steps."""
+        return sum(r.request.memory_mb for r in self._running.values())
+
+    def occupancy(self) -> Occupancy:
+        """Return a snapshot of the running and queued steps.
+
+        Returns
+        -------
+        Occupancy
+        """
+        return Occupancy(
+            max_cpus=self.max_cpus,
+            cpus_in_use=self.cpus_in_use,
+            max_memory_mb=self.max_memory_mb,
+            memory_in_use_mb=self.memory_in_use_mb,
+            running=tuple(self._running),
+            queued=tuple(w.request.name for w in self._queue),
+        )
+
+    def _clamp(self, request: ResourceRequest) -> ResourceRequest:
+        """Limit a request to the budget so that it can run on an idle machine."""
+        cpus = min(max(1, request.cpus), self.max_cpus)
+        memory_mb = min(max(0, request.memory_mb), self.max_memory_mb)
+
+        if (cpus, memory_mb) != (request.cpus, request.memory_mb):
+            self.log.warning(
+                f"Step {request.name!r} requests {request.cpus} CPUs and "
+                f"{request.memory_mb} MB, exceeding the local budget of "
+                f"{self.max_cpus} CPUs and {self.max_memory_mb} MB. "
+                "It will run when no other steps are running."
+            )
+        return request._replace(cpus=cpus, memory_mb=memory_mb)
+
+    def _fits(self, request: ResourceRequest) -> bool:
+        """Return `True` if a request fits in the remaining budget."""
+        return (
+            self.cpus_in_use + request.cpus <= self.max_cpus
+            and self.memory_in_use_mb + request.memory_mb <= self.max_memory_mb
+        )
+
+    def _dispatch(self) -> None:
+        """Admit queued requests, in arrival order, while they fit the budget."""
+        passed_over: list[_Waiter] = []
+
+        for waiter in list(self._queue):
+            if waiter.admitted.done():
+                # the waiting coroutine was cancelled
+                self._queue.remove(waiter)
+                continue
+
+            if not self._fits(waiter.request):
+                passed_over.append(waiter)
+                continue
+
+            if any(w.bypassed >= self.max_bypass for w in passed_over):
+                # reserve the remaining capacity for a starved request
+                break
+
+            for w in passed_over:
+                w.bypassed += 1
+
+            self._queue.remove(waiter)
+            self._running[waiter.request.name] = _Reservation(waiter.request)
+            waiter.admitted.set_result(None)
+            self.log.debug(
+                f"Admitted step {waiter.request.name!r} "
+                f"({self.cpus_in_use}/{self.max_cpus} CPUs in use)"
+            )
+
+    async def acquire(self, request: ResourceRequest) -> None:
+        """Wait until a step is admitted.
+
+        Parameters
+        ----------
+        request : ResourceRequest
+            The resources required by the step.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(self._clamp(request), loop.create_future())
+        self._queue.append(waiter)
+        self._dispatch()
+
+        if not waiter.admitted.done():
+            self.log.info(
+                f"Step {request.name!r} is waiting for {waiter.request.cpus} CPUs "
+                f"({self.cpus_in_use}/{self.max_cpus} CPUs in use, "
+                f"{len(self._queue)} steps queued)"
+            )
+            self._ensure_reaper()
+
+        try:
+            await waiter.admitted
+        except asyncio.CancelledError:
+            if waiter in self._queue:
+                self._queue.remove(waiter)
+            raise
+
+    def attach(self, name: str, is_finished: Callable[[], bool]) -> None:
+        """Register a check used to reclaim the resources of an admitted step.
+
+        Parameters
+        ----------
+        name : str
+            The name of the admitted step.
+        is_finished : Callable[[], bool]
+            A function returning `True` once the step has ended.
+        """
+        if reservation := self._running.get(name):
+            reservation.is_finished = is_finished
+
+    def release(self, name: str) -> None:
+        """Reclaim the resources held by a step and admit waiting steps.
+
+        Parameters
+        ----------
+        name : str
+            The name of the step.
+        """
+        if self._running.pop(name, None) is not None:
+            self.log.debug(f"Released resources of step {name!r}")
+            self._dispatch()
+
+    def reap(self) -> list[str]:
+        """Reclaim the resources of every admitted step that has ended.
+
+        Returns
+        -------
+        list[str]
+            The names of the steps whose resources were reclaimed.
+        """
+        finished = [
+            name
+            for name, reservation in self._running.items()
+            if reservation.is_finished is not None and reservation.is_finished()
+        ]
+        for name in finished:
+            self.release(name)
+        return finished
+
+    async def _reap_while_queued(self) -> None:
+        """Check for ended steps until no requests are waiting."""
+        while self._queue:
+            await asyncio.sleep(self.poll_interval)
+            self.reap()
+
+    def _ensure_reaper(self) -> None:
+        """Start checking for ended steps if no check is in progress."""
+        reaper = self._reaper
+        if (
+            reaper is None
+            or reaper.done()
+            or reaper.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._reaper = asyncio.create_task(self._reap_while_queued())
+
+
+@functools.lru_cache
+def get_local_scheduler() -> LocalResourceScheduler:
+    """Return the process-wide scheduler used by the local launcher."""
+    return LocalResourceScheduler()
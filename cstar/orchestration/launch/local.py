@@ -3,12 +3,13 @@ import datetime
 import os
 import subprocess
 import typing as t
+import weakref
 from pathlib import Path
 from subprocess import run as sprun
 
 from psutil import NoSuchProcess
 from psutil import Process as PsProcess
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError
 
 from cstar.base.adapter import (
     ConfiguredModelAdapter,
@@ -22,6 +23,11 @@ from cstar.base.log import get_logger
 from cstar.base.utils import WALLTIME_RE, additional_files_dir
 from cstar.orchestration.adapter import StepToRunRequestAdapter
 from cstar.orchestration.formatting import ModelFormatter
+from cstar.orchestration.launch.admission import (
+    Occupancy,
+    ResourceRequest,
+    get_local_scheduler,
+)
 from cstar.orchestration.models import KeyValueStore
 from cstar.orchestration.orchestration import (
     Launcher,
@@ -41,6 +47,54 @@ if t.TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+EXIT_POLL_SECONDS: t.Final[float] = 0.1
+"""The time (in seconds) between exit checks when a process cannot be watched."""
+
+
+async def wait_for_exit(process: subprocess.Popen[bytes]) -> int:
+    """Wait for a child process to exit without blocking the event loop.
+
+    Where supported (Linux), a pidfd for the process is registered with the event
+    loop so the caller resumes as soon as the process exits. Otherwise, the process
+    is polled every `EXIT_POLL_SECONDS`.
+
+    Parameters
+    ----------
+    process : subprocess.Popen
+        The child process to wait for.
+
+    Returns
+    -------
+    int
+        The return code of the process.
+    """
+    if (rc := process.poll()) is not None:
+        return rc
+
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        while (rc := process.poll()) is None:
+            await asyncio.sleep(EXIT_POLL_SECONDS)
+        return rc
+
+    loop = asyncio.get_running_loop()
+    exited: asyncio.Future[None] = loop.create_future()
+
+    def on_readable() -> None:
+        if not exited.done():
+            exited.set_result(None)
+
+    try:
+        loop.add_reader(pidfd, on_readable)
+        await exited
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+
+    # the process has exited, so reaping it does not block
+    return process.wait()
+
 
 def run_as_process(step: "Step", cmd: list[str], log_file: Path) -> dict[str, int]:
     with log_file.open("w+") as log:
@@ -63,6 +117,9 @@ class LocalHandle(ProcessHandle):
     launcher_name: str = "local"
     """The launcher used to launch the process."""
 
+    _exit_watch: "asyncio.Task[int] | None" = PrivateAttr(default=None)
+    """A task completing with the return code of the process once it exits."""
+
     @property
     def start_ts(self) -> float:
         if isinstance(self.start_at, datetime.datetime):
@@ -93,6 +150,22 @@ class LocalHandle(ProcessHandle):
     def is_expired(self) -> bool:
         return not hasattr(self, "_process")
 
+    def watch_exit(self) -> "asyncio.Task[int]":
+        """Return a task completing with the return code of the process once it
+        exits.
+
+        The task is shared by all callers on the running event loop.
+
+        Returns
+        -------
+        asyncio.Task[int]
+        """
+        watch = self._exit_watch
+        if watch is None or watch.get_loop() is not asyncio.get_running_loop():
+            watch = asyncio.create_task(wait_for_exit(self.process))
+            self._exit_watch = watch
+        return watch
+
 
 class LocalComputeSpec(BaseModel):
     """Compute configuration options when using the local launcher."""
@@ -104,6 +177,8 @@ class LocalComputeSpec(BaseModel):
     """Maximum amount of time a process should be allowed to run (D-HH:MM:SS format)."""
     force_kill_timeout: str = Field(default=DEFAULT_FK_TIMEOUT, pattern=WALLTIME_RE)
     """Grace period before force-killing a local process after timeout is exceeded (D-HH:MM:SS format)."""
+    memory_mb: int = Field(default=0, ge=0)
+    """Expected peak memory use of the process (in MB), used for admission control."""
 
     model_config: t.ClassVar[ConfigDict] = ConfigDict(str_strip_whitespace=True)
     """Configure model to ignore empty strings."""
@@ -238,6 +313,10 @@ class LocalLauncher(Launcher[LocalHandle]):
     """Mapping of task name to process ID."""
     use_proxy: t.ClassVar[bool] = is_feature_enabled(ENV_FF_ENABLE_LOCAL_PROXY)
     """Set flag to `True` to use a proxy script to enable asynchronous scheduling."""
+    _exit_events: t.ClassVar[
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event]"
+    ] = weakref.WeakKeyDictionary()
+    """Per event loop, an event set when a launched process exits."""
 
     @classmethod
     def check_preconditions(cls) -> None:
@@ -275,6 +354,75 @@ class LocalLauncher(Launcher[LocalHandle]):
 
         return formatter.format(request)
 
+    @staticmethod
+    def resource_request(step: "LiveStep") -> ResourceRequest:
+        """Determine the resources occupied by a step while it runs.
+
+        The CPU count is read from the step's blueprint and the memory hint from
+        the `memory_mb` local compute override, if supplied.
+
+        Parameters
+        ----------
+        step : LiveStep
+            The step to be executed.
+
+        Returns
+        -------
+        ResourceRequest
+        """
+        memory_mb = 0
+        if step.compute_overrides:
+            try:
+                compute = LocalComputeAdapter(allow_unmodified=True).adapt(
+                    step.compute_overrides
+                )
+                memory_mb = compute.memory_mb
+            except (CstarAdaptationError, ValidationError):
+                log.debug(f"No memory hint found for step {step.name!r}")
+
+        return ResourceRequest(step.name, step.blueprint.cpus_needed, memory_mb)
+
+    @classmethod
+    def _exit_event(cls) -> asyncio.Event:
+        """Return the event set when a process launched on the running loop exits."""
+        loop = asyncio.get_running_loop()
+        if (event := cls._exit_events.get(loop)) is None:
+            event = cls._exit_events[loop] = asyncio.Event()
+        return event
+
+    @classmethod
+    async def wait_for_update(cls, timeout: float) -> bool:
+        """Wait until a launched process exits, or the timeout elapses.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time (in seconds) to wait.
+
+        Returns
+        -------
+        bool
+            `True` if a process exited since the previous call.
+        """
+        event = cls._exit_event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except TimeoutError:
+            return False
+
+        event.clear()
+        return True
+
+    @staticmethod
+    def occupancy() -> Occupancy:
+        """Return the steps queued for and occupying local resources.
+
+        Returns
+        -------
+        Occupancy
+        """
+        return get_local_scheduler().occupancy()
+
     @staticmethod
     async def _submit(step: "LiveStep", dependencies: list[LocalHandle]) -> LocalHandle:
         """Submit a step to a local process.
@@ -367,7 +515,7 @@ class LocalLauncher(Launcher[LocalHandle]):
                 return "RUNNING"
             return "COMPLETED"
 
-        rc = handle.process.returncode
+        rc = handle.process.poll()
 
         if rc is None:
             status = "RUNNING"
@@ -413,7 +561,7 @@ class LocalLauncher(Launcher[LocalHandle]):
 
             # wait for the dependencies to complete before launching
             while active_found and not failure_found:
-                await asyncio.sleep(1)
+                await cls._wait_for_any_exit(dependencies)
 
                 tasks = [asyncio.Task(cls.query_status(h)) for h in dependencies]
                 statuses = await asyncio.gather(*tasks)
@@ -425,12 +573,56 @@ class LocalLauncher(Launcher[LocalHandle]):
             raise CstarExpectationFailed(msg)
 
         live_step = LiveStep.from_step(step)
-        handle = await LocalLauncher._submit(live_step, dependencies)
+
+        # wait until the CPUs (and memory) required by the step are available
+        scheduler = get_local_scheduler()
+        await scheduler.acquire(LocalLauncher.resource_request(live_step))
+
+        try:
+            handle = await LocalLauncher._submit(live_step, dependencies)
+        except BaseException:
+            scheduler.release(live_step.name)
+            raise
+
+        process = handle.process
+        scheduler.attach(live_step.name, lambda: process.poll() is not None)
+
+        def on_exit(watch: "asyncio.Task[int]") -> None:
+            if not watch.cancelled():
+                scheduler.release(live_step.name)
+                LocalLauncher._exit_event().set()
+
+        handle.watch_exit().add_done_callback(on_exit)
+
         return Task[LocalHandle](
             step=live_step,
             handle=handle,
         )
 
+    @classmethod
+    async def _wait_for_any_exit(cls, handles: list[LocalHandle]) -> None:
+        """Wait until one of the processes exits.
+
+        Processes that have already exited are not waited for. Handles without
+        a process (e.g. reloaded from a prior run) cannot be watched, so the wait
+        is limited to one second when any are present.
+
+        Parameters
+        ----------
+        handles : list[LocalHandle]
+            The handles of the processes to wait for.
+        """
+        watches = [h.watch_exit() for h in handles if not h.is_expired]
+        pending = [w for w in watches if not w.done()]
+        timeout = 1.0 if len(watches) < len(handles) else None
+
+        if pending:
+            await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        elif timeout is not None:
+            await asyncio.sleep(timeout)
+
     @classmethod
     async def query_status(cls, item: Task[LocalHandle] | LocalHandle) -> Status:
         """Retrieve the status of an item.
@@ -504,7 +696,7 @@ class LocalLauncher(Launcher[LocalHandle]):
         process = item.handle.process
 
         if not item.handle.is_expired:  # wonky is-null check...
-            if process.returncode is not None:
+            if process.poll() is not None:
                 msg = f"Unable to cancel a completed task `{process.pid}"
                 log.debug(msg)
             else:
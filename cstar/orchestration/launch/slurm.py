@@ -1,16 +1,15 @@
 import asyncio
+import functools
 import os
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
-from prefect import State, task
-from prefect import Task as PrefectTask
-from prefect.client.schemas import TaskRun
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from cstar.base.adapter import ConfiguredModelAdapter, CstarAdaptationError
 from cstar.base.env import (
     ENV_CSTAR_RUNID,
-    ENV_CSTAR_SLURM_POST_SUBMIT_DELAY,
+    ENV_CSTAR_SLURM_SUBMIT_CONCURRENCY,
     get_env_item,
 )
 from cstar.base.exceptions import CstarError, CstarExpectationFailed
@@ -20,10 +19,11 @@ from cstar.execution.handler import ExecutionStatus
 from cstar.execution.scheduler_job import (
     SchedulerJob,
     create_scheduler_job,
-    get_slurm_batch,
-    get_slurm_batches,
+    get_slurm_status_service,
 )
 from cstar.orchestration.adapter import StepToRunRequestAdapter
+from cstar.orchestration.engine import get_engine
+from cstar.orchestration.ledger import SubmissionLedger
 from cstar.orchestration.models import KeyValueStore
 from cstar.orchestration.orchestration import (
     Launcher,
@@ -37,20 +37,31 @@ from cstar.orchestration.utils import (
     ENV_CSTAR_SLURM_ACCOUNT,
     ENV_CSTAR_SLURM_MAX_WALLTIME,
     ENV_CSTAR_SLURM_QUEUE,
+    ORCH_ENGINE_PREFECT,
 )
 
 if t.TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from prefect import State
+    from prefect import Task as PrefectTask
+    from prefect.client.schemas import TaskRun
     from prefect.context import TaskRunContext
 
     from cstar.orchestration.orchestration import LiveStep
 
+    _SubmitTask: t.TypeAlias = PrefectTask[
+        [LiveStep, list["SlurmHandle"]], Coroutine[t.Any, t.Any, "SlurmHandle"]
+    ]
+    """`SlurmLauncher._submit` wrapped as a Prefect task."""
+
 log = get_logger(__name__)
 
 
 async def on_submit_complete(
-    task: PrefectTask[["LiveStep", list["SlurmHandle"]], "SlurmHandle"],
-    task_run: TaskRun,
-    state: State["SlurmHandle"],
+    task: "_SubmitTask",
+    task_run: "TaskRun",
+    state: "State[SlurmHandle]",
 ) -> None:
     """Perform actions required when a job submission completes
     successfully.
@@ -82,6 +93,21 @@ def cache_key_func(context: "TaskRunContext", params: dict[str, t.Any]) -> str:
     return cache_key
 
 
+@functools.lru_cache
+def get_submission_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used to run `sbatch`.
+
+    Its size, read from `CSTAR_SLURM_SUBMIT_CONCURRENCY`, bounds the number of
+    concurrent submissions.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+    """
+    max_workers = max(1, int(get_env_item(ENV_CSTAR_SLURM_SUBMIT_CONCURRENCY).value))
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sbatch")
+
+
 class SlurmComputeSpec(BaseModel):
     num_cpus: int = 0
     """Total number of CPUs required by the job."""
@@ -174,11 +200,6 @@ class SlurmHandle(ProcessHandle):
 class SlurmLauncher(Launcher[SlurmHandle]):
     """A launcher that executes steps in a SLURM-enabled cluster."""
 
-    POST_SUBMIT_DELAY: t.Final[float] = float(
-        get_env_item(ENV_CSTAR_SLURM_POST_SUBMIT_DELAY).value
-    )
-    """Delay after a submission to ensure status for a SLURM job can be queried."""
-
     @staticmethod
     def configured_queue() -> str:
         """Get the queue to use for SLURM jobs.
@@ -298,11 +319,6 @@ class SlurmLauncher(Launcher[SlurmHandle]):
             depends_on=job_dep_ids,
         )
 
-    @task(
-        persist_result=True,
-        cache_key_fn=cache_key_func,
-        on_completion=[on_submit_complete],
-    )
     @staticmethod
     async def _submit(step: "LiveStep", dependencies: list[SlurmHandle]) -> SlurmHandle:
         """Submit a step to SLURM as a new batch allocation.
@@ -334,12 +350,13 @@ class SlurmLauncher(Launcher[SlurmHandle]):
 
         msg = f"Submitting command `{short_command}...` for step `{step.name}`."
         log.debug(msg)
-        job.submit()
 
-        if job.id:
-            # introduce slight delay so `sacct` queries can locate this job
-            await asyncio.sleep(SlurmLauncher.POST_SUBMIT_DELAY)
+        # run `sbatch` off the event loop so steps ready in the same tick are
+        # submitted concurrently, up to the size of the submission executor
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(get_submission_executor(), job.submit)
 
+        if job.id:
             log.debug("Submission of `%s` created Job ID `%s`", step.name, job.id)
             return SlurmHandle(
                 pid=str(job.id),
@@ -350,6 +367,46 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         msg = f"Unable to retrieve job ID for step `{step.name}`. Job `{job}` failed"
         raise RuntimeError(msg)
 
+    @staticmethod
+    async def _submit_once(
+        step: "LiveStep",
+        dependencies: list[SlurmHandle],
+        *,
+        refresh: bool = False,
+    ) -> SlurmHandle:
+        """Submit a step at most once per run.
+
+        A job submitted for the step by a prior attempt of the run is re-used. With
+        the `prefect` engine, submissions are cached as Prefect task results;
+        otherwise, they are recorded in the `SubmissionLedger` of the run.
+
+        Parameters
+        ----------
+        step : LiveStep
+            The step to submit to SLURM.
+        dependencies : list[SlurmHandle]
+            The list of tasks that must complete prior to execution of the submitted Step.
+        refresh : bool
+            Pass `True` to submit the step even if it was previously submitted.
+
+        Returns
+        -------
+        SlurmHandle
+            A ProcessHandle identifying the submitted job.
+        """
+        if get_engine() == ORCH_ENGINE_PREFECT:
+            submit_task = get_prefect_submit_task()
+            if refresh:
+                submit_task = submit_task.with_options(refresh_cache=True)
+            return await submit_task(step, dependencies)
+
+        return await SubmissionLedger().submit_once(
+            step.name,
+            lambda: SlurmLauncher._submit(step, dependencies),
+            SlurmHandle,
+            refresh=refresh,
+        )
+
     @staticmethod
     async def _get_status(job_id: str) -> ExecutionStatus:
         """Retrieve the status of a step running in SLURM.
@@ -364,7 +421,7 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         ExecutionStatus
             The current status of the step.
         """
-        batch = await get_slurm_batch(job_id)
+        batch = await get_slurm_status_service().get_batch(job_id)
         return batch.status
 
     @staticmethod
@@ -392,7 +449,8 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         if not dependencies:
             return dependencies
 
-        batch_map = await get_slurm_batches([d.pid for d in dependencies])
+        service = get_slurm_status_service()
+        batch_map = await service.get_batches([d.pid for d in dependencies])
         successes = {
             k for k, v in batch_map.items() if v.status == ExecutionStatus.COMPLETED
         }
@@ -430,7 +488,7 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         state_repo = StateRepository()
 
         prior_handle = await state_repo.get_sentinel(step.name, SlurmHandle)
-        submit_fn = SlurmLauncher._submit
+        refresh = step.clobber
 
         if prior_handle:
             # use persisted task as sentinel only; query SLURM for up-to-date status
@@ -439,14 +497,11 @@ class SlurmLauncher(Launcher[SlurmHandle]):
             if Status.is_failure(last_status):
                 # force cache refresh for any tasks that didn't succeed
                 step.fsm.clear_prior()
-                submit_fn = SlurmLauncher._submit.with_options(refresh_cache=True)
+                refresh = True
 
         dependencies = await cls._prune_completed_dependencies(dependencies)
 
-        if step.clobber:
-            submit_fn = SlurmLauncher._submit.with_options(refresh_cache=True)
-
-        handle = await submit_fn(step, dependencies)
+        handle = await SlurmLauncher._submit_once(step, dependencies, refresh=refresh)
         await SlurmLauncher.update_status(handle)
 
         return Task(
@@ -559,6 +614,7 @@ class SlurmLauncher(Launcher[SlurmHandle]):
                 msg_err="Non-zero exit code when cancelling job.",
             )
             item.status = Status.Cancelled
+            get_slurm_status_service().invalidate([handle.pid])
         except RuntimeError:
             log.exception("Unable to cancel the task `%s`", handle.pid)
 
@@ -567,3 +623,21 @@ class SlurmLauncher(Launcher[SlurmHandle]):
     @classmethod
     def handle_klass(cls) -> type[SlurmHandle]:
         return SlurmHandle
+
+
+@functools.lru_cache
+def get_prefect_submit_task() -> "_SubmitTask":
+    """Return `SlurmLauncher._submit` as a Prefect task whose result is cached
+    on the run id and step name.
+
+    Returns
+    -------
+    PrefectTask
+    """
+    from prefect import task  # noqa: PLC0415
+
+    return task(
+        persist_result=True,
+        cache_key_fn=cache_key_func,
+        on_completion=[on_submit_complete],
+    )(SlurmLauncher._submit)
@@ -0,0 +1,148 @@
+"""A record of the jobs submitted for each step of a run.
+
+When a run is restarted, the orchestrator must not submit a second job for a
+step whose job was already submitted. With the `native` engine, the
+`SubmissionLedger` provides this guarantee (which the Prefect engine provides by
+caching the result of the submission task). Each submission is recorded as a
+small file under the run-state directory, keyed by the run id and step name.
+"""
+
+import asyncio
+import os
+import typing as t
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from cstar.base.log import get_logger
+from cstar.base.utils import slugify
+from cstar.execution.file_system import StateDirectoryManager
+from cstar.orchestration.orchestration import ProcessHandle
+
+log = get_logger(__name__)
+
+_THandle = t.TypeVar("_THandle", bound=ProcessHandle)
+
+
+class SubmissionLedger:
+    """Record the handle of the job submitted for each step of a run."""
+
+    DIR_NAME: t.ClassVar[str] = "submissions"
+    """The name of the directory in the run-state directory holding the ledger."""
+
+    run_id: str | None
+    """The run id of the ledger, or `None` to use the run id of the environment."""
+
+    def __init__(self, run_id: str | None = None) -> None:
+        """Initialize the ledger.
+
+        Parameters
+        ----------
+        run_id : str | None
+            The run id of the ledger. Defaults to the value of `CSTAR_RUNID`.
+        """
+        self.run_id = run_id
+
+    @property
+    def root_dir(self) -> Path:
+        """The directory containing the ledger entries of the run."""
+        state_dir = StateDirectoryManager.run_state_dir(run_id=self.run_id)
+        return state_dir / self.DIR_NAME
+
+    def entry_path(self, step_name: str) -> Path:
+        """Return the path to the ledger entry of a step.
+
+        Parameters
+        ----------
+        step_name : str
+            The name of the step.
+
+        Returns
+        -------
+        Path
+        """
+        return self.root_dir / f"{slugify(step_name)}.json"
+
+    def _read(self, step_name: str, klass: type[_THandle]) -> _THandle | None:
+        path = self.entry_path(step_name)
+        try:
+            return klass.model_validate_json(path.read_text())
+        except FileNotFoundError:
+            return None
+
+    def _write(self, step_name: str, handle: ProcessHandle) -> Path:
+        path = self.entry_path(step_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file and rename it so a crash never leaves a
+        # partially written entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(handle.model_dump_json())
+        tmp_path.replace(path)
+        return path
+
+    async def get(self, step_name: str, klass: type[_THandle]) -> _THandle | None:
+        """Return the handle recorded for a step, if any.
+
+        Parameters
+        ----------
+        step_name : str
+            The name of the step.
+        klass : type[_THandle]
+            The type of the recorded handle.
+
+        Returns
+        -------
+        _THandle | None
+        """
+        return await asyncio.to_thread(self._read, step_name, klass)
+
+    async def put(self, step_name: str, handle: ProcessHandle) -> Path:
+        """Record the handle of the job submitted for a step.
+
+        Parameters
+        ----------
+        step_name : str
+            The name of the step.
+        handle : ProcessHandle
+            The handle of the submitted job.
+
+        Returns
+        -------
+        Path
+            The path to the ledger entry.
+        """
+        return await asyncio.to_thread(self._write, step_name, handle)
+
+    async def submit_once(
+        self,
+        step_name: str,
+        submit: Callable[[], Awaitable[_THandle]],
+        klass: type[_THandle],
+        *,
+        refresh: bool = False,
+    ) -> _THandle:
+        """Submit a step unless a submission is already recorded for it.
+
+        Parameters
+        ----------
+        step_name : str
+            The name of the step.
+        submit : Callable[[], Awaitable[_THandle]]
+            A function submitting the step and returning the handle of its job.
+        klass : type[_THandle]
+            The type of the recorded handle.
+        refresh : bool
+            Pass `True` to ignore a recorded submission and submit again.
+
+        Returns
+        -------
+        _THandle
+            The handle of the recorded or newly submitted job.
+        """
+        if not refresh and (handle := await self.get(step_name, klass)):
+            log.debug(f"Re-using recorded submission of step {step_name!r}: {handle}")
+            return handle
+
+        handle = await submit()
+        await self.put(step_name, handle)
+        return handle
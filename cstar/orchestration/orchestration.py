@@ -30,7 +30,7 @@ from cstar.execution.file_system import (
 from cstar.orchestration.formatting import ModelFormatter
 from cstar.orchestration.models import Blueprint, ConfiguredBaseModel, Step, Workplan
 from cstar.orchestration.serialization import (
-    deserialize,
+    deserialize_cached,
     intenum_representer,
     register_representer,
 )
@@ -246,11 +246,15 @@ class LiveStep(Step):
 
     @property
     def blueprint(self) -> Blueprint:
-        """Load and return the blueprint associated with this step."""
+        """Load and return the blueprint associated with this step.
+
+        The blueprint file is parsed once per version of its content; every access
+        returns a new copy of the blueprint.
+        """
         path = Path(self.blueprint_path)
         app = get_app_for_blueprint(path)
 
-        return deserialize(path, app.blueprint)
+        return deserialize_cached(path, app.blueprint)
 
     @property
     def script_path(self) -> Path:
@@ -401,6 +405,12 @@ class Planner(LoggingMixin):
     graph: "DiGraph[str]"
     """The graph used for task planning."""
 
+    revision: int
+    """A counter incremented each time the status of a node changes."""
+
+    _status_listeners: list[Callable[[str, t.Any, Status], None]]
+    """Callbacks executed when the status of a node changes."""
+
     def __init__(
         self,
         workplan: Workplan,
@@ -414,6 +424,8 @@ class Planner(LoggingMixin):
         """
         self.workplan = workplan
         self.graph = Planner._workplan_to_graph(workplan)
+        self.revision = 0
+        self._status_listeners = []
 
     @classmethod
     def _workplan_to_graph(cls, workplan: Workplan) -> "DiGraph[str]":
@@ -493,6 +505,22 @@ class Planner(LoggingMixin):
 
         self.graph.nodes[n][key] = value
 
+        if key == KEY_STATUS and stored != value:
+            self.revision += 1
+            for listener in self._status_listeners:
+                listener(n, stored, t.cast("Status", value))
+
+    def subscribe(self, listener: Callable[[str, t.Any, Status], None]) -> None:
+        """Register a callback to be executed when the status of a node changes.
+
+        Parameters
+        ----------
+        listener : Callable[[str, t.Any, Status], None]
+            A function accepting the node identifier, the prior status, and
+            the new status.
+        """
+        self._status_listeners.append(listener)
+
     @t.overload
     def retrieve(
         self,
@@ -594,6 +622,146 @@ class Planner(LoggingMixin):
         return values
 
 
+class ReadySet:
+    """Incrementally track the open and closed nodes of a plan for a `RunMode`.
+
+    Per-node counters of unmet dependencies are updated only when the planner
+    reports a status transition, so identifying the nodes that are ready for
+    processing does not require a scan of the entire graph.
+    """
+
+    planner: Planner
+    """The planner whose nodes are tracked."""
+
+    mode: RunMode
+    """The run mode used to determine when a node is closed."""
+
+    closed: dict[str, Status]
+    """Mapping of closed node identifiers to their status."""
+
+    failures: set[str]
+    """The closed nodes that terminated with a failure status."""
+
+    unmet: dict[str, int]
+    """Mapping of node identifiers to the number of dependencies that are not closed."""
+
+    ready: set[str]
+    """The nodes that are not closed and have no unmet dependencies."""
+
+    def __init__(self, planner: Planner, mode: RunMode) -> None:
+        """Initialize the ready set from the current state of the planner.
+
+        Parameters
+        ----------
+        planner : Planner
+            The planner whose nodes are tracked.
+        mode : RunMode
+            The run mode used to determine when a node is closed.
+        """
+        self.planner = planner
+        self.mode = mode
+
+        g = planner.graph
+        statuses = planner.retrieve_all(KEY_STATUS)
+
+        self.closed = {n: s for n, s in statuses.items() if self.is_closed(s)}
+        self.failures = {n for n, s in self.closed.items() if Status.is_failure(s)}
+        self.unmet = {
+            n: sum(1 for u in g.predecessors(n) if u not in self.closed)
+            for n in g.nodes
+        }
+        self.ready = {
+            n for n, count in self.unmet.items() if not count and n not in self.closed
+        }
+
+        planner.subscribe(self.on_status_changed)
+
+    def is_closed(self, status: Status | None) -> bool:
+        """Return `True` if a status closes a node in the tracked run mode.
+
+        A closed node also satisfies the dependencies of its successors.
+
+        Parameters
+        ----------
+        status : Status | None
+            The status to evaluate.
+
+        Returns
+        -------
+        bool
+        """
+        if status is None:
+            return False
+
+        if self.mode == RunMode.Schedule:
+            # anything previously scheduled is "closed" when scheduling
+            return Status.is_terminal(status) or Status.is_in_progress(status)
+
+        return Status.is_terminal(status)
+
+    def on_status_changed(self, n: str, _prior: t.Any, status: Status) -> None:
+        """Update the counters affected by a status transition.
+
+        Parameters
+        ----------
+        n : str
+            The node identifier.
+        _prior : t.Any
+            The previously stored status.
+        status : Status
+            The new status.
+        """
+        was_closed = n in self.closed
+        is_closed = self.is_closed(status)
+
+        if is_closed:
+            self.closed[n] = status
+
+        if is_closed and Status.is_failure(status):
+            self.failures.add(n)
+        else:
+            self.failures.discard(n)
+
+        if was_closed == is_closed:
+            return
+
+        successors = self.planner.graph.successors(n)
+
+        if is_closed:
+            self.ready.discard(n)
+            for v in successors:
+                self.unmet[v] -= 1
+                if not self.unmet[v] and v not in self.closed:
+                    self.ready.add(v)
+        else:
+            del self.closed[n]
+            if not self.unmet[n]:
+                self.ready.add(n)
+            for v in successors:
+                self.unmet[v] += 1
+                self.ready.discard(v)
+
+    def open_nodes(self) -> dict[str, Status] | None:
+        """Return the nodes that are executing or ready to execute.
+
+        Returns
+        -------
+        dict[str, Status] | None
+            - Mapping of open nodes to their status.
+            - An empty mapping indicates no actions are currently possible.
+            - Null indicates all nodes are closed or a node has failed.
+        """
+        g = self.planner.graph
+
+        if self.failures or len(self.closed) == g.number_of_nodes():
+            return None
+
+        return {
+            n: Status.Unsubmitted if not g.in_degree(n) else g.nodes[n][KEY_STATUS]
+            for n in self.ready
+        }
+
+
 class Launcher(t.Protocol, t.Generic[_THandle]):
     """Contract required to implement a task launcher."""
 
@@ -697,6 +865,26 @@ class Launcher(t.Protocol, t.Generic[_THandle]):
         """Return the type used by the launcher instance for managing tasks."""
         ...
 
+    @classmethod
+    async def wait_for_update(cls, timeout: float) -> bool:
+        """Wait until the status of a task may have changed, or the timeout elapses.
+
+        Launchers that are notified when tasks end return as soon as a
+        notification arrives; by default, the full timeout elapses.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time (in seconds) to wait.
+
+        Returns
+        -------
+        bool
+            `True` if the wait ended due to a notification.
+        """
+        await asyncio.sleep(timeout)
+        return False
+
 
 class Orchestrator(LoggingMixin):
     """Manage the execution of a `Workplan`."""
@@ -713,6 +901,9 @@ class Orchestrator(LoggingMixin):
     _on_launched: Callable[[ProcessHandle], Awaitable[None]] | None = None
     """A callback to be executed when the orchestrator launches a task."""
 
+    _ready_sets: dict[RunMode, ReadySet]
+    """Incrementally maintained open and closed nodes for each run mode."""
+
     def __init__(self, planner: Planner, launcher: Launcher[t.Any]) -> None:
         """Initialize the orchestrator.
 
@@ -725,6 +916,36 @@ class Orchestrator(LoggingMixin):
         """
         self.planner = planner
         self.launcher = launcher
+        self._ready_sets = {}
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes whenever the status of any node changes.
+
+        Returns
+        -------
+        int
+        """
+        return self.planner.revision
+
+    def _get_ready_set(self, mode: RunMode) -> ReadySet:
+        """Return the ready set tracking nodes for a run mode.
+
+        The ready set is built from the planner on first use and is
+        updated incrementally as node statuses change.
+
+        Parameters
+        ----------
+        mode : RunMode
+            The run mode used to determine when a node is closed.
+
+        Returns
+        -------
+        ReadySet
+        """
+        if mode not in self._ready_sets:
+            self._ready_sets[mode] = ReadySet(self.planner, mode)
+        return self._ready_sets[mode]
 
     def get_open_nodes(self, *, mode: RunMode) -> Mapping[str, Status] | None:
         """Retrieve the set of task nodes with a non-terminal state that are
@@ -737,45 +958,13 @@ class Orchestrator(LoggingMixin):
             - An empty set indicates no actions are currently possible.
             - Null indicates all nodes are closed (traversal is complete).
         """
-        g = self.planner.graph
-        open_nodes: dict[str, Status] = {}
-        closed_set = self.get_closed_nodes(mode=mode)
-
-        if self.planner.workplan:
-            nodes = {s.name for s in self.planner.workplan.steps}
-        else:
-            nodes = {n for n in self.planner.graph}
-
-        working_list = set(nodes).difference(closed_set.keys())
+        ready_set = self._get_ready_set(mode)
 
-        if failures := {u: s for u, s in closed_set.items() if Status.is_failure(s)}:
+        if ready_set.failures:
+            failures = {u: ready_set.closed[u] for u in ready_set.failures}
             self.log.error(f"Exiting due to task failures: {failures}")
-            return None
-
-        for n in working_list:
-            in_edges = list(g.in_edges(n))
-            in_degree = g.in_degree(n)
 
-            satisfied = all(
-                (
-                    Status.is_in_progress(g.nodes[u][KEY_STATUS])
-                    or Status.is_terminal(g.nodes[u][KEY_STATUS])
-                    if mode == RunMode.Schedule
-                    else Status.is_terminal(g.nodes[u][KEY_STATUS])
-                )
-                for (u, _) in in_edges
-            )
-
-            if in_degree == 0:
-                open_nodes[n] = Status.Unsubmitted
-            elif satisfied:
-                open_nodes[n] = g.nodes[n][KEY_STATUS]
-
-        if working_list:
-            # working list has options. if none are ready, return empty set.
-            return open_nodes
-
-        return None
+        return ready_set.open_nodes()
 
     def get_closed_nodes(self, *, mode: RunMode) -> Mapping[str, Status]:
         """Retrieve the set of task nodes with a terminal state.
@@ -785,13 +974,7 @@ class Orchestrator(LoggingMixin):
         set of str
             A set of node IDs identifying nodes with a Done status.
         """
-        targets = Status.terminal_states()
-
-        if mode == RunMode.Schedule:
-            # anything previously scheduled is "closed" when scheduling
-            targets.update({Status.Submitted, Status.Running, Status.Ending})
-
-        return self.planner.retrieve_all(KEY_STATUS, filter_fn=lambda x: x in targets)
+        return dict(self._get_ready_set(mode).closed)
 
     def _locate_dependencies(self, step: LiveStep) -> list[ProcessHandle] | None:
         """Look for the dependencies of the step.
@@ -863,6 +1046,22 @@ class Orchestrator(LoggingMixin):
         self.planner.store(node, KEY_STATUS, task.status)
         return task
 
+    async def wait_for_update(self, timeout: float) -> bool:
+        """Wait until the launcher reports a possible status change, or the
+        timeout elapses.
+
+        Parameters
+        ----------
+        timeout : float
+            The maximum time (in seconds) to wait.
+
+        Returns
+        -------
+        bool
+            `True` if the wait ended due to a notification from the launcher.
+        """
+        return await self.launcher.wait_for_update(timeout)
+
     async def update_planner_state(
         self, n: str, task: Task[ProcessHandle] | None
     ) -> None:
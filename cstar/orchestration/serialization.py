@@ -1,15 +1,28 @@
 import enum
+import functools
+import os
+import threading
 import typing as t
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path, PosixPath
 
 import yaml
+from pydantic import BaseModel
 from pydantic_core import from_json
-from yaml.scanner import ScannerError
 
+from cstar.base.env import get_env_item
 from cstar.base.log import get_logger
 from cstar.execution.file_system import local_copy
+from cstar.orchestration.utils import ENV_CSTAR_ORCH_STATE_FORMAT
+
+try:
+    from yaml import CDumper as _BaseDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML was built without LibYAML
+    from yaml import Dumper as _BaseDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 log = get_logger(__name__)
 
@@ -49,6 +62,7 @@ class SerializableModel(t.Protocol):
 
 
 _T = t.TypeVar("_T", bound=SerializableModel)
+_M = t.TypeVar("_M", bound=BaseModel)
 
 
 @dataclass
@@ -101,7 +115,7 @@ def read_yaml_to_raw(path: Path) -> dict[str, t.Any]:
     dict[str, t.Any]
     """
     with path.open("r", encoding="utf-8") as fp:
-        return yaml.safe_load(fp)
+        return yaml.load(fp, Loader=_SafeLoader)  # noqa: S506
 
 
 def read_raw(
@@ -115,6 +129,9 @@ def read_raw(
     ----------
     path : Path
         The path to the persisted entity.
+    mode : PersistenceMode
+        The format of the file. The default value of `auto` selects the format
+        based on the file extension.
 
     Returns
     -------
@@ -127,16 +144,15 @@ def read_raw(
     if mode == PersistenceMode.auto:
         mode = _mode_detect(path)
 
-    readers = [read_json_to_raw]
+    # YAML is a superset of JSON, so only a failed JSON read is retried as YAML
+    readers = [read_yaml_to_raw]
     if mode == PersistenceMode.json:
-        readers.append(read_yaml_to_raw)
-    else:
-        readers.insert(0, read_yaml_to_raw)
+        readers.insert(0, read_json_to_raw)
 
     for reader_fn in readers:
         try:
             return reader_fn(path)
-        except (ScannerError, ValueError):
+        except (yaml.YAMLError, ValueError):
             msg = f"Deserialization failed with {mode!r} for {str(path)!r}"
             log.debug(msg)
 
@@ -145,7 +161,6 @@ def read_raw(
         "may point to an HTML page instead of the raw YAML content."
     )
     raise RuntimeError(msg)
-    # log.warning(msg)
 
 
 def _read_json(path: Path, klass: type[_T]) -> _T:
@@ -220,16 +235,28 @@ def set_representer(
     return dumper.represent_list(list(data))
 
 
-_RT = t.TypeVar("_RT", enum.IntEnum, enum.StrEnum, PosixPath)
+_RT = t.TypeVar("_RT", enum.IntEnum, enum.StrEnum, PosixPath, set)
+
+
+class _ModelDumper(_BaseDumper):
+    """Dumper used to serialize models, emitting with LibYAML when available."""
+
+    def ignore_aliases(self, data: t.Any) -> bool:  # noqa: ARG002, ANN401
+        """Write repeated values in full instead of using anchors and aliases."""
+        return True
 
 
 def register_representer(
     model_type: type[_RT],
-    conversion_fn: Callable[[yaml.Dumper, _RT], yaml.ScalarNode],
+    conversion_fn: Callable[[yaml.Dumper, _RT], yaml.Node],
 ) -> None:
     """Register a yaml representer for the serialization of a specific entity type."""
-    dumper = yaml.Dumper
-    dumper.add_representer(model_type, conversion_fn)
+    for dumper in (yaml.Dumper, _ModelDumper):
+        dumper.add_representer(model_type, conversion_fn)  # type: ignore[arg-type]
+
+
+register_representer(set, set_representer)
+register_representer(PosixPath, path_representer)
 
 
 def model_to_yaml(model: SerializableModel) -> str:
@@ -252,21 +279,41 @@ def model_to_yaml(model: SerializableModel) -> str:
     if hasattr(model, "application"):
         dumped["application"] = str(getattr(model, "application"))  # noqa: B009
 
-    dumper = yaml.Dumper
-    dumper.ignore_aliases = lambda *_args: True  # type: ignore[method-assign]
-    dumper.add_representer(set, set_representer)
-
-    register_representer(PosixPath, path_representer)
+    schema_url = str(dumped.pop("$schema", ""))
+    content = yaml.dump(dumped, Dumper=_ModelDumper, sort_keys=False)
 
-    if schema_url := str(dumped.pop("$schema", "")):
-        content = yaml.dump(dumped, sort_keys=False)
+    if schema_url:
         content = f"# yaml-language-server: $schema={schema_url}\n{content}"
-    else:
-        content = yaml.dump(dumped, sort_keys=False)
 
     return content
 
 
+def get_state_mode() -> PersistenceMode:
+    """Return the persistence mode of files that are only read by C-Star.
+
+    User-facing files (e.g. workplans and blueprints) are always written as YAML.
+
+    Returns
+    -------
+    PersistenceMode
+        The value of `CSTAR_ORCH_STATE_FORMAT`.
+
+    Raises
+    ------
+    ValueError
+        If `CSTAR_ORCH_STATE_FORMAT` is not a known format.
+    """
+    value = get_env_item(ENV_CSTAR_ORCH_STATE_FORMAT).value
+    options = (PersistenceMode.yaml, PersistenceMode.json)
+    if value not in options:
+        msg = (
+            f"Unknown state format {value!r}. Set {ENV_CSTAR_ORCH_STATE_FORMAT} "
+            f"to one of: {', '.join(options)}."
+        )
+        raise ValueError(msg)
+    return PersistenceMode(value)
+
+
 def _mode_detect(path: Path) -> PersistenceMode:
     """Use the file extension to select the persistence mode.
 
@@ -336,6 +383,197 @@ def deserialize(
     return model
 
 
+class FileStamp(t.NamedTuple):
+    """Identifies a version of a file's content."""
+
+    mtime_ns: int
+    """The modification time of the file (in nanoseconds)."""
+    size: int
+    """The size of the file (in bytes)."""
+
+    @classmethod
+    def of(cls, path: Path) -> "FileStamp":
+        """Return the stamp of the current content of a file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        """
+        stat = os.stat(path)
+        return cls(stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class _CacheEntry:
+    """The parsed content of a file and the models validated from it."""
+
+    stamp: FileStamp
+    """The version of the file the entry was parsed from."""
+    raw: dict[str, t.Any]
+    """The parsed content of the file."""
+    models: dict[tuple[type, str], t.Any] = field(default_factory=dict)
+    """The models validated from the content, by type and working directory."""
+
+
+class DeserializationCache:
+    """A process-wide cache of models deserialized from files.
+
+    Each file is parsed once per version, identified by its path, modification
+    time and size, and each model type is validated once from the parsed
+    content per working directory, as validators may resolve relative paths.
+    Callers receive a deep copy of the cached model, so modifying a returned
+    model never affects other callers.
+    """
+
+    max_entries: int
+    """The maximum number of files in the cache. A value of 0 disables caching."""
+
+    parses: int
+    """The number of times a file was parsed."""
+
+    hits: int
+    """The number of loads served without parsing a file."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of files in the cache. Pass 0 to disable caching.
+        """
+        self.max_entries = max_entries
+        self.parses = 0
+        self.hits = 0
+        self._entries: OrderedDict[Path, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _parse(self, path: Path, mode: PersistenceMode) -> dict[str, t.Any]:
+        """Parse a file into a dictionary."""
+        self.parses += 1
+        if mode == PersistenceMode.auto:
+            mode = _mode_detect(path)
+
+        if mode == PersistenceMode.json:
+            raw = read_json_to_raw(path)
+        else:
+            raw = read_yaml_to_raw(path)
+
+        if raw:
+            raw.pop("$schema", None)
+        return raw
+
+    def load(
+        self,
+        path: Path | str,
+        klass: type[_M],
+        mode: PersistenceMode = PersistenceMode.auto,
+    ) -> _M:
+        """Deserialize a file, re-using a previously deserialized model if the
+        file is unchanged.
+
+        Parameters
+        ----------
+        path : Path | str
+            The location of the file.
+        klass : type[_M]
+            The type to instantiate.
+        mode : PersistenceMode
+            The type of serializer used to create the file.
+
+        Returns
+        -------
+        _M
+            A copy of the cached model.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        """
+        if not self.max_entries:
+            return deserialize(path, klass, mode=mode)
+
+        path = Path(path).resolve()
+        model_key = (klass, os.getcwd())
+        try:
+            stamp = FileStamp.of(path)
+        except FileNotFoundError:
+            msg = f"No file found at path `{path}` to deserialize to `{klass.__name__}`"
+            raise FileNotFoundError(msg) from None
+
+        model: _M | None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(path)
+                model = entry.models.get(model_key)
+            else:
+                entry, model = None, None
+
+        if entry is None:
+            entry = _CacheEntry(stamp, self._parse(path, mode))
+            with self._lock:
+                self._entries[path] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        if model is None:
+            model = klass.model_validate(entry.raw)
+            entry.models[model_key] = model
+        else:
+            self.hits += 1
+
+        return model.model_copy(deep=True)
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Remove a file, or every file, from the cache.
+
+        Parameters
+        ----------
+        path : Path | str | None
+            The location of the file to remove. Pass `None` to clear the cache.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path).resolve(), None)
+
+
+@functools.lru_cache
+def get_deserialization_cache() -> DeserializationCache:
+    """Return the process-wide cache of deserialized models."""
+    return DeserializationCache()
+
+
+def deserialize_cached(
+    path: Path | str,
+    klass: type[_M],
+    mode: PersistenceMode = PersistenceMode.auto,
+) -> _M:
+    """Deserialize a file using the process-wide `DeserializationCache`.
+
+    Use this for files that are read repeatedly (e.g. blueprints). The returned
+    model is a copy that may be freely modified.
+
+    Parameters
+    ----------
+    path : Path | str
+        The location of the file.
+    klass : type[_M]
+        The type to instantiate.
+    mode : PersistenceMode
+        The type of serializer used to create the file.
+
+    Returns
+    -------
+    _M
+    """
+    return get_deserialization_cache().load(path, klass, mode=mode)
+
+
 def try_deserialize(
     path: Path | str,
     klass: type[_T],
@@ -389,6 +627,8 @@ def serialize(
         nbytes = fp.write(content)
         fp.flush()
 
+    # a rewrite may not change the size or (coarse) modification time of the file
+    get_deserialization_cache().invalidate(path)
     return nbytes
 
 
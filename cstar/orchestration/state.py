@@ -1,19 +1,36 @@
 import asyncio
+import functools
+import json
+import os
+import threading
 import typing as t
 from pathlib import Path
 
+from cstar.base.env import get_env_item
+from cstar.base.feature import ENV_FF_ORCH_STATE_JOURNAL, is_feature_enabled
+from cstar.base.log import get_logger
 from cstar.base.utils import slugify
 from cstar.execution.file_system import StateDirectoryManager
+from cstar.orchestration.catalog import get_run_catalog
 from cstar.orchestration.serialization import (
     PersistenceMode,
     SerializableModel,
     deserialize,
     serialize,
 )
+from cstar.orchestration.utils import ENV_CSTAR_ORCH_JOURNAL_COMPACT
+
+log = get_logger(__name__)
 
 EXT_SENTINEL: t.Final[str] = "sentinel"
 """File exension used for persisting sentinels."""
 
+JOURNAL_NAME: t.Final[str] = "state.journal.jsonl"
+"""File name of the append-only log of state transitions."""
+
+SNAPSHOT_NAME: t.Final[str] = "state.snapshot.json"
+"""File name of the compacted snapshot of the state journal."""
+
 
 class StateProxy(SerializableModel, t.Protocol):
     """Protocol defining API required to serialize and deserialize objects
@@ -32,6 +49,293 @@ the `StateProxy` protocol.
 """
 
 
+class JournalRecord(t.NamedTuple):
+    """A single state transition persisted to the journal."""
+
+    name: str
+    """The safe name of the state proxy."""
+    seen: list[int] | None
+    """The version of the sentinel file when the transition was recorded."""
+    data: dict[str, t.Any]
+    """The serialized state proxy."""
+
+
+def _sentinel_version(path: Path) -> list[int] | None:
+    """Return a token identifying the current content of a sentinel file.
+
+    The token changes whenever the file is rewritten. It is only compared for
+    equality, so it does not depend on the clocks of the hosts writing the file.
+
+    Parameters
+    ----------
+    path : Path
+        The path to a sentinel file.
+
+    Returns
+    -------
+    list[int] | None
+        The inode, size and modification time (ns) of the file, or `None` if
+        the file does not exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+class StateJournal:
+    """An append-only log of state transitions for a single run.
+
+    Transitions are buffered in memory and appended to disk on `flush`.
+    When the number of appended records exceeds a threshold, the latest record
+    for each state proxy is compacted into a snapshot and the log is truncated.
+    Replaying the snapshot and log reconstructs the state in linear time.
+    """
+
+    run_id: str
+    """The run-id whose state is journaled."""
+
+    state_dir: Path
+    """The directory containing the journal and snapshot."""
+
+    compact_after: int
+    """The number of records appended to the log before it is compacted."""
+
+    _latest: dict[str, JournalRecord] | None
+    """The latest record for each state proxy, loaded on first access."""
+
+    _pending: dict[str, StateProxy]
+    """State proxies recorded since the last call to `materialize`."""
+
+    _buffer: list[str]
+    """Serialized records that have not been appended to the log."""
+
+    _num_logged: int
+    """The number of records in the log since the last compaction."""
+
+    _lock: threading.Lock
+    """Lock protecting the buffer from concurrent flushes."""
+
+    def __init__(self, run_id: str, state_dir: Path, compact_after: int) -> None:
+        """Initialize the journal.
+
+        Parameters
+        ----------
+        run_id : str
+            The run-id whose state is journaled.
+        state_dir : Path
+            The directory containing the journal and snapshot.
+        compact_after : int
+            The number of records appended to the log before it is compacted.
+        """
+        self.run_id = run_id
+        self.state_dir = state_dir
+        self.compact_after = compact_after
+        self._latest = None
+        self._pending = {}
+        self._buffer = []
+        self._num_logged = 0
+        self._lock = threading.Lock()
+
+    @property
+    def journal_path(self) -> Path:
+        """Return the path to the append-only log.
+
+        Returns
+        -------
+        Path
+        """
+        return self.state_dir / JOURNAL_NAME
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Return the path to the compacted snapshot.
+
+        Returns
+        -------
+        Path
+        """
+        return self.state_dir / SNAPSHOT_NAME
+
+    @property
+    def records(self) -> dict[str, JournalRecord]:
+        """Return the latest record for each state proxy.
+
+        Returns
+        -------
+        dict[str, JournalRecord]
+        """
+        if self._latest is None:
+            self._latest = self.replay()
+        return self._latest
+
+    def replay(self) -> dict[str, JournalRecord]:
+        """Reconstruct the latest record for each state proxy from disk.
+
+        Returns
+        -------
+        dict[str, JournalRecord]
+        """
+        latest: dict[str, JournalRecord] = {}
+
+        if self.snapshot_path.exists():
+            raw = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            for item in raw:
+                record = JournalRecord(*item)
+                latest[record.name] = record
+
+        num_logged = 0
+        if self.journal_path.exists():
+            with self.journal_path.open("r", encoding="utf-8") as fp:
+                for line in fp:
+                    try:
+                        record = JournalRecord(*json.loads(line))
+                    except (ValueError, TypeError):
+                        # a torn write can leave a partial trailing record
+                        msg = (
+                            f"Skipping malformed journal record in {self.journal_path}"
+                        )
+                        log.warning(msg)
+                        continue
+                    latest[record.name] = record
+                    num_logged += 1
+
+        self._num_logged = num_logged
+        return latest
+
+    def append(self, proxy: StateProxy, seen: list[int] | None = None) -> None:
+        """Record the current state of a proxy.
+
+        The record is buffered in memory until the next call to `flush`.
+
+        Parameters
+        ----------
+        proxy : StateProxy
+            The state proxy to record.
+        seen : list[int] | None
+            The version of the sentinel file superseded by the record.
+        """
+        data = json.loads(proxy.model_dump_json(by_alias=True))
+        record = JournalRecord(proxy.safe_name, seen, data)
+
+        self.records[record.name] = record
+        self._pending[record.name] = proxy
+        with self._lock:
+            self._buffer.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def flush(self, *, sync: bool = False) -> int:
+        """Append all buffered records to the log.
+
+        Parameters
+        ----------
+        sync : bool
+            If `True`, force the log to be written to the storage device.
+
+        Returns
+        -------
+        int
+            The number of records appended.
+        """
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+
+        if buffer or sync:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as fp:
+                fp.write("".join(buffer))
+                fp.flush()
+                if sync:
+                    os.fsync(fp.fileno())
+
+        self._num_logged += len(buffer)
+        if self._num_logged >= self.compact_after:
+            self.compact()
+
+        return len(buffer)
+
+    def compact(self) -> None:
+        """Write the latest record for each state proxy to a snapshot and
+        truncate the log.
+        """
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump(list(self.records.values()), fp, separators=(",", ":"))
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        tmp_path.replace(self.snapshot_path)
+        self.journal_path.write_text("", encoding="utf-8")
+        self._num_logged = 0
+
+        msg = f"Compacted {len(self.records)} journal records into {self.snapshot_path}"
+        log.debug(msg)
+
+    def materialize(self, *, mode: PersistenceMode = PersistenceMode.yaml) -> set[Path]:
+        """Write a sentinel file for every proxy recorded since the last call.
+
+        Parameters
+        ----------
+        mode : PersistenceMode
+            The persistence mode to use when serializing
+
+        Returns
+        -------
+        set[Path]
+            The paths to the written sentinel files.
+        """
+        pending, self._pending = self._pending, {}
+        paths: set[Path] = set()
+
+        for name, proxy in pending.items():
+            path = StateRepository.sentinel_path(proxy, run_id=self.run_id, mode=mode)
+            serialize(path, proxy, mode=mode)
+            paths.add(path)
+
+            # the written file matches the record and must not supersede it
+            if record := self.records.get(name):
+                self.records[name] = record._replace(seen=_sentinel_version(path))
+
+        return paths
+
+
+def get_state_journal(run_id: str | None = None) -> StateJournal:
+    """Return the state journal for a run.
+
+    Parameters
+    ----------
+    run_id : str | None
+        The run-id whose state is journaled. Defaults to the current run-id.
+
+    Returns
+    -------
+    StateJournal
+    """
+    state_dir = StateDirectoryManager.run_state_dir(run_id=run_id)
+    return _get_state_journal(state_dir.name, state_dir)
+
+
+@functools.lru_cache
+def _get_state_journal(run_id: str, state_dir: Path) -> StateJournal:
+    """Create a state journal shared by all callers for a run.
+
+    Parameters
+    ----------
+    run_id : str
+        The run-id whose state is journaled.
+    state_dir : Path
+        The directory containing the journal and snapshot.
+
+    Returns
+    -------
+    StateJournal
+    """
+    compact_after = int(get_env_item(ENV_CSTAR_ORCH_JOURNAL_COMPACT).value)
+    return StateJournal(run_id, state_dir, compact_after)
+
+
 async def load_sentinels(
     klass: type[_TStateProxy],
     *,
@@ -59,8 +363,27 @@ class StateRepository:
     """API used to manage storage of state information related to a run.
 
     Contains standard CRUD operations for sentinel (task) records.
+
+    When journaling is enabled, sentinel updates are appended to the
+    `StateJournal` for the run instead of rewriting the sentinel file.
     """
 
+    journaled: bool
+    """Flag indicating if state transitions are persisted to a journal."""
+
+    def __init__(self, *, journaled: bool | None = None) -> None:
+        """Initialize the repository.
+
+        Parameters
+        ----------
+        journaled : bool | None
+            Pass `True` to persist state transitions to a journal. Defaults to the
+            value of the `CSTAR_FF_ORCH_STATE_JOURNAL` feature flag.
+        """
+        if journaled is None:
+            journaled = is_feature_enabled(ENV_FF_ORCH_STATE_JOURNAL)
+        self.journaled = journaled
+
     @classmethod
     def sentinel_name(
         cls,
@@ -128,10 +451,38 @@ class StateRepository:
             proxy = proxy.safe_name
 
         persist_to = StateRepository.sentinel_path(proxy)
+
+        if self.journaled:
+            record = get_state_journal().records.get(slugify(proxy))
+            if record and not self._is_newer(persist_to, record):
+                return klass.model_validate(record.data)
+
         if persist_to.exists():
             return await asyncio.to_thread(deserialize, persist_to, klass, mode=mode)
         return None
 
+    @staticmethod
+    def _is_newer(path: Path, record: JournalRecord) -> bool:
+        """Return `True` if a sentinel file was modified after a journal record.
+
+        Sentinel files may be updated by processes outside the orchestrator
+        (e.g. the local job proxy), so the most recent source is preferred. A
+        file is newer if it was rewritten after the record was appended.
+
+        Parameters
+        ----------
+        path : Path
+            The path to a sentinel file.
+        record : JournalRecord
+            The latest journal record for the same state proxy.
+
+        Returns
+        -------
+        bool
+        """
+        version = _sentinel_version(path)
+        return version is not None and version != record.seen
+
     async def put_sentinel(
         self,
         proxy: StateProxy,
@@ -156,12 +507,53 @@ class StateRepository:
         """
         persist_to = self.sentinel_path(proxy, mode=mode)
 
+        if self.journaled:
+            if not persist_to.exists():
+                # materialize the first state so external processes can locate it
+                await asyncio.to_thread(serialize, persist_to, proxy, mode=mode)
+
+            get_state_journal().append(proxy, _sentinel_version(persist_to))
+            return persist_to
+
         if persist_to.exists():
             persist_to.unlink()
 
         num_bytes = await asyncio.to_thread(serialize, persist_to, proxy, mode=mode)
+
+        if num_bytes > 0 and (catalog := get_run_catalog()):
+            row = self._catalog_row(persist_to, proxy)
+            await asyncio.to_thread(catalog.put_steps, [row])
+
         return persist_to if num_bytes > 0 else None
 
+    @staticmethod
+    def _catalog_row(
+        path: Path,
+        proxy: StateProxy,
+    ) -> tuple[Path, str, str, int, str, int, str]:
+        """Create the record used to index a sentinel in the run catalog.
+
+        Parameters
+        ----------
+        path : Path
+            The path to the sentinel file.
+        proxy : StateProxy
+            The state proxy persisted to the sentinel file.
+
+        Returns
+        -------
+        tuple[Path, str, str, int, str, int, str]
+        """
+        return (
+            path,
+            path.parent.name,
+            proxy.safe_name,
+            int(getattr(proxy, "status", 0)),
+            str(getattr(proxy, "pid", "")),
+            path.stat().st_mtime_ns,
+            proxy.model_dump_json(by_alias=True),
+        )
+
     async def list_sentinels(
         self,
         klass: type[_TStateProxy],
@@ -181,10 +573,129 @@ class StateRepository:
         list[Path]
         """
         files = await self._list_sentinel_files(run_id=run_id, mode=mode)
+
+        journaled: list[_TStateProxy] = []
+        if self.journaled:
+            records = get_state_journal(run_id=run_id).records
+            by_path = {
+                self.sentinel_path(name, run_id=run_id, mode=mode): record
+                for name, record in records.items()
+            }
+            journaled = [
+                klass.model_validate(record.data)
+                for path, record in by_path.items()
+                if not self._is_newer(path, record)
+            ]
+            files = [
+                path
+                for path in files
+                if path not in by_path or self._is_newer(path, by_path[path])
+            ]
+
+        loaded = await self._load_sentinel_files(files, klass, run_id=run_id, mode=mode)
+        return [*journaled, *loaded]
+
+    async def _load_sentinel_files(
+        self,
+        files: list[Path],
+        klass: type[_TStateProxy],
+        *,
+        run_id: str | None = None,
+        mode: PersistenceMode = PersistenceMode.yaml,
+    ) -> list[_TStateProxy]:
+        """Deserialize sentinel files.
+
+        When the run catalog is enabled, sentinels that have not been modified
+        since they were indexed are loaded from the catalog.
+
+        Parameters
+        ----------
+        files : list[Path]
+            The sentinel files to load.
+        klass : type[_TStateProxy]
+            The type of handles to deserialize
+        run_id : str | None
+            The run-id owning the sentinel files.
+        mode : PersistenceMode
+            The persistence mode to use when deserializing
+
+        Returns
+        -------
+        list[_TStateProxy]
+        """
+        if not (catalog := get_run_catalog()):
+            coros = [
+                asyncio.to_thread(deserialize, path, klass, mode=mode) for path in files
+            ]
+            return await asyncio.gather(*coros)
+
+        state_dir = StateDirectoryManager.run_state_dir(run_id=run_id)
+        indexed = await asyncio.to_thread(catalog.steps, state_dir.name)
+
+        loaded: dict[Path, _TStateProxy] = {}
+        stale: list[Path] = []
+
+        for path in files:
+            entry = indexed.get(path)
+            if entry and entry[0] == path.stat().st_mtime_ns:
+                loaded[path] = klass.model_validate_json(entry[1])
+            else:
+                stale.append(path)
+
         coros = [
-            asyncio.to_thread(deserialize, path, klass, mode=mode) for path in files
+            asyncio.to_thread(deserialize, path, klass, mode=mode) for path in stale
         ]
-        return await asyncio.gather(*coros)
+        refreshed = await asyncio.gather(*coros)
+        loaded.update(zip(stale, refreshed, strict=True))
+
+        if stale:
+            rows = [self._catalog_row(p, loaded[p]) for p in stale]
+            await asyncio.to_thread(catalog.put_steps, rows)
+
+        return [loaded[path] for path in files]
+
+    async def flush(self, *, sync: bool = False) -> int:
+        """Append buffered state transitions to the journal.
+
+        Parameters
+        ----------
+        sync : bool
+            If `True`, force the journal to be written to the storage device.
+
+        Returns
+        -------
+        int
+            The number of transitions written.
+        """
+        if not self.journaled:
+            return 0
+
+        return await asyncio.to_thread(get_state_journal().flush, sync=sync)
+
+    async def close(
+        self,
+        *,
+        mode: PersistenceMode = PersistenceMode.yaml,
+    ) -> set[Path]:
+        """Flush the journal to the storage device and write the latest state
+        of every updated proxy to its sentinel file.
+
+        Parameters
+        ----------
+        mode : PersistenceMode
+            The persistence mode to use when serializing
+
+        Returns
+        -------
+        set[Path]
+            The paths to the updated sentinel files.
+        """
+        if not self.journaled:
+            return set()
+
+        journal = get_state_journal()
+        await asyncio.to_thread(journal.flush, sync=True)
+        return await asyncio.to_thread(journal.materialize, mode=mode)
 
     async def _list_sentinel_files(
         self,
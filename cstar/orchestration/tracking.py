@@ -7,14 +7,21 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field
 
+from cstar.base.cache import exclusive_lock
 from cstar.base.log import LoggingMixin
 from cstar.base.utils import slugify, utc_now
 from cstar.execution.file_system import (
     StateDirectoryManager,
     local_copy,
 )
+from cstar.orchestration.catalog import RunCatalog, get_run_catalog
 from cstar.orchestration.models import Workplan
-from cstar.orchestration.serialization import PersistenceMode, deserialize, serialize
+from cstar.orchestration.serialization import (
+    PersistenceMode,
+    deserialize,
+    get_state_mode,
+    serialize,
+)
 
 
 class WorkplanRun(BaseModel):
@@ -82,8 +89,47 @@ class TrackingRepository(LoggingMixin):
     _HISTORY_DIR: t.Final[str] = "history"
     """The directory containing all run history."""
 
-    _MODE: PersistenceMode = PersistenceMode.yaml
-    """The serialization mode to use."""
+    _GENERATION_FILE: t.Final[str] = "latest.generation"
+    """The file counting the updates made to the latest-run records."""
+
+    _MODES: t.Final[tuple[PersistenceMode, ...]] = (
+        PersistenceMode.yaml,
+        PersistenceMode.json,
+    )
+    """The serialization modes in which run records may have been persisted."""
+
+    _HISTORY_GLOB: t.Final[str] = "??????????????.??????"
+    """Pattern matching the formatted run date of a history record file name."""
+
+    @property
+    def _mode(self) -> PersistenceMode:
+        """Return the serialization mode used to persist new run records."""
+        return get_state_mode()
+
+    def _glob(
+        self,
+        directory: Path,
+        pattern: str,
+        *,
+        recursive: bool = False,
+    ) -> list[Path]:
+        """Find the run records in any serialization mode matching a pattern.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory to search.
+        pattern : str
+            The pattern matching the record file names, without extension.
+        recursive : bool
+            Pass `True` to search sub-directories recursively.
+
+        Returns
+        -------
+        list[Path]
+        """
+        glob = directory.rglob if recursive else directory.glob
+        return [path for mode in self._MODES for path in glob(f"{pattern}.{mode}")]
 
     @property
     def _root(self) -> Path:
@@ -131,36 +177,52 @@ class TrackingRepository(LoggingMixin):
         """
         return run_date.strftime("%Y%m%d%H%M%S.%f")
 
-    def _runfile_name(self, run_date: datetime) -> str:
+    def _runfile_name(
+        self,
+        run_date: datetime,
+        mode: PersistenceMode | None = None,
+    ) -> str:
         """Generate the file name for persisting a `WorkplanRun` history entry to disk.
 
         Parameters
         ----------
         run_date : datetime
             The start time of the run.
+        mode : PersistenceMode | None
+            The serialization mode of the record. Defaults to the configured mode.
 
         Returns
         -------
         str
         """
         formatted_dt = self._format_run_date(run_date)
-        return f"{formatted_dt}.{TrackingRepository._MODE.value}"
+        return f"{formatted_dt}.{(mode or self._mode).value}"
 
-    def _latestfile_name(self, run_id: str) -> str:
+    def _latestfile_name(
+        self,
+        run_id: str,
+        mode: PersistenceMode | None = None,
+    ) -> str:
         """Generate the file name for persisting the latest `WorkplanRun` history entry to disk.
 
         Parameters
         ----------
         run_id : str
             The run_id of the WorkplanRun
+        mode : PersistenceMode | None
+            The serialization mode of the record. Defaults to the configured mode.
 
         Returns
         -------
         str
         """
-        return f"{run_id}.{TrackingRepository._MODE.value}"
+        return f"{run_id}.{(mode or self._mode).value}"
 
-    def latest_path(self, run_id: str) -> Path:
+    def latest_path(
+        self,
+        run_id: str,
+        mode: PersistenceMode | None = None,
+    ) -> Path:
         """Generate the full path for persisting a `WorkplanRun` to disk as
         the "latest run" record.
 
@@ -168,19 +230,26 @@ class TrackingRepository(LoggingMixin):
         ----------
         run_id : str
             The run_id of the WorkplanRun
+        mode : PersistenceMode | None
+            The serialization mode of the record. Defaults to the configured mode.
 
         Returns
         -------
         Path
         """
-        runfile_name = self._latestfile_name(run_id)
+        runfile_name = self._latestfile_name(run_id, mode)
         return self.latest_dir / runfile_name
 
     def run_history_dir(self, run_id: str) -> Path:
         """Generate the path to the history directory."""
         return self.history_dir / run_id
 
-    def history_path(self, run_id: str, run_date: datetime) -> Path:
+    def history_path(
+        self,
+        run_id: str,
+        run_date: datetime,
+        mode: PersistenceMode | None = None,
+    ) -> Path:
         """Generate the full path for persisting a `WorkplanRun` to disk as
         a history record.
 
@@ -190,12 +259,14 @@ class TrackingRepository(LoggingMixin):
             The run_id of the WorkplanRun
         run_date : datetime
             The datetime the run was executed
+        mode : PersistenceMode | None
+            The serialization mode of the record. Defaults to the configured mode.
 
         Returns
         -------
         Path
         """
-        runfile_name = self._runfile_name(run_date)
+        runfile_name = self._runfile_name(run_date, mode)
         return self.run_history_dir(run_id) / runfile_name
 
     def _find_run_path(self, run_id: str, run_date: datetime | None) -> Path:
@@ -216,18 +287,21 @@ class TrackingRepository(LoggingMixin):
         Path
         """
         if run_date:
-            path = self.history_path(run_id, run_date)
+            for mode in self._MODES:
+                path = self.history_path(run_id, run_date, mode)
+                if path.exists():
+                    msg = f"Located workplan run in history for {run_id!r} at: {path}"
+                    self.log.trace(msg)
+                    return path
+
+        for mode in self._MODES:
+            path = self.latest_path(run_id, mode)
             if path.exists():
-                msg = f"Located workplan run in history for {run_id!r} at: {path}"
+                msg = f"Located latest run of {run_id!r} at: {path}"
                 self.log.trace(msg)
                 return path
 
-        path = self.latest_path(run_id)
-        if path.exists():
-            msg = f"Located latest run of {run_id!r} at: {path}"
-            self.log.trace(msg)
-
-        return path
+        return self.latest_path(run_id)
 
     def list_runtracking_paths(
         self,
@@ -253,9 +327,10 @@ class TrackingRepository(LoggingMixin):
         """
         run_paths: list[Path] = []
 
-        latest = self.latest_path(run_id)
-        if latest.exists():
-            run_paths.append(latest)
+        for mode in self._MODES:
+            latest = self.latest_path(run_id, mode)
+            if latest.exists():
+                run_paths.append(latest)
 
         search_dir = self.run_history_dir(run_id=run_id)
         all_runs = search_dir.iterdir() if search_dir.exists() else list[Path]()
@@ -355,17 +430,36 @@ class TrackingRepository(LoggingMixin):
         Path
             The path to the persisted history record
         """
-        run_path = self.history_path(run.run_id, run.start_at)
-        latest_path = self.latest_path(run.run_id)
+        mode = self._mode
+        run_path = self.history_path(run.run_id, run.start_at, mode)
+        latest_path = self.latest_path(run.run_id, mode)
 
-        if not serialize(run_path, run):
+        # bring the catalog up to date before the latest-run record changes
+        catalog = await self._get_catalog()
+
+        if not serialize(run_path, run, mode=mode):
             self.log.warning("Run could not be persisted")
 
         if not latest_path.parent.exists():
             latest_path.parent.mkdir(parents=True)
 
-        latest_path.unlink(missing_ok=True)
+        # a latest record written in another mode must not shadow this run
+        for prior_mode in self._MODES:
+            self.latest_path(run.run_id, prior_mode).unlink(missing_ok=True)
         latest_path.symlink_to(run_path)
+        generation = self._bump_generation()
+
+        if catalog:
+            record = run.model_dump_json()
+            await asyncio.to_thread(
+                catalog.put_run,
+                run.run_id,
+                run.start_at,
+                run.workplan_path,
+                run_path,
+                record,
+                generation,
+            )
 
         msg = f"Run persisted to: {run_path}"
         self.log.debug(msg)
@@ -381,7 +475,11 @@ class TrackingRepository(LoggingMixin):
         -------
         Sequence[WorkplanRun]
         """
-        run_paths = list(self.latest_dir.glob(f"{run_id_filter}*.{self._MODE}"))
+        if catalog := await self._get_catalog():
+            records = await asyncio.to_thread(catalog.latest_runs, run_id_filter)
+            return [WorkplanRun.model_validate_json(r.record) for r in records]
+
+        run_paths = self._glob(self.latest_dir, f"{run_id_filter}*")
         coros = [
             asyncio.to_thread(deserialize, run_path, WorkplanRun)
             for run_path in run_paths
@@ -398,11 +496,114 @@ class TrackingRepository(LoggingMixin):
         -------
         Sequence[WorkplanRun]
         """
+        if catalog := await self._get_catalog():
+            records = await asyncio.to_thread(catalog.history_runs, run_id_filter)
+            return [WorkplanRun.model_validate_json(r.record) for r in records]
+
         # Filter run-id subfolder w/filename format YYYYMMDDHHMMSS.XXXXXX.yaml
-        glob_pattern = f"{run_id_filter}*/??????????????.??????.{self._MODE}"
-        run_paths = list(self.history_dir.rglob(glob_pattern))
+        glob_pattern = f"{run_id_filter}*/{self._HISTORY_GLOB}"
+        run_paths = self._glob(self.history_dir, glob_pattern, recursive=True)
         coros = [
             asyncio.to_thread(deserialize, run_path, WorkplanRun)
             for run_path in run_paths
         ]
         return await asyncio.gather(*coros)
+
+    async def _get_catalog(self) -> RunCatalog | None:
+        """Return the run catalog if indexing is enabled.
+
+        The catalog is rebuilt from the persisted run records the first time
+        it is used and whenever the generation it indexed differs from the
+        generation of the latest-run records, e.g. after runs were persisted
+        while indexing was disabled.
+
+        Returns
+        -------
+        RunCatalog | None
+        """
+        if (catalog := get_run_catalog()) is None:
+            return None
+
+        if not catalog.exists or catalog.generation() != self._generation():
+            await asyncio.to_thread(self.rebuild_catalog, catalog)
+        return catalog
+
+    @property
+    def _generation_path(self) -> Path:
+        """Return the path to the file counting updates to latest-run records."""
+        return self._root / self._GENERATION_FILE
+
+    def _generation(self) -> int:
+        """Return the number of updates made to the latest-run records.
+
+        Returns
+        -------
+        int
+        """
+        try:
+            return int(self._generation_path.read_text())
+        except (OSError, ValueError):
+            return 0
+
+    def _bump_generation(self) -> tuple[int, int]:
+        """Count an update to the latest-run records.
+
+        Returns
+        -------
+        tuple[int, int]
+            The generation before and after the update.
+        """
+        path = self._generation_path
+        with exclusive_lock(path.with_name(f"{path.name}.lock")):
+            prior = self._generation()
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}")
+            tmp_path.write_text(str(prior + 1))
+            tmp_path.replace(path)
+        return prior, prior + 1
+
+    def _latest_links(self) -> dict[str, Path]:
+        """Return the history path targeted by each latest-run record.
+
+        Records whose history file no longer exists are ignored.
+
+        Returns
+        -------
+        dict[str, Path]
+            Mapping of run-ids to the history path of their latest run.
+        """
+        return {
+            path.stem: path.readlink()
+            for path in self._glob(self.latest_dir, "*")
+            if path.is_symlink() and path.exists()
+        }
+
+    def rebuild_catalog(self, catalog: RunCatalog | None = None) -> int:
+        """Replace the content of the run catalog with the persisted run records.
+
+        Parameters
+        ----------
+        catalog : RunCatalog | None
+            The catalog to rebuild. Defaults to the catalog in the state directory.
+
+        Returns
+        -------
+        int
+            The number of runs indexed.
+        """
+        catalog = catalog or RunCatalog()
+        glob_pattern = f"*/{self._HISTORY_GLOB}"
+
+        # read before the records so updates made while indexing trigger a rebuild
+        generation = self._generation()
+
+        runs: list[tuple[str, datetime, Path, Path, str]] = []
+        for run_path in self._glob(self.history_dir, glob_pattern):
+            run = deserialize(run_path, WorkplanRun)
+            record = run.model_dump_json()
+            runs.append((run.run_id, run.start_at, run.workplan_path, run_path, record))
+
+        catalog.replace(runs, self._latest_links().items(), generation)
+
+        msg = f"Indexed {len(runs)} runs in catalog: {catalog.path}"
+        self.log.debug(msg)
+        return len(runs)
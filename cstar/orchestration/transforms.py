@@ -31,7 +31,11 @@ from cstar.orchestration.models import (
     Workplan,
 )
 from cstar.orchestration.orchestration import LiveStep, LiveWorkplan
-from cstar.orchestration.serialization import deserialize, serialize
+from cstar.orchestration.serialization import (
+    deserialize,
+    deserialize_cached,
+    serialize,
+)
 from cstar.orchestration.tracking import TrackingRepository, WorkplanRun
 
 if t.TYPE_CHECKING:
@@ -599,7 +603,7 @@ class OverrideTransform(Transform[LiveStep]):
         )
         bp_type = app.blueprint
 
-        blueprint: Blueprint = deserialize(bp_path, bp_type)
+        blueprint: Blueprint = deserialize_cached(bp_path, bp_type)
 
         updated_bp = self.apply(blueprint, step.blueprint_overrides)
         update: dict[str, t.Any] = {"blueprint_overrides": {}}
@@ -757,7 +761,7 @@ class DirectiveConfig(BaseModel):
                 workplan = DirectiveConfig.load_workplan()
 
             app = get_app_for_blueprint(local_bp)
-            blueprint = t.cast("Blueprint", deserialize(local_bp, app.blueprint))
+            blueprint = t.cast("Blueprint", deserialize_cached(local_bp, app.blueprint))
 
             step = LiveStep(
                 name="directive-step",
@@ -6,6 +6,12 @@ from cstar.base.env import ENV_CSTAR_RUNID, EnvVar, generate_run_id
 _GROUP_ORCH: t.Final[str] = "Orchestration"
 _GROUP_DEV: t.Final[str] = "Developer Only"
 
+ORCH_ENGINE_PREFECT: t.Final[str] = "prefect"
+"""Run workplans as Prefect flows, caching SLURM submissions as Prefect results."""
+
+ORCH_ENGINE_NATIVE: t.Final[str] = "native"
+"""Run workplans in-process, recording SLURM submissions in a submission ledger."""
+
 
 ENV_CSTAR_ORCH_DELAYS: t.Annotated[
     t.Literal["CSTAR_ORCH_DELAYS"],
@@ -27,6 +33,37 @@ ENV_CSTAR_ORCH_TRX_FREQ: t.Annotated[
 ] = "CSTAR_ORCH_TRX_FREQ"
 """Environment variable containing the time span for time-splitting transforms."""
 
+ENV_CSTAR_ORCH_JOURNAL_COMPACT: t.Annotated[
+    t.Literal["CSTAR_ORCH_JOURNAL_COMPACT"],
+    EnvVar(
+        "Number of journaled state transitions written before compacting into a snapshot.",
+        _GROUP_ORCH,
+        "1000",
+    ),
+] = "CSTAR_ORCH_JOURNAL_COMPACT"
+"""Environment variable containing the number of journaled state transitions
+written before the journal is compacted into a snapshot."""
+
+ENV_CSTAR_ORCH_ENGINE: t.Annotated[
+    t.Literal["CSTAR_ORCH_ENGINE"],
+    EnvVar(
+        "Engine used to execute workplans. Options: prefect, native.",
+        _GROUP_ORCH,
+        ORCH_ENGINE_PREFECT,
+    ),
+] = "CSTAR_ORCH_ENGINE"
+"""Environment variable containing the engine used to execute workplans."""
+
+ENV_CSTAR_ORCH_STATE_FORMAT: t.Annotated[
+    t.Literal["CSTAR_ORCH_STATE_FORMAT"],
+    EnvVar(
+        "File format of internal run records. Options: yaml, json.",
+        _GROUP_ORCH,
+        "yaml",
+    ),
+] = "CSTAR_ORCH_STATE_FORMAT"
+"""Environment variable containing the file format of internal run records."""
+
 ENV_CSTAR_SLURM_ACCOUNT: t.Annotated[
     t.Literal["CSTAR_SLURM_ACCOUNT"],
     EnvVar(
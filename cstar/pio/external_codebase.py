@@ -1,8 +1,8 @@
-import os
 import shutil
 import typing as t
 from pathlib import Path
 
+from cstar.base.build_tools import build_jobs, compiler_launcher
 from cstar.base.external_codebase import ExternalCodeBase
 from cstar.base.gitutils import _check_local_repo_changed_from_remote
 from cstar.base.utils import _run_cmd
@@ -21,7 +21,8 @@ class PIOExternalCodeBase(ExternalCodeBase):
     (GPTL) is disabled as ROMS links only `-lpiof -lpioc`.
 
     Note: unlike MARBL, the built libraries carry no compiler suffix, so switching
-    compilers on a system requires a fresh build (e.g. `CSTAR_FRESH_CODEBASES=1`).
+    compilers on a system requires a fresh build. Shared installs (see
+    `ExternalCodeBase.install`) are built separately for each compiler.
     """
 
     @property
@@ -36,13 +37,21 @@ class PIOExternalCodeBase(ExternalCodeBase):
     def root_env_var(self) -> str:
         return "PIO_ROOT"
 
-    def _get_dependency_root(self, env_var: str) -> str | None:
-        """Look up a dependency location from the C-Star environment or the process
-        environment.
+    @property
+    def build_options(self) -> dict[str, str | None]:
+        return {"ranlib": self._ranlib()}
+
+    def _ranlib(self) -> str | None:
+        """Return the `ranlib` CMake must use to finish static archives, if any.
+
+        On macOS, CMake finishes static archives with Apple-style ranlib flags
+        (`-c`) but pairs conda's clang with llvm-ranlib, which rejects them.
+        Pin CMAKE_RANLIB to the `ranlib` on PATH (cctools in a conda env,
+        Apple's outside one), which accepts those flags.
         """
-        return get_sysmgr().environment.environment_variables.get(
-            env_var
-        ) or os.environ.get(env_var)
+        if get_sysmgr().name.startswith("darwin"):
+            return shutil.which("ranlib")
+        return None
 
     def _configure(self) -> None:
         """Configure the PIO codebase on the local machine.
@@ -62,7 +71,7 @@ class PIOExternalCodeBase(ExternalCodeBase):
         pio_root = self.working_copy.path
         # Set env var:
         cstar_sysmgr = get_sysmgr()
-        cstar_sysmgr.environment.set_env_var(self.root_env_var, str(pio_root))
+        self._set_environment(pio_root)
 
         netcdf_home = self._get_dependency_root("NETCDFHOME")
         pnetcdf_home = self._get_dependency_root("PNETCDFHOME")
@@ -87,15 +96,12 @@ class PIOExternalCodeBase(ExternalCodeBase):
         if mpi_home and (Path(mpi_home) / "bin/mpif90").exists():
             mpifc = str(Path(mpi_home) / "bin/mpif90")
 
-        # On macOS, CMake finishes static archives with Apple-style ranlib flags
-        # (`-c`) but pairs conda's clang with llvm-ranlib, which rejects them.
-        # Pin CMAKE_RANLIB to the `ranlib` on PATH (cctools in a conda env,
-        # Apple's outside one), which accepts those flags.
-        ranlib_clause = ""
-        if cstar_sysmgr.name.startswith("darwin"):
-            ranlib = shutil.which("ranlib")
-            if ranlib:
-                ranlib_clause = f"-DCMAKE_RANLIB:FILEPATH={ranlib} "
+        ranlib = self._ranlib()
+        ranlib_clause = f"-DCMAKE_RANLIB:FILEPATH={ranlib} " if ranlib else ""
+
+        # ccache caches C compilations only, so only the C library is relaunched
+        launcher = compiler_launcher()
+        launcher_clause = f"-DCMAKE_C_COMPILER_LAUNCHER={launcher} " if launcher else ""
 
         # Configure. The build directory must be named `build` and the library must
         # not be installed elsewhere: ROMS' Makedefs.inc hardcodes both.
@@ -117,6 +123,7 @@ class PIOExternalCodeBase(ExternalCodeBase):
             f"-DCMAKE_Fortran_COMPILER={mpifc} "
             f"-DCMAKE_PREFIX_PATH='{netcdf_home};{pnetcdf_home}' "
             f"{ranlib_clause}"
+            f"{launcher_clause}"
             # Preseeding HAVE_PAR_FILTERS skips PIO's filter feature test, which
             # keys off netcdf_meta.h's NC_HAS_PAR_FILTERS. That macro appears in
             # netcdf-c 4.7.4 but the inquiry API PIO then compiles against
@@ -137,7 +144,7 @@ class PIOExternalCodeBase(ExternalCodeBase):
 
         # Compile
         _run_cmd(
-            "cmake --build build --parallel 4",
+            f"cmake --build build --parallel {build_jobs()}",
             cwd=pio_root,
             msg_pre="Compiling ParallelIO...",
             msg_post=f"ParallelIO successfully installed at {pio_root}",
@@ -158,6 +165,10 @@ class PIOExternalCodeBase(ExternalCodeBase):
         pio_root = get_sysmgr().environment.environment_variables.get(self.root_env_var)
         if not pio_root:
             return False
+        # Shared installs are described by their manifest:
+        installed = self._check_install_manifest(pio_root)
+        if installed is not None:
+            return installed
         # Check PIO repo hasn't changed:
         assert self.source.checkout_target is not None  # cannot be for ExternalCodeBase
         # NOTE can't use self.working_copy.changed_from_source here as ExternalCodeBase uses this property to set `working_copy`
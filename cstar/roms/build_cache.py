@@ -0,0 +1,146 @@
+"""A content-addressed cache of compiled ROMS executables.
+
+Steps of a time-split workplan and members of an ensemble compile identical
+executables from identical inputs. The cache stores each executable under a key
+derived from everything that affects compilation so that later builds can
+link to the cached executable instead of running `make`.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import typing as t
+from collections.abc import Mapping
+from pathlib import Path
+
+from cstar.base.cache import DirectoryCache
+from cstar.base.env import ENV_CSTAR_BUILD_CACHE_MAX_MB, get_env_item
+from cstar.execution.file_system import DirectoryManager
+
+_EXE_NAME: t.Final[str] = "roms"
+"""The file name of the cached executable."""
+
+_META_NAME: t.Final[str] = "meta.json"
+"""The file name of the metadata stored with each cached executable."""
+
+
+def compute_build_key(components: Mapping[str, t.Any]) -> str:
+    """Compute a cache key from the inputs to a build.
+
+    Parameters
+    ----------
+    components : Mapping[str, t.Any]
+        JSON-serializable values that affect the output of the build.
+
+    Returns
+    -------
+    str
+        A hex digest uniquely identifying the build inputs.
+    """
+    content = json.dumps(components, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class CachedBuild(t.NamedTuple):
+    """Metadata about an executable materialized from the build cache."""
+
+    exe_path: Path
+    """The path the cached executable was materialized to."""
+    verified: bool
+    """Whether the linkage of the executable was verified when it was cached."""
+
+
+class BuildCache(DirectoryCache):
+    """A size-bounded, least-recently-used cache of compiled executables.
+
+    Each entry is a directory named with the build key. Concurrent builds of
+    the same key are serialized by a per-key file lock, so only the first
+    build runs `make` and subsequent builds are served from the cache.
+    """
+
+    description: t.ClassVar[str] = "ROMS builds"
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        """Initialize the build cache.
+
+        Parameters
+        ----------
+        root : Path | None
+            The directory containing cache entries. Defaults to a directory in
+            the C-Star cache home.
+        max_bytes : int | None
+            The maximum combined size of all cache entries. Defaults to the value
+            of `CSTAR_BUILD_CACHE_MAX_MB`.
+        """
+        if max_bytes is None:
+            max_mb = float(get_env_item(ENV_CSTAR_BUILD_CACHE_MAX_MB).value or 0)
+            max_bytes = int(max_mb * 1024 * 1024)
+
+        super().__init__(
+            root or DirectoryManager.cache_home() / "roms_builds", max_bytes
+        )
+
+    def fetch(self, key: str, target: Path) -> CachedBuild | None:
+        """Materialize a cached executable at a target path.
+
+        The executable is hardlinked when possible and copied otherwise.
+
+        Parameters
+        ----------
+        key : str
+            The build key of the executable.
+        target : Path
+            The path to materialize the executable to.
+
+        Returns
+        -------
+        CachedBuild | None
+            The materialized build, or `None` if the key is not cached.
+        """
+        entry = self._entry_dir(key)
+        cached_exe = entry / _EXE_NAME
+
+        if not self.enabled or not cached_exe.exists():
+            return None
+
+        meta = json.loads((entry / _META_NAME).read_text())
+
+        target.unlink(missing_ok=True)
+        try:
+            os.link(cached_exe, target)
+        except OSError:
+            shutil.copy2(cached_exe, target)
+
+        self._touch(key)
+        self.log.info(f"Using cached ROMS executable for build {key[:12]}")
+        return CachedBuild(target, bool(meta.get("verified", False)))
+
+    def store(self, key: str, exe_path: Path, *, verified: bool) -> None:
+        """Add an executable to the cache and evict old entries if necessary.
+
+        Parameters
+        ----------
+        key : str
+            The build key of the executable.
+        exe_path : Path
+            The path to the compiled executable.
+        verified : bool
+            Whether the linkage of the executable has been verified.
+        """
+        if not self.enabled or not exe_path.is_file():
+            return
+
+        staging = self._stage(key)
+
+        cached_exe = staging / _EXE_NAME
+        shutil.copy2(exe_path, cached_exe)
+        # hardlinks share permissions; prevent in-place edits of the cached file
+        cached_exe.chmod(0o555)
+
+        meta = {"verified": verified, "created_at": time.time()}
+        (staging / _META_NAME).write_text(json.dumps(meta))
+
+        self.log.debug(f"Cached ROMS executable for build {key[:12]}")
+        self._publish(key, staging)
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 
+from cstar.base.build_tools import build_jobs
 from cstar.base.external_codebase import ExternalCodeBase
 from cstar.base.gitutils import _check_local_repo_changed_from_remote
 from cstar.base.utils import _run_cmd
@@ -37,16 +38,27 @@ class ROMSExternalCodeBase(ExternalCodeBase):
     def root_env_var(self) -> str:
         return "ROMS_ROOT"
 
+    @property
+    def build_options(self) -> dict[str, str | None]:
+        return {
+            "mpi_wrapper": explicit_mpi_wrapper(),
+            "rpath_flags": rpath_link_flags(),
+        }
+
+    def _set_environment(self, root: Path) -> None:
+        cstar_sysmgr = get_sysmgr()
+        cstar_sysmgr.environment.set_env_var(self.root_env_var, str(root))
+        cstar_sysmgr.environment.set_env_var(
+            "PATH", f"{root / 'Tools-Roms'}:{os.environ.get('PATH')}"
+        )
+
     def _configure(self) -> None:
         # Set env vars:
         assert self.working_copy is not None  # verified by ExternalCodeBase.configure()
         roms_root = self.working_copy.path
+        self._set_environment(roms_root)
 
         cstar_sysmgr = get_sysmgr()
-        cstar_sysmgr.environment.set_env_var(self.root_env_var, str(roms_root))
-        cstar_sysmgr.environment.set_env_var(
-            "PATH", f"{roms_root / 'Tools-Roms'}:{os.environ.get('PATH')}"
-        )
 
         # Compile Tools-Roms
         mpi_wrapper = explicit_mpi_wrapper()
@@ -58,7 +70,7 @@ class ROMSExternalCodeBase(ExternalCodeBase):
         rpath_clause = f"USER_LDFLAGS='{rpath_flags}' " if rpath_flags else ""
 
         _run_cmd(
-            f"make {wrapper_clause}{rpath_clause}COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} {wrapper_clause}{rpath_clause}COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=roms_root / "Tools-Roms",
             msg_pre="Compiling Tools-Roms package for UCLA ROMS...",
             msg_post="Compiled Tools-Roms",
@@ -75,6 +87,10 @@ class ROMSExternalCodeBase(ExternalCodeBase):
         )
         if not roms_root:
             return False
+        # Shared installs are described by their manifest:
+        installed = self._check_install_manifest(roms_root)
+        if installed is not None:
+            return installed
         assert self.source.checkout_target is not None  # Cannot be for ExternalCodeBase
         #
         if _check_local_repo_changed_from_remote(
@@ -0,0 +1,164 @@
+"""Join partitioned ROMS output files while the model is still running.
+
+ROMS writes each output stream (e.g. `ocean_his`) to a sequence of files whose
+names carry the timestamp of their first record. When a file is full, ROMS
+closes it and opens the next one, so once any tile of a later file in the same
+stream exists, every tile of the earlier file is complete. The
+`IncrementalJoiner` watches the output directory in a background thread and
+joins each closed file set as soon as it is detected, leaving only the last
+file of each stream for `ROMSSimulation.post_run`.
+"""
+
+import re
+import threading
+import typing as t
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+
+from cstar.base.log import LoggingMixin
+
+_TILE_PATTERN: t.Final[re.Pattern[str]] = re.compile(
+    r"^(?P<stream>.+)\.(?P<stamp>\d{14})\.(?P<tile>\d+)\.nc$"
+)
+"""Matches the name of a partitioned output file, e.g. `ocean_his.20240101000000.3.nc`."""
+
+
+def closed_file_sets(output_dir: Path, num_tiles: int) -> list[str]:
+    """Find the partitioned output files that ROMS has finished writing.
+
+    A file set is closed when all of its tiles exist and a later file set of the
+    same stream has been started.
+
+    Parameters
+    ----------
+    output_dir : Path
+        The directory ROMS writes its output to.
+    num_tiles : int
+        The number of tiles in each file set.
+
+    Returns
+    -------
+    list[str]
+        The wildcard pattern matching the tiles of each closed file set, ordered
+        by stream and timestamp.
+    """
+    tiles: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for path in output_dir.glob("*.??????????????.*.nc"):
+        if match := _TILE_PATTERN.match(path.name):
+            tiles[match["stream"]][match["stamp"]] += 1
+
+    closed: list[str] = []
+    for stream, stamps in sorted(tiles.items()):
+        *earlier, _latest = sorted(stamps)
+        closed.extend(
+            f"{stream}.{stamp}.*.nc" for stamp in earlier if stamps[stamp] == num_tiles
+        )
+    return closed
+
+
+class IncrementalJoiner(LoggingMixin):
+    """Join closed output file sets in a background thread while a run is active.
+
+    A file set whose join fails is not retried; its tiles are left in place to be
+    joined by `ROMSSimulation.post_run`.
+    """
+
+    output_dir: Path
+    """The directory ROMS writes its output to."""
+
+    num_tiles: int
+    """The number of tiles in each file set."""
+
+    interval: float
+    """The time (in seconds) between scans of the output directory."""
+
+    joined: set[str]
+    """The wildcard patterns of the file sets that have been joined."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        num_tiles: int,
+        join: Callable[[str], object],
+        is_running: Callable[[], bool],
+        interval: float = 30.0,
+    ) -> None:
+        """Initialize the joiner.
+
+        Parameters
+        ----------
+        output_dir : Path
+            The directory ROMS writes its output to.
+        num_tiles : int
+            The number of tiles in each file set.
+        join : Callable[[str], object]
+            A function joining the file set matching a wildcard pattern.
+        is_running : Callable[[], bool]
+            A function returning `False` once the run has ended.
+        interval : float
+            The time (in seconds) between scans of the output directory.
+        """
+        self.output_dir = output_dir
+        self.num_tiles = num_tiles
+        self.interval = interval
+        self.joined = set()
+
+        self._join = join
+        self._is_running = is_running
+        self._attempted: set[str] = set()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll(self) -> list[str]:
+        """Join every closed file set that has not been joined yet.
+
+        Returns
+        -------
+        list[str]
+            The wildcard patterns of the file sets joined by this call.
+        """
+        joined: list[str] = []
+        for wildcard in closed_file_sets(self.output_dir, self.num_tiles):
+            if wildcard in self._attempted or self._stop_event.is_set():
+                continue
+            self._attempted.add(wildcard)
+
+            try:
+                self._join(wildcard)
+            except Exception:
+                self.log.warning(
+                    f"Incremental join of {wildcard!r} failed; "
+                    "it will be joined after the run completes",
+                    exc_info=True,
+                )
+                continue
+
+            self.joined.add(wildcard)
+            joined.append(wildcard)
+        return joined
+
+    def _watch(self) -> None:
+        """Scan the output directory until the run ends or the joiner is stopped."""
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+            if not self._is_running():
+                break
+
+    def start(self) -> None:
+        """Start watching the output directory in a background thread."""
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._watch, name="roms.incremental_join", daemon=True
+        )
+        self._thread.start()
+        self.log.debug(f"Watching {self.output_dir} for closed output files")
+
+    def stop(self) -> None:
+        """Stop watching the output directory, waiting for any join in progress."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
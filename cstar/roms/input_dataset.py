@@ -3,9 +3,11 @@ import shutil
 import tempfile
 from abc import ABC
 from collections.abc import Generator
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NamedTuple
 
 from cstar.base.exceptions import CstarExpectationFailed
 from cstar.base.input_dataset import InputDataset
@@ -20,10 +22,95 @@ from cstar.base.utils import (
 from cstar.io.constants import FileEncoding
 from cstar.io.source_data import SourceData, SourceDataCollection
 from cstar.io.staged_data import StagedDataCollection, StagedFile
+from cstar.roms.partition_cache import PartitionCache, compute_partition_key
 
 roms_tools = lazy_import("roms_tools")
 
 
+class _FilePartitioning(NamedTuple):
+    """The result of partitioning a single netCDF file."""
+
+    files: list[Path]
+    """The partitioned files."""
+    retry_reason: str | None
+    """The error that caused partitioning to be retried without coarse dims, if any."""
+
+
+def _partition_file(
+    idfile: Path,
+    np_xi: int,
+    np_eta: int,
+    include_coarse_dims: bool,
+    cache: PartitionCache | None = None,
+) -> _FilePartitioning:
+    """Partition a netCDF file, retrying without coarse dims if partitioning fails.
+
+    This function is defined at module level so that it can be run in a process
+    pool.
+
+    Parameters
+    ----------
+    idfile : Path
+        The file to partition.
+    np_xi : int
+        The number of tiles in the x direction.
+    np_eta : int
+        The number of tiles in the y direction.
+    include_coarse_dims : bool
+        Whether to first attempt partitioning with coarse dims.
+    cache : PartitionCache, optional
+        A cache from which the tiles are linked if the same file has already been
+        partitioned into the same decomposition, and to which new tiles are added.
+
+    Returns
+    -------
+    _FilePartitioning
+    """
+    if cache is None or not cache.enabled or not idfile.is_file():
+        return _partition_file_uncached(idfile, np_xi, np_eta, include_coarse_dims)
+
+    key = compute_partition_key(idfile, np_xi, np_eta, include_coarse_dims)
+    with cache.lock(key):
+        if cached := cache.fetch(key, idfile):
+            return _FilePartitioning(cached.files, cached.retry_reason)
+
+        # tiles linked from the cache are read-only hardlinks; unlink them so the
+        # new tiles are written to new inodes instead of into the cache
+        for suffix in ROMSPartitioning.suffixes(np_xi * np_eta):
+            (idfile.parent / f"{idfile.stem}{suffix}").unlink(missing_ok=True)
+
+        result = _partition_file_uncached(idfile, np_xi, np_eta, include_coarse_dims)
+        cache.store(key, idfile, result.files, result.retry_reason)
+        return result
+
+
+def _partition_file_uncached(
+    idfile: Path, np_xi: int, np_eta: int, include_coarse_dims: bool
+) -> _FilePartitioning:
+    """Partition a netCDF file with `roms_tools.partition_netcdf`.
+
+    See `_partition_file` for a description of the parameters.
+    """
+    try:
+        result = roms_tools.partition_netcdf(
+            idfile,
+            np_xi=np_xi,
+            np_eta=np_eta,
+            include_coarse_dims=include_coarse_dims,
+        )
+        return _FilePartitioning(result, None)
+    except Exception as e:
+        retry_reason = str(e)
+
+    result = roms_tools.partition_netcdf(
+        idfile,
+        np_xi=np_xi,
+        np_eta=np_eta,
+        include_coarse_dims=False,
+    )
+    return _FilePartitioning(result, retry_reason)
+
+
 class ROMSPartitioning:
     """Describes a partitioning of a ROMS input dataset into a grid of subdomains.
 
@@ -191,7 +278,11 @@ class ROMSInputDataset(InputDataset, ABC):
         return input_dataset_dict
 
     def partition(
-        self, np_xi: int, np_eta: int, overwrite_existing_files: bool = False
+        self,
+        np_xi: int,
+        np_eta: int,
+        overwrite_existing_files: bool = False,
+        executor: Executor | None = None,
     ) -> None:
         """Partition a netCDF dataset into tiles to run ROMS in parallel.
 
@@ -208,6 +299,10 @@ class ROMSInputDataset(InputDataset, ABC):
         overwrite_existing_files (bool, optional):
            If `True` and this `ROMSInputDataset` has already been partitioned,
            the existing files will be overwritten
+        executor (Executor, optional):
+           An executor (e.g. a process pool) on which to partition the files of
+           this dataset concurrently. Files are partitioned one at a time in the
+           current process if not provided.
 
         Notes:
         ------
@@ -274,44 +369,47 @@ class ROMSInputDataset(InputDataset, ABC):
         def partition_files(files: list[Path]) -> list[Path]:
             """Helper function that wraps the actual roms_tools.partition_netcdf
             call.
+
+            The first file is partitioned alone: if it must be retried without
+            coarse dims, the remaining files are partitioned without them.
             """
             new_parted_files: list[Path] = []
+            map_fn = executor.map if executor is not None else map
+            # only files that exist on disk can be identified by their content
+            cache = PartitionCache() if any(f.is_file() for f in files) else None
 
             include_coarse_dims = True
 
-            for idfile in files:
-                msg = f"Partitioning {idfile} into ({np_xi},{np_eta})"
-                self.log.info(msg)
+            for batch in (files[:1], files[1:]):
+                for idfile in batch:
+                    msg = f"Partitioning {idfile} into ({np_xi},{np_eta})"
+                    self.log.info(msg)
 
+                results = map_fn(
+                    _partition_file,
+                    batch,
+                    repeat(np_xi),
+                    repeat(np_eta),
+                    repeat(include_coarse_dims),
+                    repeat(cache),
+                )
                 try:
-                    result = roms_tools.partition_netcdf(
-                        idfile,
-                        np_xi=np_xi,
-                        np_eta=np_eta,
-                        include_coarse_dims=include_coarse_dims,
+                    # results are collected in submission order
+                    for idfile, (parted, reason) in zip(batch, results):
+                        if reason is not None:
+                            msg = (
+                                f"Encountered error partitioning {idfile} with "
+                                "coarse dims; retrying without coarse dims. "
+                                f"Exception: {reason}"
+                            )
+                            self.log.warning(msg)
+                            include_coarse_dims = False
+                        new_parted_files.extend(parted)
+                except Exception:
+                    self.log.exception(
+                        "Still encountered error during partitioning; aborting."
                     )
-
-                except Exception as e:
-                    msg = (
-                        f"Encountered error partitioning {idfile} with coarse dims; "
-                        f"retrying without coarse dims. Exception: {e}"
-                    )
-                    self.log.warning(msg)
-                    include_coarse_dims = False
-                    try:
-                        result = roms_tools.partition_netcdf(
-                            idfile,
-                            np_xi=np_xi,
-                            np_eta=np_eta,
-                            include_coarse_dims=include_coarse_dims,
-                        )
-                    except Exception as e:
-                        self.log.exception(
-                            "Still encountered error during partitioning; aborting."
-                        )
-                        raise
-
-                new_parted_files.extend(result)
+                    raise
 
             return [f.resolve() for f in new_parted_files]
 
@@ -398,6 +496,7 @@ class ROMSInputDataset(InputDataset, ABC):
         """Stages partitioned source files, checking pre-existence individually."""
         # If some (or all) files exist, go through and check which ones (if any) to stage:
         if self.working_copy:
+            missing = []
             for i, s in enumerate(self.partitioned_source):
                 target_path = local_dir / s.basename
                 if self.working_copy and self.working_copy[i].path == target_path:  # type: ignore[index]
@@ -405,7 +504,10 @@ class ROMSInputDataset(InputDataset, ABC):
                     self.log.info(msg)
                     continue
 
-                self._working_copy.append(s.stage(local_dir))  # type: ignore[union-attr]
+                missing.append(s)
+
+            for staged in SourceDataCollection(missing).stage(local_dir):
+                self._working_copy.append(staged)  # type: ignore[union-attr]
             return
         # Otherwise stage them all:
         self._working_copy = self.partitioned_source.stage(local_dir)
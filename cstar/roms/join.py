@@ -0,0 +1,260 @@
+"""A streaming, in-process engine for joining partitioned ROMS output files.
+
+Without ParallelIO, each ROMS process writes its own tile of every output file.
+The tiles are usually joined by the `ncjoin` program from Tools-Roms. This module
+provides an alternative that runs in the C-Star process: the joined file is
+defined up front, then filled one variable and one record at a time, so that at
+most a single tile record of a single variable is held in memory.
+"""
+
+import re
+import typing as t
+from collections.abc import Sequence
+from pathlib import Path
+
+from cstar.base.log import get_logger
+from cstar.base.utils import lazy_import
+
+if t.TYPE_CHECKING:
+    import netCDF4 as nc
+    from netCDF4 import CompressionLevel, CompressionType
+else:
+    nc = lazy_import("netCDF4")
+
+log = get_logger(__name__)
+
+_PARTITIONED_DIM_PREFIXES: t.Final[tuple[str, ...]] = ("xi_", "eta_")
+"""Prefixes of the horizontal dimensions that are split across tiles."""
+
+_DROPPED_ATTRS: t.Final[frozenset[str]] = frozenset({"partition"})
+"""Global attributes describing a single tile that are not copied when joining."""
+
+_TILE_INDEX_PATTERN: t.Final[re.Pattern[str]] = re.compile(r"\.\d{14}\.(\d+)\.nc$")
+"""Extracts the tile index following the output timestamp in the name of a
+partitioned file."""
+
+
+def tile_index(path: Path) -> int:
+    """Return the index of the tile stored in a partitioned file.
+
+    Parameters
+    ----------
+    path : Path
+        The path to a partitioned file, e.g. `ocean_his.20240101000000.003.nc`.
+
+    Returns
+    -------
+    int
+
+    Raises
+    ------
+    ValueError
+        If the file name does not end with an output timestamp and a tile index.
+    """
+    if match := _TILE_INDEX_PATTERN.search(path.name):
+        return int(match.group(1))
+    msg = f"Unable to determine the tile index of {path.name}"
+    raise ValueError(msg)
+
+
+def _is_partitioned(dim: str) -> bool:
+    return dim.startswith(_PARTITIONED_DIM_PREFIXES)
+
+
+class _TileLayout(t.NamedTuple):
+    """The position of every tile within the joined domain."""
+
+    sizes: dict[str, int]
+    """The size of each partitioned dimension in the joined file."""
+    offsets: list[dict[str, int]]
+    """The offset of each tile along each of its partitioned dimensions."""
+
+
+def _compute_layout(tiles: Sequence["nc.Dataset"], np_xi: int) -> _TileLayout:
+    """Compute the offset of each tile from the sizes of its neighbours.
+
+    ROMS numbers tiles row by row, so tile `i` is in column `i % np_xi` and row
+    `i // np_xi`. Tiles on the edges of the domain carry extra boundary points,
+    so offsets are accumulated from the actual dimension sizes of each tile.
+
+    Parameters
+    ----------
+    tiles : Sequence[nc.Dataset]
+        The open tiles, in tile order.
+    np_xi : int
+        The number of tiles in the xi direction.
+
+    Returns
+    -------
+    _TileLayout
+    """
+    if len(tiles) % np_xi:
+        msg = f"{len(tiles)} tiles cannot be arranged in rows of {np_xi}"
+        raise ValueError(msg)
+    np_eta = len(tiles) // np_xi
+
+    def size(i: int, dim: str) -> int:
+        return len(tiles[i].dimensions[dim]) if dim in tiles[i].dimensions else 0
+
+    dims = {d for tile in tiles for d in tile.dimensions if _is_partitioned(d)}
+    offsets: list[dict[str, int]] = [{} for _ in tiles]
+    sizes: dict[str, int] = {}
+
+    for dim in dims:
+        along_xi = dim.startswith("xi_")
+        for i in range(len(tiles)):
+            ii, jj = i % np_xi, i // np_xi
+            preceding = (
+                [jj * np_xi + k for k in range(ii)]
+                if along_xi
+                else [k * np_xi + ii for k in range(jj)]
+            )
+            offsets[i][dim] = sum(size(k, dim) for k in preceding)
+
+        line = range(np_xi) if along_xi else range(0, np_eta * np_xi, np_xi)
+        sizes[dim] = sum(size(k, dim) for k in line)
+
+    return _TileLayout(sizes, offsets)
+
+
+def _define_joined_file(
+    template: "nc.Dataset", out: "nc.Dataset", sizes: dict[str, int]
+) -> None:
+    """Define the dimensions, variables and attributes of the joined file.
+
+    Parameters
+    ----------
+    template : nc.Dataset
+        The first tile, whose structure is copied.
+    out : nc.Dataset
+        The joined file, open for writing.
+    sizes : dict[str, int]
+        The size of each partitioned dimension in the joined file.
+    """
+    out.setncatts(
+        {
+            k: template.getncattr(k)
+            for k in template.ncattrs()
+            if k not in _DROPPED_ATTRS
+        }
+    )
+
+    for name, dim in template.dimensions.items():
+        length = None if dim.isunlimited() else sizes.get(name, len(dim))
+        out.createDimension(name, length)
+
+    for name, var in template.variables.items():
+        attrs = {k: var.getncattr(k) for k in var.ncattrs()}
+        fill_value = attrs.pop("_FillValue", None)
+        # netCDF3 files report no filters
+        filters = var.filters() or {}
+        compression: CompressionType | None = "zlib" if filters.get("zlib") else None
+        complevel = t.cast("CompressionLevel", filters.get("complevel") or 4)
+        out_var = out.createVariable(
+            name,
+            var.datatype,
+            var.dimensions,
+            compression=compression,
+            complevel=complevel,
+            shuffle=bool(filters.get("shuffle")),
+            fill_value=fill_value,
+        )
+        out_var.setncatts(attrs)
+
+
+def _copy_variable(
+    name: str,
+    tiles: Sequence["nc.Dataset"],
+    out: "nc.Dataset",
+    layout: _TileLayout,
+) -> None:
+    """Copy one variable from every tile into the joined file, record by record.
+
+    Parameters
+    ----------
+    name : str
+        The name of the variable.
+    tiles : Sequence[nc.Dataset]
+        The open tiles, in tile order.
+    out : nc.Dataset
+        The joined file, open for writing.
+    layout : _TileLayout
+        The position of every tile within the joined domain.
+    """
+    out_var = out.variables[name]
+    dims = out_var.dimensions
+    is_record = bool(dims) and out.dimensions[dims[0]].isunlimited()
+    num_records = len(tiles[0].variables[name]) if is_record else 1
+
+    # variables without horizontal dimensions are identical in every tile
+    sources = (
+        list(enumerate(tiles))
+        if any(_is_partitioned(d) for d in dims)
+        else [(0, tiles[0])]
+    )
+
+    for rec in range(num_records):
+        for i, tile in sources:
+            var = tile.variables[name]
+            region = tuple(
+                slice(
+                    layout.offsets[i].get(d, 0),
+                    layout.offsets[i].get(d, 0) + var.shape[axis],
+                )
+                for axis, d in enumerate(dims)
+            )
+            if is_record:
+                out_var[(rec, *region[1:])] = var[rec]
+            elif dims:
+                out_var[region] = var[...]
+            else:
+                out_var.assignValue(var.getValue())
+
+
+def join_tiles(tiles: Sequence[Path], out_file: Path, np_xi: int) -> Path:
+    """Join the partitioned tiles of a ROMS output file.
+
+    The joined file is written to a temporary path next to `out_file` and renamed
+    once complete, so a partially joined file is never left at `out_file`.
+
+    Parameters
+    ----------
+    tiles : Sequence[Path]
+        The partitioned files. They are ordered by the tile index in their names.
+    out_file : Path
+        The path of the joined file.
+    np_xi : int
+        The number of tiles in the xi direction.
+
+    Returns
+    -------
+    Path
+        The path of the joined file.
+    """
+    ordered = sorted(tiles, key=tile_index)
+    tmp_file = out_file.with_name(f".{out_file.name}.tmp")
+
+    datasets = [nc.Dataset(p, "r") for p in ordered]
+    try:
+        for ds in datasets:
+            ds.set_auto_maskandscale(False)
+        layout = _compute_layout(datasets, np_xi)
+        template = datasets[0]
+
+        with nc.Dataset(tmp_file, "w", format=template.data_model) as out:
+            out.set_auto_maskandscale(False)
+            # every value is written from a tile; skip prefilling with fill values
+            out.set_fill_off()
+            _define_joined_file(template, out, layout.sizes)
+            for name in template.variables:
+                _copy_variable(name, datasets, out, layout)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    finally:
+        for ds in datasets:
+            ds.close()
+
+    tmp_file.rename(out_file)
+    log.debug(f"Joined {len(ordered)} tiles into {out_file.name}")
+    return out_file
@@ -0,0 +1,223 @@
+"""A content-addressed cache of partitioned ROMS input files.
+
+Steps of a time-split workplan and members of an ensemble partition the same
+grid, tidal and boundary files into the same decomposition. The cache stores
+the tiles produced from each source file under a key derived from the content
+of the file, the decomposition and the coarse-dims option, so later partition
+requests link the cached tiles instead of calling `roms_tools.partition_netcdf`.
+"""
+
+import hashlib
+import json
+import shutil
+import time
+import typing as t
+from functools import lru_cache
+from importlib.metadata import version
+from pathlib import Path
+
+from cstar.base.cache import DirectoryCache
+from cstar.base.env import ENV_CSTAR_PARTITION_CACHE_MAX_MB, get_env_item
+from cstar.execution.file_system import DirectoryManager
+from cstar.io.dataset_cache import materialize
+from cstar.io.fingerprint import get_fingerprint_index
+
+_META_NAME: t.Final[str] = "meta.json"
+"""The file name of the metadata stored with each set of cached tiles."""
+
+
+@lru_cache
+def _roms_tools_version() -> str:
+    """Return the installed version of `roms_tools`, which partitions the files."""
+    return version("roms_tools")
+
+
+def compute_partition_key(
+    source: Path, np_xi: int, np_eta: int, include_coarse_dims: bool
+) -> str:
+    """Compute a cache key from the inputs to a partitioning.
+
+    The key includes the version of `roms_tools`, so tiles are not reused after
+    an upgrade that may change the partitioned output.
+
+    Parameters
+    ----------
+    source : Path
+        The file to partition.
+    np_xi : int
+        The number of tiles in the x direction.
+    np_eta : int
+        The number of tiles in the y direction.
+    include_coarse_dims : bool
+        Whether coarse dims are requested in the tiles.
+
+    Returns
+    -------
+    str
+        A hex digest uniquely identifying the partitioning.
+    """
+    components = {
+        "sha256": get_fingerprint_index().sha256(source),
+        "np_xi": np_xi,
+        "np_eta": np_eta,
+        "include_coarse_dims": include_coarse_dims,
+        "roms_tools": _roms_tools_version(),
+    }
+    content = json.dumps(components, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class CachedPartitioning(t.NamedTuple):
+    """Metadata about tiles materialized from the partition cache."""
+
+    files: list[Path]
+    """The paths the cached tiles were materialized to, in partition order."""
+    retry_reason: str | None
+    """The error that caused the cached tiles to be created without coarse dims."""
+
+
+class PartitionCache(DirectoryCache):
+    """A size-bounded, least-recently-used cache of partitioned files.
+
+    Each entry is a directory named with the partition key, holding one file per
+    tile. Tiles are stored by their suffix (e.g. `.03.nc`) so that they can be
+    materialized next to a source file with any name. Concurrent partitioning of
+    the same key, from any process on the host, is serialized by a per-key file
+    lock.
+    """
+
+    description: t.ClassVar[str] = "partitionings"
+
+    def __init__(self, root: Path | None = None, max_bytes: int | None = None) -> None:
+        """Initialize the partition cache.
+
+        Parameters
+        ----------
+        root : Path | None
+            The directory containing cache entries. Defaults to a directory in
+            the C-Star cache home.
+        max_bytes : int | None
+            The maximum combined size of all cache entries. Defaults to the value
+            of `CSTAR_PARTITION_CACHE_MAX_MB`.
+        """
+        if max_bytes is None:
+            max_mb = float(get_env_item(ENV_CSTAR_PARTITION_CACHE_MAX_MB).value or 0)
+            max_bytes = int(max_mb * 1024 * 1024)
+
+        super().__init__(
+            root or DirectoryManager.cache_home() / "partitions", max_bytes
+        )
+
+    def _verify(self, entry: Path, meta: dict[str, t.Any]) -> bool:
+        """Check that every cached tile is present and has its recorded checksum.
+
+        Parameters
+        ----------
+        entry : Path
+            The cache entry to verify.
+        meta : dict[str, t.Any]
+            The metadata stored with the entry.
+
+        Returns
+        -------
+        bool
+        """
+        index = get_fingerprint_index()
+        for suffix, digest in meta["tiles"].items():
+            tile = entry / suffix
+            if not tile.is_file() or index.sha256(tile) != digest:
+                return False
+        return True
+
+    def fetch(self, key: str, source: Path) -> CachedPartitioning | None:
+        """Materialize cached tiles next to a source file.
+
+        Tiles are hardlinked when possible. An entry whose tiles fail the
+        integrity check is discarded.
+
+        Parameters
+        ----------
+        key : str
+            The partition key of the source file.
+        source : Path
+            The file the tiles were partitioned from.
+
+        Returns
+        -------
+        CachedPartitioning | None
+            The materialized tiles, or `None` if the key is not cached.
+        """
+        entry = self._entry_dir(key)
+        meta_path = entry / _META_NAME
+
+        if not self.enabled or not meta_path.exists():
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text())
+            valid = self._verify(entry, meta)
+        except (OSError, ValueError, KeyError):
+            valid = False
+        if not valid:
+            self.log.warning(f"Discarding corrupt cached partitioning {key[:12]}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        files: list[Path] = []
+        for suffix in meta["tiles"]:
+            target = source.parent / f"{source.stem}{suffix}"
+            materialize(entry / suffix, target)
+            files.append(target)
+
+        self._touch(key)
+        self.log.info(f"Using cached partitioning of {source.name}")
+        return CachedPartitioning(files, meta.get("retry_reason"))
+
+    def store(
+        self, key: str, source: Path, files: list[Path], retry_reason: str | None
+    ) -> None:
+        """Add the tiles of a source file to the cache and evict old entries if
+        necessary.
+
+        Parameters
+        ----------
+        key : str
+            The partition key of the source file.
+        source : Path
+            The file the tiles were partitioned from.
+        files : list[Path]
+            The tiles, in partition order.
+        retry_reason : str | None
+            The error that caused the tiles to be created without coarse dims,
+            if any.
+        """
+        prefix = source.stem
+        if (
+            not self.enabled
+            or not files
+            or not all(f.is_file() and f.name.startswith(prefix) for f in files)
+        ):
+            return
+
+        staging = self._stage(key)
+
+        index = get_fingerprint_index()
+        tiles: dict[str, str] = {}
+        for f in files:
+            suffix = f.name[len(prefix) :]
+            cached = staging / suffix
+            materialize(f, cached)
+            # hardlinks share permissions; prevent in-place edits of the cached tile
+            cached.chmod(0o444)
+            tiles[suffix] = index.sha256(cached)
+
+        meta = {
+            "source": source.name,
+            "tiles": tiles,
+            "retry_reason": retry_reason,
+            "created_at": time.time(),
+        }
+        (staging / _META_NAME).write_text(json.dumps(meta))
+
+        self.log.debug(f"Cached partitioning of {source.name} as {key[:12]}")
+        self._publish(key, staging)
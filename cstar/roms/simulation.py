@@ -1,9 +1,13 @@
 import logging
+import multiprocessing
 import os
 import re
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
+from functools import partial
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
@@ -29,15 +33,30 @@ from cstar.applications.roms_marbl.adapter import (
 )
 from cstar.applications.roms_marbl.models import RomsMarblBlueprint
 from cstar.base.additional_code import AdditionalCode
+from cstar.base.build_tools import build_jobs
 from cstar.base.env import (
     ENV_CSTAR_CLOBBER_WORKING_DIR,
+    ENV_CSTAR_DISABLE_BUILD_VERIFICATION,
+    ENV_CSTAR_FRESH_CODEBASES,
+    ENV_CSTAR_INCREMENTAL_JOIN,
+    ENV_CSTAR_INCREMENTAL_JOIN_INTERVAL,
+    ENV_CSTAR_JOIN_ENGINE,
     ENV_CSTAR_NPROCS_POST,
+    ENV_CSTAR_NPROCS_PRE,
+    ENV_CSTAR_SHARED_CODEBASES,
     FLAG_OFF,
     FLAG_ON,
+    JOIN_ENGINE_NATIVE,
+    JOIN_ENGINE_NCJOIN,
     get_env_item,
 )
 from cstar.base.exceptions import CstarExpectationFailed
-from cstar.base.feature import ENV_FF_DEBUG_BUILD_MODE, is_feature_enabled
+from cstar.base.feature import (
+    ENV_FF_DEBUG_BUILD_MODE,
+    is_feature_enabled,
+    is_flag_enabled,
+)
+from cstar.base.gitutils import _get_clean_head_hash
 from cstar.base.utils import (
     _dict_to_tree,
     _get_sha256_hash,
@@ -48,10 +67,12 @@ from cstar.execution.file_system import RomsFileSystemManager, remove_files
 from cstar.execution.handler import ExecutionStatus
 from cstar.execution.local_process import LocalProcess
 from cstar.execution.scheduler_job import create_scheduler_job
+from cstar.io.concurrency import StagingTask, run_concurrently
 from cstar.io.constants import FileEncoding
 from cstar.io.source_data import SourceData
 from cstar.marbl.external_codebase import MARBLExternalCodeBase
 from cstar.pio.external_codebase import PIOExternalCodeBase
+from cstar.roms.build_cache import BuildCache, compute_build_key
 from cstar.roms.build_verification import (
     assert_single_toolchain_stack,
     explicit_mpi_wrapper,
@@ -60,6 +81,7 @@ from cstar.roms.build_verification import (
 )
 from cstar.roms.discretization import ROMSDiscretization
 from cstar.roms.external_codebase import ROMSExternalCodeBase
+from cstar.roms.incremental_join import IncrementalJoiner
 from cstar.roms.input_dataset import (
     ROMSBoundaryForcing,
     ROMSCdrForcing,
@@ -72,6 +94,7 @@ from cstar.roms.input_dataset import (
     ROMSSurfaceForcing,
     ROMSTidalForcing,
 )
+from cstar.roms.join import join_tiles
 from cstar.roms.namelist import RomsNamelistBase, namelist_schema_for_ref
 from cstar.simulation import Simulation
 from cstar.system.manager import get_sysmgr
@@ -80,6 +103,18 @@ if TYPE_CHECKING:
     from cstar.base.external_codebase import ExternalCodeBase
     from cstar.execution.file_system import JobFileSystemManager
     from cstar.execution.handler import ExecutionHandler
+    from cstar.io.staged_data import StagedDataCollection
+
+_BUILD_ENV_VARS: tuple[str, ...] = (
+    "LOADEDMODULES",
+    "PATH",
+    "MPIHOME",
+    "NETCDFHOME",
+    "NETCDFFHOME",
+    "PNETCDFHOME",
+    "LD_RUN_PATH",
+)
+"""Environment variables that select the toolchain used to compile ROMS."""
 
 
 def _ncjoin_wildcard(
@@ -154,6 +189,43 @@ def _extract_data_join_wildcard(
     logger.info(f"Spatial extract/join of {str(out_file)!r} is complete")
 
 
+def _native_join_wildcard(
+    wildcard_pattern: str, input_dir: Path, output_dir: Path, np_xi: int
+) -> Path:
+    """Spatially join netcdfs matching the wildcard pattern in-process, write the
+    joined output to output_dir, and remove the unjoined outputs (except for rst
+    files, which would need to be repartitioned later).
+
+    This function is defined at module level so that it can be run in a process
+    pool.
+
+    Parameters
+    ----------
+    wildcard_pattern : str
+        The wildcard pattern to match for files within input_dir.
+    input_dir : Path
+        Location of the partitioned netcdfs to be joined.
+    output_dir : Path
+        Location to write the joined output to.
+    np_xi : int
+        The number of tiles in the xi direction.
+
+    Returns
+    -------
+    Path
+        The path to the joined output.
+    """
+    out_file = join_tiles(
+        list(input_dir.glob(wildcard_pattern)),
+        output_dir / wildcard_pattern.replace(".*.nc", ".nc"),
+        np_xi=np_xi,
+    )
+
+    if "rst" not in wildcard_pattern:
+        remove_files(input_dir, wildcard_pattern)
+    return out_file
+
+
 class ROMSSimulation(Simulation):
     """A specialized `Simulation` subclass for configuring and running ROMS (Regional
     Ocean Modeling System) simulations.
@@ -405,6 +477,7 @@ class ROMSSimulation(Simulation):
         self._exe_hash: str | None = None
 
         self._execution_handler: ExecutionHandler | None = None
+        self._joiner: IncrementalJoiner | None = None
 
     def _find_namelist_file(self) -> None:
         """Identify the Fortran namelist (.nml) file from runtime code.
@@ -536,7 +609,7 @@ class ROMSSimulation(Simulation):
 
         def is_correctable(inp: ROMSInputDataset) -> bool:
             """roms-tools yaml files' dates can be meaningfully corrected, netCDF dates cannot"""
-            return inp.source._classification.value.file_encoding == FileEncoding.TEXT
+            return inp.source.classification.value.file_encoding == FileEncoding.TEXT
 
         def correct_date_bound_or_raise(inp: ROMSInputDataset, bound: str):
             """Correct (if possible) a mismatched date value between this ROMSSimulation and dataset, or raise."""
@@ -1210,7 +1283,10 @@ class ROMSSimulation(Simulation):
         in the simulation directory.
 
         The method performs the following steps:
-        1. Configures the ROMS and MARBL external codebases.
+        1. Configures the ROMS and MARBL external codebases. Unless
+           `CSTAR_SHARED_CODEBASES` is disabled, codebases are installed in a
+           host-wide store shared by all simulations (see
+           `ExternalCodeBase.install`).
         2. Fetches and organizes compile-time code.
         3. Fetches and organizes runtime code (e.g., namelists).
         4. Fetches and prepares input datasets.
@@ -1226,6 +1302,8 @@ class ROMSSimulation(Simulation):
         -----
         - Input datasets are only fetched if their date range overlaps the
           simulation's start and end dates.
+        - Compile-time code, runtime code and input datasets are staged
+          concurrently, up to `CSTAR_STAGING_WORKERS` at a time.
 
         See Also
         --------
@@ -1255,32 +1333,56 @@ class ROMSSimulation(Simulation):
 
         self.log.info(f"🛠️ Configuring {self.__class__.__name__}")
 
+        fresh_codebases = is_flag_enabled(ENV_CSTAR_FRESH_CODEBASES)
+        shared_codebases = (
+            get_env_item(ENV_CSTAR_SHARED_CODEBASES).value == FLAG_ON
+            and not fresh_codebases
+        )
+
         for codebase in (x for x in self.codebases if x is not None):
             self.log.info(f"🔧 Setting up {codebase.__class__.__name__}...")
+
+            # codebases are built once per host and shared by all simulations
+            if shared_codebases:
+                codebase.install()
+                continue
+
             codebase_dir = self.fs_manager.codebase_subdir(codebase.key)
 
             # if we're running a workplan, for now, set up a code directory for each
             # step, otherwise they may try to clobber each other or get tripped up on
             # detecting existing directories.
-            if os.getenv("CSTAR_FRESH_CODEBASES", "0") == "1" and codebase_dir.exists():
+            if fresh_codebases and codebase_dir.exists():
                 shutil.rmtree(codebase_dir)
 
             codebase_dir.mkdir(parents=True, exist_ok=True)
             codebase.setup(codebase_dir)
             os.environ[codebase.root_env_var] = str(codebase_dir)
 
-        # Compile-time code
+        # Compile-time code, runtime code and input datasets are independent and
+        # are staged concurrently
+        tasks: list[StagingTask[None]] = []
+
         self.log.info("📦 Fetching compile-time code...")
         if self.compile_time_code is not None:
-            self.compile_time_code.get(compile_time_code_dir)
+            tasks.append(
+                StagingTask(
+                    "compile-time code",
+                    partial(self.compile_time_code.get, compile_time_code_dir),
+                )
+            )
 
-        # Runtime code
         self.log.info("📦 Fetching runtime code... ")
         if self.runtime_code is not None:
-            self.runtime_code.get(runtime_code_dir)
+            tasks.append(
+                StagingTask(
+                    "runtime code", partial(self.runtime_code.get, runtime_code_dir)
+                )
+            )
 
-        # InputDatasets
         self.log.info("📦 Fetching input datasets...")
+        # datasets sharing a source are staged in sequence to avoid clobbering
+        datasets_by_location: dict[str, list[ROMSInputDataset]] = defaultdict(list)
         for inp in self.input_datasets:
             # Download input dataset if its date range overlaps Simulation's date range
             if (
@@ -1289,9 +1391,20 @@ class ROMSSimulation(Simulation):
                 or (inp.start_date <= self.end_date)
                 and (self.end_date >= self.start_date)
             ):
+                datasets_by_location[inp.source.location].append(inp)
+
+        def _get_datasets(datasets: list[ROMSInputDataset]) -> None:
+            for inp in datasets:
                 self.log.debug(f"Fetching {inp.source.location}")
                 inp.get(local_dir=input_datasets_dir)
 
+        tasks.extend(
+            StagingTask(location, partial(_get_datasets, datasets))
+            for location, datasets in datasets_by_location.items()
+        )
+
+        run_concurrently(tasks)
+
     @property
     def is_setup(self) -> bool:
         """Check whether the ROMSSimulation is fully configured locally.
@@ -1378,6 +1491,9 @@ class ROMSSimulation(Simulation):
 
         Notes
         -----
+        - Executables are cached by the codebase commits, compile-time code,
+          and compiler environment. A cached executable is linked into the
+          build directory instead of recompiling (see `BuildCache`).
         - This method first attempts to clean the build directory before compilation.
         - The compiled executable is stored in the `exe_path` attribute.
         - Compilation uses the system's default compiler, which can be configured
@@ -1425,6 +1541,100 @@ class ROMSSimulation(Simulation):
             )
             return
 
+        components = self._build_components(build_dir)
+        if components is None:
+            self.log.info(
+                "Unable to identify the codebase commits; compiling without the build cache"
+            )
+            self._compile(build_dir)
+        else:
+            build_cache = BuildCache()
+            build_key = compute_build_key(components)
+
+            with build_cache.lock(build_key):
+                cached = None if rebuild else build_cache.fetch(build_key, exe_path)
+
+                if cached is None:
+                    self._compile(build_dir)
+                    verified = not is_flag_enabled(ENV_CSTAR_DISABLE_BUILD_VERIFICATION)
+                    build_cache.store(build_key, exe_path, verified=verified)
+                elif not cached.verified:
+                    verify_roms_linkage(exe_path)
+
+        self.exe_path = exe_path
+        self._exe_hash = _get_sha256_hash(exe_path)
+
+    def _build_components(self, build_dir: Path) -> dict[str, Any] | None:
+        """Collect the inputs that determine the output of compiling ROMS.
+
+        Parameters
+        ----------
+        build_dir : Path
+            Location of the staged compile-time code.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            JSON-serializable values used to compute the build cache key, or
+            `None` if the commit of a codebase cannot be identified.
+        """
+        cstar_sysmgr = get_sysmgr()
+        compile_time_code = cast("AdditionalCode", self.compile_time_code)
+        working_copy = cast("StagedDataCollection", compile_time_code.working_copy)
+
+        codebases: dict[str, list[str]] = {}
+        for cb in self.codebases:
+            # the build uses the codebase at the root in the environment
+            root: str | Path | None = (
+                cstar_sysmgr.environment.environment_variables.get(cb.root_env_var)
+            )
+            if root is None and cb.working_copy is not None:
+                root = cb.working_copy.path
+
+            commit = _get_clean_head_hash(root) if root else None
+            if commit is None:
+                self.log.debug(f"Unable to identify the commit of {cb.root_env_var}")
+                return None
+            codebases[type(cb).__name__] = [cb.source.location, commit]
+
+        # compile-time code includes `cppdefs.opt` and any user-supplied Makefile
+        code_files = {
+            p.relative_to(build_dir).as_posix(): _get_sha256_hash(p)
+            for p in working_copy.paths
+            if p.is_file()
+        }
+        environment = {
+            k: os.environ.get(k)
+            or cstar_sysmgr.environment.environment_variables.get(k)
+            for k in _BUILD_ENV_VARS
+        }
+
+        return {
+            "codebases": codebases,
+            "code_files": code_files,
+            "compiler": cstar_sysmgr.environment.compiler,
+            "system": cstar_sysmgr.name,
+            "environment": environment,
+            "system_environment": cstar_sysmgr.environment.environment_variables,
+            "debug": is_feature_enabled(ENV_FF_DEBUG_BUILD_MODE),
+            "use_pio": self.use_pio,
+        }
+
+    def _compile(self, build_dir: Path) -> None:
+        """Run `make` to compile the ROMS executable in the build directory.
+
+        Parameters
+        ----------
+        build_dir : Path
+            Location of the staged compile-time code.
+
+        Raises
+        ------
+        RuntimeError
+            If an error occurs during the compilation process.
+        """
+        exe_path = build_dir / "roms"
+
         if (build_dir / "Compile").is_dir():
             _run_cmd(
                 "make compile_clean",
@@ -1450,7 +1660,7 @@ class ROMSSimulation(Simulation):
         rpath_clause = f"USER_LDFLAGS='{rpath_flags}' " if rpath_flags else ""
 
         _run_cmd(
-            f"make {mode_clause}{wrapper_clause}{rpath_clause}COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} {mode_clause}{wrapper_clause}{rpath_clause}COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=build_dir,
             msg_pre="Compiling UCLA-ROMS configuration...",
             msg_post=f"UCLA-ROMS compiled at {build_dir}",
@@ -1460,9 +1670,6 @@ class ROMSSimulation(Simulation):
 
         verify_roms_linkage(exe_path)
 
-        self.exe_path = exe_path
-        self._exe_hash = _get_sha256_hash(exe_path)
-
     def _validate_pio_cppdefs(self, build_dir: Path) -> None:
         """Ensure `use_pio` agrees with the compile-time `cppdefs.opt`.
 
@@ -1566,12 +1773,57 @@ class ROMSSimulation(Simulation):
         datasets_to_partition = [
             d for d in self.input_datasets if d.exists_locally and d.partitionable
         ]
-        for f in datasets_to_partition:
-            f.partition(
-                np_xi=self.discretization.n_procs_x,
-                np_eta=self.discretization.n_procs_y,
-                overwrite_existing_files=overwrite_existing_files,
+        if not datasets_to_partition:
+            return
+
+        nprocs = int(get_env_item(ENV_CSTAR_NPROCS_PRE).value)
+
+        # opt-in: the files of every dataset are partitioned on one bounded process
+        # pool; "spawn" avoids forking a process that may hold netCDF/HDF5 state
+        pool: ProcessPoolExecutor | nullcontext[None] = (
+            ProcessPoolExecutor(
+                max_workers=nprocs, mp_context=multiprocessing.get_context("spawn")
             )
+            if nprocs > 1
+            else nullcontext()
+        )
+        with pool as executor:
+            self._partition_datasets(
+                datasets_to_partition, executor, overwrite_existing_files
+            )
+
+    def _partition_datasets(
+        self,
+        datasets: list[ROMSInputDataset],
+        executor: Executor | None,
+        overwrite_existing_files: bool,
+    ) -> None:
+        """Partition input datasets concurrently on a shared executor.
+
+        Parameters
+        ----------
+        datasets : list[ROMSInputDataset]
+            The datasets to partition.
+        executor : Executor | None
+            The executor on which the files of each dataset are partitioned, or
+            `None` to partition them in the current process.
+        overwrite_existing_files : bool
+            If True, any existing partitioned files will be overwritten
+        """
+        tasks = [
+            StagingTask(
+                f"partition {d.__class__.__name__}",
+                partial(
+                    d.partition,
+                    np_xi=self.discretization.n_procs_x,
+                    np_eta=self.discretization.n_procs_y,
+                    overwrite_existing_files=overwrite_existing_files,
+                    executor=executor,
+                ),
+            )
+            for d in datasets
+        ]
+        run_concurrently(tasks, max_workers=len(tasks) if executor else 1)
 
     def _validate_pio_inputs(self) -> None:
         """Ensure all locally staged input datasets are readable by ROMS with
@@ -1752,6 +2004,7 @@ class ROMSSimulation(Simulation):
 
             job_instance.submit()
             self._execution_handler = job_instance
+            self._start_incremental_join()
             return job_instance
 
         else:  # cstar_sysmgr.scheduler is None
@@ -1762,8 +2015,32 @@ class ROMSSimulation(Simulation):
             )
             self._execution_handler = romsprocess
             romsprocess.start()
+            self._start_incremental_join()
             return romsprocess
 
+    def _start_incremental_join(self) -> None:
+        """Start joining closed output files in the background if
+        `CSTAR_INCREMENTAL_JOIN` is enabled.
+
+        Output files written with ParallelIO are already joined, so no joiner is
+        started when `use_pio` is set.
+        """
+        if self.use_pio or not is_flag_enabled(ENV_CSTAR_INCREMENTAL_JOIN):
+            return
+
+        handler = self._execution_handler
+        if handler is None:
+            return
+
+        self._joiner = IncrementalJoiner(
+            self.fs_manager.output_dir,
+            num_tiles=self.discretization.n_procs_x * self.discretization.n_procs_y,
+            join=self._join_output,
+            is_running=lambda: not ExecutionStatus.is_terminal(handler.status),
+            interval=float(get_env_item(ENV_CSTAR_INCREMENTAL_JOIN_INTERVAL).value),
+        )
+        self._joiner.start()
+
     def post_run(self) -> None:
         """Perform post-processing steps after the ROMS simulation run.
 
@@ -1783,7 +2060,8 @@ class ROMSSimulation(Simulation):
           (`*.??????????????.*.nc`) and merges them into unified files.
         - Partitioned files are moved to a `PARTITIONED` subdirectory
           within the output directory after merging.
-        - Uses the `ncjoin` command-line tool for file merging.
+        - Uses the `ncjoin` command-line tool for file merging, or the in-process
+          engine in `cstar.roms.join` if `CSTAR_JOIN_ENGINE` is `native`.
 
         Examples
         --------
@@ -1826,8 +2104,21 @@ class ROMSSimulation(Simulation):
             )
             return
 
+        # wait for any join in progress; already joined files are skipped below
+        joined_incrementally: set[str] = set()
+        if self._joiner is not None:
+            self._joiner.stop()
+            joined_incrementally = self._joiner.joined
+            self._joiner = None
+
         files = list(output_dir.glob("*.??????????????.*.nc"))
-        if not files:
+        unique_wildcards = {
+            str(Path(fname.stem).with_suffix(".*.nc")) for fname in files
+        } - joined_incrementally
+        if not unique_wildcards and joined_incrementally:
+            self.log.info("All output files were joined while ROMS was running")
+            return
+        if not unique_wildcards:
             self.log.warning(f"No suitable output found in `{output_dir}`")
             return
 
@@ -1848,11 +2139,96 @@ class ROMSSimulation(Simulation):
             )
 
         nprocs = int(get_env_item(ENV_CSTAR_NPROCS_POST).value)
-        unique_wildcards = {
-            str(Path(fname.stem).with_suffix(".*.nc")) for fname in files
-        }
+
+        if self._join_engine() == JOIN_ENGINE_NATIVE:
+            # extracted boundary data is still joined by `extract_data_join`
+            native_wildcards = sorted(w for w in unique_wildcards if "ext" not in w)
+            self._join_natively(native_wildcards, nprocs)
+            unique_wildcards -= set(native_wildcards)
 
         with ThreadPoolExecutor(max_workers=nprocs) as executor:
             # list() exhausts the returned iterator, which is needed to surface any errors
             # that were raised in the threaded join operations
             list(executor.map(_spatial_join, unique_wildcards))
+
+    @staticmethod
+    def _join_engine() -> str:
+        """Return the engine used to join partitioned output files.
+
+        Returns
+        -------
+        str
+            The value of `CSTAR_JOIN_ENGINE`.
+
+        Raises
+        ------
+        ValueError
+            If `CSTAR_JOIN_ENGINE` is not a known engine.
+        """
+        engine = get_env_item(ENV_CSTAR_JOIN_ENGINE).value
+        if engine not in (JOIN_ENGINE_NCJOIN, JOIN_ENGINE_NATIVE):
+            msg = (
+                f"Unknown join engine {engine!r}. Set {ENV_CSTAR_JOIN_ENGINE} to "
+                f"{JOIN_ENGINE_NCJOIN!r} or {JOIN_ENGINE_NATIVE!r}."
+            )
+            raise ValueError(msg)
+        return engine
+
+    def _join_output(self, wildcard_pattern: str) -> None:
+        """Join a single set of partitioned output files in the current process.
+
+        Parameters
+        ----------
+        wildcard_pattern : str
+            The wildcard pattern matching the partitioned files.
+        """
+        input_dir = self.fs_manager.output_dir
+        output_dir = self.fs_manager.joined_output_dir
+        output_dir.mkdir(exist_ok=True, parents=True)
+
+        if "ext" in wildcard_pattern:
+            _extract_data_join_wildcard(
+                wildcard_pattern, input_dir, output_dir, logger=self.log
+            )
+        elif self._join_engine() == JOIN_ENGINE_NATIVE:
+            self.log.info(f"Spatial join of netCDF files {wildcard_pattern!r} starting")
+            out_file = _native_join_wildcard(
+                wildcard_pattern, input_dir, output_dir, self.discretization.n_procs_x
+            )
+            self.log.info(f"Spatial join of {str(out_file)!r} is complete")
+        else:
+            _ncjoin_wildcard(wildcard_pattern, input_dir, output_dir, logger=self.log)
+
+    def _join_natively(self, wildcards: list[str], nprocs: int) -> None:
+        """Join partitioned output files with the in-process join engine.
+
+        Files are joined concurrently on a process pool, as the netCDF library
+        cannot safely be used from several threads.
+
+        Parameters
+        ----------
+        wildcards : list[str]
+            The wildcard patterns matching the partitioned files of each output.
+        nprocs : int
+            The maximum number of files joined concurrently.
+        """
+        join = partial(
+            _native_join_wildcard,
+            input_dir=self.fs_manager.output_dir,
+            output_dir=self.fs_manager.joined_output_dir,
+            np_xi=self.discretization.n_procs_x,
+        )
+        for w in wildcards:
+            self.log.info(f"Spatial join of netCDF files {w!r} starting")
+
+        pool: ProcessPoolExecutor | nullcontext[None] = (
+            ProcessPoolExecutor(
+                max_workers=nprocs, mp_context=multiprocessing.get_context("spawn")
+            )
+            if nprocs > 1 and len(wildcards) > 1
+            else nullcontext()
+        )
+        with pool as executor:
+            map_fn = executor.map if executor is not None else map
+            for out_file in map_fn(join, wildcards):
+                self.log.info(f"Spatial join of {str(out_file)!r} is complete")
@@ -0,0 +1,7 @@
+"""Performance benchmarks for C-Star.
+
+Benchmarks are not collected by the unit or integration test suites. Each
+module is executable directly, e.g.::
+
+    python -m cstar.tests.benchmarks.bench_orchestrator --help
+"""
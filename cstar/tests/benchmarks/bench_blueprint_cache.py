@@ -0,0 +1,170 @@
+"""Count the blueprint deserializations made while planning and running a workplan.
+
+A workplan of `hello_world` steps, sharing a small number of blueprint files, is
+transformed as it is when a run is prepared (writing an `.ovrd` blueprint per
+step). Each transformed step's blueprint is then accessed as it is during a run:
+once per access of `LiveStep.blueprint` by the launcher, the submission and the
+status rendering. The number of files parsed and the elapsed time are reported
+with the deserialization cache disabled and enabled.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_blueprint_cache --steps 1000
+"""
+
+import argparse
+import textwrap
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.applications.hello_world import APP_NAME
+from cstar.orchestration import serialization
+from cstar.orchestration.models import Step, Workplan
+from cstar.orchestration.orchestration import LiveStep, configure_environment
+from cstar.orchestration.serialization import DeserializationCache
+from cstar.orchestration.transforms import WorkplanTransformer
+
+BLUEPRINT: str = textwrap.dedent("""\
+    name: Benchmark blueprint {i}
+    description: A blueprint shared by many steps
+    application: hello_world
+    state: draft
+    target: 'benchmark {i}'
+    schema_version: '1.0.0'
+    """)
+"""The content of each shared blueprint."""
+
+
+def create_workplan(root: Path, num_steps: int, num_blueprints: int) -> Workplan:
+    """Create a workplan whose steps share a set of blueprint files.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which the blueprints are written.
+    num_steps : int
+        The number of steps in the workplan.
+    num_blueprints : int
+        The number of distinct blueprint files.
+
+    Returns
+    -------
+    Workplan
+    """
+    paths = []
+    for i in range(num_blueprints):
+        path = root / f"blueprint-{i}.yaml"
+        path.write_text(BLUEPRINT.format(i=i))
+        paths.append(path)
+
+    steps = [
+        Step(
+            name=f"s-{i}",
+            application=APP_NAME,
+            blueprint=paths[i % num_blueprints].as_posix(),
+        )
+        for i in range(num_steps)
+    ]
+    return Workplan(name="shared", description="shared blueprints", steps=steps)
+
+
+def plan_and_run(wp: Workplan, accesses: int) -> tuple[float, float]:
+    """Transform a workplan and access the blueprint of every resulting step.
+
+    Parameters
+    ----------
+    wp : Workplan
+        The workplan to transform.
+    accesses : int
+        The number of times the blueprint of each step is accessed.
+
+    Returns
+    -------
+    tuple[float, float]
+        The time (in seconds) spent planning and running.
+    """
+    t0 = time.perf_counter()
+    transformed = WorkplanTransformer(wp).apply()
+    steps = [LiveStep.from_step(step) for step in transformed.steps]
+    t1 = time.perf_counter()
+
+    for step in steps:
+        for _ in range(accesses):
+            _ = step.blueprint
+    t2 = time.perf_counter()
+
+    return t1 - t0, t2 - t1
+
+
+def measure(
+    num_steps: int,
+    num_blueprints: int,
+    accesses: int,
+    cache: DeserializationCache,
+) -> dict[str, float]:
+    """Count the files parsed while planning and running a workplan.
+
+    Parameters
+    ----------
+    num_steps : int
+        The number of steps in the workplan.
+    num_blueprints : int
+        The number of distinct blueprint files.
+    accesses : int
+        The number of times the blueprint of each step is accessed.
+    cache : DeserializationCache
+        The process-wide deserialization cache to use.
+
+    Returns
+    -------
+    dict[str, float]
+        The number of parses and the time spent planning and running.
+    """
+    parses = 0
+    read_yaml_to_raw = serialization.read_yaml_to_raw
+
+    def counting_read(path: Path) -> dict[str, object]:
+        nonlocal parses
+        parses += 1
+        return read_yaml_to_raw(path)
+
+    with (
+        TemporaryDirectory() as tmp_dir,
+        mock.patch.object(serialization, "read_yaml_to_raw", counting_read),
+        mock.patch.object(
+            serialization, "get_deserialization_cache", return_value=cache
+        ),
+    ):
+        root = Path(tmp_dir)
+        configure_environment(root / "output", "bench-blueprint-cache")
+        wp = create_workplan(root, num_steps, num_blueprints)
+
+        plan_s, run_s = plan_and_run(wp, accesses)
+
+    return {"parses": parses, "plan_s": plan_s, "run_s": run_s}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--blueprints", type=int, default=10)
+    parser.add_argument("--accesses", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.steps} steps, {args.blueprints} blueprints")
+    print(f"{'cache':>8} {'parses':>7} {'plan_s':>7} {'run_s':>7}")
+    for label, max_entries in (("disabled", 0), ("enabled", 1024)):
+        r = measure(
+            args.steps,
+            args.blueprints,
+            args.accesses,
+            DeserializationCache(max_entries=max_entries),
+        )
+        print(f"{label:>8} {r['parses']:>7.0f} {r['plan_s']:>7.2f} {r['run_s']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
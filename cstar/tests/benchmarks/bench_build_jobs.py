@@ -0,0 +1,147 @@
+"""Time the compilation of a synthetic Makefile with serial and parallel jobs.
+
+A Makefile compiling many generated C sources into a static library stands in for
+a codebase. It is built with `make -jN` for several values of N, as ROMS,
+Tools-Roms and MARBL are built with `CSTAR_BUILD_JOBS`, and optionally rebuilt
+after a clean with the compiler launched through `ccache`.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_build_jobs --sources 200 --jobs 1 4 16
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from cstar.base.env import build_jobs_factory
+
+_MAKEFILE = """\
+SRCS := $(wildcard src/*.c)
+OBJS := $(SRCS:src/%.c=obj/%.o)
+
+libsynthetic.a: $(OBJS)
+\tar rcs $@ $^
+
+obj/%.o: src/%.c
+\t@mkdir -p obj
+\t$(CC) -O2 -c $< -o $@
+
+clean:
+\trm -rf obj libsynthetic.a
+"""
+
+
+def create_project(root: Path, num_sources: int, num_functions: int) -> None:
+    """Create a Makefile and generated C sources.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which to create the project.
+    num_sources : int
+        The number of C sources.
+    num_functions : int
+        The number of functions in every source, which sets its compile time.
+    """
+    (root / "src").mkdir(parents=True)
+    (root / "Makefile").write_text(_MAKEFILE)
+
+    for i in range(num_sources):
+        functions = "\n".join(
+            f"double f_{i}_{j}(double x) {{\n"
+            f"    double s = 0;\n"
+            f"    for (int k = 0; k < {j + 8}; k++) s += x * k / (k + {j + 1}.0);\n"
+            f"    return s;\n"
+            f"}}"
+            for j in range(num_functions)
+        )
+        (root / "src" / f"source_{i:04d}.c").write_text(functions)
+
+
+def time_build(root: Path, jobs: int, cc: str) -> float:
+    """Clean and build the project, returning the elapsed time.
+
+    Parameters
+    ----------
+    root : Path
+        The project directory.
+    jobs : int
+        The number of parallel jobs.
+    cc : str
+        The C compiler command.
+
+    Returns
+    -------
+    float
+        The elapsed time (in seconds).
+    """
+    subprocess.run(["make", "clean"], cwd=root, capture_output=True, check=True)
+
+    t0 = time.perf_counter()
+    subprocess.run(
+        ["make", f"-j{jobs}", f"CC={cc}"], cwd=root, capture_output=True, check=True
+    )
+    return time.perf_counter() - t0
+
+
+def run_benchmark(num_sources: int, num_functions: int, jobs: list[int]) -> None:
+    """Build a synthetic project with each number of jobs and print the timings.
+
+    Parameters
+    ----------
+    num_sources : int
+        The number of C sources.
+    num_functions : int
+        The number of functions in every source.
+    jobs : list[int]
+        The numbers of parallel jobs to build with.
+    """
+    ccache = shutil.which("ccache")
+
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        create_project(root, num_sources, num_functions)
+
+        print(f"available processors: {build_jobs_factory()}")
+        print(f"{'launcher':>9} {'jobs':>5} {'elapsed_s':>10}")
+        for n in jobs:
+            print(f"{'-':>9} {n:>5} {time_build(root, n, 'cc'):>10.3f}")
+
+        if ccache:
+            env = {**os.environ, "CCACHE_DIR": str(root / "ccache")}
+            for label in ("cold", "warm"):
+                subprocess.run(
+                    ["make", "clean"], cwd=root, capture_output=True, check=True
+                )
+                t0 = time.perf_counter()
+                subprocess.run(
+                    ["make", f"-j{max(jobs)}", f"CC={ccache} cc"],
+                    cwd=root,
+                    env=env,
+                    capture_output=True,
+                    check=True,
+                )
+                elapsed = time.perf_counter() - t0
+                print(f"{'ccache':>9} {max(jobs):>5} {elapsed:>10.3f} ({label})")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=200)
+    parser.add_argument("--functions", type=int, default=50)
+    parser.add_argument(
+        "--jobs", type=int, nargs="+", default=[1, int(build_jobs_factory())]
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.sources, args.functions, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
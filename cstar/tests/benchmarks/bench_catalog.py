@@ -0,0 +1,132 @@
+"""Compare run listing with and without the SQLite run catalog.
+
+Synthetic run records are written to a temporary state directory and the
+`TrackingRepository` listing queries used by `cstar workplan status` and
+run-id autocompletion are timed against the YAML files and the catalog.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_catalog --runs 10000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import typing as t
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.env import ENV_CSTAR_STATE_HOME, FLAG_OFF, FLAG_ON
+from cstar.base.feature import ENV_FF_ORCH_RUN_CATALOG
+from cstar.orchestration.tracking import TrackingRepository, WorkplanRun
+
+RUNS_PER_ID: t.Final[int] = 10
+"""The number of history records created for each synthetic run-id."""
+
+
+async def populate(repo: TrackingRepository, num_runs: int, root: Path) -> None:
+    """Persist synthetic run records.
+
+    Parameters
+    ----------
+    repo : TrackingRepository
+        The repository used to persist the runs.
+    num_runs : int
+        The number of runs to persist.
+    root : Path
+        A directory used to generate the paths referenced by each run.
+    """
+    t0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+    for i in range(num_runs):
+        run_id = f"run-{i // RUNS_PER_ID:05d}"
+        run = WorkplanRun(
+            workplan_path=root / f"{run_id}.yaml",
+            trx_workplan_path=root / f"{run_id}-trx.yaml",
+            output_path=root / "output" / run_id,
+            run_id=run_id,
+            start_at=t0 + timedelta(seconds=i),
+            environment={f"VAR_{j}": str(j) for j in range(20)},
+            sentinels={root / "state" / f"step-{j}.sentinel.yaml" for j in range(10)},
+        )
+        await repo.put_workplan_run(run)
+
+
+async def timed(fn: Callable[[], Awaitable[t.Sized]]) -> tuple[float, int]:
+    """Time the execution of a query.
+
+    Parameters
+    ----------
+    fn : Callable[[], Awaitable[t.Sized]]
+        The query to execute.
+
+    Returns
+    -------
+    tuple[float, int]
+        The elapsed time in seconds and the number of results.
+    """
+    t0 = time.perf_counter()
+    result = await fn()
+    return time.perf_counter() - t0, len(result)
+
+
+async def run_benchmark(num_runs: int) -> None:
+    """Populate a state directory and print query timings.
+
+    Parameters
+    ----------
+    num_runs : int
+        The number of synthetic runs to persist.
+    """
+    repo = TrackingRepository()
+    queries: dict[str, Callable[[], Awaitable[t.Sized]]] = {
+        "latest (all)": lambda: repo.list_latest_runs(""),
+        "latest (prefix)": lambda: repo.list_latest_runs("run-001"),
+        "history (all)": lambda: repo.list_history_runs(""),
+        "history (run-id)": lambda: repo.list_history_runs("run-00042"),
+    }
+
+    with TemporaryDirectory() as tmp_dir:
+        env = {ENV_CSTAR_STATE_HOME: tmp_dir, ENV_FF_ORCH_RUN_CATALOG: FLAG_OFF}
+
+        with mock.patch.dict(os.environ, env):
+            t0 = time.perf_counter()
+            await populate(repo, num_runs, Path(tmp_dir))
+            print(f"populated {num_runs} runs in {time.perf_counter() - t0:.2f}s")
+
+            files = {name: await timed(fn) for name, fn in queries.items()}
+
+            t0 = time.perf_counter()
+            repo.rebuild_catalog()
+            print(f"rebuilt catalog in {time.perf_counter() - t0:.2f}s\n")
+
+            os.environ[ENV_FF_ORCH_RUN_CATALOG] = FLAG_ON
+            indexed = {name: await timed(fn) for name, fn in queries.items()}
+
+    print(
+        f"{'query':<18} {'results':>8} {'files_s':>9} {'catalog_s':>10} {'speedup':>8}"
+    )
+    for name, (file_s, count) in files.items():
+        catalog_s, catalog_count = indexed[name]
+        assert count == catalog_count, f"Mismatched results for {name!r}"
+        print(
+            f"{name:<18} {count:>8} {file_s:>9.3f} {catalog_s:>10.4f} "
+            f"{file_s / catalog_s:>7.0f}x"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10_000)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Count the source inspections performed when loading large blueprints.
+
+A local `http.server` serves synthetic binary datasets after an artificial delay
+that simulates the latency of a remote data host. A blueprint referencing those
+datasets is "loaded" by creating a `SourceData` for each of them, and then the
+sources are classified as they would be when staging. Loading is repeated with
+a fresh in-process state to simulate a second command using the same cache.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_classification --datasets 200
+"""
+
+import argparse
+import os
+import threading
+import time
+import typing as t
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.env import ENV_CSTAR_CACHE_HOME
+from cstar.io.classification_cache import _get_classification_cache
+from cstar.io.source_data import SourceData, _SourceInspector, get_remote_header
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    """Serve a fixed binary payload after a delay, counting the requests."""
+
+    latency: t.ClassVar[float] = 0.0
+    payload: t.ClassVar[bytes] = b"\x89HDF\r\n\x1a\n" + bytes(range(256)) * 4
+    requests: t.ClassVar[Counter[str]] = Counter()
+
+    def _send_headers(self) -> None:
+        self.requests[self.command] += 1
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._send_headers()
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._send_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        """Silence the per-request log output."""
+
+
+@contextmanager
+def serve(latency: float) -> Iterator[str]:
+    """Run a local HTTP server in a background thread.
+
+    Parameters
+    ----------
+    latency : float
+        The delay (in seconds) applied to every request.
+
+    Returns
+    -------
+    Iterator[str]
+        The base URL of the server.
+    """
+    _CountingHandler.latency = latency
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _measure(label: str, fn: Callable[[], object], inspections: Counter[str]) -> None:
+    """Run a phase of the benchmark and print its cost."""
+    _CountingHandler.requests.clear()
+    inspections.clear()
+
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+
+    n_requests = sum(_CountingHandler.requests.values())
+    n_inspections = inspections["classify"]
+    print(f"{label:>20} {n_inspections:>12} {n_requests:>9} {elapsed:>10.3f}")
+
+
+def run_benchmark(num_datasets: int, latency: float) -> None:
+    """Load a blueprint of remote datasets and print the inspection cost.
+
+    Parameters
+    ----------
+    num_datasets : int
+        The number of datasets referenced by the blueprint.
+    latency : float
+        The delay (in seconds) applied to every request.
+    """
+    inspections: Counter[str] = Counter()
+    classify = _SourceInspector.classify
+
+    def _counting_classify(self: _SourceInspector) -> t.Any:
+        inspections["classify"] += 1
+        return classify(self)
+
+    with (
+        serve(latency) as url,
+        TemporaryDirectory() as cache_home,
+        mock.patch.dict(os.environ, {ENV_CSTAR_CACHE_HOME: cache_home}),
+        mock.patch.object(_SourceInspector, "classify", _counting_classify),
+    ):
+        locations = [f"{url}/forcing_{i:04d}.nc" for i in range(num_datasets)]
+        sources: list[SourceData] = []
+
+        def _load() -> None:
+            sources[:] = [SourceData(location=loc) for loc in locations]
+
+        def _classify() -> None:
+            for s in sources:
+                _ = s.classification
+
+        def _reload() -> None:
+            _get_classification_cache.cache_clear()
+            get_remote_header.cache_clear()
+            _load()
+            _classify()
+
+        print(f"{'phase':>20} {'inspections':>12} {'requests':>9} {'elapsed_s':>10}")
+        _measure("load", _load, inspections)
+        _measure("first classification", _classify, inspections)
+        _measure("reload and classify", _reload, inspections)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    run_benchmark(args.datasets, args.latency)
+
+
+if __name__ == "__main__":
+    main()
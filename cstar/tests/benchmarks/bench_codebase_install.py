@@ -0,0 +1,146 @@
+"""Compare setting up an external codebase per step and from the codebase store.
+
+A synthetic local repository stands in for the MARBL codebase, and a fake `make`
+that sleeps stands in for compiling it. Many steps then set up the codebase,
+first as each step of a workplan used to, by cloning and compiling it in the
+step's own directory, and then with `ExternalCodeBase.install`, which builds
+the codebase once in the host-wide codebase store.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_codebase_install --steps 20 --build-s 2
+"""
+
+import argparse
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.codebase_store import _get_codebase_store
+from cstar.base.env import ENV_CSTAR_CACHE_HOME
+from cstar.io.constants import SourceClassification
+from cstar.marbl.external_codebase import MARBLExternalCodeBase
+
+
+def _git(*args: str, cwd: Path | None = None) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=C-Star", "-c", "user.email=cstar@example.com"]
+        + list(args),
+        cwd=cwd,
+        capture_output=True,
+        check=True,
+    )
+
+
+def create_repository(root: Path) -> str:
+    """Create a bare repository laid out like the MARBL codebase.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which to create the repository.
+
+    Returns
+    -------
+    str
+        The URL of the repository.
+    """
+    bare_dir, work_dir = root / "remote.git", root / "work"
+    _git("init", "-q", "--bare", "--initial-branch=main", str(bare_dir))
+    _git("clone", "-q", str(bare_dir), str(work_dir))
+
+    (work_dir / "src").mkdir()
+    (work_dir / "src" / "Makefile").write_text("all:\n")
+    _git("add", ".", cwd=work_dir)
+    _git("commit", "-q", "-m", "initial", cwd=work_dir)
+    _git("push", "-q", "origin", "HEAD:main", cwd=work_dir)
+    return bare_dir.as_uri()
+
+
+def create_fake_make(bin_dir: Path, build_seconds: float, log_path: Path) -> None:
+    """Create a `make` that records its invocation and sleeps.
+
+    Parameters
+    ----------
+    bin_dir : Path
+        The directory in which to create the executable.
+    build_seconds : float
+        The time (in seconds) each build takes.
+    log_path : Path
+        The file recording each invocation.
+    """
+    bin_dir.mkdir(parents=True)
+    make = bin_dir / "make"
+    make.write_text(f"#!/bin/sh\necho make >> {log_path}\nsleep {build_seconds}\n")
+    make.chmod(0o755)
+
+
+def run_benchmark(num_steps: int, build_seconds: float, workers: int) -> None:
+    """Set up a codebase for many steps and print the cost of each strategy.
+
+    Parameters
+    ----------
+    num_steps : int
+        The number of steps setting up the codebase.
+    build_seconds : float
+        The time (in seconds) each build takes.
+    workers : int
+        The number of steps set up concurrently.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        url = create_repository(root / "repo")
+        log_path = root / "builds.log"
+        create_fake_make(root / "bin", build_seconds, log_path)
+
+        env = {
+            "PATH": f"{root / 'bin'}:{os.environ['PATH']}",
+            ENV_CSTAR_CACHE_HOME: str(root / "cache"),
+        }
+
+        def _setup(strategy: str, i: int) -> None:
+            codebase = MARBLExternalCodeBase(url, checkout_target="main")
+            if strategy == "shared":
+                codebase.install()
+            else:
+                codebase.setup(root / strategy / f"step-{i:03d}" / "marbl")
+
+        print(f"{'strategy':>9} {'builds':>7} {'elapsed_s':>10}")
+        for strategy in ("per-step", "shared"):
+            log_path.write_text("")
+            _get_codebase_store.cache_clear()
+
+            with (
+                mock.patch.dict(os.environ, env),
+                mock.patch(
+                    "cstar.io.source_data.classify_location",
+                    return_value=SourceClassification.REMOTE_REPOSITORY,
+                ),
+                ThreadPoolExecutor(workers) as executor,
+            ):
+                t0 = time.perf_counter()
+                list(executor.map(partial(_setup, strategy), range(num_steps)))
+                elapsed = time.perf_counter() - t0
+
+            n_builds = len(log_path.read_text().splitlines())
+            print(f"{strategy:>9} {n_builds:>7} {elapsed:>10.3f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--build-s", type=float, default=2.0)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    run_benchmark(args.steps, args.build_s, args.workers)
+
+
+if __name__ == "__main__":
+    main()
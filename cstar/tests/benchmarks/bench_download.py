@@ -0,0 +1,143 @@
+"""Compare single-stream and segmented downloads of a large remote file.
+
+A local `http.server` serves a synthetic binary file with byte-range support,
+throttling every connection to a fixed bandwidth to simulate a remote data host
+that limits per-connection throughput. The file is downloaded with an increasing
+number of concurrent segments.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_download --size-mb 64 --bandwidth-mb 16
+"""
+
+import argparse
+import threading
+import time
+import typing as t
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from cstar.io.download import Download
+
+_BLOCK_SIZE: t.Final[int] = 64 * 1024
+"""The number of bytes written to a connection between throttling delays."""
+
+
+class _ThrottledHandler(BaseHTTPRequestHandler):
+    """Serve a fixed binary payload at a limited per-connection bandwidth."""
+
+    bandwidth: t.ClassVar[float] = 0.0
+    payload: t.ClassVar[bytes] = b""
+
+    def _send_headers(self) -> tuple[int, int]:
+        start, end = 0, len(self.payload) - 1
+        if spec := self.headers.get("Range"):
+            first, last = spec.removeprefix("bytes=").split("-")
+            start, end = int(first), min(int(last or end), end)
+            self.send_response(206)
+            content_range = f"bytes {start}-{end}/{len(self.payload)}"
+            self.send_header("Content-Range", content_range)
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"benchmark"')
+        self.end_headers()
+        return start, end
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._send_headers()
+
+    def do_GET(self) -> None:  # noqa: N802
+        start, end = self._send_headers()
+        for offset in range(start, end + 1, _BLOCK_SIZE):
+            block = self.payload[offset : min(offset + _BLOCK_SIZE, end + 1)]
+            self.wfile.write(block)
+            time.sleep(len(block) / self.bandwidth)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        """Silence the per-request log output."""
+
+
+@contextmanager
+def serve(bandwidth: float, size: int) -> Iterator[str]:
+    """Run a local HTTP server in a background thread.
+
+    Parameters
+    ----------
+    bandwidth : float
+        The throughput (in bytes per second) of every connection.
+    size : int
+        The size (in bytes) of the served file.
+
+    Returns
+    -------
+    Iterator[str]
+        The URL of the served file.
+    """
+    _ThrottledHandler.bandwidth = bandwidth
+    _ThrottledHandler.payload = b"\x00\xff" * (size // 2)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottledHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/forcing.nc"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_benchmark(size: int, bandwidth: float, segments: list[int]) -> None:
+    """Download a remote file and print the elapsed time.
+
+    Parameters
+    ----------
+    size : int
+        The size (in bytes) of the file.
+    bandwidth : float
+        The throughput (in bytes per second) of every connection.
+    segments : list[int]
+        The numbers of concurrent segments to benchmark.
+    """
+    with serve(bandwidth, size) as url:
+        print(f"{'segments':>8} {'elapsed_s':>10} {'MB/s':>8} {'speedup':>8}")
+        baseline = 0.0
+        for n in segments:
+            with TemporaryDirectory() as tmp_dir:
+                target = Path(tmp_dir) / "forcing.nc"
+                download = Download(url, target, segments=n, min_segment_bytes=1)
+
+                t0 = time.perf_counter()
+                download.run()
+                elapsed = time.perf_counter() - t0
+
+                assert target.stat().st_size == size
+
+            baseline = baseline or elapsed
+            rate = size / elapsed / 1024 / 1024
+            print(f"{n:>8} {elapsed:>10.3f} {rate:>8.1f} {baseline / elapsed:>7.1f}x")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=64)
+    parser.add_argument("--bandwidth-mb", type=float, default=16)
+    parser.add_argument("--segments", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    run_benchmark(
+        int(args.size_mb * 1024 * 1024),
+        args.bandwidth_mb * 1024 * 1024,
+        args.segments,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Compare the startup and per-step overhead of the orchestration engines.
+
+For each engine, a fresh interpreter submits a number of steps through
+`SlurmLauncher._submit_once` inside an `engine_flow`, with the `sbatch` call
+replaced by a no-op. The steps are then submitted a second time to measure the
+cost of detecting that a step was already submitted. Startup is the remainder of
+the interpreter's wall time: imports and, for Prefect, starting the ephemeral
+server and the flow run.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_engine --steps 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.env import ENV_CSTAR_RUNID, ENV_CSTAR_STATE_HOME
+from cstar.orchestration.engine import engine_flow
+from cstar.orchestration.launch.slurm import SlurmHandle, SlurmLauncher
+from cstar.orchestration.orchestration import LiveStep
+from cstar.orchestration.utils import (
+    ENV_CSTAR_ORCH_ENGINE,
+    ORCH_ENGINE_NATIVE,
+    ORCH_ENGINE_PREFECT,
+)
+
+BLUEPRINT_PATH: str = "/dev/null/blueprint.yaml"
+"""A placeholder blueprint path; the no-op submission never loads it."""
+
+
+async def fake_submit(step: LiveStep, _deps: list[SlurmHandle]) -> SlurmHandle:
+    """Stand in for `SlurmLauncher._submit` without calling `sbatch`."""
+    return SlurmHandle(pid=str(hash(step.name)), name=step.name, run_id="bench")
+
+
+@engine_flow
+async def submit_twice(steps: list[LiveStep]) -> dict[str, float]:
+    """Submit every step twice within a flow of the selected engine.
+
+    Parameters
+    ----------
+    steps : list[LiveStep]
+        The steps to submit.
+
+    Returns
+    -------
+    dict[str, float]
+        The time (in seconds) spent on first and repeated submissions.
+    """
+    t0 = time.perf_counter()
+    for step in steps:
+        await SlurmLauncher._submit_once(step, [])
+    t1 = time.perf_counter()
+    for step in steps:
+        await SlurmLauncher._submit_once(step, [])
+    t2 = time.perf_counter()
+    return {"submit_s": t1 - t0, "resubmit_s": t2 - t1}
+
+
+async def submit_steps(root: Path, num_steps: int) -> dict[str, float]:
+    """Create and submit steps, replacing `sbatch` with a no-op.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which step working directories are created.
+    num_steps : int
+        The number of steps to submit.
+
+    Returns
+    -------
+    dict[str, float]
+        The time (in seconds) spent on first and repeated submissions.
+    """
+    steps = [
+        LiveStep(
+            name=f"step-{i}",
+            application="sleep",
+            blueprint=BLUEPRINT_PATH,
+            working_dir=root / f"step-{i}",
+        )
+        for i in range(num_steps)
+    ]
+
+    # patch with a plain function; Prefect cannot wrap a mock in a task
+    with mock.patch.object(SlurmLauncher, "_submit", staticmethod(fake_submit)):
+        return await submit_twice(steps)
+
+
+def run_engine(engine: str, num_steps: int) -> dict[str, float]:
+    """Run the submissions in a fresh interpreter using an engine.
+
+    Parameters
+    ----------
+    engine : str
+        The orchestration engine.
+    num_steps : int
+        The number of steps to submit.
+
+    Returns
+    -------
+    dict[str, float]
+        The wall time of the interpreter and the submission timings.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        env = {
+            **os.environ,
+            ENV_CSTAR_ORCH_ENGINE: engine,
+            ENV_CSTAR_RUNID: f"bench-{engine}",
+            ENV_CSTAR_STATE_HOME: (root / "state").as_posix(),
+            "PREFECT_HOME": (root / "prefect").as_posix(),
+        }
+        cmd = [
+            sys.executable,
+            "-m",
+            "cstar.tests.benchmarks.bench_engine",
+            "--child",
+            f"--steps={num_steps}",
+            f"--root={root}",
+        ]
+
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True)
+        wall_s = time.perf_counter() - t0
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {"wall_s": wall_s, **result}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--root", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(submit_steps(args.root, args.steps))))
+        return
+
+    print(f"{args.steps} steps")
+    print(
+        f"{'engine':>8} {'wall_s':>7} {'startup_s':>10} "
+        f"{'submit_ms/step':>15} {'resubmit_ms/step':>17}"
+    )
+    for engine in (ORCH_ENGINE_PREFECT, ORCH_ENGINE_NATIVE):
+        r = run_engine(engine, args.steps)
+        startup = r["wall_s"] - r["submit_s"] - r["resubmit_s"]
+        print(
+            f"{engine:>8} {r['wall_s']:>7.2f} {startup:>10.2f} "
+            f"{1000 * r['submit_s'] / args.steps:>15.2f} "
+            f"{1000 * r['resubmit_s'] / args.steps:>17.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
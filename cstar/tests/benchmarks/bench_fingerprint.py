@@ -0,0 +1,108 @@
+"""Measure verification of staged files with and without the fingerprint index.
+
+A directory of large synthetic files is staged as a `StagedDataCollection`
+and `changed_from_source` - the check performed for each input dataset by
+`ROMSSimulation.is_setup` - is timed against rehashing every file serially.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_fingerprint --files 8 --size-mb 256
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.env import ENV_CSTAR_CACHE_HOME
+from cstar.base.utils import _get_sha256_hash
+from cstar.io.staged_data import StagedDataCollection, StagedFile
+
+_CHUNK: bytes = os.urandom(1024 * 1024)
+"""A block of random bytes used to generate synthetic files."""
+
+
+def create_files(root: Path, num_files: int, size_mb: int) -> list[Path]:
+    """Write synthetic files of a fixed size.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which to write the files.
+    num_files : int
+        The number of files to write.
+    size_mb : int
+        The size (in MB) of each file.
+
+    Returns
+    -------
+    list[Path]
+    """
+    paths = [root / f"forcing_{i:03d}.nc" for i in range(num_files)]
+    for i, path in enumerate(paths):
+        with path.open("wb") as fp:
+            fp.write(i.to_bytes(8))
+            for _ in range(size_mb):
+                fp.write(_CHUNK)
+    return paths
+
+
+def run_benchmark(num_files: int, size_mb: int) -> None:
+    """Create synthetic files and print verification timings.
+
+    Parameters
+    ----------
+    num_files : int
+        The number of files to verify.
+    size_mb : int
+        The size (in MB) of each file.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        (root / "data").mkdir()
+
+        t0 = time.perf_counter()
+        paths = create_files(root / "data", num_files, size_mb)
+        print(f"wrote {num_files} x {size_mb} MB in {time.perf_counter() - t0:.2f}s\n")
+
+        t0 = time.perf_counter()
+        hashes = [_get_sha256_hash(p) for p in paths]
+        rehash_s = time.perf_counter() - t0
+
+        staged = StagedDataCollection(
+            StagedFile(source=mock.Mock(), path=p, sha256=h)
+            for p, h in zip(paths, hashes)
+        )
+
+        with mock.patch.dict(os.environ, {ENV_CSTAR_CACHE_HOME: str(root / "cache")}):
+            t0 = time.perf_counter()
+            assert not staged.changed_from_source
+            cold_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            assert not staged.changed_from_source
+            warm_s = time.perf_counter() - t0
+
+    print(f"{'check':<24} {'elapsed_s':>10} {'speedup':>8}")
+    for name, elapsed in [
+        ("serial rehash", rehash_s),
+        ("index (cold)", cold_s),
+        ("index (warm)", warm_s),
+    ]:
+        print(f"{name:<24} {elapsed:>10.4f} {rehash_s / elapsed:>7.1f}x")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--size-mb", type=int, default=256)
+    args = parser.parse_args()
+
+    run_benchmark(args.files, args.size_mb)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Compare the throughput and peak memory of the ROMS output join engines.
+
+Synthetic tiles of a ROMS history file are written with `netCDF4` and joined by
+`ncjoin` (if it is on the PATH) and by the in-process engine in
+`cstar.roms.join`. Each join runs in a fresh child process so that its peak
+resident set size can be measured in isolation.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_join --np-xi 4 --np-eta 4 --records 12
+"""
+
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import netCDF4 as nc
+import numpy as np
+
+from cstar.roms.join import join_tiles
+
+PREFIX: str = "ocean_his.20240101000000"
+"""The prefix of the synthetic tiles."""
+
+
+def write_tiles(
+    root: Path,
+    np_xi: int,
+    np_eta: int,
+    tile_nx: int,
+    tile_ny: int,
+    num_records: int,
+    num_levels: int,
+) -> int:
+    """Write synthetic tiles of a ROMS history file.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which to write the tiles.
+    np_xi, np_eta : int
+        The number of tiles in each direction.
+    tile_nx, tile_ny : int
+        The number of rho points of each tile in each direction.
+    num_records : int
+        The number of time records.
+    num_levels : int
+        The number of vertical levels of the 3D variables.
+
+    Returns
+    -------
+    int
+        The combined size (in bytes) of the tiles.
+    """
+    rng = np.random.default_rng(0)
+    ndigits = len(str(np_xi * np_eta - 1))
+
+    for node in range(np_xi * np_eta):
+        path = root / f"{PREFIX}.{node:0{ndigits}d}.nc"
+        with nc.Dataset(path, "w") as ds:
+            ds.setncattr("partition", [node, np_xi * np_eta])
+            ds.createDimension("time", None)
+            ds.createDimension("s_rho", num_levels)
+            ds.createDimension("eta_rho", tile_ny)
+            ds.createDimension("xi_rho", tile_nx)
+
+            ds.createVariable("ocean_time", "f8", ("time",))[:] = np.arange(num_records)
+            for name in ("temp", "salt", "w"):
+                var = ds.createVariable(
+                    name, "f4", ("time", "s_rho", "eta_rho", "xi_rho")
+                )
+                for rec in range(num_records):
+                    var[rec] = rng.random((num_levels, tile_ny, tile_nx))
+            zeta = ds.createVariable("zeta", "f4", ("time", "eta_rho", "xi_rho"))
+            zeta[:] = rng.random((num_records, tile_ny, tile_nx))
+
+    return sum(p.stat().st_size for p in root.glob(f"{PREFIX}.*.nc"))
+
+
+def measure(engine: str, root: Path, np_xi: int) -> None:
+    """Join the tiles in `root` with one engine and print the elapsed time and
+    peak RSS as JSON.
+
+    Parameters
+    ----------
+    engine : str
+        Either `ncjoin` or `native`.
+    root : Path
+        The directory containing the tiles.
+    np_xi : int
+        The number of tiles in the xi direction.
+    """
+    t0 = time.perf_counter()
+    if engine == "ncjoin":
+        subprocess.run(["ncjoin", f"{PREFIX}.*.nc"], cwd=root, check=True)
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    else:
+        join_tiles(list(root.glob(f"{PREFIX}.*.nc")), root / f"{PREFIX}.nc", np_xi)
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+    elapsed = time.perf_counter() - t0
+
+    print(json.dumps({"elapsed": elapsed, "max_rss_kb": usage.ru_maxrss}))
+
+
+def run_benchmark(
+    np_xi: int,
+    np_eta: int,
+    tile_nx: int,
+    tile_ny: int,
+    num_records: int,
+    num_levels: int,
+) -> None:
+    """Join synthetic tiles with each engine and print a comparison.
+
+    Parameters
+    ----------
+    np_xi, np_eta : int
+        The number of tiles in each direction.
+    tile_nx, tile_ny : int
+        The number of rho points of each tile in each direction.
+    num_records : int
+        The number of time records.
+    num_levels : int
+        The number of vertical levels of the 3D variables.
+    """
+    engines = ["native"]
+    if shutil.which("ncjoin"):
+        engines.insert(0, "ncjoin")
+    else:
+        print("ncjoin is not on the PATH; benchmarking the native engine only")
+
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        size = write_tiles(
+            root, np_xi, np_eta, tile_nx, tile_ny, num_records, num_levels
+        )
+        print(f"joining {np_xi * np_eta} tiles, {size / 2**20:.1f} MB")
+
+        print(f"{'engine':>8} {'elapsed_s':>10} {'MB/s':>8} {'peak_rss_MB':>12}")
+        for engine in engines:
+            (root / f"{PREFIX}.nc").unlink(missing_ok=True)
+            result = subprocess.run(
+                [sys.executable, "-m", "cstar.tests.benchmarks.bench_join"]
+                + ["--measure", engine, "--dir", str(root), "--np-xi", str(np_xi)],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            elapsed, rss_mb = stats["elapsed"], stats["max_rss_kb"] / 1024
+            throughput = size / 2**20 / elapsed
+            print(f"{engine:>8} {elapsed:>10.3f} {throughput:>8.1f} {rss_mb:>12.1f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--np-xi", type=int, default=4)
+    parser.add_argument("--np-eta", type=int, default=4)
+    parser.add_argument("--tile-nx", type=int, default=128)
+    parser.add_argument("--tile-ny", type=int, default=128)
+    parser.add_argument("--records", type=int, default=12)
+    parser.add_argument("--levels", type=int, default=32)
+    parser.add_argument("--measure", choices=["ncjoin", "native"])
+    parser.add_argument("--dir", type=Path)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.dir, args.np_xi)
+        return
+
+    run_benchmark(
+        args.np_xi,
+        args.np_eta,
+        args.tile_nx,
+        args.tile_ny,
+        args.records,
+        args.levels,
+    )
+
+
+if __name__ == "__main__":
+    main()
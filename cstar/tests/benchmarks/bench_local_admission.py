@@ -0,0 +1,142 @@
+"""Measure the makespan of many multi-rank local steps with and without admission
+control.
+
+Each fake step runs a group of rank processes that alternate a fixed amount of
+CPU-bound work with a barrier, like the time steps of an MPI model. When more
+ranks than cores are running, every barrier waits for the slowest, descheduled
+rank, so oversubscribing the machine slows every step down.
+
+Three policies are compared:
+
+- `unlimited`: start every step at once (the former local launcher behavior).
+- `admission`: admit steps with the `LocalResourceScheduler`, using the number
+  of available processors as the CPU budget.
+- `sequential`: run one step at a time.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_local_admission --steps 20 --ranks 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import sys
+import time
+
+from cstar.base.env import build_jobs_factory
+from cstar.orchestration.launch.admission import (
+    LocalResourceScheduler,
+    ResourceRequest,
+)
+
+
+def _rank(barrier: "mp.synchronize.Barrier", iterations: int, work: int) -> None:
+    """Alternate CPU-bound work with a barrier shared by all ranks of a step."""
+    for _ in range(iterations):
+        total = 0
+        for i in range(work):
+            total += i * i
+        barrier.wait()
+
+
+def run_step(ranks: int, iterations: int, work: int) -> None:
+    """Run the rank processes of a single fake step.
+
+    Parameters
+    ----------
+    ranks : int
+        The number of rank processes.
+    iterations : int
+        The number of work/barrier iterations.
+    work : int
+        The number of loop iterations of CPU-bound work between barriers.
+    """
+    barrier = mp.Barrier(ranks)
+    procs = [
+        mp.Process(target=_rank, args=(barrier, iterations, work)) for _ in range(ranks)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+
+async def run_policy(
+    max_cpus: int, num_steps: int, ranks: int, iterations: int, work: int
+) -> float:
+    """Run every fake step under a CPU budget and return the makespan.
+
+    Parameters
+    ----------
+    max_cpus : int
+        The CPU budget of the scheduler.
+    num_steps : int
+        The number of steps.
+    ranks : int
+        The number of ranks of each step.
+    iterations : int
+        The number of work/barrier iterations of each step.
+    work : int
+        The amount of CPU-bound work between barriers.
+
+    Returns
+    -------
+    float
+        The time (in seconds) until the last step ended.
+    """
+    scheduler = LocalResourceScheduler(max_cpus=max_cpus, max_memory_mb=1)
+
+    async def step(name: str) -> None:
+        await scheduler.acquire(ResourceRequest(name, ranks))
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "cstar.tests.benchmarks.bench_local_admission",
+                "--step",
+                f"--ranks={ranks}",
+                f"--iterations={iterations}",
+                f"--work={work}",
+            )
+            await proc.wait()
+        finally:
+            scheduler.release(name)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(step(f"step-{i}") for i in range(num_steps)))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--ranks", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--work", type=int, default=20_000)
+    parser.add_argument("--cpus", type=int, default=int(build_jobs_factory()))
+    parser.add_argument("--step", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.step:
+        run_step(args.ranks, args.iterations, args.work)
+        return
+
+    policies = {
+        "unlimited": args.steps * args.ranks,
+        "admission": args.cpus,
+        "sequential": args.ranks,
+    }
+
+    print(f"{args.steps} steps x {args.ranks} ranks on {args.cpus} CPUs")
+    print(f"{'policy':>11} {'max_cpus':>9} {'makespan_s':>11}")
+    for policy, max_cpus in policies.items():
+        makespan = asyncio.run(
+            run_policy(max_cpus, args.steps, args.ranks, args.iterations, args.work)
+        )
+        print(f"{policy:>11} {max_cpus:>9} {makespan:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Measure the scheduling overhead per dependency edge of the local launcher.
+
+A chain of steps, each depending on the previous one, is processed to
+completion with the `LocalLauncher` (without the proxy script). Every step runs a
+trivial command, so the makespan is dominated by the time between a process
+exiting and its dependent being started. The cost of running the commands
+themselves is measured by running them serially, and subtracted from the
+makespan to obtain the overhead per edge.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_local_chain --steps 200
+"""
+
+import argparse
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.orchestration.dag_runner import process_plan
+from cstar.orchestration.launch.admission import ResourceRequest
+from cstar.orchestration.launch.local import LocalLauncher
+from cstar.orchestration.orchestration import (
+    Orchestrator,
+    Planner,
+    RunMode,
+    configure_environment,
+)
+from cstar.tests.benchmarks.bench_orchestrator import chain_workplan
+
+COMMAND: str = "true;"
+"""The script executed by every step."""
+
+
+def run_commands_serially(num_steps: int) -> float:
+    """Run the step command once per step, one after the other.
+
+    Parameters
+    ----------
+    num_steps : int
+        The number of times to run the command.
+
+    Returns
+    -------
+    float
+        The elapsed time (in seconds).
+    """
+    t0 = time.perf_counter()
+    for _ in range(num_steps):
+        subprocess.run(["sh", "-c", COMMAND], check=True)
+    return time.perf_counter() - t0
+
+
+async def run_chain(num_steps: int, mode: RunMode) -> float:
+    """Process a chain of trivial steps with the local launcher.
+
+    Parameters
+    ----------
+    num_steps : int
+        The number of steps in the chain.
+    mode : RunMode
+        The run mode used by the orchestrator.
+
+    Returns
+    -------
+    float
+        The makespan (in seconds).
+    """
+    planner = Planner(workplan=chain_workplan(num_steps))
+    orchestrator = Orchestrator(planner, LocalLauncher())
+
+    with (
+        mock.patch.object(LocalLauncher, "adapt_step", side_effect=lambda *_: COMMAND),
+        mock.patch.object(
+            LocalLauncher,
+            "resource_request",
+            side_effect=lambda step: ResourceRequest(step.name, 1),
+        ),
+        mock.patch.object(LocalLauncher, "use_proxy", False),
+    ):
+        t0 = time.perf_counter()
+        await process_plan(orchestrator, mode)
+        return time.perf_counter() - t0
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument(
+        "--mode",
+        default=RunMode.Monitor.value,
+        choices=[m.value for m in RunMode],
+    )
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tmp_dir:
+        configure_environment(Path(tmp_dir), "bench-local-chain")
+
+        baseline = run_commands_serially(args.steps)
+        makespan = asyncio.run(run_chain(args.steps, RunMode(args.mode)))
+
+    overhead_ms = 1000 * (makespan - baseline) / max(1, args.steps - 1)
+    print(f"{'steps':>6} {'serial_s':>9} {'makespan_s':>11} {'overhead_ms/edge':>17}")
+    print(f"{args.steps:>6} {baseline:>9.2f} {makespan:>11.2f} {overhead_ms:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
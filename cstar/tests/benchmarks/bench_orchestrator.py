@@ -0,0 +1,203 @@
+"""Measure per-tick orchestration overhead on large synthetic workplans.
+
+A no-op launcher completes every task as soon as it is launched, so the
+measured latency reflects only the cost of planning and bookkeeping in the
+`Orchestrator` (identifying open nodes, processing them, and updating state).
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_orchestrator --sizes 1000,10000,50000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import typing as t
+from collections.abc import Callable
+
+from cstar.orchestration.models import Step, Workplan
+from cstar.orchestration.orchestration import (
+    Launcher,
+    LiveStep,
+    Orchestrator,
+    Planner,
+    ProcessHandle,
+    RunMode,
+    Status,
+    Task,
+)
+
+BLUEPRINT_PATH: t.Final[str] = "/dev/null/blueprint.yaml"
+"""A placeholder blueprint path; the no-op launcher never loads it."""
+
+
+class NoOpHandle(ProcessHandle):
+    """Handle for a task that completes immediately."""
+
+    launcher_name: str = "noop"
+    """The launcher used to launch the process."""
+
+
+class NoOpLauncher(Launcher[NoOpHandle]):
+    """A launcher that completes every task as soon as it is launched."""
+
+    num_launched: int = 0
+    """The number of tasks launched."""
+
+    @classmethod
+    def check_preconditions(cls) -> None:
+        return None
+
+    @classmethod
+    async def launch(
+        cls,
+        step: LiveStep,
+        dependencies: list[NoOpHandle],
+    ) -> Task[NoOpHandle]:
+        cls.num_launched += 1
+        handle = NoOpHandle(
+            pid=str(cls.num_launched),
+            name=step.name,
+            run_id="benchmark",
+            status=Status.Done,
+        )
+        return Task(step=step, handle=handle)
+
+    @classmethod
+    async def query_status(cls, item: Task[NoOpHandle] | NoOpHandle) -> Status:
+        handle = item.handle if isinstance(item, Task) else item
+        return handle.status
+
+    @classmethod
+    async def update_status(
+        cls,
+        item: Task[NoOpHandle] | NoOpHandle,
+    ) -> tuple[bool, NoOpHandle]:
+        handle = item.handle if isinstance(item, Task) else item
+        return False, handle
+
+    @classmethod
+    async def cancel(cls, item: Task[NoOpHandle]) -> Task[NoOpHandle]:
+        return item
+
+    @classmethod
+    def handle_klass(cls) -> type[NoOpHandle]:
+        return NoOpHandle
+
+
+def _step(name: str, depends_on: list[str] | None = None) -> Step:
+    return Step(
+        name=name,
+        application="sleep",
+        blueprint=BLUEPRINT_PATH,
+        depends_on=depends_on or [],
+    )
+
+
+def fanout_workplan(num_steps: int) -> Workplan:
+    """Create a workplan where a single root step fans out to all other steps."""
+    steps = [_step("s-0")]
+    steps.extend(_step(f"s-{i}", ["s-0"]) for i in range(1, num_steps))
+    return Workplan(name="fanout", description="wide fan-out", steps=steps)
+
+
+def chain_workplan(num_steps: int) -> Workplan:
+    """Create a workplan where every step depends on the previous step."""
+    steps = [_step("s-0")]
+    steps.extend(_step(f"s-{i}", [f"s-{i - 1}"]) for i in range(1, num_steps))
+    return Workplan(name="chain", description="long chain", steps=steps)
+
+
+def diamond_workplan(num_steps: int) -> Workplan:
+    """Create a workplan of repeated fan-out, fan-in diamonds."""
+    steps = [_step("b-0")]
+    for k in range(max(1, (num_steps - 1) // 3)):
+        top = f"b-{k}"
+        steps.append(_step(f"l-{k}", [top]))
+        steps.append(_step(f"r-{k}", [top]))
+        steps.append(_step(f"b-{k + 1}", [f"l-{k}", f"r-{k}"]))
+    return Workplan(name="diamond", description="chained diamonds", steps=steps)
+
+
+SHAPES: t.Final[dict[str, Callable[[int], Workplan]]] = {
+    "fanout": fanout_workplan,
+    "chain": chain_workplan,
+    "diamond": diamond_workplan,
+}
+"""Mapping of workplan shape names to their generator function."""
+
+
+async def run_benchmark(workplan: Workplan, mode: RunMode) -> dict[str, float]:
+    """Process a workplan to completion and record the latency of each tick.
+
+    Parameters
+    ----------
+    workplan : Workplan
+        The workplan to process.
+    mode : RunMode
+        The run mode used by the orchestrator.
+
+    Returns
+    -------
+    dict[str, float]
+        Summary statistics for the run.
+    """
+    t0 = time.perf_counter()
+    planner = Planner(workplan=workplan)
+    orchestrator = Orchestrator(planner, NoOpLauncher())
+    plan_duration = time.perf_counter() - t0
+
+    latencies: list[float] = []
+    open_set = orchestrator.get_open_nodes(mode=mode)
+
+    while open_set is not None:
+        t0 = time.perf_counter()
+        await orchestrator.run(mode=mode)
+        open_set = orchestrator.get_open_nodes(mode=mode)
+        latencies.append(time.perf_counter() - t0)
+
+    latencies.sort()
+    return {
+        "steps": len(workplan.steps),
+        "plan_s": plan_duration,
+        "ticks": len(latencies),
+        "total_s": sum(latencies),
+        "mean_ms": 1000 * statistics.fmean(latencies),
+        "p95_ms": 1000 * latencies[int(0.95 * (len(latencies) - 1))],
+        "max_ms": 1000 * latencies[-1],
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,5000,10000,50000")
+    parser.add_argument("--shapes", default=",".join(SHAPES))
+    parser.add_argument(
+        "--mode",
+        default=RunMode.Schedule.value,
+        choices=[m.value for m in RunMode],
+    )
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",")]
+    shapes = [x.strip() for x in args.shapes.split(",")]
+    mode = RunMode(args.mode)
+
+    header = f"{'shape':<8} {'steps':>7} {'plan_s':>8} {'ticks':>7} {'total_s':>9} {'mean_ms':>9} {'p95_ms':>9} {'max_ms':>9}"
+    print(header)
+
+    for shape in shapes:
+        for size in sizes:
+            result = asyncio.run(run_benchmark(SHAPES[shape](size), mode))
+            print(
+                f"{shape:<8} {result['steps']:>7.0f} {result['plan_s']:>8.2f} "
+                f"{result['ticks']:>7.0f} {result['total_s']:>9.2f} "
+                f"{result['mean_ms']:>9.3f} {result['p95_ms']:>9.3f} "
+                f"{result['max_ms']:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
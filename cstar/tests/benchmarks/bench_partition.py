@@ -0,0 +1,172 @@
+"""Compare serial and process-pool partitioning of ROMS input datasets.
+
+A synthetic grid and a set of synthetic surface forcing files are written with
+`xarray` and partitioned by `ROMSInputDataset.partition`, first in the current
+process and then on process pools of increasing size, as `ROMSSimulation.pre_run`
+does when `CSTAR_NPROCS_PRE` is set to a value greater than 1.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_partition --files 16 --nx 512 --ny 256
+"""
+
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
+import xarray as xr
+
+from cstar.io.source_data import SourceData
+from cstar.io.staged_data import StagedDataCollection, StagedFile
+from cstar.roms.input_dataset import (
+    ROMSInputDataset,
+    ROMSModelGrid,
+    ROMSSurfaceForcing,
+)
+
+
+def create_dataset(path: Path, nx: int, ny: int, nt: int) -> Path:
+    """Write a synthetic netCDF file on a ROMS rho/u/v grid.
+
+    Parameters
+    ----------
+    path : Path
+        The path of the file to write.
+    nx : int
+        The number of interior points in the x direction.
+    ny : int
+        The number of interior points in the y direction.
+    nt : int
+        The number of time records. A file without time records is a grid.
+
+    Returns
+    -------
+    Path
+        The path of the written file.
+    """
+    rng = np.random.default_rng(0)
+    shape = (ny + 2, nx + 2)
+    dims = ("eta_rho", "xi_rho")
+
+    data_vars: dict[str, tuple[tuple[str, ...], np.ndarray]] = {
+        "h": (dims, rng.random(shape)),
+        "mask_u": (("eta_rho", "xi_u"), np.ones((ny + 2, nx + 1))),
+        "mask_v": (("eta_v", "xi_rho"), np.ones((ny + 1, nx + 2))),
+    }
+    if nt:
+        data_vars = {
+            name: (("time", *dims), rng.random((nt, *shape)).astype("float32"))
+            for name in ("swrad", "lwrad", "Tair", "qair", "rain")
+        }
+    xr.Dataset(data_vars).to_netcdf(path)
+    return path
+
+
+def make_dataset(cls: type[ROMSInputDataset], files: list[Path]) -> ROMSInputDataset:
+    """Create an input dataset whose working copy is a set of local files.
+
+    Parameters
+    ----------
+    cls : type[ROMSInputDataset]
+        The type of dataset to create.
+    files : list[Path]
+        The locally staged files of the dataset.
+
+    Returns
+    -------
+    ROMSInputDataset
+    """
+    dataset = cls(location=str(files[0]))
+    dataset._working_copy = StagedDataCollection(
+        StagedFile(SourceData(location=str(f)), f) for f in files
+    )
+    return dataset
+
+
+def run_benchmark(
+    num_files: int,
+    nx: int,
+    ny: int,
+    nt: int,
+    np_xi: int,
+    np_eta: int,
+    workers: list[int],
+) -> None:
+    """Partition a synthetic grid and forcing and print the elapsed time.
+
+    Parameters
+    ----------
+    num_files : int
+        The number of surface forcing files.
+    nx, ny : int
+        The number of interior points of the grid in each direction.
+    nt : int
+        The number of time records in each forcing file.
+    np_xi, np_eta : int
+        The decomposition to partition into.
+    workers : list[int]
+        The values of `CSTAR_NPROCS_PRE` to benchmark.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        grid = create_dataset(root / "grid.nc", nx, ny, 0)
+        forcing = [
+            create_dataset(root / f"surface_{i:03d}.nc", nx, ny, nt)
+            for i in range(num_files)
+        ]
+
+        print(f"{'workers':>8} {'elapsed_s':>10} {'speedup':>8}")
+        baseline = 0.0
+        for n in workers:
+            datasets = [
+                make_dataset(ROMSModelGrid, [grid]),
+                make_dataset(ROMSSurfaceForcing, forcing),
+            ]
+            t0 = time.perf_counter()
+            if n > 1:
+                with ProcessPoolExecutor(
+                    max_workers=n, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    for d in datasets:
+                        d.partition(np_xi=np_xi, np_eta=np_eta, executor=executor)
+            else:
+                for d in datasets:
+                    d.partition(np_xi=np_xi, np_eta=np_eta)
+            elapsed = time.perf_counter() - t0
+
+            num_partitions = sum(len(d.partitioning or []) for d in datasets)
+            assert num_partitions == (num_files + 1) * np_xi * np_eta
+
+            baseline = baseline or elapsed
+            print(f"{n:>8} {elapsed:>10.3f} {baseline / elapsed:>7.1f}x")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=16)
+    parser.add_argument("--nx", type=int, default=512)
+    parser.add_argument("--ny", type=int, default=256)
+    parser.add_argument("--nt", type=int, default=8)
+    parser.add_argument("--np-xi", type=int, default=8)
+    parser.add_argument("--np-eta", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    run_benchmark(
+        args.files,
+        args.nx,
+        args.ny,
+        args.nt,
+        args.np_xi,
+        args.np_eta,
+        args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
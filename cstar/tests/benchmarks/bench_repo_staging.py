@@ -0,0 +1,175 @@
+"""Compare staging a repository by copying a cached clone and by mirror clones.
+
+A synthetic local repository stands in for a remote codebase. It is staged into
+many targets, first as the cached stager used to: `git pull` the cached clone
+and `cp -a` it (including `.git`) into each target. It is then staged with the
+`CachedRemoteRepositoryStager`, which clones each target from a bare mirror
+with `git clone --local`.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_repo_staging --targets 50 --files 2000
+"""
+
+import argparse
+import os
+import subprocess
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.env import ENV_CSTAR_CACHE_HOME
+from cstar.io.constants import SourceClassification
+from cstar.io.source_data import SourceData
+
+
+def _git(*args: str, cwd: Path | None = None) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=C-Star", "-c", "user.email=cstar@example.com"]
+        + list(args),
+        cwd=cwd,
+        capture_output=True,
+        check=True,
+    )
+
+
+def create_repository(root: Path, num_files: int, file_size: int) -> str:
+    """Create a bare repository with a single commit of random files.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which to create the repository.
+    num_files : int
+        The number of files in the repository.
+    file_size : int
+        The size (in bytes) of every file.
+
+    Returns
+    -------
+    str
+        The URL of the repository.
+    """
+    bare_dir, work_dir = root / "remote.git", root / "work"
+    _git("init", "-q", "--bare", "--initial-branch=main", str(bare_dir))
+    _git("clone", "-q", str(bare_dir), str(work_dir))
+
+    for i in range(num_files):
+        path = work_dir / f"src/module_{i // 100:03d}/file_{i:05d}.F90"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(file_size))
+
+    _git("add", ".", cwd=work_dir)
+    _git("commit", "-q", "-m", "initial", cwd=work_dir)
+    _git("push", "-q", "origin", "HEAD:main", cwd=work_dir)
+    return bare_dir.as_uri()
+
+
+def disk_usage(path: Path) -> int:
+    """Return the bytes allocated to the files under a directory.
+
+    Parameters
+    ----------
+    path : Path
+        The directory to measure.
+
+    Returns
+    -------
+    int
+    """
+    seen: set[tuple[int, int]] = set()
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            st = os.lstat(Path(dirpath) / name)
+            if (st.st_dev, st.st_ino) not in seen:
+                seen.add((st.st_dev, st.st_ino))
+                total += st.st_blocks * 512
+    return total
+
+
+def stage_by_copy(url: str, cache_dir: Path, targets: list[Path]) -> None:
+    """Stage a repository by copying a cached clone into every target.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the repository.
+    cache_dir : Path
+        The path of the cached clone.
+    targets : list[Path]
+        The directories in which to stage the repository.
+    """
+    for target in targets:
+        if not cache_dir.exists():
+            _git("clone", "-q", url, str(cache_dir))
+        else:
+            _git("-C", str(cache_dir), "pull", "-q")
+        subprocess.run(["cp", "-a", f"{cache_dir}/", str(target)], check=True)
+        _git("-C", str(target), "checkout", "-q", "main")
+
+
+def stage_by_mirror(url: str, targets: list[Path]) -> None:
+    """Stage a repository with the cached repository stager.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the repository.
+    targets : list[Path]
+        The directories in which to stage the repository.
+    """
+    for target in targets:
+        source = SourceData(url, identifier="main")
+        source._classification = SourceClassification.REMOTE_REPOSITORY
+        source.stage(target)
+
+
+def run_benchmark(num_targets: int, num_files: int, file_size: int) -> None:
+    """Stage a repository into many targets and print the cost of each strategy.
+
+    Parameters
+    ----------
+    num_targets : int
+        The number of targets.
+    num_files : int
+        The number of files in the repository.
+    file_size : int
+        The size (in bytes) of every file.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        url = create_repository(root / "repo", num_files, file_size)
+
+        print(f"{'strategy':>8} {'elapsed_s':>10} {'targets_MB':>11} {'cache_MB':>9}")
+        for strategy in ("copy", "mirror"):
+            cache_home = root / strategy / "cache"
+            targets = [root / strategy / f"target-{i:03d}" for i in range(num_targets)]
+
+            with mock.patch.dict(os.environ, {ENV_CSTAR_CACHE_HOME: str(cache_home)}):
+                t0 = time.perf_counter()
+                if strategy == "copy":
+                    stage_by_copy(url, cache_home / "repo", targets)
+                else:
+                    stage_by_mirror(url, targets)
+                elapsed = time.perf_counter() - t0
+
+            target_mb = sum(disk_usage(t) for t in targets) / 1024 / 1024
+            cache_mb = disk_usage(cache_home) / 1024 / 1024
+            print(f"{strategy:>8} {elapsed:>10.3f} {target_mb:>11.1f} {cache_mb:>9.1f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", type=int, default=50)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=16 * 1024)
+    args = parser.parse_args()
+
+    run_benchmark(args.targets, args.files, args.size)
+
+
+if __name__ == "__main__":
+    main()
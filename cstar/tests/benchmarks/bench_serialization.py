@@ -0,0 +1,151 @@
+"""Compare the cost of writing and reading orchestration files in each format.
+
+Representative documents (a workplan, the ROMS-MARBL blueprint template and a
+`WorkplanRun` record) are dumped and loaded repeatedly with the pure-Python YAML
+dumper and loader, with their LibYAML counterparts (used by `serialize` and
+`deserialize` when available) and as compact JSON (available for internal state
+files via `CSTAR_ORCH_STATE_FORMAT=json`).
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_serialization --repeat 20
+"""
+
+import argparse
+import json
+import time
+import typing as t
+from collections.abc import Callable
+from pathlib import Path
+
+import yaml
+from pydantic_core import from_json
+
+from cstar.base.utils import additional_files_dir
+from cstar.orchestration.tracking import WorkplanRun
+from cstar.tests.benchmarks.bench_orchestrator import chain_workplan
+
+Codec = tuple[Callable[[t.Any], str], Callable[[str], t.Any]]
+"""A function dumping a document to text and a function loading it back."""
+
+
+class _PyDumper(yaml.Dumper):
+    """The pure-Python dumper, configured like the dumper used by `serialize`."""
+
+    def ignore_aliases(self, data: t.Any) -> bool:  # noqa: ARG002, ANN401
+        return True
+
+
+class _CDumper(yaml.CDumper):
+    """The LibYAML dumper, configured like the dumper used by `serialize`."""
+
+    def ignore_aliases(self, data: t.Any) -> bool:  # noqa: ARG002, ANN401
+        return True
+
+
+CODECS: dict[str, Codec] = {
+    "yaml-py": (
+        lambda d: yaml.dump(d, Dumper=_PyDumper, sort_keys=False),
+        lambda s: yaml.load(s, Loader=yaml.SafeLoader),  # noqa: S506
+    ),
+    "yaml-c": (
+        lambda d: yaml.dump(d, Dumper=_CDumper, sort_keys=False),
+        lambda s: yaml.load(s, Loader=yaml.CSafeLoader),  # noqa: S506
+    ),
+    "json": (
+        lambda d: json.dumps(d, separators=(",", ":")),
+        from_json,
+    ),
+}
+"""The codecs to compare, by name."""
+
+
+def documents(num_steps: int) -> dict[str, dict[str, t.Any]]:
+    """Create the documents to serialize.
+
+    Parameters
+    ----------
+    num_steps : int
+        The number of steps in the workplan.
+
+    Returns
+    -------
+    dict[str, dict[str, t.Any]]
+        JSON-compatible documents, by name.
+    """
+    bp_path = additional_files_dir() / "templates/bp/roms_marbl/blueprint.2.1.0.yaml"
+    with bp_path.open(encoding="utf-8") as fp:
+        # represent dates as strings, as in the JSON representation of a blueprint
+        blueprint = json.loads(json.dumps(yaml.safe_load(fp), default=str))
+
+    workplan = chain_workplan(num_steps)
+    run = WorkplanRun(
+        workplan_path=Path("/runs/workplan.yaml"),
+        trx_workplan_path=Path("/runs/bench/workplan_transformed.yaml"),
+        output_path=Path("/runs/bench"),
+        run_id="bench",
+        environment={f"VAR_{i}": f"value-{i}" for i in range(50)},
+    )
+
+    return {
+        f"workplan-{num_steps}": workplan.model_dump(mode="json", by_alias=True),
+        "blueprint": blueprint,
+        "workplan-run": run.model_dump(mode="json"),
+    }
+
+
+def measure(
+    document: dict[str, t.Any],
+    codec: Codec,
+    repeat: int,
+) -> tuple[float, float, int]:
+    """Time dumping and loading a document.
+
+    Parameters
+    ----------
+    document : dict[str, t.Any]
+        The document to serialize.
+    codec : Codec
+        The dump and load functions.
+    repeat : int
+        The number of times the document is dumped and loaded.
+
+    Returns
+    -------
+    tuple[float, float, int]
+        The mean time (in seconds) to dump and to load the document, and the
+        size of the serialized document (in bytes).
+    """
+    dump, load = codec
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        content = dump(document)
+    t1 = time.perf_counter()
+    for _ in range(repeat):
+        loaded = load(content)
+    t2 = time.perf_counter()
+
+    assert loaded == document
+    return (t1 - t0) / repeat, (t2 - t1) / repeat, len(content.encode())
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'document':>14} {'codec':>8} {'dump_ms':>8} {'load_ms':>8} {'bytes':>8}")
+    for doc_name, document in documents(args.steps).items():
+        for codec_name, codec in CODECS.items():
+            dump_s, load_s, nbytes = measure(document, codec, args.repeat)
+            print(
+                f"{doc_name:>14} {codec_name:>8} {1000 * dump_s:>8.2f} "
+                f"{1000 * load_s:>8.2f} {nbytes:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
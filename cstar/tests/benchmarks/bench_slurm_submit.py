@@ -0,0 +1,249 @@
+"""Compare serial and concurrent submission of a frontier of SLURM jobs.
+
+Fake `sbatch` and `sacct` executables are placed on the PATH. `sbatch` takes a
+fixed time to respond, and `sacct` only reports a job once a configurable
+accounting lag has elapsed since its submission, mimicking the delay between
+`slurmctld` accepting a job and `slurmdbd` recording it.
+
+Two strategies are measured:
+
+- `serial`: submit one job at a time, sleeping a fixed delay after each
+  submission so that `sacct` can locate the job (the former launcher behavior).
+- `concurrent`: submit jobs on the bounded submission executor used by
+  `SlurmLauncher`, relying on the status service to report each job as pending
+  until it becomes visible.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_slurm_submit --jobs 300 --lag 2.0
+"""
+
+import argparse
+import asyncio
+import os
+import textwrap
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from cstar.base.env import ENV_CSTAR_SLURM_SUBMIT_CONCURRENCY
+from cstar.execution.handler import ExecutionStatus
+from cstar.execution.scheduler_job import SlurmJob, SlurmStatusService
+from cstar.orchestration.launch.slurm import get_submission_executor
+from cstar.system.scheduler import SlurmQOS, SlurmScheduler
+
+FAKE_SBATCH: str = textwrap.dedent("""\
+    #!/bin/bash
+    sleep "$FAKE_SBATCH_LATENCY"
+
+    exec 9>"$FAKE_SLURM_DIR/id.lock"
+    flock 9
+    job_id=$(( $(cat "$FAKE_SLURM_DIR/next_id" 2>/dev/null || echo 1000) + 1 ))
+    echo "$job_id" > "$FAKE_SLURM_DIR/next_id"
+    date +%s.%N > "$FAKE_SLURM_DIR/submitted.$job_id"
+
+    echo "Submitted batch job $job_id"
+    """)
+"""A stand-in for `sbatch` that allocates sequential job IDs after a fixed latency."""
+
+FAKE_SACCT: str = textwrap.dedent("""\
+    #!/bin/bash
+    echo "$@" >> "$FAKE_SLURM_DIR/sacct.log"
+    now=$(date +%s.%N)
+
+    IFS=',' read -ra job_ids <<< "$2"
+    for job_id in "${job_ids[@]}"; do
+        stamp="$FAKE_SLURM_DIR/submitted.$job_id"
+        [ -f "$stamp" ] || continue
+        # the job is visible once the accounting lag has elapsed
+        if awk -v now="$now" -v t="$(cat "$stamp")" -v lag="$FAKE_SACCT_LAG" \\
+                'BEGIN { exit !(now - t >= lag) }'; then
+            printf "%s cstar_job 2026-03-06T15:03:24 Unknown Unknown PENDING\\n" \\
+                "$job_id"
+        fi
+    done
+    """)
+"""A stand-in for `sacct` that hides each job until the accounting lag has elapsed."""
+
+
+def install_fakes(root: Path, sbatch_latency: float, lag: float) -> None:
+    """Place the fake executables on the PATH and configure them.
+
+    Parameters
+    ----------
+    root : Path
+        The directory holding the executables and their state.
+    sbatch_latency : float
+        The time (in seconds) taken by each `sbatch` call.
+    lag : float
+        The time (in seconds) before a submitted job is visible to `sacct`.
+    """
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    for name, script in (("sbatch", FAKE_SBATCH), ("sacct", FAKE_SACCT)):
+        path = bin_dir / name
+        path.write_text(script)
+        path.chmod(0o755)
+
+    os.environ.update(
+        {
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "FAKE_SLURM_DIR": root.as_posix(),
+            "FAKE_SBATCH_LATENCY": str(sbatch_latency),
+            "FAKE_SACCT_LAG": str(lag),
+        }
+    )
+
+
+def create_jobs(root: Path, num_jobs: int, depends_on: list[str]) -> list[SlurmJob]:
+    """Create a frontier of jobs sharing the same dependencies.
+
+    Parameters
+    ----------
+    root : Path
+        The directory in which job scripts and outputs are written.
+    num_jobs : int
+        The number of jobs to create.
+    depends_on : list[str]
+        The job IDs every job depends on.
+
+    Returns
+    -------
+    list[SlurmJob]
+    """
+    queue = SlurmQOS(name="bench", max_walltime_method=lambda _: "02:00:00")
+    scheduler = SlurmScheduler(
+        queues=[queue], primary_queue_name="bench", requires_task_distribution=False
+    )
+    return [
+        SlurmJob(
+            scheduler=scheduler,
+            commands="true",
+            account_key="bench",
+            cpus=1,
+            walltime="00:10:00",
+            job_name=f"step-{i}",
+            script_path=root / f"step-{i}.sh",
+            run_path=root,
+            output_file=root / f"step-{i}.out",
+            queue_name="bench",
+            depends_on=depends_on,
+        )
+        for i in range(num_jobs)
+    ]
+
+
+def submit_serially(
+    jobs: list[SlurmJob], service: SlurmStatusService, delay: float
+) -> list[ExecutionStatus]:
+    """Submit jobs one at a time, sleeping after each submission.
+
+    Returns
+    -------
+    list[ExecutionStatus]
+        The status reported for each job immediately after its submission.
+    """
+    statuses = []
+    for job in jobs:
+        job_id = job.submit()
+        assert job_id is not None
+        time.sleep(delay)
+        service.invalidate([job_id])
+        statuses.append(service.get_batch_sync(job_id).status)
+    return statuses
+
+
+async def submit_concurrently(
+    jobs: list[SlurmJob], service: SlurmStatusService
+) -> list[ExecutionStatus]:
+    """Submit jobs on the bounded submission executor.
+
+    Returns
+    -------
+    list[ExecutionStatus]
+        The status reported for each job immediately after its submission.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def submit(job: SlurmJob) -> ExecutionStatus:
+        job_id = await loop.run_in_executor(get_submission_executor(), job.submit)
+        assert job_id is not None
+        # `SlurmJob.submit` registers the job with the process-wide service only
+        service.register_submission([job_id])
+        return (await service.get_batch(job_id)).status
+
+    return await asyncio.gather(*map(submit, jobs))
+
+
+def run_benchmark(
+    num_jobs: int, sbatch_latency: float, lag: float, delay: float, concurrency: int
+) -> None:
+    """Submit a frontier of jobs with each strategy and print a comparison.
+
+    Parameters
+    ----------
+    num_jobs : int
+        The number of jobs in the frontier.
+    sbatch_latency : float
+        The time (in seconds) taken by each `sbatch` call.
+    lag : float
+        The time (in seconds) before a submitted job is visible to `sacct`.
+    delay : float
+        The fixed post-submission delay used by the serial strategy.
+    concurrency : int
+        The maximum number of concurrent submissions.
+    """
+    os.environ[ENV_CSTAR_SLURM_SUBMIT_CONCURRENCY] = str(concurrency)
+
+    with TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        install_fakes(root, sbatch_latency, lag)
+        sacct_log = root / "sacct.log"
+
+        # every job in the frontier depends on a single, already submitted root
+        (root_job,) = create_jobs(root / "root", 1, [])
+        root_job.submit()
+        depends_on = [str(root_job.id)]
+
+        print(
+            f"submitting {num_jobs} jobs: sbatch latency {sbatch_latency}s, "
+            f"sacct lag {lag}s, post-submit delay {delay}s, concurrency {concurrency}"
+        )
+        print(f"{'strategy':>10} {'elapsed_s':>10} {'sacct':>6} {'unsubmitted':>12}")
+
+        for strategy in ("serial", "concurrent"):
+            jobs = create_jobs(root / strategy, num_jobs, depends_on)
+            service = SlurmStatusService(ttl=5.0, visibility_timeout=60.0)
+            sacct_log.unlink(missing_ok=True)
+
+            t0 = time.perf_counter()
+            if strategy == "serial":
+                statuses = submit_serially(jobs, service, delay)
+            else:
+                statuses = asyncio.run(submit_concurrently(jobs, service))
+            elapsed = time.perf_counter() - t0
+
+            num_sacct = (
+                len(sacct_log.read_text().splitlines()) if sacct_log.exists() else 0
+            )
+            unsubmitted = statuses.count(ExecutionStatus.UNSUBMITTED)
+            print(f"{strategy:>10} {elapsed:>10.2f} {num_sacct:>6} {unsubmitted:>12}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=300)
+    parser.add_argument("--sbatch-latency", type=float, default=0.2)
+    parser.add_argument("--lag", type=float, default=2.0)
+    parser.add_argument("--delay", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    run_benchmark(
+        args.jobs, args.sbatch_latency, args.lag, args.delay, args.concurrency
+    )
+
+
+if __name__ == "__main__":
+    main()
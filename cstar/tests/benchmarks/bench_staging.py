@@ -0,0 +1,140 @@
+"""Compare serial and concurrent staging of remote files.
+
+A local `http.server` serves synthetic binary files after an artificial delay
+that simulates the latency of a remote data host. A `SourceDataCollection` of
+those files is staged with increasing values of `CSTAR_STAGING_WORKERS`.
+
+Usage::
+
+    python -m cstar.tests.benchmarks.bench_staging --files 32 --latency 0.2
+"""
+
+import argparse
+import os
+import threading
+import time
+import typing as t
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from cstar.base.env import ENV_CSTAR_STAGING_HOST_WORKERS, ENV_CSTAR_STAGING_WORKERS
+from cstar.io.source_data import SourceDataCollection
+
+
+class _LatencyHandler(BaseHTTPRequestHandler):
+    """Serve a fixed binary payload after a configurable delay."""
+
+    latency: t.ClassVar[float] = 0.0
+    payload: t.ClassVar[bytes] = b""
+
+    def _send_headers(self) -> None:
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._send_headers()
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._send_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        """Silence the per-request log output."""
+
+
+@contextmanager
+def serve(latency: float, size: int) -> Iterator[str]:
+    """Run a local HTTP server in a background thread.
+
+    Parameters
+    ----------
+    latency : float
+        The delay (in seconds) applied to every request.
+    size : int
+        The size (in bytes) of every served file.
+
+    Returns
+    -------
+    Iterator[str]
+        The base URL of the server.
+    """
+    _LatencyHandler.latency = latency
+    _LatencyHandler.payload = b"\x00\xff" * (size // 2)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _LatencyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_benchmark(
+    num_files: int,
+    latency: float,
+    size: int,
+    workers: list[int],
+    host_workers: int,
+) -> None:
+    """Stage a collection of remote files and print the elapsed time.
+
+    Parameters
+    ----------
+    num_files : int
+        The number of files in the collection.
+    latency : float
+        The delay (in seconds) applied to every request.
+    size : int
+        The size (in bytes) of every file.
+    workers : list[int]
+        The values of `CSTAR_STAGING_WORKERS` to benchmark.
+    host_workers : int
+        The value of `CSTAR_STAGING_HOST_WORKERS`.
+    """
+    with serve(latency, size) as url:
+        collection = SourceDataCollection.from_locations(
+            [f"{url}/forcing_{i:03d}.nc" for i in range(num_files)]
+        )
+
+        print(f"{'workers':>8} {'elapsed_s':>10} {'speedup':>8}")
+        baseline = 0.0
+        for n in workers:
+            env = {
+                ENV_CSTAR_STAGING_WORKERS: str(n),
+                ENV_CSTAR_STAGING_HOST_WORKERS: str(host_workers),
+            }
+            with TemporaryDirectory() as tmp_dir, mock.patch.dict(os.environ, env):
+                t0 = time.perf_counter()
+                staged = collection.stage(Path(tmp_dir))
+                elapsed = time.perf_counter() - t0
+
+                assert len(staged) == num_files
+
+            baseline = baseline or elapsed
+            print(f"{n:>8} {elapsed:>10.3f} {baseline / elapsed:>7.1f}x")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--size", type=int, default=1024 * 1024)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--host-workers", type=int, default=16)
+    args = parser.parse_args()
+
+    run_benchmark(args.files, args.latency, args.size, args.workers, args.host_workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.build_tools import build_jobs, compiler_launcher
+from cstar.marbl.external_codebase import MARBLExternalCodeBase
+from cstar.pio.external_codebase import PIOExternalCodeBase
+from cstar.tests.unit_tests.helpers import FakeBuildTools
+
+
+class TestBuildJobs:
+    def test_build_jobs_default(self) -> None:
+        """Verify that builds use every processor available by default."""
+        with mock.patch.dict(os.environ):
+            os.environ.pop("CSTAR_BUILD_JOBS", None)
+            assert build_jobs() == len(os.sched_getaffinity(0))
+
+    def test_build_jobs_from_env(self) -> None:
+        """Verify that the number of build jobs can be set in the environment."""
+        with mock.patch.dict(os.environ, {"CSTAR_BUILD_JOBS": "7"}):
+            assert build_jobs() == 7
+
+    @pytest.mark.parametrize("value", ["0", "-2", "many"])
+    def test_build_jobs_invalid(self, value: str) -> None:
+        """Verify that an invalid number of build jobs raises."""
+        with (
+            mock.patch.dict(os.environ, {"CSTAR_BUILD_JOBS": value}),
+            pytest.raises(ValueError, match="CSTAR_BUILD_JOBS"),
+        ):
+            build_jobs()
+
+
+class TestCompilerLauncher:
+    def test_compiler_launcher_detects_ccache(
+        self, fake_build_tools: FakeBuildTools
+    ) -> None:
+        """Verify that ccache is used when it is found on the PATH."""
+        assert compiler_launcher() == str(fake_build_tools.bin_dir / "ccache")
+
+    def test_compiler_launcher_disabled(self, fake_build_tools: FakeBuildTools) -> None:
+        """Verify that ccache is not used when disabled."""
+        with mock.patch.dict(os.environ, {"CSTAR_BUILD_CCACHE": "0"}):
+            assert compiler_launcher() is None
+
+    def test_compiler_launcher_not_found(self, tmp_path: Path) -> None:
+        """Verify that no launcher is used when ccache is not installed."""
+        with mock.patch.dict(os.environ, {"PATH": str(tmp_path)}):
+            assert compiler_launcher() is None
+
+
+class TestBuildInvocations:
+    def test_make_receives_jobs(
+        self,
+        marblexternalcodebase_staged: MARBLExternalCodeBase,
+        marbl_path: Path,
+        fake_build_tools: FakeBuildTools,
+    ) -> None:
+        """Verify that `make` is run with the configured number of jobs."""
+        (marbl_path / "src").mkdir(parents=True)
+
+        with mock.patch.dict(os.environ, {"CSTAR_BUILD_JOBS": "6"}):
+            marblexternalcodebase_staged._configure()
+
+        (make_call,) = fake_build_tools.calls
+        assert make_call.split()[:2] == ["make", "-j6"]
+
+    def test_cmake_receives_jobs_and_launcher(
+        self,
+        pioexternalcodebase_staged: PIOExternalCodeBase,
+        pio_path: Path,
+        fake_build_tools: FakeBuildTools,
+    ) -> None:
+        """Verify that CMake builds with the configured number of jobs and launches
+        the C compiler through ccache.
+        """
+        pio_path.mkdir(parents=True)
+
+        with mock.patch.dict(os.environ, {"CSTAR_BUILD_JOBS": "6"}):
+            pioexternalcodebase_staged._configure()
+
+        configure_call, build_call = fake_build_tools.calls
+        launcher = fake_build_tools.bin_dir / "ccache"
+        assert f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}" in configure_call.split()
+        assert build_call == "cmake --build build --parallel 6"
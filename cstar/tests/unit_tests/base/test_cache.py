@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from cstar.base.cache import DirectoryCache, exclusive_lock
+
+
+def test_exclusive_lock_non_blocking(tmp_path: Path) -> None:
+    """Verify a non-blocking lock is not acquired while the lock is held."""
+    lock_path = tmp_path / "locks" / "key.lock"
+
+    with exclusive_lock(lock_path) as held:
+        assert held
+        with exclusive_lock(lock_path, blocking=False) as other:
+            assert not other
+
+    with exclusive_lock(lock_path, blocking=False) as held:
+        assert held
+
+
+def test_directory_cache_publish(tmp_path: Path) -> None:
+    """Verify a staged entry replaces the published entry of the same key."""
+    cache = DirectoryCache(tmp_path / "cache", max_bytes=10_000)
+
+    for content in ("first", "second"):
+        staging = cache._stage("key")
+        (staging / "data").write_text(content)
+        cache._publish("key", staging)
+
+    assert (cache.root / "key" / "data").read_text() == "second"
+    assert [p.name for p in cache.root.iterdir() if p.is_dir()] == ["key"]
+
+
+def test_directory_cache_skips_locked_entries(tmp_path: Path) -> None:
+    """Verify entries locked by another process are not evicted."""
+    cache = DirectoryCache(tmp_path / "cache", max_bytes=10_000)
+
+    for key in ("a", "b"):
+        staging = cache._stage(key)
+        (staging / "data").write_text(key * 10)
+        cache._publish(key, staging)
+
+    cache.max_bytes = 1
+    with cache.lock("a"):
+        assert cache.evict() == ["b"]
+
+    assert (cache.root / "a").exists()
+    assert not (cache.root / "b").exists()
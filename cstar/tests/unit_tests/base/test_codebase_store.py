@@ -0,0 +1,174 @@
+import os
+import stat
+import threading
+from collections.abc import Callable, Generator
+from unittest import mock
+
+import pytest
+
+from cstar.base.codebase_store import get_codebase_store
+from cstar.base.external_codebase import ExternalCodeBase
+from cstar.io.constants import SourceClassification
+from cstar.marbl.external_codebase import MARBLExternalCodeBase
+from cstar.pio.external_codebase import PIOExternalCodeBase
+from cstar.system.manager import get_sysmgr
+from cstar.tests.unit_tests.helpers import FakeBuildTools, LocalGitRemote
+
+
+@pytest.fixture
+def codebase_factory(
+    local_git_remote: LocalGitRemote,
+    fake_build_tools: FakeBuildTools,
+) -> Generator[Callable[..., ExternalCodeBase], None, None]:
+    """Fixture returning a factory for codebases of the local git remote."""
+    # MARBL is compiled in the `src` directory of the repository
+    (local_git_remote.work_dir / "src").mkdir()
+    (local_git_remote.work_dir / "src" / "Makefile").touch()
+    local_git_remote.git("add", "src")
+    local_git_remote.commit("third")
+
+    with (
+        mock.patch.dict(os.environ),
+        mock.patch(
+            "cstar.io.source_data.classify_location",
+            return_value=SourceClassification.REMOTE_REPOSITORY,
+        ),
+    ):
+
+        def _create(
+            cls: type[ExternalCodeBase] = MARBLExternalCodeBase,
+            checkout_target: str = "main",
+        ) -> ExternalCodeBase:
+            return cls(
+                source_repo=local_git_remote.url, checkout_target=checkout_target
+            )
+
+        yield _create
+
+
+@pytest.mark.parametrize(
+    "codebase_cls, tool_calls",
+    [(MARBLExternalCodeBase, ["make"]), (PIOExternalCodeBase, ["cmake", "cmake"])],
+)
+def test_install_builds_once_across_concurrent_steps(
+    codebase_factory: Callable[..., ExternalCodeBase],
+    fake_build_tools: FakeBuildTools,
+    codebase_cls: type[ExternalCodeBase],
+    tool_calls: list[str],
+) -> None:
+    """Verify that concurrent steps installing the same codebase build it once and
+    share the install.
+    """
+    codebases = [codebase_factory(codebase_cls) for _ in range(8)]
+    threads = [threading.Thread(target=cb.install) for cb in codebases]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [call.split()[0] for call in fake_build_tools.calls] == tool_calls
+
+    roots = {cb.working_copy.path for cb in codebases if cb.working_copy}
+    assert len(roots) == 1
+    root = roots.pop()
+    assert root.parent.parent == get_codebase_store().root
+    assert os.environ[codebases[0].root_env_var] == str(root)
+    assert (root / "README.md").read_text() == "third"
+
+
+def test_install_is_read_only(
+    codebase_factory: Callable[..., ExternalCodeBase],
+) -> None:
+    """Verify that the files of an install cannot be modified."""
+    codebase = codebase_factory()
+    codebase.install()
+
+    assert codebase.working_copy is not None
+    readme = codebase.working_copy.path / "README.md"
+    assert not readme.stat().st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def test_install_keys(
+    codebase_factory: Callable[..., ExternalCodeBase],
+    fake_build_tools: FakeBuildTools,
+    local_git_remote: LocalGitRemote,
+) -> None:
+    """Verify that installs are shared by checkout targets of the same commit and
+    built separately for other commits and compilers.
+    """
+    head = local_git_remote.git("rev-parse", "main")
+    for checkout_target in ("main", head, "v1.0.0"):
+        codebase_factory(PIOExternalCodeBase, checkout_target).install()
+
+    # cmake is run to configure and to build each install
+    assert len(fake_build_tools.calls) == 4
+
+    with mock.patch.object(
+        type(get_sysmgr().environment),
+        "compiler",
+        new_callable=mock.PropertyMock,
+        return_value="not-the-compiler",
+    ):
+        codebase_factory(PIOExternalCodeBase).install()
+
+    assert len(fake_build_tools.calls) == 6
+
+
+def test_install_is_configured_from_manifest(
+    codebase_factory: Callable[..., ExternalCodeBase],
+) -> None:
+    """Verify that an installed codebase is recognized as configured from the store
+    manifest without querying git.
+    """
+    installed = codebase_factory()
+    installed.install()
+    assert installed.working_copy is not None
+
+    env_vars = {
+        **get_sysmgr().environment.environment_variables,
+        "MARBL_ROOT": str(installed.working_copy.path),
+    }
+    with (
+        mock.patch(
+            "cstar.system.environment.CStarEnvironment.environment_variables",
+            new_callable=mock.PropertyMock,
+            return_value=env_vars,
+        ) as mock_env_vars,
+        mock.patch(
+            "cstar.marbl.external_codebase._check_local_repo_changed_from_remote"
+        ) as mock_check,
+    ):
+        codebase = codebase_factory()
+        assert codebase.is_configured
+        assert codebase.working_copy is not None
+
+        # a different commit is not configured by the install
+        assert not codebase_factory(checkout_target="v1.0.0").is_configured
+
+        # nor is a different toolchain
+        mock_env_vars.return_value = {**env_vars, "MPIHOME": "/other/mpi"}
+        assert not codebase_factory().is_configured
+
+    mock_check.assert_not_called()
+
+
+def test_install_rebuilds_incomplete_install(
+    codebase_factory: Callable[..., ExternalCodeBase],
+    fake_build_tools: FakeBuildTools,
+) -> None:
+    """Verify that an install interrupted before completion is rebuilt."""
+    codebase = codebase_factory()
+    with (
+        mock.patch.object(MARBLExternalCodeBase, "_configure", side_effect=OSError),
+        pytest.raises(OSError),
+    ):
+        codebase.install()
+
+    assert codebase.working_copy is not None
+    store = get_codebase_store()
+    assert store.manifest_for(codebase.working_copy.path) is None
+
+    codebase_factory().install()
+
+    assert len(fake_build_tools.calls) == 1
+    assert store.manifest_for(codebase.working_copy.path) is not None
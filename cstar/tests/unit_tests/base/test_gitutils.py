@@ -1,15 +1,24 @@
+import os
+import time
 import warnings
+from collections.abc import Generator
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from cstar.base.env import ENV_CSTAR_GIT_REF_CACHE_PERSIST, FLAG_OFF
 from cstar.base.gitutils import (
     _clone_and_checkout,
+    _get_clean_head_hash,
     _get_hash_from_checkout_target,
+    _get_ref_cache,
     _get_repo_head_hash,
     _get_repo_remote,
     git_location_to_raw,
 )
+from cstar.base.utils import _run_cmd
+from cstar.tests.unit_tests.helpers import LocalGitRemote
 
 
 def test_get_repo_remote():
@@ -68,6 +77,18 @@ def test_get_repo_head_hash():
         )
 
 
+def test_get_clean_head_hash(local_git_remote: LocalGitRemote, tmp_path: Path):
+    """Verify the commit of HEAD is only returned for an unmodified repository."""
+    work_dir = local_git_remote.work_dir
+    head = local_git_remote.git("rev-parse", "HEAD")
+
+    assert _get_clean_head_hash(work_dir) == head
+    assert _get_clean_head_hash(tmp_path) is None
+
+    (work_dir / "README.md").write_text("modified")
+    assert _get_clean_head_hash(work_dir) is None
+
+
 @pytest.mark.parametrize(
     "repo_url, checkout_target, filename, subdir, expected",
     [
@@ -385,3 +406,66 @@ class TestGetHashFromCheckoutTarget:
                 ) in str(warning.message)
             else:
                 assert len(warning_list) == 0
+
+
+class TestRefCache:
+    """Test class for the caching of remote refs by `_get_hash_from_checkout_target`."""
+
+    @pytest.fixture
+    def git_calls(self) -> Generator[mock.Mock, None, None]:
+        """Count the git commands run by `cstar.base.gitutils`."""
+        with mock.patch("cstar.base.gitutils._run_cmd", wraps=_run_cmd) as run_cmd:
+            yield run_cmd
+
+    def test_single_ls_remote_per_repository(
+        self, local_git_remote: LocalGitRemote, git_calls: mock.Mock
+    ) -> None:
+        """Verify several targets of one repository are resolved with one ls-remote."""
+        repo_url = local_git_remote.url
+        head = local_git_remote.git("rev-parse", "HEAD")
+        tag = local_git_remote.git("rev-parse", "v1.0.0^{commit}")
+
+        assert _get_hash_from_checkout_target(repo_url, "main") == head
+        assert _get_hash_from_checkout_target(repo_url, "v1.0.0") == tag
+        assert _get_hash_from_checkout_target(repo_url, head) == head
+        assert _get_hash_from_checkout_target(repo_url, "main") == head
+
+        assert git_calls.call_count == 1
+
+    def test_branches_expire_and_commits_do_not(
+        self, local_git_remote: LocalGitRemote, git_calls: mock.Mock
+    ) -> None:
+        """Verify branches are resolved again after the TTL, but commit hashes are not."""
+        repo_url = local_git_remote.url
+        old_head = _get_hash_from_checkout_target(repo_url, "main")
+        new_head = local_git_remote.commit("third")
+
+        # within the TTL, the cached branch is used
+        assert _get_hash_from_checkout_target(repo_url, "main") == old_head
+        assert git_calls.call_count == 1
+
+        with mock.patch(
+            "cstar.base.gitutils.time.time", return_value=time.time() + 3600
+        ):
+            assert _get_hash_from_checkout_target(repo_url, old_head) == old_head
+            assert git_calls.call_count == 1
+
+            assert _get_hash_from_checkout_target(repo_url, "main") == new_head
+            assert git_calls.call_count == 2  # noqa: PLR2004
+
+    def test_refs_shared_between_processes(
+        self, local_git_remote: LocalGitRemote, git_calls: mock.Mock
+    ) -> None:
+        """Verify cached refs are persisted to the cache home if enabled."""
+        repo_url = local_git_remote.url
+        head = _get_hash_from_checkout_target(repo_url, "main")
+
+        # simulate a new process
+        _get_ref_cache.cache_clear()
+        assert _get_hash_from_checkout_target(repo_url, "main") == head
+        assert git_calls.call_count == 1
+
+        _get_ref_cache.cache_clear()
+        with mock.patch.dict(os.environ, {ENV_CSTAR_GIT_REF_CACHE_PERSIST: FLAG_OFF}):
+            assert _get_hash_from_checkout_target(repo_url, "main") == head
+        assert git_calls.call_count == 2  # noqa: PLR2004
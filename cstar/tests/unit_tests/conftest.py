@@ -31,20 +31,21 @@ from cstar.base.log import get_logger
 from cstar.base.utils import additional_files_dir
 from cstar.execution.file_system import RomsFileSystemManager
 from cstar.io.constants import SourceClassification
-from cstar.io.retriever import Retriever
-from cstar.io.source_data import SourceData, SourceDataCollection, _SourceInspector
+from cstar.io.source_data import SourceData, SourceDataCollection
 from cstar.io.staged_data import (
     StagedData,
     StagedDataCollection,
     StagedFile,
     StagedRepository,
 )
-from cstar.io.stager import Stager
 from cstar.marbl.external_codebase import MARBLExternalCodeBase
 from cstar.orchestration.launch.local import LocalLauncher
 from cstar.orchestration.models import Step
 from cstar.orchestration.orchestration import LiveStep, LiveWorkplan
-from cstar.orchestration.serialization import deserialize
+from cstar.orchestration.serialization import (
+    deserialize,
+    get_deserialization_cache,
+)
 from cstar.orchestration.tracking import TrackingRepository, WorkplanRun
 from cstar.pio.external_codebase import PIOExternalCodeBase
 from cstar.tests.unit_tests.fake_abc_subclasses import (
@@ -52,6 +53,11 @@ from cstar.tests.unit_tests.fake_abc_subclasses import (
     FakeInputDataset,
     StubSimulation,
 )
+from cstar.tests.unit_tests.helpers import (
+    FakeBuildTools,
+    LocalGitRemote,
+    MockSourceData,
+)
 
 
 @pytest.fixture(scope="module")
@@ -108,98 +114,6 @@ def blueprint_path(
 ################################################################################
 
 
-class MockStager(Stager):
-    """Mock subclass of Stager to skip any staging and retrieval logic.
-
-    `stage` returns a MockStagedData instance
-    """
-
-    @property
-    def retriever(self):
-        if not hasattr(self, "_retriever"):
-            self._retriever = mock.Mock(spec=Retriever)
-        return self._retriever
-
-    def stage(self, target_dir: Path):
-        return MockStagedData(
-            source=self.source, path=target_dir / self.source.basename
-        )
-
-
-class MockRetriever(Retriever):
-    def read(self, bytes_to_have_read: bytes = b"fake_bytes") -> bytes:
-        return bytes_to_have_read
-
-    def _save(self, target_dir: Path) -> Path:
-        return target_dir
-
-
-class MockStagedData(StagedData):
-    """Mock subclass of StagedData to skip any filesystem and network logic.
-
-    Can be initialized with 'mock_changed_from_source' param to set the value of
-    the 'changed_from_source' property
-    """
-
-    def __init__(
-        self, source: "SourceData", path: "Path", mock_changed_from_source: bool = False
-    ):
-        super().__init__(source, path)
-        self._mock_changed_from_source = mock_changed_from_source
-
-    @property
-    def changed_from_source(self) -> bool:
-        return self._mock_changed_from_source
-
-    def unstage(self):
-        pass
-
-    def reset(self):
-        pass
-
-
-class MockSourceInspector(_SourceInspector):
-    """Mock subclass of _SourceInspector to skip any classification logic.
-
-    Tests can initialize with 'classification' parameter to set the desired classification manually.
-    """
-
-    def __init__(
-        self, location: str | Path, classification: SourceClassification | None = None
-    ):
-        self._location = str(location)
-        # Specifically for this mock, user chooses classification
-        self._source_type = classification.value.source_type if classification else None
-        self._location_type = (
-            classification.value.location_type if classification else None
-        )
-        self._file_encoding = (
-            classification.value.file_encoding if classification else None
-        )
-
-
-class MockSourceData(SourceData):
-    """Mock subclass of SourceData to skip any filesystem or network logic.
-
-    Tests can provide 'classification' parameter to set desired classification manually.
-    """
-
-    def __init__(
-        self,
-        location: str | Path,
-        identifier: str | None = None,
-        # Specifically for this mock, user chooses classification
-        classification: SourceClassification = SourceClassification.LOCAL_TEXT_FILE,
-    ):
-        self._location = str(location)
-        self._identifier = identifier
-
-        self._classification = classification
-
-        self._stager = MockStager(source=self)
-        self._retriever = MockRetriever(source=self)
-
-
 @pytest.fixture
 def mocksourcedata_factory() -> Callable[
     [SourceClassification, str | Path, str | None], MockSourceData
@@ -462,6 +376,40 @@ def mock_sourcedatacollection() -> SourceDataCollectionFn:
     return _create
 
 
+################################################################################
+# Git
+################################################################################
+@pytest.fixture
+def local_git_remote(tmp_path: Path) -> LocalGitRemote:
+    """Fixture providing a local bare repository with two commits on `main`.
+
+    The first commit is tagged `v1.0.0`.
+    """
+    remote = LocalGitRemote(tmp_path / "git")
+    remote.commit("first", tag="v1.0.0")
+    remote.commit("second")
+    return remote
+
+
+################################################################################
+# Build tools
+################################################################################
+@pytest.fixture
+def fake_build_tools(tmp_path: Path) -> Generator[FakeBuildTools, None, None]:
+    """Fixture placing fake build tools first on the PATH.
+
+    The dependencies required to configure ParallelIO are also set.
+    """
+    tools = FakeBuildTools(tmp_path / "tools")
+    env = {
+        "PATH": f"{tools.bin_dir}:{os.environ['PATH']}",
+        "NETCDFHOME": "/netcdf/home",
+        "PNETCDFHOME": "/pnetcdf/home",
+    }
+    with mock.patch.dict(os.environ, env):
+        yield tools
+
+
 ################################################################################
 # StagedData
 ################################################################################
@@ -2257,6 +2205,14 @@ def mock_xdg_dirs(tmp_path: Path) -> Generator[dict[str, Path]]:
         yield xdg_vars
 
 
+@pytest.fixture(autouse=True)
+def clear_deserialization_cache() -> Generator[None]:
+    """Prevent models deserialized by one test from being re-used by another."""
+    get_deserialization_cache().invalidate()
+    yield
+    get_deserialization_cache().invalidate()
+
+
 @pytest.fixture(autouse=True)
 def mock_local_delay() -> float:
     """Set a tiny delay between status queries made by the local launcher during unit tests.
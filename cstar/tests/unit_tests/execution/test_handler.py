@@ -6,7 +6,7 @@ from unittest.mock import PropertyMock, patch
 
 import pytest
 
-from cstar.execution.handler import ExecutionHandler, ExecutionStatus
+from cstar.execution.handler import ExecutionHandler, ExecutionStatus, _LogWatcher
 
 
 class MockExecutionHandler(ExecutionHandler):
@@ -183,7 +183,7 @@ class TestExecutionHandlerUpdates:
             Mocked to return `ExecutionStatus.RUNNING`, simulating a running job.
         builtins.input
             Mocked to simulate user responses to the confirmation prompt.
-        time.sleep
+        _LogWatcher.wait
             Mocked to simulate a `KeyboardInterrupt` during indefinite updates.
 
         Fixtures
@@ -221,7 +221,7 @@ class TestExecutionHandlerUpdates:
             mock_status.return_value = ExecutionStatus.RUNNING
 
             # Simulate a KeyboardInterrupt during the updates call
-            with patch("asyncio.sleep", side_effect=KeyboardInterrupt):
+            with patch.object(_LogWatcher, "wait", side_effect=KeyboardInterrupt):
                 await handler.updates(seconds=0)  # Run updates indefinitely
 
                 # Assert that the "stopped by user" message was printed
@@ -893,6 +893,15 @@ async def test_get_slurm_batches() -> None:
         (ExecutionStatus.FAILED, "FAILED"),
         (ExecutionStatus.TIMEOUT, "TIMEOUT"),
         (ExecutionStatus.FAILED, "OUT_OF_MEMORY"),
+        (ExecutionStatus.FAILED, "NODE_FAIL"),
+        (ExecutionStatus.FAILED, "BOOT_FAIL"),
+        (ExecutionStatus.FAILED, "PREEMPTED"),
+        (ExecutionStatus.TIMEOUT, "DEADLINE"),
+        (ExecutionStatus.CANCELLED, "REVOKED"),
+        (ExecutionStatus.PENDING, "REQUEUED"),
+        (ExecutionStatus.HELD, "REQUEUE_HOLD"),
+        (ExecutionStatus.HELD, "SUSPENDED"),
+        (ExecutionStatus.ENDING, "COMPLETING"),
     ],
 )
 def test_get_slurm_batch_sync(exp_status: ExecutionStatus, raw_status: str) -> None:
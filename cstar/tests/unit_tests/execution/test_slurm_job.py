@@ -3,7 +3,11 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
-from cstar.execution.scheduler_job import ExecutionStatus, SlurmJob
+from cstar.execution.scheduler_job import (
+    ExecutionStatus,
+    SlurmJob,
+    get_slurm_status_service,
+)
 from cstar.system.scheduler import SlurmPartition, SlurmQOS, SlurmScheduler
 
 
@@ -100,7 +104,11 @@ class TestSlurmJob:
             "LD_LIBRARY_PATH": "/mock/lib",
         }
 
+        # job status is served by a process-wide cache
+        get_slurm_status_service.cache_clear()
+
     def teardown_method(self, method):
+        get_slurm_status_service.cache_clear()
         self.patch_qos_properties.stop()  # Stop the patch_queue_properties to restore the original behavior
         self.patch_partition_properties.stop()
 
@@ -466,41 +474,41 @@ class TestSlurmJob:
         [
             (None, "", 0, ExecutionStatus.UNSUBMITTED, False),  # Unsubmitted job
             (
-                12345,
+                15514059,
                 "15514059 2026-03-05T14:43:39 2026-03-05T14:44:05 2026-03-05T14:44:07 001_1-wee+ PENDING\n",
                 0,
                 ExecutionStatus.PENDING,
                 False,
             ),  # Pending job
             (
-                12345,
+                15514059,
                 "15514059 2026-03-05T14:43:39 2026-03-05T14:44:05 2026-03-05T14:44:07 001_1-wee+ RUNNING\n",
                 0,
                 ExecutionStatus.RUNNING,
                 False,
             ),  # Running job
             (
-                12345,
+                15514059,
                 "15514059 2026-03-05T14:43:39 2026-03-05T14:44:05 2026-03-05T14:44:07 001_1-wee+ COMPLETED\n",
                 0,
                 ExecutionStatus.COMPLETED,
                 False,
             ),  # Completed job
             (
-                12345,
+                15514059,
                 "15514059 2026-03-05T14:43:39 2026-03-05T14:44:05 2026-03-05T14:44:07 001_1-wee+ CANCELLED\n",
                 0,
                 ExecutionStatus.CANCELLED,
                 False,
             ),  # Cancelled job
             (
-                12345,
+                15514059,
                 "15514059 2026-03-05T14:43:39 2026-03-05T14:44:05 2026-03-05T14:44:07 001_1-wee+ FAILED\n",
                 0,
                 ExecutionStatus.FAILED,
                 False,
             ),  # Failed job
-            (12345, "", 1, None, True),  # sacct command failure
+            (15514059, "", 1, None, True),  # sacct command failure
         ],
     )
     def test_status(
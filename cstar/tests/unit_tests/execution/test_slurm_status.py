@@ -0,0 +1,310 @@
+import asyncio
+import logging
+import os
+import textwrap
+import threading
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.env import (
+    ENV_CSTAR_SLURM_STATUS_TTL,
+    ENV_CSTAR_STATUS_POLL_MAX_SECONDS,
+    ENV_CSTAR_STATUS_POLL_MIN_SECONDS,
+)
+from cstar.execution.handler import ExecutionStatus
+from cstar.execution.scheduler_job import (
+    SlurmJob,
+    SlurmStatusService,
+    get_slurm_status_service,
+)
+from cstar.orchestration.launch.slurm import SlurmHandle, SlurmLauncher
+from cstar.orchestration.orchestration import Status
+from cstar.system.scheduler import SlurmQOS, SlurmScheduler
+
+FAKE_SACCT: str = textwrap.dedent("""\
+    #!/bin/bash
+    # record the invocation so tests can count sacct calls
+    echo "$@" >> "$FAKE_SACCT_LOG"
+
+    IFS=',' read -ra job_ids <<< "$2"
+    for job_id in "${job_ids[@]}"; do
+        # jobs listed in FAKE_SACCT_HIDDEN are not yet visible to sacct
+        [[ ",${FAKE_SACCT_HIDDEN}," == *",${job_id},"* ]] && continue
+        printf "%s cstar_job 2026-03-06T15:03:24 Unknown Unknown %s\\n" \\
+            "$job_id" "${FAKE_SACCT_STATE:-RUNNING}"
+    done
+    """)
+"""A stand-in for `sacct` that reports a fixed state for every requested job."""
+
+
+@pytest.fixture
+def fake_sacct(tmp_path: Path) -> Generator[Callable[[], int], None, None]:
+    """Place a fake `sacct` executable on the PATH.
+
+    Returns
+    -------
+    Callable[[], int]
+        A function returning the number of times `sacct` has been invoked.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+
+    sacct_path = bin_dir / "sacct"
+    sacct_path.write_text(FAKE_SACCT)
+    sacct_path.chmod(0o755)
+
+    log_path = tmp_path / "sacct.log"
+    log_path.touch()
+
+    def _num_calls() -> int:
+        return len(log_path.read_text().splitlines())
+
+    env = {
+        "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        "FAKE_SACCT_LOG": log_path.as_posix(),
+    }
+
+    get_slurm_status_service.cache_clear()
+    with mock.patch.dict(os.environ, env):
+        yield _num_calls
+    get_slurm_status_service.cache_clear()
+
+
+def test_status_service_single_query(fake_sacct: Callable[[], int]) -> None:
+    """Verify that a request for many jobs results in a single `sacct` call."""
+    service = SlurmStatusService(ttl=60)
+    job_ids = [str(x) for x in range(1000, 1050)]
+
+    batches = service.get_batches_sync(job_ids)
+
+    assert fake_sacct() == 1
+    assert set(batches) == set(job_ids)
+    assert all(b.status == ExecutionStatus.RUNNING for b in batches.values())
+
+
+def test_status_service_serves_from_cache(fake_sacct: Callable[[], int]) -> None:
+    """Verify that repeated requests inside the TTL do not query `sacct`."""
+    service = SlurmStatusService(ttl=60)
+    job_ids = ["1001", "1002", "1003"]
+
+    for _ in range(10):
+        for job_id in job_ids:
+            service.get_batch_sync(job_id)
+
+    # each job is unknown on its first request; afterwards all are served from cache
+    assert fake_sacct() == len(job_ids)
+
+    before = fake_sacct()
+    service.get_batches_sync(job_ids)
+    assert fake_sacct() == before
+
+
+def test_status_service_refreshes_outstanding(
+    fake_sacct: Callable[[], int],
+) -> None:
+    """Verify that an expired status refreshes all tracked jobs in one query."""
+    service = SlurmStatusService(ttl=0)
+    service.track(["1001", "1002", "1003"])
+
+    service.get_batch_sync("1001")
+    service.get_batch_sync("1002")
+
+    assert fake_sacct() == 2  # noqa: PLR2004
+    assert service.num_queries == 2  # noqa: PLR2004
+
+
+def test_status_service_terminal_not_requeried(
+    fake_sacct: Callable[[], int],
+) -> None:
+    """Verify that jobs in a terminal state are never queried again."""
+    service = SlurmStatusService(ttl=0)
+
+    with mock.patch.dict(os.environ, {"FAKE_SACCT_STATE": "COMPLETED"}):
+        for _ in range(5):
+            batch = service.get_batch_sync("1001")
+
+    assert batch.status == ExecutionStatus.COMPLETED
+    assert fake_sacct() == 1
+
+
+def test_status_service_invalidate(fake_sacct: Callable[[], int]) -> None:
+    """Verify that invalidating a job forces the next request to query `sacct`."""
+    service = SlurmStatusService(ttl=60)
+
+    service.get_batch_sync("1001")
+    service.invalidate(["1001"])
+    service.get_batch_sync("1001")
+
+    assert fake_sacct() == 2  # noqa: PLR2004
+
+
+def test_status_service_submission_pending_until_visible(
+    fake_sacct: Callable[[], int],
+) -> None:
+    """Verify that a submitted job is reported as pending, without a `sacct`
+    query, and is re-queried until it becomes visible.
+    """
+    service = SlurmStatusService(ttl=60, visibility_timeout=60)
+    service.register_submission(["1001"])
+
+    assert service.get_batch_sync("1001").status == ExecutionStatus.PENDING
+    assert fake_sacct() == 0
+
+    with mock.patch.object(SlurmStatusService, "VISIBILITY_RETRY", 0):
+        with mock.patch.dict(os.environ, {"FAKE_SACCT_HIDDEN": "1001"}):
+            # the job is re-queried despite the long TTL while it is not visible
+            assert service.get_batch_sync("1001").status == ExecutionStatus.PENDING
+            assert service.get_batch_sync("1001").status == ExecutionStatus.PENDING
+            assert fake_sacct() == 2  # noqa: PLR2004
+
+        assert service.get_batch_sync("1001").status == ExecutionStatus.RUNNING
+        assert fake_sacct() == 3  # noqa: PLR2004
+
+    # once visible, the job follows the regular TTL
+    assert service.get_batch_sync("1001").status == ExecutionStatus.RUNNING
+    assert fake_sacct() == 3  # noqa: PLR2004
+
+
+def test_status_service_submission_visibility_timeout(
+    fake_sacct: Callable[[], int],
+) -> None:
+    """Verify that a submitted job that never becomes visible is reported as
+    unsubmitted once the visibility timeout elapses.
+    """
+    service = SlurmStatusService(ttl=0, visibility_timeout=0)
+    service.register_submission(["1001"])
+
+    with mock.patch.dict(os.environ, {"FAKE_SACCT_HIDDEN": "1001"}):
+        assert service.get_batch_sync("1001").status == ExecutionStatus.UNSUBMITTED
+
+
+def test_status_service_unmapped_state() -> None:
+    """Verify that a job in a state that cannot be mapped is reported as unknown
+    without affecting the status of the other jobs in the same query.
+    """
+    sacct_output = textwrap.dedent("""\
+        1001 cstar_job 2026-03-06T15:03:24 Unknown Unknown RUNNING
+        1002 cstar_job 2026-03-06T15:03:24 Unknown Unknown unknown-raw-status
+        """)
+    service = SlurmStatusService(ttl=60)
+
+    with mock.patch(
+        "cstar.execution.scheduler_job._run_cmd", return_value=sacct_output
+    ):
+        batches = service.get_batches_sync(["1001", "1002"])
+
+    assert batches["1001"].status == ExecutionStatus.RUNNING
+    assert batches["1002"].status == ExecutionStatus.UNKNOWN
+
+
+@pytest.mark.asyncio
+async def test_launcher_query_status_batched(fake_sacct: Callable[[], int]) -> None:
+    """Verify concurrent status queries from the launcher share `sacct` calls."""
+    handles = [
+        SlurmHandle(pid=str(x), name=f"step-{x}", run_id="run")
+        for x in range(2000, 2500)
+    ]
+    get_slurm_status_service().track(h.pid for h in handles)
+
+    statuses = await asyncio.gather(*map(SlurmLauncher.query_status, handles))
+    assert all(s == Status.Running for s in statuses)
+    assert fake_sacct() == 1
+
+    updates = await asyncio.gather(*map(SlurmLauncher.update_status, handles))
+    assert all(changed for changed, _ in updates)
+    assert fake_sacct() == 1
+
+
+@pytest.mark.asyncio
+async def test_launcher_prune_completed_dependencies(
+    fake_sacct: Callable[[], int],
+) -> None:
+    """Verify that dependency pruning is served by the status service."""
+    handles = [
+        SlurmHandle(pid=str(x), name=f"step-{x}", run_id="run")
+        for x in range(3000, 3010)
+    ]
+
+    with mock.patch.dict(os.environ, {"FAKE_SACCT_STATE": "COMPLETED"}):
+        remaining = await SlurmLauncher._prune_completed_dependencies(handles)  # type: ignore[reportPrivateUsage]
+        statuses = await asyncio.gather(*map(SlurmLauncher.query_status, handles))
+
+    assert not remaining
+    assert all(s == Status.Done for s in statuses)
+    assert fake_sacct() == 1
+
+
+@pytest.mark.asyncio
+async def test_monitored_job_status_poll_cadence(
+    fake_sacct: Callable[[], int],
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Verify that streaming updates from a running job queries `sacct` on the
+    status polling cadence rather than every time the log is read to its end.
+    """
+    output_file = tmp_path / "job.out"
+    output_file.touch()
+    lines = [f"step {i}" for i in range(15)]
+
+    queue = SlurmQOS(name="test_queue", query_name="test_queue")
+    with mock.patch.object(
+        SlurmQOS,
+        "max_walltime",
+        new_callable=mock.PropertyMock,
+        return_value="02:00:00",
+    ):
+        job = SlurmJob(
+            scheduler=SlurmScheduler(
+                queues=[queue],
+                primary_queue_name="test_queue",
+                requires_task_distribution=False,
+            ),
+            commands="echo Hello, World",
+            account_key="test_account",
+            cpus=4,
+            walltime="01:00:00",
+            job_name="test_job",
+            output_file=output_file,
+            queue_name="test_queue",
+        )
+    job._id = 1234
+    caplog.set_level(logging.INFO, logger=job.log.name)
+
+    def fake_job() -> None:
+        # write a line every 0.1 seconds for 1.5 seconds, then finish
+        with output_file.open("a") as f:
+            for line in lines:
+                time.sleep(0.1)
+                f.write(f"{line}\n")
+                f.flush()
+        os.environ["FAKE_SACCT_STATE"] = "COMPLETED"
+
+    env = {
+        "FAKE_SACCT_STATE": "RUNNING",
+        ENV_CSTAR_SLURM_STATUS_TTL: "0",
+        ENV_CSTAR_STATUS_POLL_MIN_SECONDS: "0.2",
+        ENV_CSTAR_STATUS_POLL_MAX_SECONDS: "1.0",
+    }
+    with mock.patch.dict(os.environ, env):
+        writer = threading.Thread(target=fake_job)
+        writer.start()
+
+        async def monitor() -> None:
+            while job._enabled:
+                await job.updates(seconds=0.5)
+
+        await asyncio.wait_for(monitor(), timeout=10)
+        writer.join()
+
+    assert job.status == ExecutionStatus.COMPLETED
+    for line in lines:
+        assert line in caplog.text
+
+    # polling at 0.1 s intervals while tailing the log would query sacct 15+ times;
+    # backing off from 0.2 s to 1.0 s needs at most 6 queries over the 1.5 s run
+    assert fake_sacct() <= 6  # noqa: PLR2004
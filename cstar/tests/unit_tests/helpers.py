@@ -0,0 +1,253 @@
+import subprocess
+import threading
+import typing as t
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from unittest import mock
+
+from cstar.io.constants import SourceClassification
+from cstar.io.retriever import Retriever
+from cstar.io.source_data import SourceData, _SourceInspector
+from cstar.io.staged_data import StagedData
+from cstar.io.stager import Stager
+
+
+class MockStager(Stager):
+    """Mock subclass of Stager to skip any staging and retrieval logic.
+
+    `stage` returns a MockStagedData instance
+    """
+
+    @property
+    def retriever(self):
+        if not hasattr(self, "_retriever"):
+            self._retriever = mock.Mock(spec=Retriever)
+        return self._retriever
+
+    def stage(self, target_dir: Path):
+        return MockStagedData(
+            source=self.source, path=target_dir / self.source.basename
+        )
+
+
+class MockRetriever(Retriever):
+    def read(self, bytes_to_have_read: bytes = b"fake_bytes") -> bytes:
+        return bytes_to_have_read
+
+    def _save(self, target_dir: Path) -> Path:
+        return target_dir
+
+
+class MockStagedData(StagedData):
+    """Mock subclass of StagedData to skip any filesystem and network logic.
+
+    Can be initialized with 'mock_changed_from_source' param to set the value of
+    the 'changed_from_source' property
+    """
+
+    def __init__(
+        self, source: "SourceData", path: "Path", mock_changed_from_source: bool = False
+    ):
+        super().__init__(source, path)
+        self._mock_changed_from_source = mock_changed_from_source
+
+    @property
+    def changed_from_source(self) -> bool:
+        return self._mock_changed_from_source
+
+    def unstage(self):
+        pass
+
+    def reset(self):
+        pass
+
+
+class MockSourceInspector(_SourceInspector):
+    """Mock subclass of _SourceInspector to skip any classification logic.
+
+    Tests can initialize with 'classification' parameter to set the desired classification manually.
+    """
+
+    def __init__(
+        self, location: str | Path, classification: SourceClassification | None = None
+    ):
+        self._location = str(location)
+        # Specifically for this mock, user chooses classification
+        self._source_type = classification.value.source_type if classification else None
+        self._location_type = (
+            classification.value.location_type if classification else None
+        )
+        self._file_encoding = (
+            classification.value.file_encoding if classification else None
+        )
+
+
+class MockSourceData(SourceData):
+    """Mock subclass of SourceData to skip any filesystem or network logic.
+
+    Tests can provide 'classification' parameter to set desired classification manually.
+    """
+
+    def __init__(
+        self,
+        location: str | Path,
+        identifier: str | None = None,
+        # Specifically for this mock, user chooses classification
+        classification: SourceClassification = SourceClassification.LOCAL_TEXT_FILE,
+    ):
+        self._location = str(location)
+        self._identifier = identifier
+
+        self._classification = classification
+
+        self._stager = MockStager(source=self)
+        self._retriever = MockRetriever(source=self)
+
+
+class LocalGitRemote:
+    """A local bare repository standing in for a remote git repository.
+
+    The repository has a `main` branch that is updated by committing in a
+    separate working copy.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.bare_dir = root / "remote.git"
+        self.work_dir = root / "work"
+
+        self.git("init", "-q", "--bare", "--initial-branch=main", str(self.bare_dir))
+        self.git("clone", "-q", str(self.bare_dir), str(self.work_dir))
+
+    @property
+    def url(self) -> str:
+        """The URL of the bare repository."""
+        return self.bare_dir.as_uri()
+
+    def git(self, *args: str) -> str:
+        """Run a git command in the working copy and return its output."""
+        cwd = self.work_dir if self.work_dir.exists() else None
+        result = subprocess.run(
+            ["git", "-c", "user.name=C-Star", "-c", "user.email=cstar@example.com"]
+            + list(args),
+            cwd=cwd,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return result.stdout.strip()
+
+    def commit(self, message: str, tag: str | None = None) -> str:
+        """Push a new commit to `main`, optionally tagged, and return its hash."""
+        (self.work_dir / "README.md").write_text(message)
+        self.git("add", "README.md")
+        self.git("commit", "-q", "-m", message)
+        if tag:
+            self.git("tag", tag)
+        self.git("push", "-q", "origin", "HEAD:main", "--tags")
+        return self.git("rev-parse", "HEAD")
+
+
+class FakeBuildTools:
+    """Fake `make`, `cmake` and `ccache` executables that record their invocations."""
+
+    def __init__(self, root: Path) -> None:
+        self.bin_dir = root / "bin"
+        self.log_path = root / "builds.log"
+        self.bin_dir.mkdir(parents=True)
+        self.log_path.touch()
+
+        for tool in ("make", "cmake", "ccache"):
+            script = self.bin_dir / tool
+            script.write_text(
+                f'#!/bin/sh\necho "{tool} $*" >> {self.log_path}\nsleep 0.1\n'
+            )
+            script.chmod(0o755)
+
+    @property
+    def calls(self) -> list[str]:
+        """The commands run with the fake tools."""
+        return self.log_path.read_text().splitlines()
+
+
+@dataclass
+class LocalHTTPServer:
+    """A local HTTP server serving the files in a directory."""
+
+    url: str
+    """The base URL of the server."""
+    root: Path
+    """The directory containing the served files."""
+    requests: Counter[tuple[str, str]] = field(default_factory=Counter)
+    """The number of requests received for each (method, path)."""
+    ranges: list[str] = field(default_factory=list)
+    """The `Range` header of each ranged request, in order of receipt."""
+    accept_ranges: bool = True
+    """Whether byte-range requests are honored."""
+    faults: list[int] = field(default_factory=list)
+    """Byte counts after which to drop the connection of the next responses."""
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    """A lock guarding the mutable server state."""
+
+
+class LocalHTTPHandler(BaseHTTPRequestHandler):
+    """Serve files with optional range support and injected connection failures."""
+
+    state: LocalHTTPServer
+
+    def __init__(self, *args: t.Any, state: LocalHTTPServer, **kwargs: t.Any) -> None:
+        self.state = state
+        super().__init__(*args, **kwargs)
+
+    def _respond(self, method: str) -> bytes:
+        """Send the response headers and return the body to send."""
+        with self.state.lock:
+            self.state.requests[method, self.path] += 1
+
+        path = self.state.root / self.path.lstrip("/")
+        if not path.is_file():
+            self.send_error(404)
+            return b""
+
+        data = path.read_bytes()
+        start, end = 0, len(data) - 1
+
+        if (spec := self.headers.get("Range")) and self.state.accept_ranges:
+            with self.state.lock:
+                self.state.ranges.append(spec)
+            first, last = spec.removeprefix("bytes=").split("-")
+            start, end = int(first), min(int(last or end), end)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        else:
+            self.send_response(200)
+
+        body = data[start : end + 1]
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.date_time_string(path.stat().st_mtime))
+        if self.state.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return body
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._respond("HEAD")
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = self._respond("GET")
+
+        with self.state.lock:
+            fault = self.state.faults.pop(0) if self.state.faults else None
+
+        if fault is not None:
+            # send a truncated body and drop the connection
+            self.wfile.write(body[:fault])
+            self.close_connection = True
+            return
+
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        """Silence the per-request log output."""
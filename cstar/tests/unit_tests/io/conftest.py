@@ -0,0 +1,40 @@
+import threading
+from collections.abc import Generator
+from functools import partial
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from cstar.tests.unit_tests.helpers import LocalHTTPHandler, LocalHTTPServer
+
+
+@pytest.fixture
+def local_http_server(tmp_path: Path) -> Generator[LocalHTTPServer, None, None]:
+    """Run a local HTTP server that counts the requests it receives.
+
+    Files written to `root` are served at `url`. Range support can be disabled
+    and connection failures injected by modifying the returned state.
+
+    Returns
+    -------
+    LocalHTTPServer
+        The server state.
+    """
+    root = tmp_path / "served"
+    root.mkdir()
+
+    state = LocalHTTPServer(url="", root=root)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(LocalHTTPHandler, state=state)
+    )
+    state.url = f"http://127.0.0.1:{server.server_port}"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -1,158 +1,182 @@
-import typing as t
+import shutil
+import threading
 from collections.abc import Callable, Generator
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 from unittest import mock
 
 import pytest
 
+from cstar.base.exceptions import CstarError
+from cstar.base.gitutils import _clone_mirror, _fetch_mirror, _has_commit
+from cstar.io.constants import SourceClassification
+from cstar.io.retriever import RemoteRepositoryRetriever
 from cstar.io.source_data import SourceData
+from cstar.io.stager import CachedRemoteRepositoryStager
+from cstar.tests.unit_tests.helpers import LocalGitRemote, MockSourceData
 
-if t.TYPE_CHECKING:
-    from cstar.io.stager import CachedRemoteRepositoryStager as CRRS
+if TYPE_CHECKING:
+    from cstar.io.staged_data import StagedRepository
 
 
 @pytest.fixture
-def mock_home_dir(tmp_path: Path) -> Generator[Callable[[], Path], None, None]:
-    """Fixture that replaces the default home directory with a temporary
-    home directory.
+def repo_source(
+    local_git_remote: LocalGitRemote,
+) -> Callable[..., SourceData]:
+    """Fixture returning a factory for sources of the local git remote that are
+    staged by the cached stager.
     """
-    state_dir = tmp_path / "test-asset-cache"
-    state_dir.mkdir(parents=True, exist_ok=True)
 
-    with mock.patch(
-        "cstar.execution.file_system.DirectoryManager.state_home",
-        return_value=state_dir,
-    ) as mock_state_home:
-        yield mock_state_home
+    def _create(identifier: str | None = "main") -> SourceData:
+        source = MockSourceData(
+            location=local_git_remote.url,
+            identifier=identifier,
+            classification=SourceClassification.REMOTE_REPOSITORY,
+        )
+        source._stager = CachedRemoteRepositoryStager(source)
+        source._retriever = RemoteRepositoryRetriever(source)
+        return source
 
+    return _create
 
-@pytest.mark.usefixtures("mock_home_dir")
-def test_cached_stager(tmp_path: Path) -> None:
-    """Verify that the cached stager retrieves and caches the remote repo.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        A temporary path to store repository clones
-    """
-    source_data = SourceData("https://github.com/CWorthy-ocean/c-star")
-    stage_path = tmp_path / "my-roms"
-
-    staged_data = source_data.stage(stage_path)
-    stager: CRRS = t.cast("CRRS", source_data.stager)
-    cached_data_path = stager._get_cache_path()
-
-    files_1 = {x.resolve().as_posix() for x in staged_data.path.iterdir()}
-    files_2 = {x.resolve().as_posix() for x in cached_data_path.iterdir()}
-
-    # confirm the repository is retrieved.
-    assert files_1
-    assert files_2
-
-    # confirm the cache and target files do not resolve and overlap
-    assert not files_1.intersection(files_2)
-
-
-@pytest.mark.usefixtures("mock_home_dir")
-def test_cached_stager_reuse(tmp_path: Path) -> None:
-    """Verify that the cached stager performs a single clone and
-    re-uses the cached copy on repeat requests for the repository.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        A temporary path to store repository clones
-    """
-    repo_uri = "https://github.com/CWorthy-ocean/c-star"
-
-    source_data_1 = SourceData(repo_uri)
-    stage_path_1 = tmp_path / "my-roms-1"
-    staged_data_1 = source_data_1.stage(stage_path_1)
-
-    source_data_2 = SourceData(repo_uri, identifier="main")
-    stage_path_2 = tmp_path / "my-roms-2"
-
-    fake_pull = mock.MagicMock()
-    fake_clone = mock.MagicMock()
-    fake_checkout = mock.MagicMock()
 
+@pytest.fixture
+def mirror_calls() -> Generator[dict[str, mock.Mock], None, None]:
+    """Count the operations performed on the repository mirror."""
     with (
-        mock.patch("cstar.io.retriever._pull", new=fake_pull) as mock_pull,
-        mock.patch("cstar.io.retriever._clone", new=fake_clone) as mock_clone,
-        mock.patch("cstar.io.retriever._checkout", new=fake_checkout) as mock_checkout,
+        mock.patch("cstar.io.stager._clone_mirror", wraps=_clone_mirror) as clone,
+        mock.patch("cstar.io.stager._fetch_mirror", wraps=_fetch_mirror) as fetch,
     ):
-        staged_data_2 = source_data_2.stage(stage_path_2)
+        yield {"clone": clone, "fetch": fetch}
 
-    # confirm the remote is not cloned
-    mock_clone.assert_not_called()
 
-    # confirm the cached copy is updated
-    mock_pull.assert_called_once()
-
-    # confirm that checkout is called
-    mock_checkout.assert_called_once()
-
-    # confirm both targets contain files.
-    files_1 = {x.resolve().as_posix() for x in staged_data_1.path.iterdir()}
-    files_2 = {x.resolve().as_posix() for x in staged_data_2.path.iterdir()}
-
-    assert files_1
-    assert files_2
+def test_cached_stager(
+    repo_source: Callable[..., SourceData],
+    local_git_remote: LocalGitRemote,
+    tmp_path: Path,
+) -> None:
+    """Verify that the cached stager mirrors the remote repo and clones the
+    target from the mirror.
+    """
+    source = repo_source()
+    staged = cast("StagedRepository", source.stage(tmp_path / "my-roms"))
+    mirror_path = CachedRemoteRepositoryStager(source)._get_cache_path()
+
+    # confirm the repository is retrieved at the requested target
+    assert staged.checkout_hash == local_git_remote.git("rev-parse", "main")
+    assert (staged.path / "README.md").read_text() == "second"
+    assert not staged.changed_from_source
+
+    # confirm the target was cloned from a bare mirror without borrowing its objects
+    assert not (mirror_path / "README.md").exists()
+    assert not (staged.path / ".git" / "objects" / "info" / "alternates").exists()
+
+    # confirm the target refers to the source, not the mirror
+    origin = staged.path / ".git" / "config"
+    assert local_git_remote.url in origin.read_text()
+
+
+def test_cached_stager_target_independent_of_mirror(
+    repo_source: Callable[..., SourceData],
+    tmp_path: Path,
+) -> None:
+    """Verify that a staged target remains a usable repository after the mirror
+    is removed, e.g. when the C-Star cache is cleaned.
+    """
+    source = repo_source()
+    staged = cast("StagedRepository", source.stage(tmp_path / "my-roms"))
+    checkout_hash = staged.checkout_hash
 
-    # confirm the cache and target files do not resolve and overlap
-    assert not files_1.intersection(files_2)
+    shutil.rmtree(CachedRemoteRepositoryStager(source)._get_cache_path())
 
+    assert _has_commit(staged.path, checkout_hash)
+    assert not staged.changed_from_source
 
-@pytest.mark.usefixtures("mock_home_dir")
-def test_cached_stager_refresh_failure(tmp_path: Path) -> None:
-    """Verify that the cached stager re-clones a repository
-    if an attempt to refresh fails.
 
-    Parameters
-    ----------
-    tmp_path : Path
-        A temporary path to store repository clones
+def test_cached_stager_reuse(
+    repo_source: Callable[..., SourceData],
+    local_git_remote: LocalGitRemote,
+    mirror_calls: dict[str, mock.Mock],
+    tmp_path: Path,
+) -> None:
+    """Verify that the mirror is created once and is not fetched while it
+    contains the requested commits.
     """
-    repo_uri = "https://github.com/CWorthy-ocean/c-star"
-
-    cache_path = tmp_path / ".cache" / "https-github-com-cworthy-ocean-cstar"
-    cached_junk = cache_path / ".git"
-    cached_junk.mkdir(parents=True)
-    (cached_junk / "garbage").touch()
-
-    source_data_1 = SourceData(repo_uri)
-    stage_path_1 = tmp_path / "my-roms-1"
-
-    def fail_pull(*args, **kwargs) -> None:
-        msg = "Simulating a failure to pull repo updates"
-        raise RuntimeError(msg)
+    first = local_git_remote.git("rev-parse", "v1.0.0^{commit}")
+
+    staged = [
+        cast(
+            "StagedRepository", repo_source(identifier).stage(tmp_path / f"my-roms-{i}")
+        )
+        for i, identifier in enumerate(["main", "v1.0.0", first, None])
+    ]
+
+    mirror_calls["clone"].assert_called_once()
+    # only the stage without a checkout target needs the latest refs
+    mirror_calls["fetch"].assert_called_once()
+
+    assert staged[1].checkout_hash == staged[2].checkout_hash == first
+    assert staged[0].checkout_hash == staged[3].checkout_hash != first
+
+
+def test_cached_stager_fetches_missing_commit(
+    repo_source: Callable[..., SourceData],
+    local_git_remote: LocalGitRemote,
+    mirror_calls: dict[str, mock.Mock],
+    tmp_path: Path,
+) -> None:
+    """Verify that the mirror is fetched if it lacks the requested commit."""
+    repo_source().stage(tmp_path / "my-roms-1")
+    new_head = local_git_remote.commit("third")
+
+    staged = cast(
+        "StagedRepository", repo_source(new_head).stage(tmp_path / "my-roms-2")
+    )
+
+    mirror_calls["clone"].assert_called_once()
+    mirror_calls["fetch"].assert_called_once()
+    assert staged.checkout_hash == new_head
+
+
+def test_cached_stager_refresh_failure(
+    repo_source: Callable[..., SourceData],
+    mirror_calls: dict[str, mock.Mock],
+    tmp_path: Path,
+) -> None:
+    """Verify that a mirror that cannot be fetched is reported and kept."""
+    staged = cast("StagedRepository", repo_source().stage(tmp_path / "my-roms-1"))
+    mirror_path = CachedRemoteRepositoryStager(repo_source())._get_cache_path()
 
     with (
-        mock.patch("cstar.io.retriever._pull", side_effect=fail_pull) as mock_refresh,
-        mock.patch(
-            "cstar.io.retriever.RemoteRepositoryRetriever.save", return_value=cache_path
-        ) as mock_clone,
         mock.patch(
-            "cstar.io.retriever.RemoteRepositoryRetriever.checkout"
-        ) as mock_checkout,
-        mock.patch("cstar.io.stager._run_cmd") as mock_copy_cache,
-        mock.patch("cstar.io.staged_data._run_cmd"),
-        mock.patch("shutil.rmtree") as mock_rmdir,
-        mock.patch.object(
-            source_data_1.stager, "_get_cache_path", return_value=cache_path
+            "cstar.io.stager._fetch_mirror", side_effect=RuntimeError("offline")
         ),
+        pytest.raises(CstarError, match="Unable to fetch mirror"),
     ):
-        _ = source_data_1.stage(stage_path_1)
-
-    # confirm the refresh was attempted
-    mock_refresh.assert_called_once()
-
-    # confirm the cache is cleared and repo is re-cloned after refresh returns `False`
-    mock_rmdir.assert_called_once_with(cache_path)
-    mock_clone.assert_called_once()
-
-    # confirm the re-cloned repo is copied from cache to target dir
-    assert mock_copy_cache.call_count == 1  # cp -ar
-
-    # confirm that checkout was called after the cache was copied
-    mock_checkout.assert_called_once()
+        repo_source(None).stage(tmp_path / "my-roms-2")
+
+    # confirm the mirror was neither removed nor re-created
+    mirror_calls["clone"].assert_called_once()
+    assert mirror_path.exists()
+    assert staged.checkout_hash
+    assert not staged.changed_from_source
+
+
+def test_cached_stager_concurrent_stages(
+    repo_source: Callable[..., SourceData],
+    mirror_calls: dict[str, mock.Mock],
+    tmp_path: Path,
+) -> None:
+    """Verify that concurrent stages of a repository share a single mirror."""
+    threads = [
+        threading.Thread(target=repo_source().stage, args=(tmp_path / f"my-roms-{i}",))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mirror_calls["clone"].assert_called_once()
+    for i in range(4):
+        assert (tmp_path / f"my-roms-{i}" / "README.md").read_text() == "second"
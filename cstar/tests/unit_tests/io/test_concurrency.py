@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.env import ENV_CSTAR_STAGING_HOST_WORKERS, ENV_CSTAR_STAGING_WORKERS
+from cstar.io.concurrency import (
+    StagingError,
+    StagingTask,
+    host_slot,
+    run_concurrently,
+)
+from cstar.io.constants import SourceClassification
+from cstar.io.source_data import SourceDataCollection
+
+
+def test_run_concurrently_overlaps_tasks() -> None:
+    """Verify tasks run in parallel and results are returned in submission order."""
+    num_tasks = 4
+    barrier = threading.Barrier(num_tasks, timeout=5)
+
+    def task(i: int) -> Callable[[], int]:
+        def fn() -> int:
+            # deadlocks (and times out) unless all tasks run at the same time
+            barrier.wait()
+            return i
+
+        return fn
+
+    tasks = [StagingTask(f"task-{i}", task(i)) for i in range(num_tasks)]
+    assert run_concurrently(tasks, max_workers=num_tasks) == list(range(num_tasks))
+
+
+def test_run_concurrently_serial_setting() -> None:
+    """Verify tasks run on the calling thread when concurrency is disabled."""
+    tasks = [StagingTask(f"task-{i}", threading.get_ident) for i in range(3)]
+
+    with mock.patch.dict(os.environ, {ENV_CSTAR_STAGING_WORKERS: "1"}):
+        thread_ids = run_concurrently(tasks)
+
+    assert set(thread_ids) == {threading.get_ident()}
+
+
+def test_run_concurrently_reraises_single_failure() -> None:
+    """Verify a single failure is re-raised without being wrapped."""
+
+    def fail() -> None:
+        raise ValueError("Hash mismatch")
+
+    tasks = [StagingTask("ok", lambda: None), StagingTask("bad", fail)]
+
+    with pytest.raises(ValueError, match="Hash mismatch"):
+        run_concurrently(tasks, max_workers=2)
+
+
+def test_run_concurrently_aggregates_failures() -> None:
+    """Verify all tasks complete and failures are reported in submission order."""
+    completed: list[str] = []
+
+    def task(name: str, delay: float, fail: bool) -> StagingTask[None]:
+        def fn() -> None:
+            time.sleep(delay)
+            completed.append(name)
+            if fail:
+                raise RuntimeError(name)
+
+        return StagingTask(name, fn)
+
+    tasks = [
+        task("first", 0.05, fail=True),
+        task("second", 0.0, fail=False),
+        task("third", 0.0, fail=True),
+    ]
+
+    with pytest.raises(StagingError) as ex:
+        run_concurrently(tasks, max_workers=3)
+
+    assert sorted(completed) == ["first", "second", "third"]
+    assert [name for name, _ in ex.value.failures] == ["first", "third"]
+    assert isinstance(ex.value.__cause__, RuntimeError)
+
+
+def test_host_slot_limits_requests_per_host() -> None:
+    """Verify concurrent requests to one host are limited, but local paths are not."""
+    lock = threading.Lock()
+    active: dict[str, int] = {"remote": 0, "local": 0}
+    peak: dict[str, int] = {"remote": 0, "local": 0}
+
+    def task(kind: str, location: str) -> StagingTask[None]:
+        def fn() -> None:
+            with host_slot(location):
+                with lock:
+                    active[kind] += 1
+                    peak[kind] = max(peak[kind], active[kind])
+                time.sleep(0.05)
+                with lock:
+                    active[kind] -= 1
+
+        return StagingTask(location, fn)
+
+    tasks = [
+        task("remote", f"https://limited.example.com/file_{i}.nc") for i in range(6)
+    ] + [task("local", f"/data/file_{i}.nc") for i in range(6)]
+
+    with mock.patch.dict(os.environ, {ENV_CSTAR_STAGING_HOST_WORKERS: "2"}):
+        run_concurrently(tasks, max_workers=12)
+
+    assert peak["remote"] == 2  # noqa: PLR2004
+    assert peak["local"] > 2  # noqa: PLR2004
+
+
+def test_collection_stage_preserves_order(
+    mocksourcedata_factory: Callable, tmp_path: Path
+) -> None:
+    """Verify a concurrently staged collection matches the order of its sources."""
+    sources = [
+        mocksourcedata_factory(
+            classification=SourceClassification.LOCAL_TEXT_FILE,
+            location=f"file_{i}.txt",
+        )
+        for i in range(10)
+    ]
+
+    staged = SourceDataCollection(sources).stage(tmp_path)
+
+    assert staged.paths == [tmp_path / f"file_{i}.txt" for i in range(10)]
@@ -0,0 +1,151 @@
+import hashlib
+import os
+import stat
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.env import ENV_CSTAR_DATASET_CACHE_MAX_MB
+from cstar.io.dataset_cache import DatasetCache
+from cstar.io.retriever import RemoteBinaryFileRetriever
+from cstar.io.source_data import SourceData
+from cstar.io.stager import RemoteBinaryFileStager
+from cstar.tests.unit_tests.helpers import LocalHTTPServer
+
+CONTENT: bytes = b"\x89HDF\r\n\x1a\n" + bytes(range(256)) * 64
+"""The content of the served dataset."""
+
+
+@pytest.fixture
+def remote_dataset(
+    local_http_server: LocalHTTPServer,
+    mocksourcedata_remote_file: Callable[..., SourceData],
+) -> Callable[..., SourceData]:
+    """Serve a dataset and return a factory for sources pointing to it."""
+    (local_http_server.root / "grid.nc").write_bytes(CONTENT)
+
+    def _create(with_hash: bool = True) -> SourceData:
+        source = mocksourcedata_remote_file(
+            location=f"{local_http_server.url}/grid.nc",
+            identifier=hashlib.sha256(CONTENT).hexdigest() if with_hash else None,
+        )
+        source._retriever = RemoteBinaryFileRetriever(source)
+        return source
+
+    return _create
+
+
+def _downloads(server: LocalHTTPServer) -> int:
+    return server.requests["GET", "/grid.nc"]
+
+
+@pytest.mark.parametrize("with_hash", [True, False])
+def test_dataset_cache_downloads_once(
+    local_http_server: LocalHTTPServer,
+    remote_dataset: Callable[..., SourceData],
+    tmp_path: Path,
+    with_hash: bool,
+) -> None:
+    """Verify a dataset staged by several steps is only downloaded once.
+
+    Datasets are keyed by checksum when it is known, and by the URL and HTTP
+    validators otherwise.
+    """
+    staged = [
+        RemoteBinaryFileStager(remote_dataset(with_hash)).stage(tmp_path / f"step-{i}")
+        for i in range(3)
+    ]
+
+    assert _downloads(local_http_server) == 1
+    if not with_hash:
+        # the validators of datasets without a checksum are requested each time
+        assert local_http_server.requests["HEAD", "/grid.nc"] >= len(staged)
+    for item in staged:
+        assert item.path.read_bytes() == CONTENT
+        assert not item.changed_from_source
+
+    # the staged files and the cache entry share an inode
+    assert staged[0].path.stat().st_nlink == 4  # noqa: PLR2004
+    assert stat.S_IMODE(staged[0].path.stat().st_mode) == 0o444  # noqa: PLR2004
+
+
+def test_dataset_cache_detects_remote_changes(
+    local_http_server: LocalHTTPServer,
+    remote_dataset: Callable[..., SourceData],
+    tmp_path: Path,
+) -> None:
+    """Verify a dataset without a checksum is downloaded again after it changes."""
+    RemoteBinaryFileStager(remote_dataset(False)).stage(tmp_path / "step-0")
+
+    served = local_http_server.root / "grid.nc"
+    served.write_bytes(CONTENT[::-1])
+    os.utime(served, (time.time() + 60, time.time() + 60))
+
+    staged = RemoteBinaryFileStager(remote_dataset(False)).stage(tmp_path / "step-1")
+
+    assert _downloads(local_http_server) == 2  # noqa: PLR2004
+    assert staged.path.read_bytes() == CONTENT[::-1]
+
+
+def test_dataset_cache_disabled(
+    local_http_server: LocalHTTPServer,
+    remote_dataset: Callable[..., SourceData],
+    tmp_path: Path,
+) -> None:
+    """Verify every stage downloads the dataset when the cache is disabled."""
+    with mock.patch.dict(os.environ, {ENV_CSTAR_DATASET_CACHE_MAX_MB: "0"}):
+        for i in range(2):
+            RemoteBinaryFileStager(remote_dataset()).stage(tmp_path / f"step-{i}")
+
+    assert _downloads(local_http_server) == 2  # noqa: PLR2004
+
+
+def test_dataset_cache_concurrent_stages(
+    local_http_server: LocalHTTPServer,
+    remote_dataset: Callable[..., SourceData],
+    tmp_path: Path,
+) -> None:
+    """Verify concurrent stages of the same dataset wait for a single download."""
+    threads = [
+        threading.Thread(
+            target=RemoteBinaryFileStager(remote_dataset()).stage,
+            args=(tmp_path / f"step-{i}",),
+        )
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _downloads(local_http_server) == 1
+    for i in range(4):
+        assert (tmp_path / f"step-{i}" / "grid.nc").read_bytes() == CONTENT
+
+
+def test_dataset_cache_eviction(tmp_path: Path) -> None:
+    """Verify expired and least-recently-used entries are evicted without
+    affecting previously staged copies.
+    """
+    cache = DatasetCache(tmp_path / "cache", max_bytes=10_000, max_age=0)
+    staged = tmp_path / "staged"
+
+    for i, age in enumerate([7200, 60, 30, 0]):
+        path = tmp_path / f"file-{i}.nc"
+        path.write_bytes(b"0" * 1000)
+        cache.store(f"key-{i}", path, path.as_posix())
+        os.utime(cache.root / f"key-{i}", (time.time() - age, time.time() - age))
+
+    assert cache.fetch("key-0", staged / "file-0.nc")
+    os.utime(cache.root / "key-0", (time.time() - 7200, time.time() - 7200))
+
+    cache.max_bytes, cache.max_age = 2500, 3600
+    assert cache.evict() == ["key-0", "key-1"]
+
+    assert (staged / "file-0.nc").read_bytes() == b"0" * 1000
+    assert not cache.fetch("key-0", staged / "file-0.nc")
+    assert cache.fetch("key-2", staged / "file-2.nc")
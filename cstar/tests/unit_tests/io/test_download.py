@@ -0,0 +1,131 @@
+import hashlib
+import os
+from collections.abc import Generator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import requests
+
+from cstar.io.download import Download
+from cstar.tests.unit_tests.helpers import LocalHTTPServer
+
+SIZE: int = 100_000
+"""The size of the served file."""
+
+CONTENT: bytes = bytes(i % 251 for i in range(SIZE))
+"""The content of the served file."""
+
+
+@pytest.fixture(autouse=True)
+def download_settings() -> Generator[None, None, None]:
+    """Retry interrupted downloads immediately and track progress in small chunks."""
+    with (
+        mock.patch("cstar.io.download._RETRY_DELAY", 0),
+        mock.patch("cstar.io.download._CHUNK_SIZE", 10_000),
+    ):
+        yield
+
+
+@pytest.fixture
+def served(local_http_server: LocalHTTPServer) -> str:
+    """Serve the test file and return its URL."""
+    (local_http_server.root / "forcing.nc").write_bytes(CONTENT)
+    return f"{local_http_server.url}/forcing.nc"
+
+
+def _download(url: str, tmp_path: Path, **kwargs: int) -> tuple[Path, str]:
+    target = tmp_path / "out" / "forcing.nc"
+    digest = Download(url, target, min_segment_bytes=10_000, **kwargs).run()
+    return target, digest
+
+
+def test_download_segments(
+    local_http_server: LocalHTTPServer, served: str, tmp_path: Path
+) -> None:
+    """Verify a file is assembled from concurrent range requests."""
+    target, digest = _download(served, tmp_path, segments=4)
+
+    assert target.read_bytes() == CONTENT
+    assert digest == hashlib.sha256(CONTENT).hexdigest()
+    assert sorted(local_http_server.ranges) == [
+        "bytes=0-24999",
+        "bytes=25000-49999",
+        "bytes=50000-74999",
+        "bytes=75000-99999",
+    ]
+    assert sorted(p.name for p in target.parent.iterdir()) == ["forcing.nc"]
+
+
+def test_download_without_range_support(
+    local_http_server: LocalHTTPServer, served: str, tmp_path: Path
+) -> None:
+    """Verify a single stream is used when the server does not support ranges."""
+    local_http_server.accept_ranges = False
+
+    target, digest = _download(served, tmp_path, segments=4)
+
+    assert target.read_bytes() == CONTENT
+    assert digest == hashlib.sha256(CONTENT).hexdigest()
+    assert local_http_server.requests["GET", "/forcing.nc"] == 1
+    assert not local_http_server.ranges
+
+
+def test_download_resumes_dropped_connection(
+    local_http_server: LocalHTTPServer, served: str, tmp_path: Path
+) -> None:
+    """Verify a dropped connection is resumed from the last received byte."""
+    local_http_server.faults = [30_000]
+
+    target, digest = _download(served, tmp_path, segments=1, retries=1)
+
+    assert target.read_bytes() == CONTENT
+    assert digest == hashlib.sha256(CONTENT).hexdigest()
+    assert local_http_server.ranges == ["bytes=0-99999", "bytes=30000-99999"]
+
+
+def test_download_resumes_part_file(
+    local_http_server: LocalHTTPServer, served: str, tmp_path: Path
+) -> None:
+    """Verify a failed download leaves a `.part` file that a later attempt resumes."""
+    local_http_server.faults = [20_000]
+
+    with pytest.raises(requests.RequestException):
+        _download(served, tmp_path, segments=2, retries=0)
+
+    target = tmp_path / "out" / "forcing.nc"
+    assert not target.exists()
+    assert target.with_name("forcing.nc.part").exists()
+    assert target.with_name("forcing.nc.part.json").exists()
+
+    local_http_server.ranges.clear()
+    target, digest = _download(served, tmp_path, segments=2, retries=0)
+
+    assert target.read_bytes() == CONTENT
+    assert digest == hashlib.sha256(CONTENT).hexdigest()
+    # only the remainder of the interrupted segment is requested
+    assert len(local_http_server.ranges) == 1
+    assert local_http_server.ranges[0] in {"bytes=20000-49999", "bytes=70000-99999"}
+
+
+def test_download_restarts_if_remote_changed(
+    local_http_server: LocalHTTPServer, served: str, tmp_path: Path
+) -> None:
+    """Verify a `.part` file is discarded if the remote file has changed."""
+    local_http_server.faults = [5_000]
+
+    with pytest.raises(requests.RequestException):
+        _download(served, tmp_path, segments=1, retries=0)
+
+    changed = CONTENT[::-1]
+    served_path = local_http_server.root / "forcing.nc"
+    served_path.write_bytes(changed)
+    mtime = served_path.stat().st_mtime + 60
+    os.utime(served_path, (mtime, mtime))
+
+    local_http_server.ranges.clear()
+    target, digest = _download(served, tmp_path, segments=1, retries=0)
+
+    assert target.read_bytes() == changed
+    assert digest == hashlib.sha256(changed).hexdigest()
+    assert local_http_server.ranges == ["bytes=0-99999"]
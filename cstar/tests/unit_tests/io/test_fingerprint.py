@@ -0,0 +1,86 @@
+import hashlib
+import os
+from pathlib import Path
+from unittest import mock
+
+from cstar.base.utils import _get_sha256_hash
+from cstar.io.fingerprint import Fingerprint, FingerprintIndex
+from cstar.io.staged_data import StagedFile
+
+
+def _write(path: Path, content: bytes) -> str:
+    """Write a file and return the checksum of its content."""
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_fingerprint_index_skips_unchanged_files(tmp_path: Path) -> None:
+    """Verify a checksum is only computed until the file is recorded in the index."""
+    path = tmp_path / "forcing.nc"
+    expected = _write(path, b"forcing data")
+    hash_fn = mock.Mock(wraps=_get_sha256_hash)
+
+    index = FingerprintIndex(tmp_path / "index.sqlite3")
+    assert index.sha256(path, hash_fn=hash_fn) == expected
+    assert index.sha256(path, hash_fn=hash_fn) == expected
+
+    # a new process re-uses the persisted checksum
+    index = FingerprintIndex(tmp_path / "index.sqlite3")
+    assert index.sha256(path, hash_fn=hash_fn) == expected
+
+    hash_fn.assert_called_once_with(path)
+
+
+def test_fingerprint_index_detects_changes(tmp_path: Path) -> None:
+    """Verify a modified file is rehashed, even if its size is unchanged."""
+    path = tmp_path / "forcing.nc"
+    _write(path, b"version 1")
+
+    index = FingerprintIndex(tmp_path / "index.sqlite3")
+    original = index.sha256(path)
+
+    st = path.stat()
+    expected = _write(path, b"version 2")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+    assert index.sha256(path) == expected != original
+
+
+def test_fingerprint_index_unavailable(tmp_path: Path) -> None:
+    """Verify checksums are computed if the index database cannot be used."""
+    path = tmp_path / "forcing.nc"
+    expected = _write(path, b"forcing data")
+
+    # a directory cannot be opened as a database
+    index = FingerprintIndex(tmp_path)
+    assert index.sha256(path) == expected
+    assert index.get(Fingerprint.of(path)) == expected
+
+
+def test_fingerprint_index_directory_unavailable(tmp_path: Path) -> None:
+    """Verify checksums are computed if the index directory cannot be created."""
+    path = tmp_path / "forcing.nc"
+    expected = _write(path, b"forcing data")
+
+    # a file blocks the creation of the index directory
+    index = FingerprintIndex(path / "cache" / "index.sqlite3")
+    assert index.sha256(path) == expected
+    assert index.get(Fingerprint.of(path)) == expected
+
+
+def test_staged_file_uses_fingerprint_index(tmp_path: Path) -> None:
+    """Verify repeated checks of an unchanged staged file hash it only once."""
+    path = tmp_path / "forcing.nc"
+    sha256 = _write(path, b"forcing data")
+    staged = StagedFile(source=mock.Mock(), path=path, sha256=sha256)
+
+    with mock.patch(
+        "cstar.io.staged_data._get_sha256_hash", wraps=_get_sha256_hash
+    ) as mock_hash:
+        assert not staged.changed_from_source
+        assert not staged.changed_from_source
+
+        _write(path, b"modified data")
+        assert staged.changed_from_source
+
+    assert mock_hash.call_count == 2  # noqa: PLR2004
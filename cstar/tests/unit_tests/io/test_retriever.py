@@ -140,7 +140,11 @@ class TestRemoteBinaryFileRetriever:
         fake_response.iter_content.return_value = [fake_chunk]
         fake_response.raise_for_status = mock.Mock()
 
-        with mock.patch("cstar.io.retriever.requests.get", return_value=fake_response):
+        fake_session = mock.MagicMock()
+        fake_session.head.return_value.headers = {}
+        fake_session.get.return_value = fake_response
+
+        with mock.patch("cstar.io.download.get_session", return_value=fake_session):
             r = retriever.RemoteBinaryFileRetriever(source)
             path = r._save(tmp_path)
 
@@ -161,7 +165,11 @@ class TestRemoteBinaryFileRetriever:
         fake_response.iter_content.return_value = [fake_chunk]
         fake_response.raise_for_status = mock.Mock()
 
-        with mock.patch("cstar.io.retriever.requests.get", return_value=fake_response):
+        fake_session = mock.MagicMock()
+        fake_session.head.return_value.headers = {}
+        fake_session.get.return_value = fake_response
+
+        with mock.patch("cstar.io.download.get_session", return_value=fake_session):
             r = retriever.RemoteBinaryFileRetriever(source=source)
             with pytest.raises(ValueError, match="Hash mismatch"):
                 r._save(tmp_path)
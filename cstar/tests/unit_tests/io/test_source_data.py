@@ -1,8 +1,15 @@
+import os
+import time
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from cstar.base.env import ENV_CSTAR_CLASSIFICATION_TTL_HOURS
+from cstar.io.classification_cache import (
+    ClassificationCache,
+    _get_classification_cache,
+)
 from cstar.io.constants import (
     FileEncoding,
     LocationType,
@@ -357,8 +364,8 @@ class TestSourceInspector:
 
 
 class TestSourceData:
-    def test_init_sets_attributes_and_classification(self):
-        """Tests that SourceData.__init__ assigns attributes and calls `classify()``"""
+    def test_init_sets_attributes_and_defers_classification(self):
+        """Tests that SourceData.__init__ assigns attributes and defers `classify()` to first use"""
         # Arrange
         fake_location = "http://example.com/file.txt"
         fake_identifier = "abc123"
@@ -372,14 +379,96 @@ class TestSourceData:
             # Act
             src = SourceData(location=fake_location, identifier=fake_identifier)
 
-        assert src.location == fake_location
-        assert src.identifier == fake_identifier
-        assert src._classification == fake_classification
+            assert src.location == fake_location
+            assert src.identifier == fake_identifier
+            mock_inspector.assert_not_called()
+
+            assert src.classification == fake_classification
+            assert src.classification == fake_classification
 
-        # Also check inspector was called with the right location
+        # Also check inspector was called once with the right location
         mock_inspector.assert_called_once_with(fake_location)
         mock_instance.classify.assert_called_once()
 
+    def test_remote_classification_is_cached(self):
+        """Tests that remote locations are only inspected once across SourceData instances."""
+        fake_location = "http://example.com/file.nc"
+
+        with mock.patch.object(
+            _SourceInspector,
+            "classify",
+            return_value=SourceClassification.REMOTE_BINARY_FILE,
+        ) as mock_classify:
+            first = SourceData(location=fake_location).classification
+            # clear the in-process memo to simulate a new process
+            _get_classification_cache.cache_clear()
+            second = SourceData(location=fake_location).classification
+
+        assert first == second == SourceClassification.REMOTE_BINARY_FILE
+        mock_classify.assert_called_once()
+
+    def test_remote_classification_cache_unavailable(self, tmp_path: Path):
+        """Tests that remote locations are classified if the cache directory cannot
+        be created.
+        """
+        fake_location = "http://example.com/file.nc"
+        # a file blocks the creation of the cache directory
+        blocker = tmp_path / "cache"
+        blocker.touch()
+        cache = ClassificationCache(blocker / "classifications.sqlite3")
+
+        with (
+            mock.patch.object(
+                _SourceInspector,
+                "classify",
+                return_value=SourceClassification.REMOTE_BINARY_FILE,
+            ),
+            mock.patch(
+                "cstar.io.source_data.get_classification_cache", return_value=cache
+            ),
+        ):
+            classification = SourceData(location=fake_location).classification
+
+        assert classification == SourceClassification.REMOTE_BINARY_FILE
+        assert cache.get(fake_location) == SourceClassification.REMOTE_BINARY_FILE
+
+    def test_remote_classification_cache_expires(self):
+        """Tests that a cached classification is not used after its TTL."""
+        fake_location = "http://example.com/file.nc"
+
+        with mock.patch.object(
+            _SourceInspector,
+            "classify",
+            return_value=SourceClassification.REMOTE_BINARY_FILE,
+        ) as mock_classify:
+            _ = SourceData(location=fake_location).classification
+            with mock.patch(
+                "cstar.io.classification_cache.time.time",
+                return_value=time.time() + 25 * 60 * 60,
+            ):
+                _ = SourceData(location=fake_location).classification
+
+            with mock.patch.dict(os.environ, {ENV_CSTAR_CLASSIFICATION_TTL_HOURS: "0"}):
+                _ = SourceData(location=fake_location).classification
+
+        assert mock_classify.call_count == 3
+
+    def test_local_classification_is_not_cached(self, tmp_path):
+        """Tests that local paths are inspected every time, as they may change."""
+        file_path = tmp_path / "file.nc"
+        file_path.write_bytes(b"\x89HDF\r\n\x1a\n" + bytes(range(256)))
+
+        assert SourceData(file_path).classification == (
+            SourceClassification.LOCAL_BINARY_FILE
+        )
+
+        file_path.unlink()
+        file_path.mkdir()
+
+        assert SourceData(file_path).classification == (
+            SourceClassification.LOCAL_DIRECTORY
+        )
+
     @pytest.mark.parametrize(
         "classification, expected_file_hash, expected_checkout_target",
         [
@@ -479,6 +568,19 @@ class TestSourceDataCollection:
         with pytest.raises(TypeError):
             SourceDataCollection([bad])
 
+    def test_unclassified_invalid_source_raises_on_stage(self, tmp_path):
+        """Tests that unclassified sources are validated when the collection is staged."""
+        with mock.patch.object(
+            _SourceInspector,
+            "classify",
+            return_value=SourceClassification.REMOTE_REPOSITORY,
+        ) as mock_classify:
+            coll = SourceDataCollection([SourceData("http://example.com/repo")])
+            mock_classify.assert_not_called()
+
+            with pytest.raises(TypeError):
+                coll.stage(tmp_path)
+
     def test_append_and_locations(
         self, mock_sourcedatacollection, mocksourcedata_factory
     ):
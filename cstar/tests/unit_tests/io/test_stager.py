@@ -174,15 +174,17 @@ class TestStagerSubclasses:
         tmp_path: Path,
         mocksourcedata_remote_repo: SourceDataFactory,
     ) -> None:
-        """Tests that CachedRemoteRepositoryStager.stage caches the retrieved repository
-        in the correct path.
+        """Tests that CachedRemoteRepositoryStager.stage mirrors the repository
+        in the correct path and clones the target from the mirror.
         """
         source = mocksourcedata_remote_repo()
         repo_name = "repo"
         fake_path = tmp_path / repo_name
-        fake_cache_path = tmp_path / "cache" / repo_name
+        fake_cache_path = tmp_path / "cache" / f"{repo_name}.git"
         fake_retriever = mock.Mock()
-        fake_retriever.save.return_value = fake_cache_path
+
+        def fake_clone_mirror(location: str, path: Path) -> None:
+            path.mkdir(parents=True)
 
         with (
             mock.patch.object(
@@ -191,47 +193,53 @@ class TestStagerSubclasses:
                 new_callable=mock.PropertyMock,
             ) as mock_ret,
             mock.patch("cstar.io.stager.StagedRepository") as mock_staged_repo,
-            mock.patch("cstar.io.stager._run_cmd") as mock_run_cmd,
+            mock.patch(
+                "cstar.io.stager._clone_mirror", side_effect=fake_clone_mirror
+            ) as mock_clone_mirror,
+            mock.patch("cstar.io.stager._clone_local") as mock_clone_local,
             mock.patch(
                 "cstar.io.stager.CachedRemoteRepositoryStager._get_cache_path",
             ) as mock_get_cache_path,
         ):
             mock_get_cache_path.return_value = fake_cache_path
-            mock_run_cmd.return_value = ""
             mock_ret.return_value = fake_retriever
             s = stager.CachedRemoteRepositoryStager(source)
 
             result = s.stage(fake_path)
 
-        # confirm repo is put into cache
-        fake_retriever.save.assert_called_once_with(target_dir=fake_cache_path)
+        # confirm the mirror is created in the cache
+        mock_clone_mirror.assert_called_once()
+        assert mock_clone_mirror.call_args.args[0] == source.location
+        assert fake_cache_path.is_dir()
 
-        # confirm the content is copied from the cache to the target
-        mock_run_cmd.assert_called_once_with(f"cp -av {fake_cache_path}/ {fake_path}")
+        # confirm the target is cloned from the mirror
+        mock_clone_local.assert_called_once_with(
+            fake_cache_path, source.location, fake_path
+        )
+        fake_retriever.checkout.assert_called_once_with(target_dir=fake_path)
 
         # confirm the result is a new path and the cached location is not leaked
         mock_staged_repo.assert_called_once_with(source=source, path=fake_path)
         assert result is mock_staged_repo.return_value
 
+    @pytest.mark.parametrize("has_commit", [True, False])
     def test_cached_remote_repository_stager_reads_from_cache(
         self,
         tmp_path: Path,
         mocksourcedata_remote_repo: SourceDataFactory,
+        has_commit: bool,
     ) -> None:
-        """Tests that CachedRemoteRepositoryStager.stage returns fresh content from
-        the cache if the remote repository has been previously staged.
+        """Tests that CachedRemoteRepositoryStager.stage re-uses an existing mirror,
+        fetching it only if the requested commit is missing.
         """
         source = mocksourcedata_remote_repo()
         repo_name = "repo"
         fake_path = tmp_path / repo_name
 
-        fake_cache_path = tmp_path / "cache" / repo_name
+        fake_cache_path = tmp_path / "cache" / f"{repo_name}.git"
         fake_cache_path.mkdir(parents=True, exist_ok=False)
-        fake_content_path = fake_cache_path / "foo.txt"
-        fake_content_path.touch()  # trick stager into believing content is cached.
 
         fake_retriever = mock.Mock()
-        fake_retriever.save.return_value = fake_cache_path
 
         with (
             mock.patch.object(
@@ -239,24 +247,38 @@ class TestStagerSubclasses:
                 "retriever",
                 new_callable=mock.PropertyMock,
             ) as mock_ret,
+            mock.patch.object(
+                type(source),
+                "checkout_hash",
+                new_callable=mock.PropertyMock,
+                return_value="abc123",
+            ),
             mock.patch("cstar.io.stager.StagedRepository"),  # avoid validation
-            mock.patch("cstar.io.stager._run_cmd") as mock_run_cmd,
+            mock.patch("cstar.io.stager._clone_mirror") as mock_clone_mirror,
+            mock.patch("cstar.io.stager._clone_local") as mock_clone_local,
+            mock.patch("cstar.io.stager._fetch_mirror") as mock_fetch_mirror,
+            mock.patch(
+                "cstar.io.stager._has_commit", return_value=has_commit
+            ) as mock_has_commit,
             mock.patch(
                 "cstar.io.stager.CachedRemoteRepositoryStager._get_cache_path",
             ) as mock_get_cache_path,
         ):
             mock_get_cache_path.return_value = fake_cache_path
-            mock_run_cmd.return_value = ""
             mock_ret.return_value = fake_retriever
             s = stager.CachedRemoteRepositoryStager(source)
 
             _ = s.stage(fake_path)
 
-        # confirm repo is not retrieved
-        fake_retriever.save.assert_not_called()
+        # confirm repo is not mirrored again
+        mock_clone_mirror.assert_not_called()
 
-        # confirm cached repo is updated with latest changes
-        fake_retriever.refresh.assert_called_once_with(target_dir=fake_cache_path)
+        # confirm the mirror is only fetched if the commit is missing
+        mock_has_commit.assert_called_once_with(fake_cache_path, "abc123")
+        assert mock_fetch_mirror.called is not has_commit
 
-        # confirm the correct hash/branch is checked out from the copy (not cache)
+        # confirm the correct hash/branch is checked out from the clone (not cache)
+        mock_clone_local.assert_called_once_with(
+            fake_cache_path, source.location, fake_path
+        )
         fake_retriever.checkout.assert_called_once_with(target_dir=fake_path)
@@ -5,6 +5,7 @@ import unittest.mock as mock
 
 import pytest
 
+from cstar.base.build_tools import build_jobs
 from cstar.marbl.external_codebase import MARBLExternalCodeBase
 from cstar.system.manager import get_sysmgr
 
@@ -80,7 +81,7 @@ class TestMARBLExternalCodeBaseConfigure:
         cstar_sysmgr = get_sysmgr()
 
         mock_run_cmd.assert_called_once_with(
-            f"make {cstar_sysmgr.environment.compiler} USEMPI=TRUE",
+            f"make -j{build_jobs()} {cstar_sysmgr.environment.compiler} USEMPI=TRUE",
             cwd=marbl_path / "src",
             msg_pre="Compiling MARBL...",
             msg_post=f"MARBL successfully installed at {marbl_path}",
@@ -380,7 +380,7 @@ async def test_run_composed_dag(
         )
         serialize(tweak_path, wp)
 
-        summary = await build_and_run_dag(tweak_path, run_id, working_dir)
+        summary = await build_and_run_dag(tweak_path, run_id)
         wp_path = summary.final_workplan
 
     wp = deserialize(wp_path, Workplan)
@@ -0,0 +1,217 @@
+import asyncio
+import datetime
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.orchestration.launch.admission import (
+    LocalResourceScheduler,
+    ResourceRequest,
+)
+from cstar.orchestration.launch.local import LocalHandle, LocalLauncher
+from cstar.orchestration.orchestration import LiveStep, Status
+
+
+class FakeProcess:
+    """A stand-in for `subprocess.Popen` whose exit is controlled by the test."""
+
+    def __init__(self) -> None:
+        self.returncode: int | None = None
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def finish(self, returncode: int = 0) -> None:
+        self.returncode = returncode
+
+
+async def _settle() -> None:
+    """Let pending admissions propagate to their waiting coroutines."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_admits_within_cpu_budget() -> None:
+    """Verify steps are admitted while they fit and the rest are queued in order."""
+    scheduler = LocalResourceScheduler(max_cpus=32, max_memory_mb=1024)
+    waits = [
+        asyncio.create_task(scheduler.acquire(ResourceRequest(f"s-{i}", 8)))
+        for i in range(5)
+    ]
+    await _settle()
+
+    occupancy = scheduler.occupancy()
+    assert occupancy.running == ("s-0", "s-1", "s-2", "s-3")
+    assert occupancy.queued == ("s-4",)
+    assert occupancy.cpus_in_use == 32  # noqa: PLR2004
+    assert not waits[4].done()
+
+    scheduler.release("s-1")
+    await asyncio.wait_for(waits[4], timeout=1)
+    assert scheduler.occupancy().running == ("s-0", "s-2", "s-3", "s-4")
+
+
+async def test_backfills_leftover_capacity() -> None:
+    """Verify a smaller, later step runs in capacity a larger step cannot use."""
+    scheduler = LocalResourceScheduler(max_cpus=32, max_memory_mb=1024)
+    large = asyncio.create_task(scheduler.acquire(ResourceRequest("large", 24)))
+    medium = asyncio.create_task(scheduler.acquire(ResourceRequest("medium", 16)))
+    small = asyncio.create_task(scheduler.acquire(ResourceRequest("small", 8)))
+    await _settle()
+
+    assert large.done()
+    assert small.done()
+    assert scheduler.occupancy().queued == ("medium",)
+
+    scheduler.release("large")
+    await asyncio.wait_for(medium, timeout=1)
+    assert scheduler.occupancy().running == ("small", "medium")
+
+
+async def test_starved_step_blocks_backfill() -> None:
+    """Verify a step overtaken `max_bypass` times reserves capacity for itself."""
+    scheduler = LocalResourceScheduler(max_cpus=32, max_memory_mb=1024, max_bypass=1)
+    await scheduler.acquire(ResourceRequest("a", 24))
+
+    large = asyncio.create_task(scheduler.acquire(ResourceRequest("large", 16)))
+    await _settle()
+    await scheduler.acquire(ResourceRequest("b", 8))  # backfilled past `large`
+    scheduler.release("b")
+
+    late = asyncio.create_task(scheduler.acquire(ResourceRequest("late", 8)))
+    await _settle()
+    # `late` fits, but `large` has already been overtaken once
+    assert scheduler.occupancy().queued == ("large", "late")
+
+    scheduler.release("a")
+    await asyncio.wait_for(asyncio.gather(large, late), timeout=1)
+    assert scheduler.occupancy().running == ("large", "late")
+
+
+async def test_memory_hint_limits_admission() -> None:
+    """Verify the memory hint of a step is part of the budget."""
+    scheduler = LocalResourceScheduler(max_cpus=32, max_memory_mb=1000)
+    await scheduler.acquire(ResourceRequest("a", 1, memory_mb=600))
+    second = asyncio.create_task(scheduler.acquire(ResourceRequest("b", 1, 600)))
+    await _settle()
+
+    assert not second.done()
+    assert scheduler.occupancy().memory_in_use_mb == 600  # noqa: PLR2004
+
+    scheduler.release("a")
+    await asyncio.wait_for(second, timeout=1)
+
+
+async def test_oversized_step_runs_alone(caplog: pytest.LogCaptureFixture) -> None:
+    """Verify a step larger than the budget is admitted once the machine is idle."""
+    scheduler = LocalResourceScheduler(max_cpus=8, max_memory_mb=1024)
+    await scheduler.acquire(ResourceRequest("small", 2))
+    oversized = asyncio.create_task(scheduler.acquire(ResourceRequest("big", 64)))
+    await _settle()
+
+    assert not oversized.done()
+    assert "exceeding the local budget" in caplog.text
+
+    scheduler.release("small")
+    await asyncio.wait_for(oversized, timeout=1)
+    assert scheduler.occupancy().cpus_in_use == 8  # noqa: PLR2004
+
+
+async def test_reclaims_cpus_of_finished_processes() -> None:
+    """Verify the resources of an attached process are reclaimed once it exits."""
+    scheduler = LocalResourceScheduler(
+        max_cpus=8, max_memory_mb=1024, poll_interval=0.01
+    )
+    process = FakeProcess()
+    await scheduler.acquire(ResourceRequest("first", 8))
+    scheduler.attach("first", lambda: process.poll() is not None)
+
+    second = asyncio.create_task(scheduler.acquire(ResourceRequest("second", 8)))
+    await asyncio.sleep(0.05)
+    assert not second.done()
+
+    process.finish()
+    await asyncio.wait_for(second, timeout=1)
+    assert scheduler.occupancy().running == ("second",)
+
+
+async def test_cancelled_waiter_leaves_queue() -> None:
+    """Verify a cancelled request is removed from the queue."""
+    scheduler = LocalResourceScheduler(max_cpus=8, max_memory_mb=1024)
+    await scheduler.acquire(ResourceRequest("first", 8))
+    waiting = asyncio.create_task(scheduler.acquire(ResourceRequest("second", 8)))
+    await _settle()
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert scheduler.occupancy().queued == ()
+    scheduler.release("first")
+    assert scheduler.occupancy().running == ()
+
+
+async def test_launcher_does_not_oversubscribe(tmp_path: Path) -> None:
+    """Verify the local launcher only starts steps that fit the CPU budget, and
+    starts queued steps as earlier ones finish.
+    """
+    scheduler = LocalResourceScheduler(
+        max_cpus=16, max_memory_mb=1024, poll_interval=0.01
+    )
+    processes: dict[str, FakeProcess] = {}
+    peak_cpus: list[int] = []
+
+    async def fake_submit(step: LiveStep, _deps: list[LocalHandle]) -> LocalHandle:
+        peak_cpus.append(scheduler.cpus_in_use)
+        processes[step.name] = FakeProcess()
+        handle = LocalHandle(
+            pid=str(len(processes)),
+            name=step.name,
+            run_id="run",
+            start_at=datetime.datetime.now(tz=datetime.UTC),
+            status=Status.Submitted,
+        )
+        handle.process = processes[step.name]  # type: ignore[assignment]
+        return handle
+
+    steps = [
+        LiveStep(
+            name=f"roms-{i}",
+            application="sleep",
+            blueprint="blueprint.yaml",
+            working_dir=tmp_path / f"roms-{i}",
+        )
+        for i in range(6)
+    ]
+
+    with (
+        mock.patch(
+            "cstar.orchestration.launch.local.get_local_scheduler",
+            return_value=scheduler,
+        ),
+        mock.patch.object(LocalLauncher, "_submit", side_effect=fake_submit),
+        mock.patch.object(
+            LocalLauncher,
+            "resource_request",
+            side_effect=lambda step: ResourceRequest(step.name, 8),
+        ),
+        mock.patch.object(LocalLauncher, "use_proxy", False),
+    ):
+        launches = [asyncio.create_task(LocalLauncher.launch(s, [])) for s in steps]
+        await asyncio.sleep(0.05)
+
+        assert set(processes) == {"roms-0", "roms-1"}
+        assert LocalLauncher.occupancy().queued == tuple(
+            f"roms-{i}" for i in range(2, 6)
+        )
+
+        # finish steps in order; each completion admits exactly one queued step
+        for i in range(6):
+            processes[f"roms-{i}"].finish()
+            await asyncio.sleep(0.05)
+
+        tasks = await asyncio.wait_for(asyncio.gather(*launches), timeout=1)
+
+    assert [t.step.name for t in tasks] == [s.name for s in steps]
+    assert max(peak_cpus) <= 16  # noqa: PLR2004
@@ -0,0 +1,122 @@
+import asyncio
+import datetime
+import subprocess
+import time
+from pathlib import Path
+from unittest import mock
+
+from cstar.orchestration.launch.admission import (
+    LocalResourceScheduler,
+    ResourceRequest,
+)
+from cstar.orchestration.launch.local import LocalHandle, LocalLauncher, wait_for_exit
+from cstar.orchestration.orchestration import LiveStep, Status
+
+
+def _start(name: str, cmd: list[str]) -> LocalHandle:
+    """Start a process and return a handle for it."""
+    process = subprocess.Popen(cmd)
+    handle = LocalHandle(
+        pid=str(process.pid),
+        name=name,
+        run_id="run",
+        start_at=datetime.datetime.now(tz=datetime.UTC),
+        status=Status.Submitted,
+    )
+    handle.process = process
+    return handle
+
+
+async def test_wait_for_exit_reaps_process() -> None:
+    """Verify waiting for a process returns its return code and reaps it."""
+    process = subprocess.Popen(["sh", "-c", "sleep 0.1; exit 3"])  # noqa: ASYNC220
+
+    rc = await asyncio.wait_for(wait_for_exit(process), timeout=5)
+
+    assert rc == 3  # noqa: PLR2004
+    assert process.returncode == 3  # noqa: PLR2004
+
+
+async def test_wait_for_exit_without_pidfd() -> None:
+    """Verify a process is polled when it cannot be watched with a pidfd."""
+    process = subprocess.Popen(["sleep", "0.1"])  # noqa: ASYNC220
+
+    with mock.patch(
+        "cstar.orchestration.launch.local.os.pidfd_open", side_effect=OSError
+    ):
+        rc = await asyncio.wait_for(wait_for_exit(process), timeout=5)
+
+    assert rc == 0
+
+
+async def test_status_reflects_exit_without_polling_loop() -> None:
+    """Verify the status of a handle is updated once its watch completes."""
+    handle = _start("failing", ["sh", "-c", "exit 1"])
+
+    await asyncio.wait_for(handle.watch_exit(), timeout=5)
+
+    assert handle.watch_exit() is handle.watch_exit()
+    assert await LocalLauncher.query_status(handle) == Status.Failed
+
+
+async def test_dependent_launches_when_dependency_exits(tmp_path: Path) -> None:
+    """Verify a dependent step is submitted as soon as its dependency exits, and
+    that the exit of a launched process wakes a waiting orchestrator.
+    """
+    dependency = _start("dependency", ["sleep", "0.2"])
+    submitted_at: list[float] = []
+
+    async def fake_submit(step: LiveStep, _deps: list[LocalHandle]) -> LocalHandle:
+        submitted_at.append(time.monotonic())
+        return _start(step.name, ["true"])
+
+    step = LiveStep(
+        name="dependent",
+        application="sleep",
+        blueprint="blueprint.yaml",
+        working_dir=tmp_path / "dependent",
+    )
+
+    with (
+        mock.patch(
+            "cstar.orchestration.launch.local.get_local_scheduler",
+            return_value=LocalResourceScheduler(max_cpus=8, max_memory_mb=1024),
+        ),
+        mock.patch.object(LocalLauncher, "_submit", side_effect=fake_submit),
+        mock.patch.object(
+            LocalLauncher,
+            "resource_request",
+            side_effect=lambda step: ResourceRequest(step.name, 1),
+        ),
+        mock.patch.object(LocalLauncher, "use_proxy", False),
+    ):
+        t0 = time.monotonic()
+        task = await asyncio.wait_for(
+            LocalLauncher.launch(step, [dependency]), timeout=5
+        )
+
+        assert dependency.process.returncode == 0
+        # well under the one second polling interval of handles that can't be watched
+        assert submitted_at[0] - t0 < 0.9  # noqa: PLR2004
+
+        assert await LocalLauncher.wait_for_update(timeout=5)
+        assert not await LocalLauncher.wait_for_update(timeout=0.05)
+        assert await LocalLauncher.query_status(task) == Status.Done
+
+
+async def test_wait_for_any_exit_ignores_exited_processes() -> None:
+    """Verify waiting on a mix of exited and running dependencies blocks until
+    a running dependency exits instead of returning immediately.
+    """
+    exited = _start("exited", ["true"])
+    running = _start("running", ["sleep", "0.5"])
+    await asyncio.wait_for(exited.watch_exit(), timeout=5)
+
+    iterations = 0
+    while running.process.poll() is None:
+        await asyncio.wait_for(
+            LocalLauncher._wait_for_any_exit([exited, running]), timeout=5
+        )
+        iterations += 1
+
+    assert iterations == 1
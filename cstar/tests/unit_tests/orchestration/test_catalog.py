@@ -0,0 +1,163 @@
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.env import ENV_CSTAR_RUNID, FLAG_ON
+from cstar.base.feature import ENV_FF_ORCH_RUN_CATALOG
+from cstar.execution.file_system import StateDirectoryManager
+from cstar.orchestration.catalog import get_run_catalog
+from cstar.orchestration.launch.local import LocalHandle
+from cstar.orchestration.orchestration import Status
+from cstar.orchestration.serialization import serialize
+from cstar.orchestration.state import StateRepository
+from cstar.orchestration.tracking import TrackingRepository, WorkplanRun
+
+
+def _run(tmp_path: Path, run_id: str, offset: int) -> WorkplanRun:
+    """Create a run record with a unique start time."""
+    return WorkplanRun(
+        workplan_path=tmp_path / f"{run_id}.yaml",
+        trx_workplan_path=tmp_path / f"{run_id}-trx.yaml",
+        output_path=tmp_path / "output",
+        run_id=run_id,
+        start_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=offset),
+    )
+
+
+async def _put_runs(tmp_path: Path) -> TrackingRepository:
+    """Persist two runs of `alpha-run` and one run of `beta-run`."""
+    repo = TrackingRepository()
+    for offset, run_id in enumerate(["alpha-run", "beta-run", "alpha-run"]):
+        await repo.put_workplan_run(_run(tmp_path, run_id, offset))
+    return repo
+
+
+def test_catalog_disabled_by_default() -> None:
+    """Verify the catalog is only used when the feature is enabled."""
+    assert get_run_catalog() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("build_catalog_first", [True, False])
+async def test_catalog_list_runs(tmp_path: Path, build_catalog_first: bool) -> None:
+    """Verify run listings from the catalog match the persisted records.
+
+    The catalog is populated by the repository or rebuilt from existing
+    records when it is first used.
+    """
+    flag = {ENV_FF_ORCH_RUN_CATALOG: FLAG_ON}
+
+    if build_catalog_first:
+        with mock.patch.dict(os.environ, flag):
+            repo = await _put_runs(tmp_path)
+    else:
+        repo = await _put_runs(tmp_path)
+        assert not StateDirectoryManager.catalog_path().exists()
+
+    with mock.patch.dict(os.environ, flag):
+        latest = await repo.list_latest_runs("")
+        history = await repo.list_history_runs("alpha")
+
+    assert StateDirectoryManager.catalog_path().exists()
+    assert {r.run_id: r.start_at.minute for r in latest} == {
+        "alpha-run": 2,
+        "beta-run": 1,
+    }
+    assert [r.start_at.minute for r in history] == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_catalog_rebuilt_when_stale(tmp_path: Path) -> None:
+    """Verify runs persisted while indexing was disabled are added to an
+    existing catalog.
+    """
+    flag = {ENV_FF_ORCH_RUN_CATALOG: FLAG_ON}
+
+    with mock.patch.dict(os.environ, flag):
+        repo = await _put_runs(tmp_path)
+
+    await repo.put_workplan_run(_run(tmp_path, "gamma-run", 3))
+    await repo.put_workplan_run(_run(tmp_path, "alpha-run", 4))
+
+    with mock.patch.dict(os.environ, flag):
+        latest = await repo.list_latest_runs("")
+        history = await repo.list_history_runs("alpha")
+
+        with mock.patch.object(repo, "rebuild_catalog") as mock_rebuild:
+            await repo.list_latest_runs("")
+
+    mock_rebuild.assert_not_called()
+    assert {r.run_id: r.start_at.minute for r in latest} == {
+        "alpha-run": 4,
+        "beta-run": 1,
+        "gamma-run": 3,
+    }
+    assert [r.start_at.minute for r in history] == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_catalog_not_rebuilt_when_current(tmp_path: Path) -> None:
+    """Verify runs persisted while indexing is enabled keep the catalog current."""
+    with mock.patch.dict(os.environ, {ENV_FF_ORCH_RUN_CATALOG: FLAG_ON}):
+        repo = await _put_runs(tmp_path)
+
+        with mock.patch.object(repo, "rebuild_catalog") as mock_rebuild:
+            await repo.put_workplan_run(_run(tmp_path, "beta-run", 3))
+            latest = await repo.list_latest_runs("")
+
+    mock_rebuild.assert_not_called()
+    assert {r.run_id: r.start_at.minute for r in latest} == {
+        "alpha-run": 2,
+        "beta-run": 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_catalog_discards_removed_runs(tmp_path: Path) -> None:
+    """Verify runs whose records were removed are not returned by the catalog."""
+    with mock.patch.dict(os.environ, {ENV_FF_ORCH_RUN_CATALOG: FLAG_ON}):
+        repo = await _put_runs(tmp_path)
+
+        for path in repo.list_runtracking_paths("beta-run", all_history=True):
+            path.unlink()
+
+        latest = await repo.list_latest_runs("")
+        history = await repo.list_history_runs("")
+
+    assert [r.run_id for r in latest] == ["alpha-run"]
+    assert [r.run_id for r in history] == ["alpha-run", "alpha-run"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_list_sentinels() -> None:
+    """Verify sentinels are loaded from the catalog until the file is modified."""
+    env = {ENV_FF_ORCH_RUN_CATALOG: FLAG_ON, ENV_CSTAR_RUNID: "test-catalog-run"}
+
+    with mock.patch.dict(os.environ, env):
+        repo = StateRepository(journaled=False)
+        handle = LocalHandle(
+            pid="1001",
+            name="step-a",
+            run_id="test-catalog-run",
+            start_at=datetime.now(),
+            status=Status.Running,
+        )
+        path = await repo.put_sentinel(handle)
+        assert path
+
+        with mock.patch("cstar.orchestration.state.deserialize") as mock_load:
+            handles = await repo.list_sentinels(LocalHandle)
+
+        mock_load.assert_not_called()
+        assert [h.status for h in handles] == [Status.Running]
+
+        # simulate an update made outside of the repository (e.g. a job proxy)
+        handle.status = Status.Done
+        serialize(path, handle)
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+
+        handles = await repo.list_sentinels(LocalHandle)
+        assert [h.status for h in handles] == [Status.Done]
@@ -0,0 +1,95 @@
+import os
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.env import ENV_CSTAR_RUNID
+from cstar.orchestration.engine import engine_flow, get_engine
+from cstar.orchestration.launch.slurm import SlurmHandle, SlurmLauncher
+from cstar.orchestration.ledger import SubmissionLedger
+from cstar.orchestration.orchestration import LiveStep
+from cstar.orchestration.utils import (
+    ENV_CSTAR_ORCH_ENGINE,
+    ORCH_ENGINE_NATIVE,
+    ORCH_ENGINE_PREFECT,
+)
+
+
+@pytest.fixture
+def native_engine() -> Generator[None]:
+    """Select the native orchestration engine for a test."""
+    env = {ENV_CSTAR_ORCH_ENGINE: ORCH_ENGINE_NATIVE, ENV_CSTAR_RUNID: "test-run"}
+    with mock.patch.dict(os.environ, env):
+        yield
+
+
+def _step(tmp_path: Path, name: str = "step-a") -> LiveStep:
+    return LiveStep(
+        name=name,
+        application="sleep",
+        blueprint="blueprint.yaml",
+        working_dir=tmp_path / name,
+    )
+
+
+def test_get_engine_rejects_unknown_engine() -> None:
+    """Verify an unknown engine is reported with the valid options."""
+    assert get_engine() == ORCH_ENGINE_PREFECT
+
+    with (
+        mock.patch.dict(os.environ, {ENV_CSTAR_ORCH_ENGINE: "airflow"}),
+        pytest.raises(ValueError, match="Unknown orchestration engine"),
+    ):
+        get_engine()
+
+
+@pytest.mark.usefixtures("native_engine")
+async def test_engine_flow_runs_natively_without_prefect() -> None:
+    """Verify a flow runs as a plain coroutine with the native engine."""
+
+    @engine_flow
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    with mock.patch.dict(sys.modules, {"prefect": None}):
+        # importing prefect would raise an ImportError
+        assert await add(1, b=2) == 3  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("native_engine")
+async def test_ledger_round_trip() -> None:
+    """Verify a recorded handle is returned for the same run and step only."""
+    handle = SlurmHandle(pid="1234", name="step a", run_id="test-run")
+    path = await SubmissionLedger().put("step a", handle)
+
+    assert path.parent == SubmissionLedger("test-run").root_dir
+    assert await SubmissionLedger().get("step a", SlurmHandle) == handle
+    assert await SubmissionLedger().get("step b", SlurmHandle) is None
+    assert await SubmissionLedger("other-run").get("step a", SlurmHandle) is None
+
+
+@pytest.mark.usefixtures("native_engine")
+async def test_slurm_submission_is_idempotent(tmp_path: Path) -> None:
+    """Verify a step is submitted once per run unless a refresh is requested."""
+    step = _step(tmp_path)
+    job_ids = iter(["1001", "1002"])
+
+    async def fake_submit(step: LiveStep, _deps: list[SlurmHandle]) -> SlurmHandle:
+        return SlurmHandle(pid=next(job_ids), name=step.name, run_id="test-run")
+
+    with mock.patch.object(SlurmLauncher, "_submit", side_effect=fake_submit) as sub:
+        first = await SlurmLauncher._submit_once(step, [])
+        again = await SlurmLauncher._submit_once(step, [])
+        assert sub.call_count == 1
+        assert again == first
+
+        refreshed = await SlurmLauncher._submit_once(step, [], refresh=True)
+        assert sub.call_count == 2  # noqa: PLR2004
+        assert refreshed.pid == "1002"
+
+        # the refreshed submission replaces the recorded one
+        assert await SlurmLauncher._submit_once(step, []) == refreshed
+        assert sub.call_count == 2  # noqa: PLR2004
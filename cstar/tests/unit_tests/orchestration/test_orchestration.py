@@ -282,6 +282,70 @@ async def test_orchestrator_multi_entrypoint_open_closed_lists(
     assert encountered == set(closed_set), "The orchestrator didn't close all tasks"
 
 
+@pytest.mark.parametrize(
+    "mode",
+    [
+        RunMode.Schedule,
+        RunMode.Monitor,
+    ],
+)
+def test_orchestrator_ready_set_transitions(
+    mode: RunMode, diamond_workplan: Workplan
+) -> None:
+    """Verify the open and closed nodes track status transitions incrementally."""
+    planner = Planner(workplan=diamond_workplan)
+    orchestrator = Orchestrator(planner, LocalLauncher())
+
+    assert orchestrator.get_open_nodes(mode=mode) == {"d-00": Status.Unsubmitted}
+    assert not orchestrator.get_closed_nodes(mode=mode)
+
+    revision = orchestrator.revision
+    planner.store("d-00", KEY_STATUS, Status.Running)
+    assert orchestrator.revision == revision + 1
+
+    if mode == RunMode.Schedule:
+        # a running node is closed and unblocks its dependents when scheduling
+        assert set(orchestrator.get_open_nodes(mode=mode) or {}) == {"d-01", "d-02"}
+        assert set(orchestrator.get_closed_nodes(mode=mode)) == {"d-00"}
+    else:
+        assert set(orchestrator.get_open_nodes(mode=mode) or {}) == {"d-00"}
+        assert not orchestrator.get_closed_nodes(mode=mode)
+
+    planner.store("d-00", KEY_STATUS, Status.Done)
+    planner.store("d-01", KEY_STATUS, Status.Done)
+    assert set(orchestrator.get_open_nodes(mode=mode) or {}) == {"d-02"}
+
+    planner.store("d-02", KEY_STATUS, Status.Done)
+    assert set(orchestrator.get_open_nodes(mode=mode) or {}) == {"d-03"}
+
+    planner.store("d-03", KEY_STATUS, Status.Done)
+    assert orchestrator.get_open_nodes(mode=mode) is None
+    assert set(orchestrator.get_closed_nodes(mode=mode)) == {
+        "d-00",
+        "d-01",
+        "d-02",
+        "d-03",
+    }
+
+
+def test_orchestrator_ready_set_failure(diamond_workplan: Workplan) -> None:
+    """Verify a failed node stops traversal and an unchanged status is ignored."""
+    planner = Planner(workplan=diamond_workplan)
+    orchestrator = Orchestrator(planner, LocalLauncher())
+    assert orchestrator.get_open_nodes(mode=RunMode.Monitor)
+
+    planner.store("d-00", KEY_STATUS, Status.Done)
+    revision = orchestrator.revision
+    planner.store("d-00", KEY_STATUS, Status.Done)
+    assert orchestrator.revision == revision
+
+    planner.store("d-01", KEY_STATUS, Status.Failed)
+    assert orchestrator.get_open_nodes(mode=RunMode.Monitor) is None
+
+    # a ready set created after the failure is initialized from the planner
+    assert orchestrator.get_open_nodes(mode=RunMode.Schedule) is None
+
+
 def test_dep_keys(tmp_path: Path) -> None:
     """Verify the orchestrator fails gracefully when dependencies are
     mismatched to step names.
@@ -1,25 +1,34 @@
+import os
 import textwrap
 import typing as t
 import uuid
 from collections.abc import Callable
 from pathlib import Path
+from unittest import mock
 
 import pytest
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from cstar.applications.core import get_application_name
+from cstar.applications.hello_world import HelloWorldBlueprint
 from cstar.applications.plotter import PlotterBlueprint
 from cstar.orchestration.launch.slurm import SlurmHandle
-from cstar.orchestration.models import Application, Workplan
+from cstar.orchestration.models import Application, BlueprintCore, Workplan
 from cstar.orchestration.orchestration import LiveStep, LiveWorkplan
 from cstar.orchestration.serialization import (
+    DeserializationCache,
     PersistenceMode,
     deserialize,
+    get_deserialization_cache,
+    get_state_mode,
+    model_to_yaml,
     read_json_to_raw,
     read_raw,
     read_yaml_to_raw,
     serialize,
 )
 from cstar.orchestration.state import StateRepository
+from cstar.orchestration.utils import ENV_CSTAR_ORCH_STATE_FORMAT
 
 
 def test_serialization_json_aliased_fields(tmp_path: Path) -> None:
@@ -519,3 +528,176 @@ def test_read_raw_no_auto(
         pets = person.get("pets", [])
         assert "Waffles" in pets
         assert "Grits" in pets
+
+
+def test_deserialization_cache_parses_once(hello_world_bp_path: Path) -> None:
+    """Verify an unchanged file is parsed once for every model type loaded."""
+    cache = DeserializationCache()
+
+    core = cache.load(hello_world_bp_path, BlueprintCore)
+    bp = cache.load(hello_world_bp_path, HelloWorldBlueprint)
+    bp_again = cache.load(str(hello_world_bp_path), HelloWorldBlueprint)
+
+    assert core.application == bp.application == "hello_world"
+    assert bp_again == bp
+    assert cache.parses == 1
+    assert cache.hits == 1
+
+
+def test_deserialization_cache_returns_copies(hello_world_bp_path: Path) -> None:
+    """Verify modifying a loaded model does not affect subsequent loads."""
+    cache = DeserializationCache()
+
+    bp = cache.load(hello_world_bp_path, HelloWorldBlueprint)
+    bp.target = "someone else"
+
+    assert cache.load(hello_world_bp_path, HelloWorldBlueprint).target != bp.target
+
+
+def test_deserialization_cache_reparses_modified_file(
+    hello_world_bp_path: Path,
+) -> None:
+    """Verify a file is parsed again when its size or modification time changes."""
+    cache = DeserializationCache()
+    bp = cache.load(hello_world_bp_path, HelloWorldBlueprint)
+
+    content = hello_world_bp_path.read_text()
+    hello_world_bp_path.write_text(content.replace(bp.target, "a longer target"))
+
+    assert cache.load(hello_world_bp_path, HelloWorldBlueprint).target == (
+        "a longer target"
+    )
+    assert cache.parses == 2  # noqa: PLR2004
+
+
+def test_deserialization_cache_invalidated_by_serialize(
+    hello_world_bp_path: Path,
+) -> None:
+    """Verify serializing to a cached path discards the cached model."""
+    cache = get_deserialization_cache()
+    bp = cache.load(hello_world_bp_path, HelloWorldBlueprint)
+
+    # an update of the same size may not change the modification time
+    bp.target = bp.target[::-1]
+    serialize(hello_world_bp_path, bp)
+
+    assert cache.load(hello_world_bp_path, HelloWorldBlueprint).target == bp.target
+
+
+def test_deserialization_cache_is_shared_by_blueprint_lookups(
+    tmp_path: Path,
+    hello_world_bp_path: Path,
+) -> None:
+    """Verify resolving the application and the blueprint of a step parses the
+    blueprint once.
+    """
+    cache = get_deserialization_cache()
+    step = LiveStep(
+        name="step-a",
+        application="hello_world",
+        blueprint=hello_world_bp_path.as_posix(),
+        working_dir=tmp_path / "step-a",
+    )
+
+    parses = cache.parses
+    assert get_application_name(hello_world_bp_path) == "hello_world"
+    _ = step.blueprint
+    _ = step.blueprint
+
+    assert cache.parses == parses + 1
+
+
+def test_deserialization_cache_validates_per_working_directory(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify relative paths resolved by validators are resolved against the
+    working directory of each load.
+    """
+
+    class FakeModel(BaseModel):
+        path: Path
+
+        @field_validator("path", mode="after")
+        @classmethod
+        def _resolve(cls, value: Path) -> Path:
+            return value.resolve()
+
+    model_path = tmp_path / "fake.json"
+    serialize(model_path, FakeModel(path=Path("output")), mode=PersistenceMode.json)
+    cache = DeserializationCache()
+
+    for cwd in (tmp_path / "a", tmp_path / "b"):
+        cwd.mkdir()
+        monkeypatch.chdir(cwd)
+        assert cache.load(model_path, FakeModel).path == cwd.resolve() / "output"
+
+    assert cache.parses == 1
+    assert cache.hits == 0
+
+
+def test_deserialization_cache_disabled(hello_world_bp_path: Path) -> None:
+    """Verify a cache without capacity deserializes the file on every load."""
+    cache = DeserializationCache(max_entries=0)
+
+    for _ in range(2):
+        assert cache.load(hello_world_bp_path, HelloWorldBlueprint)
+
+    assert cache.hits == 0
+
+
+def test_model_to_yaml_writes_repeated_values(tmp_path: Path) -> None:
+    """Verify values shared by several fields are written in full, without aliases."""
+
+    class FakeModel(BaseModel):
+        first: list[Path]
+        second: list[Path]
+
+    paths = [tmp_path / "a", tmp_path / "b"]
+    content = model_to_yaml(FakeModel(first=paths, second=paths))
+
+    assert "&" not in content
+    assert "*" not in content
+    assert content.count((tmp_path / "a").as_posix()) == 2  # noqa: PLR2004
+
+
+def test_read_raw_yaml_failure_not_retried_as_json(tmp_path: Path) -> None:
+    """Verify a file that fails to load as YAML is not read again as JSON."""
+    path = tmp_path / "invalid.yaml"
+    path.write_text("key: [unclosed")
+
+    with (
+        mock.patch(
+            "cstar.orchestration.serialization.read_json_to_raw",
+        ) as json_reader,
+        pytest.raises(RuntimeError, match="Failed to deserialize"),
+    ):
+        read_raw(path)
+
+    json_reader.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param(None, PersistenceMode.yaml, id="default"),
+        pytest.param("json", PersistenceMode.json, id="json"),
+        pytest.param("yaml", PersistenceMode.yaml, id="yaml"),
+    ],
+)
+def test_get_state_mode(value: str | None, expected: PersistenceMode) -> None:
+    """Verify the state format is read from the environment."""
+    env = {ENV_CSTAR_ORCH_STATE_FORMAT: value} if value else {}
+    with mock.patch.dict(os.environ, env):
+        if value is None:
+            os.environ.pop(ENV_CSTAR_ORCH_STATE_FORMAT, None)
+        assert get_state_mode() == expected
+
+
+def test_get_state_mode_rejects_unknown_format() -> None:
+    """Verify an unknown state format is reported."""
+    with (
+        mock.patch.dict(os.environ, {ENV_CSTAR_ORCH_STATE_FORMAT: "msgpack"}),
+        pytest.raises(ValueError, match="Unknown state format"),
+    ):
+        get_state_mode()
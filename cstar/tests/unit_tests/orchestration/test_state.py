@@ -0,0 +1,140 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.env import ENV_CSTAR_RUNID
+from cstar.orchestration.launch.local import LocalHandle
+from cstar.orchestration.orchestration import Status
+from cstar.orchestration.serialization import deserialize, serialize
+from cstar.orchestration.state import (
+    StateJournal,
+    StateRepository,
+    get_state_journal,
+)
+
+
+def _handle(name: str, status: Status) -> LocalHandle:
+    """Create a handle for a local process in a given state."""
+    return LocalHandle(
+        pid="1001",
+        name=name,
+        run_id="test-run",
+        start_at=datetime.now(),
+        status=status,
+    )
+
+
+def test_journal_flush_and_replay(tmp_path: Path) -> None:
+    """Verify buffered transitions are appended on flush and replayed in order."""
+    journal = StateJournal("test-run", tmp_path, compact_after=100)
+
+    for status in (Status.Submitted, Status.Running, Status.Done):
+        journal.append(_handle("step-a", status))
+    journal.append(_handle("step-b", Status.Running))
+
+    # transitions are buffered until the journal is flushed
+    assert not journal.journal_path.exists()
+
+    assert journal.flush() == 4  # noqa: PLR2004
+    assert len(journal.journal_path.read_text().splitlines()) == 4  # noqa: PLR2004
+
+    records = StateJournal("test-run", tmp_path, compact_after=100).replay()
+    assert set(records) == {"step-a", "step-b"}
+    assert LocalHandle.model_validate(records["step-a"].data).status == Status.Done
+    assert LocalHandle.model_validate(records["step-b"].data).status == Status.Running
+
+
+def test_journal_compaction(tmp_path: Path) -> None:
+    """Verify the log is compacted into a snapshot after the threshold is reached."""
+    journal = StateJournal("test-run", tmp_path, compact_after=5)
+    statuses = [Status.Submitted, Status.Running, Status.Done]
+
+    for status in statuses:
+        for name in ("step-a", "step-b"):
+            journal.append(_handle(name, status))
+        journal.flush()
+
+    assert journal.snapshot_path.exists()
+    assert len(journal.journal_path.read_text().splitlines()) < 5  # noqa: PLR2004
+
+    records = StateJournal("test-run", tmp_path, compact_after=5).replay()
+    assert all(
+        LocalHandle.model_validate(r.data).status == Status.Done
+        for r in records.values()
+    )
+
+
+def test_journal_skips_torn_record(tmp_path: Path) -> None:
+    """Verify a partially written trailing record does not prevent a replay."""
+    journal = StateJournal("test-run", tmp_path, compact_after=100)
+    journal.append(_handle("step-a", Status.Running))
+    journal.flush()
+
+    with journal.journal_path.open("a") as fp:
+        fp.write('["step-a",1.0,{"pid":')
+
+    records = StateJournal("test-run", tmp_path, compact_after=100).replay()
+    assert LocalHandle.model_validate(records["step-a"].data).status == Status.Running
+
+
+@pytest.mark.asyncio
+async def test_repository_journaled_sentinels() -> None:
+    """Verify a journaled repository appends transitions and materializes
+    sentinel files only when created and closed.
+    """
+    with mock.patch.dict(os.environ, {ENV_CSTAR_RUNID: "test-journaled-run"}):
+        repo = StateRepository(journaled=True)
+
+        path = await repo.put_sentinel(_handle("step-a", Status.Submitted))
+        assert path
+        assert path.exists()
+
+        await repo.put_sentinel(_handle("step-a", Status.Running))
+        await repo.put_sentinel(_handle("step-a", Status.Done))
+
+        # the sentinel file is not rewritten for each transition
+        assert deserialize(path, LocalHandle).status == Status.Submitted
+
+        await repo.flush()
+        assert get_state_journal().journal_path.exists()
+
+        handle = await repo.get_sentinel("step-a", LocalHandle)
+        assert handle
+        assert handle.status == Status.Done
+
+        handles = await repo.list_sentinels(LocalHandle)
+        assert [h.status for h in handles] == [Status.Done]
+
+        assert await repo.close() == {path}
+        assert deserialize(path, LocalHandle).status == Status.Done
+
+
+@pytest.mark.asyncio
+async def test_repository_prefers_updated_sentinel() -> None:
+    """Verify a sentinel rewritten outside the repository supersedes the journal,
+    even if its modification time is older than the journaled transition.
+    """
+    with mock.patch.dict(os.environ, {ENV_CSTAR_RUNID: "test-skewed-run"}):
+        repo = StateRepository(journaled=True)
+
+        path = await repo.put_sentinel(_handle("step-a", Status.Submitted))
+        assert path
+        await repo.put_sentinel(_handle("step-a", Status.Running))
+
+        handle = await repo.get_sentinel("step-a", LocalHandle)
+        assert handle
+        assert handle.status == Status.Running
+
+        # simulate an update by a job proxy on a host with a slow clock
+        serialize(path, _handle("step-a", Status.Done))
+        os.utime(path, ns=(0, 0))
+
+        handle = await repo.get_sentinel("step-a", LocalHandle)
+        assert handle
+        assert handle.status == Status.Done
+
+        handles = await repo.list_sentinels(LocalHandle)
+        assert [h.status for h in handles] == [Status.Done]
@@ -12,6 +12,7 @@ from cstar.base.utils import slugify
 from cstar.orchestration.models import Workplan
 from cstar.orchestration.serialization import deserialize, serialize
 from cstar.orchestration.tracking import TrackingRepository, WorkplanRun
+from cstar.orchestration.utils import ENV_CSTAR_ORCH_STATE_FORMAT
 
 
 @pytest.mark.asyncio
@@ -466,3 +467,46 @@ async def test_tracking_retrieve_mixed_case_runid(tmp_path: Path) -> None:
     found_sync = repo.get_workplan_run_sync(run_id="MIXED-Case-Run-ID")
     assert found_sync
     assert found_sync.run_id == "mixed-case-run-id"
+
+
+@pytest.mark.asyncio
+async def test_tracking_state_format(tmp_path: Path) -> None:
+    """Verify run records are written in the configured format and records
+    written in another format remain readable.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    """
+    run_id = "test-tracking-state-format"
+    runs = [
+        WorkplanRun(
+            workplan_path=tmp_path / "fake_workplan.yaml",
+            trx_workplan_path=tmp_path / "mock_transformed_workplan.yaml",
+            output_path=tmp_path / "output",
+            run_id=run_id,
+            start_at=datetime(2020, 1, 1 + i, tzinfo=UTC),
+        )
+        for i in range(2)
+    ]
+    repo = TrackingRepository()
+
+    yaml_path = await repo.put_workplan_run(runs[0])
+    with mock.patch.dict(os.environ, {ENV_CSTAR_ORCH_STATE_FORMAT: "json"}):
+        json_path = await repo.put_workplan_run(runs[1])
+
+        assert json_path.suffix == ".json"
+        assert repo.latest_path(run_id).resolve() == json_path.resolve()
+
+        history = await repo.list_history_runs(run_id)
+        assert {r.start_at for r in history} == {r.start_at for r in runs}
+
+        latest = await repo.get_workplan_run(run_id)
+        assert latest
+        assert latest.start_at == runs[1].start_at
+
+    assert yaml_path.suffix == ".yaml"
+    assert not repo.latest_path(run_id).exists()
+    run_paths = repo.list_runtracking_paths(run_id, all_history=True)
+    assert len(run_paths) == 3  # noqa: PLR2004
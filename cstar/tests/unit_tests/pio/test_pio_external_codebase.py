@@ -5,6 +5,7 @@ import unittest.mock as mock
 
 import pytest
 
+from cstar.base.build_tools import build_jobs
 from cstar.pio.external_codebase import PIOExternalCodeBase
 
 
@@ -102,7 +103,7 @@ class TestPIOExternalCodeBaseConfigure:
         assert configure_call.kwargs["cwd"] == pio_path
         assert configure_call.kwargs["raise_on_error"] is True
 
-        assert build_call.args[0] == "cmake --build build --parallel 4"
+        assert build_call.args[0] == f"cmake --build build --parallel {build_jobs()}"
         assert build_call.kwargs["cwd"] == pio_path
         assert build_call.kwargs["raise_on_error"] is True
 
@@ -0,0 +1,272 @@
+import os
+import stat
+import subprocess
+import textwrap
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.base.codebase_store import CodebaseStore
+from cstar.roms.build_cache import BuildCache, compute_build_key
+from cstar.roms.simulation import ROMSSimulation
+
+FAKE_MAKE: str = textwrap.dedent("""\
+    #!/bin/bash
+    # record the invocation so tests can count compilations
+    echo "$@" >> "$FAKE_MAKE_LOG"
+
+    if [ "$1" = "compile_clean" ]; then
+        rm -rf Compile roms
+        exit 0
+    fi
+
+    mkdir -p Compile
+    echo "roms built with $(cat cppdefs.opt)" > roms
+    chmod +x roms
+    """)
+"""A stand-in for `make` that writes a fake `roms` executable."""
+
+
+@pytest.fixture
+def fake_make(tmp_path: Path) -> Generator[Callable[[], list[str]], None, None]:
+    """Place a fake `make` executable on the PATH.
+
+    Returns
+    -------
+    Callable[[], list[str]]
+        A function returning the arguments of each `make` invocation.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+
+    make_path = bin_dir / "make"
+    make_path.write_text(FAKE_MAKE)
+    make_path.chmod(0o755)
+
+    log_path = tmp_path / "make.log"
+    log_path.touch()
+
+    env = {
+        "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        "FAKE_MAKE_LOG": log_path.as_posix(),
+    }
+    with mock.patch.dict(os.environ, env):
+        yield lambda: log_path.read_text().splitlines()
+
+
+def _git(repo_dir: Path, *args: str) -> None:
+    """Run a git command in a repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=C-Star", "-c", "user.email=cstar@example.com"]
+        + list(args),
+        cwd=repo_dir,
+        capture_output=True,
+        check=True,
+    )
+
+
+def _mock_codebase(repo_dir: Path, location: str) -> mock.MagicMock:
+    """Create a git repository with a committed ROMS Makefile and a mock codebase
+    whose working copy is the repository.
+    """
+    makefile = repo_dir / "Work" / "Makefile"
+    makefile.parent.mkdir(parents=True, exist_ok=True)
+    makefile.touch()
+
+    _git(repo_dir, "init", "-q")
+    _git(repo_dir, "add", "-A")
+    _git(repo_dir, "commit", "-q", "-m", "initial")
+
+    codebase = mock.MagicMock()
+    codebase.working_copy.path = repo_dir
+    codebase.source.location = location
+    return codebase
+
+
+@pytest.fixture
+def buildable_sim(
+    stub_romssimulation: ROMSSimulation,
+    stageddatacollection_remote_files: Callable,
+    tmp_path: Path,
+) -> Generator[ROMSSimulation, None, None]:
+    """Provide a simulation with real compile-time code files and a mock codebase
+    checked out in a git repository.
+    """
+    sim = stub_romssimulation
+    build_dir = sim.fs_manager.compile_time_code_dir
+    build_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = [build_dir / "cppdefs.opt", build_dir / "param.opt"]
+    for path in paths:
+        path.write_text(f"! {path.name}\n")
+    sim.compile_time_code._working_copy = stageddatacollection_remote_files(  # type: ignore[union-attr]
+        paths=paths
+    )
+
+    sim.codebase = _mock_codebase(
+        tmp_path / "roms_repo", "https://github.com/CWorthy-ocean/ucla-roms.git"
+    )
+    sim.marbl_codebase = None
+
+    with (
+        mock.patch("cstar.roms.simulation.rpath_link_flags", return_value=None),
+        mock.patch("cstar.roms.simulation.verify_roms_linkage"),
+        mock.patch("cstar.roms.simulation.assert_single_toolchain_stack"),
+        mock.patch("cstar.roms.simulation.explicit_mpi_wrapper", return_value=None),
+    ):
+        yield sim
+
+
+def _clear_build(sim: ROMSSimulation) -> Path:
+    """Remove the executable from the build directory, as in a fresh step."""
+    build_dir = sim.fs_manager.compile_time_code_dir
+    (build_dir / "roms").unlink()
+    sim._exe_hash = None
+    return build_dir
+
+
+def test_build_cache_hit_skips_make(
+    buildable_sim: ROMSSimulation,
+    fake_make: Callable[[], list[str]],
+) -> None:
+    """Verify an identical build is materialized from the cache without `make`."""
+    sim = buildable_sim
+    sim.build()
+    assert len(fake_make()) == 1
+
+    build_dir = _clear_build(sim)
+    sim.build()
+
+    assert len(fake_make()) == 1
+    assert sim.exe_path == build_dir / "roms"
+    assert sim.exe_path.read_text().startswith("roms built")
+    # the executable is hardlinked from the cache
+    assert sim.exe_path.stat().st_nlink == 2  # noqa: PLR2004
+
+
+def test_build_cache_hit_with_read_only_store_install(
+    buildable_sim: ROMSSimulation,
+    fake_make: Callable[[], list[str]],
+    tmp_path: Path,
+) -> None:
+    """Verify builds of a codebase installed in the (read-only) codebase store
+    are cached.
+    """
+    sim = buildable_sim
+
+    store = CodebaseStore(tmp_path / "store")
+    key = "roms"
+    with store.lock(key):
+        root_dir = store.prepare(key)
+        sim.codebase = _mock_codebase(root_dir, sim.codebase.source.location)
+        # git compares file change times to the second
+        time.sleep(1.1)
+        store.publish(key, {"checkout_targets": ["main"]})
+
+    assert not (root_dir / "Work" / "Makefile").stat().st_mode & stat.S_IWUSR
+
+    sim.build()
+    _clear_build(sim)
+    sim.build()
+
+    assert len(fake_make()) == 1
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda sim, d: (d / "cppdefs.opt").write_text("#define MARBL\n"),
+            id="cppdefs",
+        ),
+        pytest.param(
+            lambda sim, d: _git(
+                sim.codebase.working_copy.path,
+                "commit",
+                "-q",
+                "--allow-empty",
+                "-m",
+                "update",
+            ),
+            id="codebase commit",
+        ),
+        pytest.param(
+            lambda sim, d: (
+                sim.codebase.working_copy.path / "Work" / "Makefile"
+            ).write_text("# modified\n"),
+            id="uncommitted codebase change",
+        ),
+        pytest.param(
+            lambda sim, d: os.environ.update({"LOADEDMODULES": "netcdf/4.9"}),
+            id="modules",
+        ),
+    ],
+)
+def test_build_cache_miss_on_changed_inputs(
+    buildable_sim: ROMSSimulation,
+    fake_make: Callable[[], list[str]],
+    change: Callable[[ROMSSimulation, Path], object],
+) -> None:
+    """Verify that changing an input to the build results in a recompile."""
+    sim = buildable_sim
+    sim.build()
+
+    build_dir = _clear_build(sim)
+    with mock.patch.dict(os.environ):
+        change(sim, build_dir)
+        sim.build()
+
+    assert len([c for c in fake_make() if c != "compile_clean"]) == 2  # noqa: PLR2004
+
+
+def test_build_cache_rebuild_bypasses_cache(
+    buildable_sim: ROMSSimulation,
+    fake_make: Callable[[], list[str]],
+) -> None:
+    """Verify `rebuild=True` always runs `make`."""
+    sim = buildable_sim
+    sim.build()
+    sim.build(rebuild=True)
+
+    assert "compile_clean" in fake_make()
+    assert len([c for c in fake_make() if c != "compile_clean"]) == 2  # noqa: PLR2004
+
+
+def test_build_cache_disabled(
+    buildable_sim: ROMSSimulation,
+    fake_make: Callable[[], list[str]],
+) -> None:
+    """Verify the cache is bypassed when its size limit is zero."""
+    sim = buildable_sim
+
+    with mock.patch.dict(os.environ, {"CSTAR_BUILD_CACHE_MAX_MB": "0"}):
+        sim.build()
+        _clear_build(sim)
+        sim.build()
+
+    assert len([c for c in fake_make() if c != "compile_clean"]) == 2  # noqa: PLR2004
+
+
+def test_build_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Verify the least-recently-used entries are evicted to honor the size limit."""
+    cache = BuildCache(tmp_path / "cache", max_bytes=10_000)
+    keys = [compute_build_key({"n": i}) for i in range(3)]
+
+    for i, key in enumerate(keys):
+        exe = tmp_path / f"roms-{i}"
+        exe.write_bytes(b"0" * 1000)
+        with cache.lock(key):
+            cache.store(key, exe, verified=True)
+        os.utime(cache.root / key, (i, i))
+
+    cache.max_bytes = 2500
+
+    # refresh the oldest entry so the second entry is least-recently-used
+    assert cache.fetch(keys[0], tmp_path / "roms")
+    assert cache.evict() == [keys[1]]
+
+    assert cache.fetch(keys[0], tmp_path / "roms")
+    assert not cache.fetch(keys[1], tmp_path / "roms")
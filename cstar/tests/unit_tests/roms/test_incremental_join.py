@@ -0,0 +1,152 @@
+import os
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+import netCDF4 as nc
+import pytest
+
+from cstar.base.env import (
+    ENV_CSTAR_INCREMENTAL_JOIN,
+    ENV_CSTAR_INCREMENTAL_JOIN_INTERVAL,
+    ENV_CSTAR_JOIN_ENGINE,
+)
+from cstar.execution.handler import ExecutionStatus
+from cstar.execution.local_process import LocalProcess
+from cstar.roms.incremental_join import IncrementalJoiner, closed_file_sets
+from cstar.roms.simulation import ROMSSimulation
+from cstar.tests.unit_tests.roms.test_join import ETA_RHO, NUM_RECORDS, XI_RHO
+
+STAMPS: list[str] = ["20240101000000", "20240102000000", "20240103000000"]
+"""The timestamps of the files written by the fake model, in order."""
+
+FAKE_MODEL: str = textwrap.dedent("""\
+    import sys
+    import time
+    from pathlib import Path
+
+    from cstar.tests.unit_tests.roms.test_join import ETA_RHO, XI_RHO, write_tiles
+
+    output_dir = Path(sys.argv[1])
+    for stamp in sys.argv[2:]:
+        write_tiles(output_dir, f"ocean_his.{stamp}", XI_RHO, ETA_RHO)
+        print(f"wrote ocean_his.{stamp}", flush=True)
+        time.sleep(0.5)
+    """)
+"""A stand-in for ROMS that writes a new set of history tiles every half second."""
+
+
+def _touch_tiles(output_dir: Path, stamp: str, num_tiles: int) -> None:
+    for i in range(num_tiles):
+        (output_dir / f"ocean_his.{stamp}.{i}.nc").touch()
+
+
+def test_closed_file_sets(tmp_path: Path) -> None:
+    """Verify only complete file sets followed by a later file are closed."""
+    _touch_tiles(tmp_path, STAMPS[0], 4)
+    _touch_tiles(tmp_path, STAMPS[1], 3)  # still being written
+    _touch_tiles(tmp_path, STAMPS[2], 1)
+    (tmp_path / f"ocean_rst.{STAMPS[0]}.0.nc").touch()
+
+    assert closed_file_sets(tmp_path, num_tiles=4) == [f"ocean_his.{STAMPS[0]}.*.nc"]
+    assert closed_file_sets(tmp_path, num_tiles=1) == []
+
+
+def test_joiner_joins_closed_sets_while_running(tmp_path: Path) -> None:
+    """Verify each file set is joined once, as soon as the next one appears, and
+    that the last file set is left for `post_run`.
+    """
+    joined: list[str] = []
+
+    def fake_model() -> None:
+        for stamp in STAMPS:
+            _touch_tiles(tmp_path, stamp, 2)
+            time.sleep(0.4)
+
+    model = threading.Thread(target=fake_model)
+    joiner = IncrementalJoiner(
+        tmp_path,
+        num_tiles=2,
+        join=joined.append,
+        is_running=model.is_alive,
+        interval=0.02,
+    )
+
+    model.start()
+    joiner.start()
+    time.sleep(0.6)
+    # the first file set is joined while the model is still writing
+    assert joined == [f"ocean_his.{STAMPS[0]}.*.nc"]
+
+    model.join()
+    joiner.stop()
+
+    expected = [f"ocean_his.{s}.*.nc" for s in STAMPS[:-1]]
+    assert joined == expected
+    assert joiner.joined == set(expected)
+
+
+def test_joiner_does_not_retry_failed_join(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Verify a failed join is logged once and left for `post_run`."""
+    _touch_tiles(tmp_path, STAMPS[0], 1)
+    _touch_tiles(tmp_path, STAMPS[1], 1)
+    join = mock.Mock(side_effect=RuntimeError("ncjoin failed"))
+
+    joiner = IncrementalJoiner(tmp_path, 1, join=join, is_running=lambda: True)
+    assert joiner.poll() == []
+    assert joiner.poll() == []
+
+    join.assert_called_once()
+    assert not joiner.joined
+    assert "will be joined after the run completes" in caplog.text
+
+
+def test_simulation_joins_while_fake_model_runs(
+    stub_romssimulation: ROMSSimulation, tmp_path: Path
+) -> None:
+    """Verify a simulation joins output files written by a running model, and
+    that `post_run` only joins the last file.
+    """
+    sim = stub_romssimulation
+    sim.fs_manager.prepare()
+    sim.discretization.n_procs_x = len(XI_RHO)
+    sim.discretization.n_procs_y = len(ETA_RHO)
+    output_dir = sim.fs_manager.output_dir
+
+    script = tmp_path / "fake_roms.py"
+    script.write_text(FAKE_MODEL)
+    process = LocalProcess(
+        commands=" ".join([sys.executable, str(script), str(output_dir), *STAMPS]),
+        run_path=tmp_path,
+        output_file=tmp_path / "fake_roms.out",
+    )
+
+    env = {
+        ENV_CSTAR_INCREMENTAL_JOIN: "1",
+        ENV_CSTAR_INCREMENTAL_JOIN_INTERVAL: "0.05",
+        ENV_CSTAR_JOIN_ENGINE: "native",
+        "PYTHONPATH": os.pathsep.join(sys.path),
+    }
+    with mock.patch.dict(os.environ, env):
+        sim._execution_handler = process
+        process.start()
+        sim._start_incremental_join()
+        joiner = sim._joiner
+        assert joiner is not None
+
+        process.wait()
+        sim.post_run()
+
+    assert process.status == ExecutionStatus.COMPLETED
+    assert joiner.joined == {f"ocean_his.{s}.*.nc" for s in STAMPS[:-1]}
+
+    joined_dir = sim.fs_manager.joined_output_dir
+    for stamp in STAMPS:
+        with nc.Dataset(joined_dir / f"ocean_his.{stamp}.nc") as ds:
+            assert len(ds.dimensions["time"]) == NUM_RECORDS
+    assert not list(output_dir.glob("ocean_his.*.nc"))
@@ -0,0 +1,181 @@
+import os
+from pathlib import Path
+from unittest import mock
+
+import netCDF4 as nc
+import numpy as np
+import pytest
+
+from cstar.base.env import ENV_CSTAR_JOIN_ENGINE
+from cstar.execution.handler import ExecutionStatus
+from cstar.roms.join import join_tiles, tile_index
+from cstar.roms.simulation import ROMSSimulation
+
+XI_RHO: list[int] = [5, 4, 6]
+"""The xi_rho size of the tiles in each column; edge tiles carry boundary points."""
+ETA_RHO: list[int] = [4, 6]
+"""The eta_rho size of the tiles in each row."""
+NUM_RECORDS: int = 3
+NUM_LEVELS: int = 2
+
+
+def _edges(sizes: list[int]) -> list[int]:
+    return [sum(sizes[:i]) for i in range(len(sizes) + 1)]
+
+
+def write_tiles(
+    directory: Path, prefix: str, xi_rho: list[int], eta_rho: list[int]
+) -> dict[str, np.ndarray]:
+    """Write synthetic ROMS output tiles and return the expected joined variables.
+
+    The u (v) points have one fewer column (row) than the rho points on the
+    western (southern) edge of the domain.
+    """
+    np_xi = len(xi_rho)
+    xi_u = [n - 1 if i == 0 else n for i, n in enumerate(xi_rho)]
+    eta_v = [n - 1 if j == 0 else n for j, n in enumerate(eta_rho)]
+
+    rng = np.random.default_rng(0)
+    shape_rho = (sum(eta_rho), sum(xi_rho))
+    joined = {
+        "ocean_time": np.arange(NUM_RECORDS, dtype="f8") * 3600.0,
+        "h": rng.random(shape_rho),
+        "zeta": rng.random((NUM_RECORDS, *shape_rho)).astype("f4"),
+        "u": rng.random((NUM_RECORDS, NUM_LEVELS, sum(eta_rho), sum(xi_u))),
+        "v": rng.random((NUM_RECORDS, NUM_LEVELS, sum(eta_v), sum(xi_rho))),
+    }
+
+    xr_, xu_, er_, ev_ = map(_edges, (xi_rho, xi_u, eta_rho, eta_v))
+    for j in range(len(eta_rho)):
+        for i in range(np_xi):
+            node = j * np_xi + i
+            path = directory / f"{prefix}.{node:02d}.nc"
+            with nc.Dataset(path, "w") as ds:
+                ds.setncattr("title", "synthetic")
+                ds.setncattr("partition", [node, np_xi * len(eta_rho)])
+                ds.createDimension("time", None)
+                ds.createDimension("s_rho", NUM_LEVELS)
+                ds.createDimension("xi_rho", xi_rho[i])
+                ds.createDimension("xi_u", xi_u[i])
+                ds.createDimension("eta_rho", eta_rho[j])
+                ds.createDimension("eta_v", eta_v[j])
+
+                rho = (slice(er_[j], er_[j + 1]), slice(xr_[i], xr_[i + 1]))
+                u = (slice(er_[j], er_[j + 1]), slice(xu_[i], xu_[i + 1]))
+                v = (slice(ev_[j], ev_[j + 1]), slice(xr_[i], xr_[i + 1]))
+                all_ = (slice(None),)
+
+                ds.createVariable("theta_s", "f8", ()).assignValue(5.0)
+                time = ds.createVariable("ocean_time", "f8", ("time",))
+                time[:] = joined["ocean_time"]
+                h = ds.createVariable("h", "f8", ("eta_rho", "xi_rho"))
+                h[:] = joined["h"][rho]
+
+                zeta = ds.createVariable(
+                    "zeta", "f4", ("time", "eta_rho", "xi_rho"), zlib=True
+                )
+                zeta.units = "meter"
+                zeta[:] = joined["zeta"][(*all_, *rho)]
+
+                var = ds.createVariable("u", "f8", ("time", "s_rho", "eta_rho", "xi_u"))
+                var[:] = joined["u"][(*all_, *all_, *u)]
+                var = ds.createVariable("v", "f8", ("time", "s_rho", "eta_v", "xi_rho"))
+                var[:] = joined["v"][(*all_, *all_, *v)]
+
+    return joined
+
+
+def test_tile_index() -> None:
+    """Verify the tile index is parsed from the name of a partitioned file."""
+    assert tile_index(Path("ocean_his.20240101000000.012.nc")) == 12  # noqa: PLR2004
+    with pytest.raises(ValueError, match="tile index"):
+        tile_index(Path("ocean_his.20240101000000.nc"))
+    with pytest.raises(ValueError, match="tile index"):
+        tile_index(Path("ocean_his.012.nc"))
+
+
+def test_join_tiles_matches_original(tmp_path: Path) -> None:
+    """Verify that joining synthetic tiles reproduces the original variables."""
+    expected = write_tiles(tmp_path, "ocean_his.20240101000000", XI_RHO, ETA_RHO)
+    tiles = list(tmp_path.glob("ocean_his.*.nc"))
+
+    out_file = join_tiles(tiles, tmp_path / "joined.nc", np_xi=len(XI_RHO))
+
+    with nc.Dataset(out_file) as ds:
+        assert "partition" not in ds.ncattrs()
+        assert ds.title == "synthetic"
+        assert ds.dimensions["time"].isunlimited()
+        assert len(ds.dimensions["xi_rho"]) == sum(XI_RHO)
+        assert len(ds.dimensions["eta_v"]) == sum(ETA_RHO) - 1
+        assert ds.variables["zeta"].units == "meter"
+        assert ds.variables["zeta"].filters()["zlib"]
+        assert ds.variables["theta_s"].getValue() == 5.0  # noqa: PLR2004
+
+        for name, values in expected.items():
+            np.testing.assert_array_equal(ds.variables[name][:], values)
+
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_join_tiles_rejects_incomplete_rows(tmp_path: Path) -> None:
+    """Verify that tiles which do not fill whole rows are rejected."""
+    write_tiles(tmp_path, "ocean_his.20240101000000", XI_RHO, ETA_RHO)
+    tiles = sorted(tmp_path.glob("ocean_his.*.nc"))[:-1]
+
+    with pytest.raises(ValueError, match="cannot be arranged"):
+        join_tiles(tiles, tmp_path / "joined.nc", np_xi=len(XI_RHO))
+
+    assert not (tmp_path / "joined.nc").exists()
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+@pytest.mark.parametrize("nprocs", ["1", "2"])
+def test_post_run_joins_natively(
+    stub_romssimulation: ROMSSimulation, nprocs: str
+) -> None:
+    """Verify `post_run` joins outputs in-process when the native engine is chosen,
+    and keeps the partitioned restart files.
+    """
+    sim = stub_romssimulation
+    sim.fs_manager.prepare()
+    sim.discretization.n_procs_x = len(XI_RHO)
+    output_dir = sim.fs_manager.output_dir
+
+    his = write_tiles(output_dir, "ocean_his.20240101000000", XI_RHO, ETA_RHO)
+    write_tiles(output_dir, "ocean_rst.20240101000000", XI_RHO, ETA_RHO)
+
+    sim._execution_handler = mock.MagicMock()
+    sim._execution_handler.status = ExecutionStatus.COMPLETED
+
+    env = {ENV_CSTAR_JOIN_ENGINE: "native", "CSTAR_NPROCS_POST": nprocs}
+    with (
+        mock.patch.dict(os.environ, env),
+        mock.patch("subprocess.run") as mock_subprocess,
+    ):
+        sim.post_run()
+
+    mock_subprocess.assert_not_called()
+
+    joined_dir = sim.fs_manager.joined_output_dir
+    with nc.Dataset(joined_dir / "ocean_his.20240101000000.nc") as ds:
+        np.testing.assert_array_equal(ds.variables["zeta"][:], his["zeta"])
+    assert (joined_dir / "ocean_rst.20240101000000.nc").exists()
+
+    assert not list(output_dir.glob("ocean_his.*.nc"))
+    assert len(list(output_dir.glob("ocean_rst.*.nc"))) == len(XI_RHO) * len(ETA_RHO)
+
+
+def test_post_run_rejects_unknown_engine(stub_romssimulation: ROMSSimulation) -> None:
+    """Verify `post_run` raises if `CSTAR_JOIN_ENGINE` is not a known engine."""
+    sim = stub_romssimulation
+    sim.fs_manager.prepare()
+    (sim.fs_manager.output_dir / "ocean_his.20240101000000.0.nc").touch()
+
+    sim._execution_handler = mock.MagicMock()
+    sim._execution_handler.status = ExecutionStatus.COMPLETED
+
+    with (
+        mock.patch.dict(os.environ, {ENV_CSTAR_JOIN_ENGINE: "nco"}),
+        pytest.raises(ValueError, match="Unknown join engine"),
+    ):
+        sim.post_run()
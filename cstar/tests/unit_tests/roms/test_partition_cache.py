@@ -0,0 +1,220 @@
+import os
+from collections.abc import Callable, Generator
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cstar.io.source_data import SourceData
+from cstar.io.staged_data import StagedFile
+from cstar.roms.input_dataset import ROMSInputDataset, ROMSPartitioning
+from cstar.roms.partition_cache import PartitionCache, compute_partition_key
+from cstar.tests.unit_tests.fake_abc_subclasses import FakeROMSInputDataset
+
+
+def _fake_partition_netcdf(
+    idfile: Path, np_xi: int, np_eta: int, include_coarse_dims: bool
+) -> list[Path]:
+    """Write one small tile per partition next to the source file."""
+    n = np_xi * np_eta
+    tiles = [
+        idfile.parent / f"{idfile.stem}{suffix}"
+        for suffix in ROMSPartitioning.suffixes(n)
+    ]
+    for i, tile in enumerate(tiles):
+        tile.write_text(f"{idfile.read_text()} tile {i} coarse={include_coarse_dims}")
+    return tiles
+
+
+@pytest.fixture
+def mock_partition_netcdf() -> Generator[mock.MagicMock, None, None]:
+    """Replace `roms_tools.partition_netcdf` with a function writing real tiles."""
+    with mock.patch(
+        "cstar.roms.input_dataset.roms_tools.partition_netcdf",
+        side_effect=_fake_partition_netcdf,
+    ) as mock_partition:
+        yield mock_partition
+
+
+@pytest.fixture
+def make_step_dataset(tmp_path: Path) -> Callable[[str], ROMSInputDataset]:
+    """Create a dataset staged in the input directory of a new step.
+
+    Every step stages its own copy of the same grid file, as a workplan does.
+    """
+
+    def _create(step: str) -> ROMSInputDataset:
+        path = tmp_path / step / "input" / "roms_grd.nc"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("grid")
+
+        dataset = FakeROMSInputDataset(location=path.as_posix())
+        dataset._working_copy = StagedFile(SourceData(location=path.as_posix()), path)
+        return dataset
+
+    return _create
+
+
+@pytest.fixture(autouse=True)
+def mock_exists_locally() -> Generator[None, None, None]:
+    with mock.patch(
+        "cstar.base.input_dataset.InputDataset.exists_locally",
+        new_callable=mock.PropertyMock,
+        return_value=True,
+    ):
+        yield
+
+
+def test_partition_cache_second_step_skips_partitioning(
+    make_step_dataset: Callable[[str], ROMSInputDataset],
+    mock_partition_netcdf: mock.MagicMock,
+) -> None:
+    """Verify a second identical step links cached tiles without partitioning."""
+    first = make_step_dataset("step_1")
+    first.partition(np_xi=2, np_eta=2)
+    assert mock_partition_netcdf.call_count == 1
+
+    second = make_step_dataset("step_2")
+    mock_partition_netcdf.reset_mock()
+    second.partition(np_xi=2, np_eta=2)
+
+    assert mock_partition_netcdf.call_count == 0
+    assert second.partitioning is not None
+    assert [f.name for f in second.partitioning.files] == [
+        f.name
+        for f in first.partitioning.files  # type: ignore[union-attr]
+    ]
+    for tile in second.partitioning.files:
+        assert tile.parent == second.working_copy.path.parent  # type: ignore[union-attr]
+        assert tile.read_text().startswith("grid tile")
+        # the tile is hardlinked from the cache
+        assert tile.stat().st_nlink > 1
+
+
+@pytest.mark.parametrize(
+    "np_xi, np_eta, content",
+    [
+        pytest.param(4, 1, "grid", id="decomposition"),
+        pytest.param(2, 2, "another grid", id="content"),
+    ],
+)
+def test_partition_cache_miss_on_changed_inputs(
+    make_step_dataset: Callable[[str], ROMSInputDataset],
+    mock_partition_netcdf: mock.MagicMock,
+    np_xi: int,
+    np_eta: int,
+    content: str,
+) -> None:
+    """Verify that a different decomposition or source content is repartitioned."""
+    make_step_dataset("step_1").partition(np_xi=2, np_eta=2)
+
+    second = make_step_dataset("step_2")
+    second.working_copy.path.write_text(content)  # type: ignore[union-attr]
+    second.partition(np_xi=np_xi, np_eta=np_eta)
+
+    assert mock_partition_netcdf.call_count == 2  # noqa: PLR2004
+
+
+def test_partition_cache_replays_coarse_dims_retry(
+    make_step_dataset: Callable[[str], ROMSInputDataset],
+    mock_partition_netcdf: mock.MagicMock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Verify that tiles created without coarse dims are cached under the
+    requested option and that the retry is reported again on a cache hit.
+    """
+
+    def no_coarse_dims(idfile, np_xi, np_eta, include_coarse_dims):
+        if include_coarse_dims:
+            raise ValueError("coarse dims are not divisible")
+        return _fake_partition_netcdf(idfile, np_xi, np_eta, include_coarse_dims)
+
+    mock_partition_netcdf.side_effect = no_coarse_dims
+    make_step_dataset("step_1").partition(np_xi=2, np_eta=2)
+    assert mock_partition_netcdf.call_count == 2  # noqa: PLR2004
+
+    caplog.clear()
+    second = make_step_dataset("step_2")
+    second.partition(np_xi=2, np_eta=2)
+
+    assert mock_partition_netcdf.call_count == 2  # noqa: PLR2004
+    assert "coarse dims are not divisible" in caplog.text
+    assert second.partitioning.files[0].read_text().endswith("coarse=False")  # type: ignore[union-attr]
+
+
+def test_partition_cache_discards_corrupt_entry(
+    make_step_dataset: Callable[[str], ROMSInputDataset],
+    mock_partition_netcdf: mock.MagicMock,
+) -> None:
+    """Verify that an entry with a modified tile is discarded and repartitioned."""
+    first = make_step_dataset("step_1")
+    first.partition(np_xi=2, np_eta=2)
+
+    cache = PartitionCache()
+    (entry,) = [p for p in cache.root.iterdir() if p.is_dir()]
+    tile = entry / ROMSPartitioning.suffix(0, 4)
+    tile.chmod(0o644)
+    tile.write_text("corrupt")
+
+    second = make_step_dataset("step_2")
+    second.partition(np_xi=2, np_eta=2)
+
+    assert mock_partition_netcdf.call_count == 2  # noqa: PLR2004
+    assert second.partitioning.files[0].read_text().startswith("grid tile 0")  # type: ignore[union-attr]
+
+
+def test_partition_cache_disabled(
+    make_step_dataset: Callable[[str], ROMSInputDataset],
+    mock_partition_netcdf: mock.MagicMock,
+) -> None:
+    """Verify the cache is bypassed when its size limit is zero."""
+    with mock.patch.dict(os.environ, {"CSTAR_PARTITION_CACHE_MAX_MB": "0"}):
+        make_step_dataset("step_1").partition(np_xi=2, np_eta=2)
+        make_step_dataset("step_2").partition(np_xi=2, np_eta=2)
+
+    assert mock_partition_netcdf.call_count == 2  # noqa: PLR2004
+
+
+def test_partition_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Verify the least-recently-used entries are evicted to honor the size limit."""
+    cache = PartitionCache(tmp_path / "cache", max_bytes=10_000)
+    sources = []
+    keys = []
+
+    for i in range(3):
+        source = tmp_path / f"grid_{i}.nc"
+        source.write_text(f"grid {i}")
+        tile = tmp_path / f"grid_{i}.0.nc"
+        tile.write_bytes(b"0" * 1000)
+
+        key = compute_partition_key(source, 1, 1, True)
+        with cache.lock(key):
+            cache.store(key, source, [tile], None)
+        os.utime(cache.root / key, (i, i))
+        sources.append(source)
+        keys.append(key)
+
+    cache.max_bytes = 2500
+
+    # refresh the oldest entry so the second entry is least-recently-used
+    assert cache.fetch(keys[0], sources[0])
+    assert cache.evict() == [keys[1]]
+
+    assert cache.fetch(keys[0], sources[0])
+    assert not cache.fetch(keys[1], sources[1])
+
+
+def test_partition_key_includes_roms_tools_version(tmp_path: Path) -> None:
+    """Verify tiles are not reused after `roms_tools` is upgraded."""
+    source = tmp_path / "grid.nc"
+    source.write_text("grid")
+
+    keys = set()
+    for roms_tools_version in ("4.0.1", "4.1.0"):
+        with mock.patch(
+            "cstar.roms.partition_cache._roms_tools_version",
+            return_value=roms_tools_version,
+        ):
+            keys.add(compute_partition_key(source, 2, 2, True))
+
+    assert len(keys) == 2  # noqa: PLR2004
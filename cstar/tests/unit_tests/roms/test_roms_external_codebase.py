@@ -5,6 +5,7 @@ import unittest.mock as mock
 
 import pytest
 
+from cstar.base.build_tools import build_jobs
 from cstar.roms.external_codebase import ROMSExternalCodeBase
 from cstar.system.manager import get_sysmgr
 
@@ -89,7 +90,7 @@ class TestROMSExternalCodeBaseConfigure:
         cstar_sysmgr = get_sysmgr()
 
         mock_run_cmd.assert_any_call(
-            f"make COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=roms_path / "Tools-Roms",
             msg_pre="Compiling Tools-Roms package for UCLA ROMS...",
             msg_post="Compiled Tools-Roms",
@@ -126,7 +127,7 @@ class TestROMSExternalCodeBaseConfigure:
 
         cstar_sysmgr = get_sysmgr()
         mock_run_cmd.assert_any_call(
-            f"make MPI_WRAPPER={wrapper_path} COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} MPI_WRAPPER={wrapper_path} COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=roms_path / "Tools-Roms",
             msg_pre="Compiling Tools-Roms package for UCLA ROMS...",
             msg_post="Compiled Tools-Roms",
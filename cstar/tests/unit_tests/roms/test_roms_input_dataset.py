@@ -1,5 +1,7 @@
 import logging
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
@@ -374,6 +376,58 @@ class TestROMSInputDatasetPartition:
                 == expected_partitioned_files
             )
 
+    @mock.patch("cstar.roms.input_dataset.roms_tools.partition_netcdf")
+    @mock.patch(
+        "cstar.base.input_dataset.InputDataset.exists_locally",
+        new_callable=mock.PropertyMock,
+    )
+    def test_partition_on_executor(
+        self,
+        mock_exists_locally,
+        mock_partition_netcdf,
+        romsinputdataset_remote_netcdf,
+        stageddatacollection_remote_files,
+        mock_sourcedatacollection,
+    ):
+        """Tests that files partitioned on an executor keep their order, and that a
+        retry without coarse dims on the first file applies to the remaining files.
+        """
+        mock_exists_locally.return_value = True
+        dataset = romsinputdataset_remote_netcdf
+        names = [f"file{i}" for i in range(1, 5)]
+        dataset._working_copy = stageddatacollection_remote_files(
+            paths=[Path(f"some/local/dir/{n}.nc") for n in names],
+            sources=mock_sourcedatacollection(
+                locations=[f"http://example.com/{n}.nc" for n in names],
+                identifiers=None,
+            ),
+        )
+
+        def fake_partition(idfile, np_xi, np_eta, include_coarse_dims):
+            if include_coarse_dims:
+                raise ValueError("coarse dims are not divisible")
+            # finish out of submission order
+            time.sleep(0.01 * (5 - int(idfile.stem[-1])))
+            return [idfile.with_suffix(f".{i}.nc") for i in range(2)]
+
+        mock_partition_netcdf.side_effect = fake_partition
+
+        with (
+            mock.patch.object(Path, "resolve", autospec=True, side_effect=lambda p: p),
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            dataset.partition(np_xi=2, np_eta=1, executor=executor)
+
+        assert dataset.partitioning.files == [
+            Path(f"some/local/dir/{n}.{i}.nc") for n in names for i in range(2)
+        ]
+        # the first file is tried with and without coarse dims, the rest without
+        coarse = [
+            c.kwargs["include_coarse_dims"]
+            for c in mock_partition_netcdf.call_args_list
+        ]
+        assert coarse == [True, False, False, False, False]
+
     @mock.patch("cstar.roms.input_dataset.roms_tools.partition_netcdf")
     def test_partition_skips_if_already_partitioned(
         self,
@@ -2,6 +2,7 @@ import logging
 import pickle
 import re
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -11,6 +12,7 @@ import pytest
 from pydantic import ValidationError
 
 from cstar.base.additional_code import AdditionalCode
+from cstar.base.build_tools import build_jobs
 from cstar.base.external_codebase import ExternalCodeBase
 from cstar.execution.handler import ExecutionStatus
 from cstar.marbl.external_codebase import MARBLExternalCodeBase
@@ -1035,12 +1037,46 @@ class TestProcessingAndExecution:
         """Tests that `setup` correctly fetches and organizes simulation components."""
         sim = stub_romssimulation
 
-        sim.setup()
+        with mock.patch.dict("os.environ", {"CSTAR_SHARED_CODEBASES": "0"}):
+            sim.setup()
 
         assert mock_externalcodebase_setup.call_count == 2
         assert mock_additionalcode_get.call_count == 2
         assert mock_inputdataset_get.call_count == 9
 
+    @pytest.mark.parametrize(
+        "env, expect_shared",
+        [
+            ({}, True),
+            ({"CSTAR_SHARED_CODEBASES": "0"}, False),
+            ({"CSTAR_FRESH_CODEBASES": "1"}, False),
+        ],
+    )
+    @mock.patch.object(ROMSInputDataset, "get")
+    @mock.patch.object(AdditionalCode, "get")
+    @mock.patch.object(ExternalCodeBase, "install")
+    @mock.patch.object(ExternalCodeBase, "setup")
+    def test_setup_shared_codebases(
+        self,
+        mock_externalcodebase_setup,
+        mock_externalcodebase_install,
+        mock_additionalcode_get,
+        mock_inputdataset_get,
+        env,
+        expect_shared,
+        stub_romssimulation,
+    ):
+        """Tests that `setup` installs codebases in the shared codebase store unless
+        per-simulation codebases are requested.
+        """
+        sim = stub_romssimulation
+
+        with mock.patch.dict("os.environ", env):
+            sim.setup()
+
+        assert mock_externalcodebase_install.call_count == (2 if expect_shared else 0)
+        assert mock_externalcodebase_setup.call_count == (0 if expect_shared else 2)
+
     @pytest.mark.parametrize(
         "codebase_status, marbl_status, expected",
         [
@@ -1297,7 +1333,7 @@ class TestProcessingAndExecution:
         )
         cstar_sysmgr = get_sysmgr()
         mock_subprocess.assert_any_call(
-            f"make COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=build_dir,
             shell=True,
             capture_output=True,
@@ -1357,7 +1393,7 @@ class TestProcessingAndExecution:
 
         cstar_sysmgr = get_sysmgr()
         mock_subprocess.assert_any_call(
-            f"make MPI_WRAPPER={wrapper_path} COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} MPI_WRAPPER={wrapper_path} COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=build_dir,
             shell=True,
             capture_output=True,
@@ -1409,7 +1445,7 @@ class TestProcessingAndExecution:
 
         cstar_sysmgr = get_sysmgr()
         mock_subprocess.assert_any_call(
-            f"make USER_LDFLAGS='{rpath_flags}' "
+            f"make -j{build_jobs()} USER_LDFLAGS='{rpath_flags}' "
             f"COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=build_dir,
             shell=True,
@@ -1560,7 +1596,7 @@ class TestProcessingAndExecution:
         assert mock_subprocess.call_count == 1
         cstar_sysmgr = get_sysmgr()
         mock_subprocess.assert_any_call(
-            f"make COMPILER={cstar_sysmgr.environment.compiler}",
+            f"make -j{build_jobs()} COMPILER={cstar_sysmgr.environment.compiler}",
             cwd=build_dir,
             shell=True,
             capture_output=True,
@@ -1610,13 +1646,47 @@ class TestProcessingAndExecution:
 
             # Assert that partition() was called only on datasets that exist locally
             dataset_1.partition.assert_called_once_with(
-                np_xi=2, np_eta=3, overwrite_existing_files=False
+                np_xi=2, np_eta=3, overwrite_existing_files=False, executor=mock.ANY
             )
             dataset_2.partition.assert_not_called()  # Does not exist → shouldn't be partitioned
             dataset_3.partition.assert_called_once_with(
-                np_xi=2, np_eta=3, overwrite_existing_files=False
+                np_xi=2, np_eta=3, overwrite_existing_files=False, executor=mock.ANY
             )
 
+    @pytest.mark.parametrize(
+        "nprocs, expected_executor",
+        [(None, type(None)), ("1", type(None)), ("3", ProcessPoolExecutor)],
+    )
+    def test_pre_run_partitions_on_process_pool(
+        self, stub_romssimulation, monkeypatch, nprocs, expected_executor
+    ):
+        """Tests that `pre_run` partitions datasets on a process pool sized by
+        `CSTAR_NPROCS_PRE`, or in the current process when it is 1 or unset.
+        """
+        if nprocs is None:
+            monkeypatch.delenv("CSTAR_NPROCS_PRE", raising=False)
+        else:
+            monkeypatch.setenv("CSTAR_NPROCS_PRE", nprocs)
+
+        sim = stub_romssimulation
+        datasets = [
+            mock.MagicMock(spec=ROMSInputDataset, exists_locally=True) for _ in range(2)
+        ]
+        with mock.patch.object(
+            ROMSSimulation,
+            "input_datasets",
+            new_callable=mock.PropertyMock,
+            return_value=datasets,
+        ):
+            sim.pre_run()
+
+        executors = {d.partition.call_args.kwargs["executor"] for d in datasets}
+        assert len(executors) == 1
+        executor = executors.pop()
+        assert isinstance(executor, expected_executor)
+        if executor is not None:
+            assert executor._max_workers == int(nprocs)
+
     def test_run_raises_if_no_runtime_code_working_copy(self, stub_romssimulation):
         """Confirm that ROMSSimulation.run() raises a FileNotFoundError if
         ROMSSimulation.runtime_code does not exist locally.